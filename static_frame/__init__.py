@@ -35,6 +35,7 @@ from static_frame.core.frame import FrameAssignBLoc as FrameAssignBLoc
 from static_frame.core.frame import FrameAssignILoc as FrameAssignILoc
 from static_frame.core.frame import FrameGO as FrameGO
 from static_frame.core.frame import FrameHE as FrameHE
+from static_frame.core.group import GroupPlan as GroupPlan
 from static_frame.core.hloc import HLoc as HLoc
 from static_frame.core.index import ILoc as ILoc
 from static_frame.core.index import Index as Index
@@ -74,13 +75,19 @@ from static_frame.core.node_iter import IterNodeApplyType as IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis
 from static_frame.core.node_iter import IterNodeDelegate
 from static_frame.core.node_iter import IterNodeDelegateMapable
+from static_frame.core.node_iter import IterNodeDelegateReducible
+from static_frame.core.node_iter import IterNodeDelegateWindowArray
+from static_frame.core.node_iter import IterNodeDelegateWindowReducible
 from static_frame.core.node_iter import IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroup
 from static_frame.core.node_iter import IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeNoArgMapable
+from static_frame.core.node_iter import IterNodeResample
 from static_frame.core.node_iter import IterNodeType as IterNodeType
 from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_iter import IterNodeWindowArray
+from static_frame.core.node_iter import IterNodeWindowReducible
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignQuartet
 from static_frame.core.node_selector import InterfaceAssignTrio
@@ -1,6 +1,14 @@
+import contextlib
+import inspect
+import operator
+import os
+import sys
 import typing as tp
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import ThreadPoolExecutor
+from collections import abc
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
 
 import numpy as np
 
@@ -12,6 +20,7 @@ from static_frame.core.display import DisplayHeader
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.exception import BatchIterableInvalid
+from static_frame.core.exception import ErrorInit
 from static_frame.core.frame import Frame
 from static_frame.core.index_auto import IndexAutoFactoryType
 from static_frame.core.index_auto import RelabelInput
@@ -30,6 +39,7 @@ from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.store_directory import StoreDirectoryNPY
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -40,6 +50,8 @@ from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.core.style_config import StyleConfig
+from static_frame.core.util import CHUNKS_PER_WORKER
+from static_frame.core.util import CHUNKSIZE_AUTO
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import ELEMENT_TUPLE
@@ -47,6 +59,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import Bloc2DKeyType
 from static_frame.core.util import BoolOrBools
+from static_frame.core.util import ChunkSize
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
@@ -56,10 +69,23 @@ from static_frame.core.util import IndexInitializer
 from static_frame.core.util import KeyOrKeys
 from static_frame.core.util import NameType
 from static_frame.core.util import PathSpecifier
+from static_frame.core.util import SharedMemorySession
 from static_frame.core.util import UFunc
-
-# import multiprocessing as mp
-# mp_context = mp.get_context('spawn')
+from static_frame.core.util import call_pickle_shared_memory
+from static_frame.core.util import estimate_cost
+from static_frame.core.util import executor_is_process
+from static_frame.core.util import get_executor
+from static_frame.core.util import iter_chunk
+from static_frame.core.util import map_bounded
+from static_frame.core.util import map_by_cost
+from static_frame.core.util import reduce_tree
+
+TRANSPORT_PICKLE = 'pickle'
+TRANSPORT_SHARED_MEMORY = 'shared_memory'
+TRANSPORTS = (TRANSPORT_PICKLE, TRANSPORT_SHARED_MEMORY)
+
+# containers per chunk reduced in a worker when the count of containers is unknown
+REDUCE_CHUNKSIZE_DEFAULT = 8
 
 FrameOrSeries = tp.Union[Frame, Series]
 IteratorFrameItems = tp.Iterator[tp.Tuple[tp.Hashable, FrameOrSeries]]
@@ -99,6 +125,49 @@ def call_attr(bundle: tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]
     func = getattr(container, attr)
     return func(*args, **kwargs) # type: ignore
 
+
+class BatchOp(tp.NamedTuple):
+    '''
+    A deferred operation on a container, to be called by ``caller`` with a bundle of the container, ``args``, and (if ``with_label``) the label; if ``exception`` is raised, the container is dropped.
+    '''
+    caller: tp.Callable[..., FrameOrSeries]
+    args: tp.Tuple[tp.Any, ...]
+    with_label: bool = False
+    exception: tp.Optional[tp.Type[Exception]] = None
+
+def call_ops(bundle: tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[BatchOp, ...]]
+        ) -> tp.Tuple[bool, tp.Any]:
+    '''
+    Apply a chain of operations to a container in one call, returning a pair of a Boolean (False if the container is dropped) and the result.
+    '''
+    container, label, ops = bundle
+    for op in ops:
+        bundle_op = (container, *op.args, label) if op.with_label else (container, *op.args)
+        if op.exception is None:
+            container = op.caller(bundle_op)
+            continue
+        try:
+            container = op.caller(bundle_op)
+        except op.exception:
+            return False, None
+    return True, container
+
+def call_ops_reduce(bundle: tp.Tuple[
+                tp.List[tp.Tuple[FrameOrSeries, tp.Hashable]],
+                tp.Tuple[BatchOp, ...],
+                tp.Callable[[tp.Any, tp.Any], tp.Any],
+                ]) -> tp.Tuple[bool, tp.Any]:
+    '''
+    Apply a chain of operations to each of a chunk of pairs of container and label, combining the results with ``combine`` in a balanced tree; returns a pair of a Boolean (False if all containers are dropped) and the partial result.
+    '''
+    pairs, ops, combine = bundle
+    results = (container for keep, container in
+            (call_ops((container, label, ops)) for container, label in pairs)
+            if keep)
+    for first in results:
+        return True, reduce_tree(combine, chain((first,), results))
+    return False, None
+
 #-------------------------------------------------------------------------------
 class Batch(ContainerOperand, StoreClientMixin):
     '''
@@ -112,6 +181,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             '_max_workers',
             '_chunksize',
             '_use_threads',
+            '_transport',
+            '_executor',
+            '_mp_context',
+            '_source',
+            '_ops',
             )
 
     _config: StoreConfigMap
@@ -123,8 +197,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             name: NameType = None,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -134,6 +211,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     #---------------------------------------------------------------------------
@@ -145,8 +225,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         config_map = StoreConfigMap.from_initializer(config)
 
@@ -158,6 +241,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -167,8 +253,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -181,6 +270,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -190,8 +282,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -204,6 +299,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -213,8 +311,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -227,6 +328,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -236,8 +340,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPZ :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -250,6 +357,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -259,8 +369,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -273,6 +386,39 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
+                )
+
+    @classmethod
+    @doc_inject(selector='batch_constructor_directory')
+    def from_directory_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_workers: tp.Optional[int] = None,
+            chunksize: ChunkSize = 1,
+            use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
+            memory_map: bool = False,
+            ) -> 'Batch':
+        '''
+        Given a file path to a directory of NPY directories :obj:`Batch` store, return a :obj:`Batch` instance.
+
+        {args}
+        '''
+        store = StoreDirectoryNPY(fp, memory_map=memory_map)
+        return cls._from_store(store,
+                config=config,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -282,8 +428,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -296,6 +445,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
 
@@ -306,8 +458,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -321,6 +476,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
 
@@ -331,8 +489,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -345,6 +506,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
 
@@ -355,8 +519,11 @@ class Batch(ContainerOperand, StoreClientMixin):
             *,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> 'Batch':
         '''
         Given a file path to a HDF5 :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -369,6 +536,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                transport=transport,
+                executor=executor,
+                mp_context=mp_context,
                 )
 
     #---------------------------------------------------------------------------
@@ -379,14 +549,22 @@ class Batch(ContainerOperand, StoreClientMixin):
             name: NameType = None,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            transport: str = TRANSPORT_PICKLE,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ):
         '''
         Default constructor of a :obj:`Batch`.
 
         {args}
         '''
+        if transport not in TRANSPORTS:
+            raise ErrorInit(f'transport must be one of {TRANSPORTS}, not {transport!r}.')
+        if transport == TRANSPORT_SHARED_MEMORY and sys.version_info < (3, 8):
+            raise ErrorInit(f'transport {transport!r} requires Python 3.8 or later.')
+
         self._items = items # might be a generator!
         self._name = name
 
@@ -395,6 +573,13 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._max_workers = max_workers
         self._chunksize = chunksize
         self._use_threads = use_threads
+        self._transport = transport
+        self._executor = executor
+        self._mp_context = mp_context
+
+        # when operations are applied with a pool, the items to which they are applied, and the operations, to be fused with subsequent operations
+        self._source: tp.Optional[IteratorFrameItems] = None
+        self._ops: tp.Tuple[BatchOp, ...] = ()
 
     #---------------------------------------------------------------------------
     def _derive(self,
@@ -409,6 +594,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                transport=self._transport,
+                executor=self._executor,
+                mp_context=self._mp_context,
                 )
 
     @property
@@ -474,57 +662,113 @@ class Batch(ContainerOperand, StoreClientMixin):
     #---------------------------------------------------------------------------
     # core function application routines
 
-    def _iter_items(self) -> IteratorFrameItems:
+    def _iter_items(self,
+            items: tp.Optional[IteratorFrameItems] = None,
+            ) -> IteratorFrameItems:
         '''Iter pairs in items, providing helpful exception of a pair is not found. Thies is necessary as we cannot validate the items until we actually do an iteration, and the iterable might be an iterator.
         '''
-        for pair in self._items:
+        for pair in (self._items if items is None else items):
             try:
                 label, frame = pair
             except ValueError:
                 raise BatchIterableInvalid() from None
             yield label, frame
 
-    def _apply_pool(self,
-            labels: tp.List[tp.Hashable],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., FrameOrSeries],
-            ) -> 'Batch':
-
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+    def _get_executor(self) -> tp.ContextManager[Executor]:
+        '''
+        Return a context manager providing the executor given at initialization (not shut down on exit), or a new executor.
+        '''
+        return get_executor(self._executor,
+                max_workers=self._max_workers,
+                use_threads=self._use_threads,
+                mp_context=self._mp_context,
+                )
 
-        def gen_pool() -> IteratorFrameItems:
-            with pool_executor(max_workers=self._max_workers) as executor:
-                yield from zip(labels,
-                        executor.map(caller, arg_iter, chunksize=self._chunksize)
-                        )
-        return self._derive(gen_pool)
+    def _transport_session(self) -> tp.ContextManager[tp.Optional[SharedMemorySession]]:
+        '''
+        Return a context manager providing a :obj:`SharedMemorySession` if containers are to be transferred to and from worker processes through shared memory.
+        '''
+        if (self._transport == TRANSPORT_SHARED_MEMORY
+                and executor_is_process(self._executor, use_threads=self._use_threads)):
+            return SharedMemorySession()
+        return contextlib.nullcontext()
 
-    def _apply_pool_except(self,
-            labels: tp.List[tp.Hashable],
+    def _transport_wrap(self,
             arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
             caller: tp.Callable[..., FrameOrSeries],
-            exception: tp.Type[Exception],
-            ) -> 'Batch':
+            session: tp.Optional[SharedMemorySession],
+            ) -> tp.Tuple[tp.Iterator[tp.Any], AnyCallable]:
+        '''
+        Wrap arguments and the caller for transfer to and from worker processes through shared memory, if ``session`` is provided.
+        '''
+        if session is None:
+            return arg_iter, caller
+        return ((session.wrap(args) for args in arg_iter),
+                partial(call_pickle_shared_memory, caller))
 
-        if self._chunksize != 1:
-            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
+    def _started(self) -> bool:
+        '''
+        Return True if iteration of the items of this :obj:`Batch`, as derived by a pool, has begun; once started, items cannot be derived again from the source without re-applying operations to consumed containers.
+        '''
+        # the state of the generator is used, rather than an attribute set by the generator, as the generator would then reference this Batch, delaying its close until garbage collection
+        return (self._source is not None
+                and inspect.getgeneratorstate(self._items) != inspect.GEN_CREATED) # type: ignore
 
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+    def _source_ops(self) -> tp.Tuple[IteratorFrameItems, tp.Tuple[BatchOp, ...]]:
+        '''
+        Return the items and operations with which to fuse a subsequent operation: the source items and retained operations if the pool of this :obj:`Batch` has not been started, otherwise the items of this :obj:`Batch` and no operations.
+        '''
+        if self._source is None or self._started():
+            return self._items, ()
+        return self._source, self._ops
 
-        def gen_pool() -> IteratorFrameItems:
-            futures = []
-            with pool_executor(max_workers=self._max_workers) as executor:
-                for args in arg_iter:
-                    futures.append(executor.submit(caller, args))
+    def _apply_pool(self, op: BatchOp) -> 'Batch':
+        '''
+        Return a :obj:`Batch` that applies ``op`` with a pool. Operations applied in succession are fused: the returned :obj:`Batch` retains the items and operations of this :obj:`Batch` (if its pool has not been started), such that all operations are applied to each container in one call, and intermediate containers are never transferred to or from workers.
+        '''
+        source, ops = self._source_ops()
+        ops = ops + (op,)
 
-                for label, future in zip(labels, futures):
+        def gen_pool() -> IteratorFrameItems:
+            labels: tp.Deque[tp.Hashable] = deque()
+            def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, tp.Hashable, tp.Tuple[BatchOp, ...]]]:
+                for label, frame in self._iter_items(source):
+                    labels.append(label)
+                    yield frame, label, ops
+
+            with self._transport_session() as session:
+                with self._get_executor() as executor:
+                    if self._chunksize == CHUNKSIZE_AUTO:
+                        results = map_by_cost(executor,
+                                call_ops,
+                                arg_gen(),
+                                cost=lambda args: estimate_cost(args[0]),
+                                max_workers=self._max_workers,
+                                wrap=partial(self._transport_wrap, session=session),
+                                )
+                    else:
+                        args_pool, caller_pool = self._transport_wrap(arg_gen(), call_ops, session)
+                        # containers are submitted only as results are consumed
+                        results = map_bounded(executor,
+                                caller_pool,
+                                args_pool,
+                                chunksize=self._chunksize,
+                                max_workers=self._max_workers,
+                                )
                     try:
-                        container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
-
-        return self._derive(gen_pool)
+                        # labels are appended as args are consumed, always before the corresponding result is yielded
+                        for keep, container in results:
+                            label = labels.popleft()
+                            if keep:
+                                yield label, container
+                    finally:
+                        # if closed early, cancel or finish pending work before the session releases shared memory; a provided executor is not shut down on exit
+                        results.close()
+
+        batch = self._derive(gen_pool)
+        batch._source = source
+        batch._ops = ops
+        return batch
 
     def _apply_attr(self,
             *args: tp.Any,
@@ -534,37 +778,25 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a method on a Frame given as an attr string.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._iter_items():
                     yield label, call_attr((frame, attr, args, kwargs))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, attr, args, kwargs
-
-        return self._apply_pool(labels, arg_gen(), call_attr)
+        return self._apply_pool(BatchOp(call_attr, (attr, args, kwargs)))
 
     def apply(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._iter_items():
                     yield label, call_func((frame, func))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool(labels, arg_gen(), call_func)
+        return self._apply_pool(BatchOp(call_func, (func,)))
 
     def apply_except(self,
             func: AnyCallable,
@@ -573,7 +805,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._iter_items():
                     try:
@@ -582,35 +814,21 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func,
-                exception,
-                )
+        if self._chunksize != 1:
+            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
+        return self._apply_pool(BatchOp(call_func, (func,), exception=exception))
 
     def apply_items(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._iter_items():
                     yield label, call_func_items((frame, func, label))
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool(labels, arg_gen(), call_func_items)
+        return self._apply_pool(BatchOp(call_func_items, (func,), with_label=True))
 
     def apply_items_except(self,
             func: AnyCallable,
@@ -619,7 +837,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
+        if self._max_workers is None and self._executor is None:
             def gen() -> IteratorFrameItems:
                 for label, frame in self._iter_items():
                     try:
@@ -628,17 +846,9 @@ class Batch(ContainerOperand, StoreClientMixin):
                         pass
             return self._derive(gen)
 
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func_items,
-                exception,
-                )
+        if self._chunksize != 1:
+            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
+        return self._apply_pool(BatchOp(call_func_items, (func,), with_label=True, exception=exception))
 
     #---------------------------------------------------------------------------
     # extraction
@@ -1680,6 +1890,62 @@ class Batch(ContainerOperand, StoreClientMixin):
                 axis=axis,
                 )
 
+    #---------------------------------------------------------------------------
+    # reduction across containers
+
+    def reduce(self,
+            func: tp.Optional[AnyCallable],
+            combine: tp.Callable[[tp.Any, tp.Any], tp.Any],
+            ) -> tp.Any:
+        '''
+        Reduce all containers to a single value: ``func`` is applied to each container to produce partial results, which are combined pairwise with ``combine`` in a balanced tree, in order, as they are produced.
+
+        If this :obj:`Batch` is parallel, chunks of containers are sent to workers; each worker applies preceding operations and ``func`` to its containers, and combines the results of its chunk, returning only one partial result; partial results of chunks are then combined in this process. Chunks are of ``chunksize`` containers or, if ``chunksize`` is 1 or ``'auto'``, of the count of items divided among ``CHUNKS_PER_WORKER`` chunks per worker; if the items are an iterator of unknown length, chunks are of ``REDUCE_CHUNKSIZE_DEFAULT`` containers. Containers are loaded only as chunks are submitted.
+
+        Args:
+            func: A function that, given a container, returns a partial result; if None, containers are the partial results.
+            combine: An associative function that, given two partial results, returns their combination; if this :obj:`Batch` uses a process pool, it must be picklable.
+        '''
+        if self._max_workers is None and self._executor is None:
+            batch = self if func is None else self.apply(func)
+            return reduce_tree(combine, (v for _, v in batch._iter_items()))
+
+        source, ops = self._source_ops()
+        if func is not None:
+            ops = ops + (BatchOp(call_func, (func,)),)
+
+        pairs: tp.Iterable[tp.Tuple[FrameOrSeries, tp.Hashable]] = (
+                (frame, label) for label, frame in self._iter_items(source))
+        if isinstance(self._chunksize, int) and self._chunksize > 1:
+            size = self._chunksize
+        elif isinstance(source, abc.Sized):
+            # chunks of one container would not combine in workers; size chunks from the count of items, without loading containers
+            count = (self._max_workers or os.cpu_count() or 1) * CHUNKS_PER_WORKER
+            size = max(1, -(-len(source) // count))
+        else:
+            size = REDUCE_CHUNKSIZE_DEFAULT
+
+        chunks = ((chunk, ops, combine) for chunk in iter_chunk(pairs, size))
+        with self._transport_session() as session:
+            with self._get_executor() as executor:
+                args_pool, caller_pool = self._transport_wrap(chunks, call_ops_reduce, session)
+                # chunks are submitted only as partial results are combined
+                results = map_bounded(executor,
+                        caller_pool,
+                        args_pool,
+                        max_workers=self._max_workers,
+                        )
+                try:
+                    return reduce_tree(combine, (value for keep, value in results if keep))
+                finally:
+                    results.close()
+
+    def reduce_sum(self) -> tp.Any:
+        '''
+        Return the element-wise sum of all containers.
+        '''
+        return self.reduce(None, operator.add)
+
     #---------------------------------------------------------------------------
     # exporter
 
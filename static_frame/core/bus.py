@@ -29,6 +29,7 @@ from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.store_directory import StoreDirectoryNPY
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -325,6 +326,28 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
                 index_constructor=index_constructor,
                 )
 
+    @classmethod
+    @doc_inject(selector='bus_constructor_directory')
+    def from_directory_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_persist: tp.Optional[int] = None,
+            index_constructor: IndexConstructor = None,
+            memory_map: bool = False,
+            ) -> 'Bus':
+        '''
+        Given a file path to a directory of NPY directories :obj:`Bus` store, return a :obj:`Bus` instance.
+
+        {args}
+        '''
+        store = StoreDirectoryNPY(fp, memory_map=memory_map)
+        return cls._from_store(store,
+                config=config,
+                max_persist=max_persist,
+                index_constructor=index_constructor,
+                )
+
     @classmethod
     @doc_inject(selector='bus_constructor')
     def from_zip_parquet(cls,
@@ -19,11 +19,14 @@ from static_frame.core.container import ContainerOperand
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.fill_value_auto import FillValueAuto
+from static_frame.core.group import GroupPlan
+from static_frame.core.group import resample_plan
 from static_frame.core.rank import RankMethod
 from static_frame.core.rank import rank_1d
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_DATETIME_KIND
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
@@ -1264,6 +1267,26 @@ def group_from_container(
 
     return key
 
+def index_resample_plan(
+        index: 'IndexBase',
+        unit: str,
+        step: int = 1,
+        ) -> tp.Tuple[GroupPlan, 'IndexBase', bool]:
+    '''
+    Given a datetime64 ``index``, return the :obj:`GroupPlan` of buckets of ``step`` ``unit``, an index of bucket labels (of the ``IndexDatetime`` subclass of ``unit``, or, for weeks, ``IndexDate``), and whether buckets are contiguous in the original order, such that each bucket can be selected with a slice.
+    '''
+    from static_frame.core.index_datetime import resample_unit_to_index_cls
+
+    if index.ndim != 1 or index.dtype.kind != DTYPE_DATETIME_KIND:
+        raise RuntimeError(f'resampling requires an index of datetime64 values, not {index.__class__.__name__}')
+    index_cls = resample_unit_to_index_cls(unit)
+
+    plan = resample_plan(index.values, unit, step)
+    ordering = plan.ordering
+    contiguous = bool((ordering[1:] > ordering[:-1]).all())
+
+    return plan, index_cls(plan.labels, name=index.name), contiguous
+
 
 
 #---------------------------------------------------------------------------
@@ -22,7 +22,7 @@ ILOC_SELECTOR = '''An iloc selector, either an index, a list of indices, a slice
 
 AXIS = '''axis: Integer specifying axis, where 0 is rows and 1 is columns. Axis 0 is set by default.'''
 
-CHUNKSIZE = 'chunksize: Units of work per executor, as passed to the Thread- or ProcessPoolExecutor.'
+CHUNKSIZE = "chunksize: Units of work per executor, as passed to the Thread- or ProcessPoolExecutor; if 'auto', consecutive units of work are read in bounded windows, and each window is grouped into chunks of balanced estimated cost (by ``nbytes``), with the costliest chunks scheduled first."
 
 COLUMNS_CONSTRUCTOR = 'columns_constructor: Optional class or constructor function to create the :obj:`Index` applied to the columns.'
 
@@ -34,6 +34,8 @@ DTYPE_SPECIFIER = '''dtype: A value suitable for specyfying a NumPy dtype, such
 
 DTYPES = "dtypes: Optionally provide an iterable of dtypes, equal in length to the length of each row, or a mapping by column name (where overspecied labels is not an error). If a dtype is given as None, element-wise type determination will be used."
 
+EXECUTOR_POOL = 'executor: Optionally, a long-lived ``concurrent.futures.Executor`` to be used (and not shut down) instead of creating a new executor per call; ``max_workers``, ``use_threads``, and ``mp_context`` are then ignored.'
+
 FP = 'fp: A string file path or :obj:`Path` instance.'
 
 INDEX_CONSTRUCTOR = 'index_constructor: Optional class or constructor function to create the :obj:`Index` applied to the rows.'
@@ -42,6 +44,10 @@ MAX_PERSIST = 'max_persist: When loading :obj:`Frame` from a :obj:`Store`, optio
 
 MAX_WORKERS = 'max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to the max number of machine processes.'
 
+MEMORY_MAP = 'memory_map: If True, read each :obj:`Frame` from memory-mapped, immutable arrays; memory maps are released when the arrays are no longer referenced.'
+
+MP_CONTEXT = "mp_context: Optionally, the name of the multiprocessing start method (``'spawn'``, ``'fork'``, or ``'forkserver'``) used when creating a ProcessPoolExecutor."
+
 NAME = 'name: A hashable object to label the container.'
 
 OWN_COLUMNS = '''own_columns: Flag the passed columns as ownable by this :obj:`static_frame.{class_name}`. Primarily used by internal clients.'''
@@ -56,6 +62,8 @@ STORE = 'store: A :obj:`Store` subclass.'
 
 STORE_CONFIG_MAP = 'config: A :obj:`StoreConfig`, or a mapping of label ot :obj:`StoreConfig`'
 
+TRANSPORT = "transport: With the ProcessPoolExecutor, how containers are transferred to and from worker processes: ``'pickle'`` pickles containers in-band with the default protocol; ``'shared_memory'`` pickles containers with protocol 5 and copies their out-of-band buffers into shared memory segments, from which immutable arrays are created without copying."
+
 USE_THREADS = 'use_threads: Use the ThreadPoolExecutor instead of the ProcessPoolExecutor.'
 
 class DOC_TEMPLATE:
@@ -126,6 +134,8 @@ class DOC_TEMPLATE:
             max_workers=MAX_WORKERS,
             chunksize=CHUNKSIZE,
             use_threads=USE_THREADS,
+            executor=EXECUTOR_POOL,
+            mp_context=MP_CONTEXT,
             )
 
     argminmax = dict(
@@ -146,6 +156,24 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {TRANSPORT}
+            {EXECUTOR_POOL}
+            {MP_CONTEXT}
+            '''
+            )
+
+    batch_constructor_directory = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            {MAX_WORKERS}
+            {CHUNKSIZE}
+            {USE_THREADS}
+            {TRANSPORT}
+            {EXECUTOR_POOL}
+            {MP_CONTEXT}
+            {MEMORY_MAP}
             '''
             )
 
@@ -157,6 +185,9 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {TRANSPORT}
+            {EXECUTOR_POOL}
+            {MP_CONTEXT}
             '''
             )
 
@@ -169,6 +200,17 @@ class DOC_TEMPLATE:
             '''
             )
 
+    bus_constructor_directory = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            {MAX_PERSIST}
+            {INDEX_CONSTRUCTOR}
+            {MEMORY_MAP}
+            '''
+            )
+
     bus_init = dict(
             args = f'''
         Args:
@@ -333,6 +375,19 @@ class DOC_TEMPLATE:
             '''
             )
 
+    quilt_constructor_directory = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            axis: Integer specifying axis of virtual concatenation, where 0 is vertically (stacking rows) and 1 is horizontally (extending columns).
+            {RETAIN_LABELS}
+            {DEEPCOPY_FROM_BUS}
+            {MAX_PERSIST}
+            {MEMORY_MAP}
+            '''
+            )
+
     quilt_init = dict(
             args = f'''
         Args:
@@ -416,6 +471,43 @@ class DOC_TEMPLATE:
             '''
             )
 
+    store_client_exporter_hdf5 = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            append: If True, append rows to existing tables of the same label and add new tables to an existing file; if False, overwrite the file.
+            '''
+            )
+
+    store_client_exporter_xlsx = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            constant_memory: If True, use the XlsxWriter ``constant_memory`` mode, writing each sheet row by row with bounded memory; hierarchical index labels are not merged.
+            '''
+            )
+
+    store_client_exporter_sqlite = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            journal_mode: Optionally, an SQLite ``journal_mode`` PRAGMA value, such as "WAL" or "OFF", set before writing.
+            synchronous: Optionally, an SQLite ``synchronous`` PRAGMA value, such as "OFF" or "NORMAL", set before writing.
+            blob_layout: If True, write each table as NPY bytes, one BLOB per index array, columns array, and block, rather than as rows; such tables are faster to write and read, but are not usable as relational tables.
+            '''
+            )
+
+    store_client_exporter_directory = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            '''
+            )
+
     tail = dict(
             doc='''Return a :obj:`{class_name}` consisting only of the bottom elements as specified by ``count``.
             ''',
@@ -43,6 +43,7 @@ from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_from_optional_constructors
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
+from static_frame.core.container_util import index_resample_plan
 from static_frame.core.container_util import is_fill_value_factory_initializer
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import key_to_ascending_key
@@ -64,6 +65,9 @@ from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.exception import InvalidFillValue
 from static_frame.core.exception import RelabelInvalid
+from static_frame.core.group import GroupPlan
+from static_frame.core.group import group_reduce
+from static_frame.core.group import group_transform
 from static_frame.core.index import Index
 from static_frame.core.index import IndexGO
 from static_frame.core.index import _index_initializer_needs_init
@@ -87,8 +91,10 @@ from static_frame.core.node_iter import IterNodeConstructorAxis
 from static_frame.core.node_iter import IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeGroupOther
+from static_frame.core.node_iter import IterNodeResample
 from static_frame.core.node_iter import IterNodeType
-from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_iter import IterNodeWindowArray
+from static_frame.core.node_iter import IterNodeWindowReducible
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignQuartet
 from static_frame.core.node_selector import InterfaceAsType
@@ -97,8 +103,10 @@ from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.node_str import InterfaceString
 from static_frame.core.node_transpose import InterfaceTranspose
 from static_frame.core.node_values import InterfaceValues
-from static_frame.core.pivot import pivot_derive_constructors
-from static_frame.core.pivot import pivot_index_map
+from static_frame.core.pivot import pivot_axis_codes
+from static_frame.core.pivot import pivot_expand_index
+from static_frame.core.pivot import pivot_stack_blocks
+from static_frame.core.pivot import pivot_unstack_blocks
 from static_frame.core.protocol_dfi import DFIDataFrame
 from static_frame.core.rank import RankMethod
 from static_frame.core.rank import rank_1d
@@ -113,7 +121,6 @@ from static_frame.core.type_blocks import group_match
 from static_frame.core.type_blocks import group_sorted
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import CONTINUATION_TOKEN_INACTIVE
-from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
 from static_frame.core.util import DT64_NS
@@ -157,6 +164,7 @@ from static_frame.core.util import OptionalArrayList
 from static_frame.core.util import PathSpecifier
 from static_frame.core.util import PathSpecifierOrFileLike
 from static_frame.core.util import PathSpecifierOrFileLikeOrIterator
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import UFunc
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import argmax_2d
@@ -183,6 +191,10 @@ from static_frame.core.util import path_filter
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import ufunc_unique1d
 from static_frame.core.util import write_optional_file
+from static_frame.core.window import window_positions
+from static_frame.core.window import window_reduce
+from static_frame.core.window import window_reduce_items
+from static_frame.core.window import window_view
 
 if tp.TYPE_CHECKING:
     import pandas  # pylint: disable=W0611 #pragma: no cover
@@ -197,12 +209,14 @@ class Frame(ContainerOperand):
             '__weakref__',
             '_blocks',
             '_columns',
+            '_group_plans',
             '_index',
             '_name',
             )
 
     _blocks: TypeBlocks
     _columns: IndexBase
+    _group_plans: tp.Dict[tp.Tuple[int, tp.Hashable], GroupPlan]
     _index: IndexBase
     _name: tp.Hashable
 
@@ -1715,6 +1729,155 @@ class Frame(ContainerOperand):
     #---------------------------------------------------------------------------
     # file, data format loaders
 
+    @classmethod
+    def _iter_sql_cursor(cls,
+            cursor: sqlite3.Cursor,
+            *,
+            chunksize: int,
+            per_chunk: bool,
+            index_depth: int,
+            index_constructors: IndexConstructors,
+            columns_depth: int,
+            columns_select: tp.Optional[tp.Iterable[str]],
+            columns_constructors: IndexConstructors,
+            dtypes: DtypesSpecifier,
+            name: tp.Hashable,
+            consolidate_blocks: bool,
+            ) -> tp.Iterator['Frame']:
+        '''
+        Read rows from an executed ``cursor`` with ``fetchmany()``, converting each chunk of rows into one array per field, such that no more than ``chunksize`` rows are held as Python objects. If ``per_chunk`` is True, yield a :obj:`Frame` per chunk, closing the cursor when done; otherwise, yield one :obj:`Frame` formed from the concatenation of all chunks.
+        '''
+        field_names = [col for (col, *_) in cursor.description]
+        labels = field_names[index_depth:]
+
+        # positions, within data fields, of the fields to be read
+        iloc_sel: tp.Sequence[int] = range(len(labels))
+        if columns_select:
+            columns_select = set(columns_select)
+
+        if columns_depth <= 1 and columns_select:
+            iloc_sel, labels = zip(*(
+                    pair for pair in enumerate(labels) if pair[1] in columns_select
+                    ))
+
+        columns: tp.Optional[IndexBase] = None
+        if columns_depth == 1:
+            columns, _ = index_from_optional_constructors(
+                    labels,
+                    depth=columns_depth,
+                    default_constructor=cls._COLUMNS_CONSTRUCTOR,
+                    explicit_constructors=columns_constructors,
+                    )
+        elif columns_depth > 1:
+            # NOTE: we only support loading in IH if encoded in each header with a space delimiter
+            columns, _ = index_from_optional_constructors(
+                    labels,
+                    depth=columns_depth,
+                    default_constructor=partial(
+                            cls._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels_delimited,
+                            delimiter=' ',
+                            ),
+                    explicit_constructors=columns_constructors,
+                    )
+            if columns_select:
+                iloc_sel = columns._loc_to_iloc(columns.isin(columns_select)) # type: ignore
+                columns = columns.iloc[iloc_sel] # type: ignore
+
+        # as with from_records, dtypes of data fields are looked up by position in selected fields or by columns label; index dtypes are looked up over all fields
+        get_col_dtype = None if dtypes is None else get_col_dtype_factory(dtypes, columns) # type: ignore
+        get_col_dtype_index = None if (dtypes is None or not index_depth) else get_col_dtype_factory(
+                dtypes,
+                field_names,
+                )
+
+        # pairs of position in row, and the dtype getter and position used to look up a dtype
+        fields: tp.List[tp.Tuple[int, tp.Optional[tp.Callable[[int], DtypeSpecifier]], int]] = [
+                (i, get_col_dtype_index, i) for i in range(index_depth)]
+        fields.extend((index_depth + i, get_col_dtype, dtype_idx)
+                for dtype_idx, i in enumerate(iloc_sel))
+
+        def chunk_to_arrays(rows: tp.Sequence[tp.Sequence[tp.Any]]) -> tp.List[np.ndarray]:
+            values = list(zip(*rows)) # one tuple per field
+            return [array_from_value_iter(
+                    key=pos,
+                    idx=dtype_idx,
+                    get_value_iter=lambda key, idx: iter(values[key]), #type: ignore
+                    get_col_dtype=get_getter,
+                    row_count=len(rows),
+                    )
+                    for pos, get_getter, dtype_idx in fields]
+
+        def arrays_to_frame(arrays: tp.List[np.ndarray]) -> 'Frame':
+            if index_depth == 0:
+                index = None
+            elif index_depth == 1:
+                index, _ = index_from_optional_constructors(arrays[0],
+                        depth=index_depth,
+                        default_constructor=Index,
+                        explicit_constructors=index_constructors,
+                        )
+            else:
+                def default_constructor(
+                        arrays: tp.Iterable[np.ndarray],
+                        index_constructors: IndexConstructors,
+                        ) -> IndexHierarchy:
+                    return IndexHierarchy._from_type_blocks(
+                            TypeBlocks.from_blocks(arrays),
+                            index_constructors=index_constructors,
+                            own_blocks=True,
+                            )
+                index, _ = index_from_optional_constructors(arrays[:index_depth],
+                        depth=index_depth,
+                        default_constructor=default_constructor,
+                        explicit_constructors=index_constructors,
+                        )
+            blocks = arrays[index_depth:]
+            if consolidate_blocks:
+                blocks = TypeBlocks.consolidate_blocks(blocks) # type: ignore
+            return cls(TypeBlocks.from_blocks(blocks),
+                    index=index,
+                    own_index=index is not None,
+                    columns=columns,
+                    name=name,
+                    own_data=True,
+                    )
+
+        def chunks() -> tp.Iterator[tp.Sequence[tp.Sequence[tp.Any]]]:
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    return
+                yield rows
+
+        if per_chunk:
+            # the cursor is closed when the iterator is exhausted or discarded
+            try:
+                for rows in chunks():
+                    yield arrays_to_frame(chunk_to_arrays(rows))
+            finally:
+                cursor.close()
+            return
+
+        arrays_per_field: tp.List[tp.List[np.ndarray]] = [[] for _ in fields]
+        for rows in chunks():
+            for parts, array in zip(arrays_per_field, chunk_to_arrays(rows)):
+                parts.append(array)
+
+        if not arrays_per_field or not arrays_per_field[0]: # no rows
+            arrays = []
+            for pos, get_getter, dtype_idx in fields:
+                dtype = None if get_getter is None else get_getter(dtype_idx)
+                array = np.empty(0, dtype=DTYPE_FLOAT_DEFAULT if dtype is None else dtype)
+                array.flags.writeable = False
+                arrays.append(array)
+        else:
+            arrays = [parts[0] if len(parts) == 1 else concat_resolved(parts)
+                    for parts in arrays_per_field]
+            for array in arrays:
+                array.flags.writeable = False
+
+        yield arrays_to_frame(arrays)
+
     @classmethod
     @doc_inject(selector='constructor_frame')
     def from_sql(cls,
@@ -1730,6 +1893,7 @@ class Frame(ContainerOperand):
             name: tp.Hashable = None,
             consolidate_blocks: bool = False,
             parameters: tp.Iterable[tp.Any] = (),
+            chunksize: tp.Optional[int] = None,
             ) -> 'Frame':
         '''
         Frame constructor from an SQL query and a database connection object.
@@ -1746,6 +1910,7 @@ class Frame(ContainerOperand):
             {name}
             {consolidate_blocks}
             parameters: Provide a list of values for an SQL query expecting parameter substitution.
+            chunksize: If provided, rows are fetched from the cursor ``chunksize`` rows at a time and converted into arrays per field, avoiding holding all rows in memory.
         '''
         columns: tp.Optional[IndexBase] = None
         own_columns = False
@@ -1756,6 +1921,20 @@ class Frame(ContainerOperand):
             cursor = connection.cursor()
             cursor.execute(query, parameters)
 
+            if chunksize:
+                return next(cls._iter_sql_cursor(cursor,
+                        chunksize=chunksize,
+                        per_chunk=False,
+                        index_depth=index_depth,
+                        index_constructors=index_constructors,
+                        columns_depth=columns_depth,
+                        columns_select=columns_select,
+                        columns_constructors=columns_constructors,
+                        dtypes=dtypes,
+                        name=name,
+                        consolidate_blocks=consolidate_blocks,
+                        ))
+
             if columns_select:
                 columns_select = set(columns_select)
                 # selector function defined below
@@ -1874,6 +2053,61 @@ class Frame(ContainerOperand):
             if cursor:
                 cursor.close()
 
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def iter_sql(cls,
+            query: str,
+            *,
+            connection: sqlite3.Connection,
+            chunksize: int = 100_000,
+            index_depth: int = 0,
+            index_constructors: IndexConstructors = None,
+            columns_depth: int = 1,
+            columns_select: tp.Optional[tp.Iterable[str]] = None,
+            columns_constructors: IndexConstructors = None,
+            dtypes: DtypesSpecifier = None,
+            name: tp.Hashable = None,
+            consolidate_blocks: bool = False,
+            parameters: tp.Iterable[tp.Any] = (),
+            ) -> tp.Iterator['Frame']:
+        '''
+        Return an iterator of :obj:`Frame`, one for each chunk of up to ``chunksize`` rows fetched from the results of an SQL query.
+
+        Args:
+            query: A query string.
+            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            chunksize: The maximum number of rows in each :obj:`Frame`.
+            {dtypes}
+            index_depth:
+            index_constructors:
+            columns_depth:
+            columns_select: An optional iterable of field names to extract from the results of the query.
+            columns_constructors:
+            {name}
+            {consolidate_blocks}
+            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+        '''
+        # the query is executed before returning, such that errors are raised here; the cursor is then closed by the returned iterator
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, parameters)
+        except Exception:
+            cursor.close()
+            raise
+
+        return cls._iter_sql_cursor(cursor,
+                chunksize=chunksize,
+                per_chunk=True,
+                index_depth=index_depth,
+                index_constructors=index_constructors,
+                columns_depth=columns_depth,
+                columns_select=columns_select,
+                columns_constructors=columns_constructors,
+                dtypes=dtypes,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                )
+
     #---------------------------------------------------------------------------
     @classmethod
     @doc_inject(selector='json')
@@ -2737,11 +2971,15 @@ class Frame(ContainerOperand):
             index_constructors: IndexConstructors = None,
             columns_depth: int = 1,
             columns_constructors: IndexConstructors = None,
+            columns_select: tp.Optional[tp.Iterable[str]] = None,
+            rows_start: tp.Optional[int] = None,
+            rows_stop: tp.Optional[int] = None,
+            rows_where: tp.Optional[str] = None,
             consolidate_blocks: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
             ) -> 'Frame':
         '''
-        Load Frame from the contents of a table in an HDF5 file.
+        Load Frame from the contents of a table in an HDF5 file. Only the index fields and the fields in ``columns_select`` are read; rows can be limited to the range from ``rows_start`` to ``rows_stop``, and further filtered with a PyTables condition expression given by ``rows_where``.
         '''
         from static_frame.core.store_config import StoreConfig
         from static_frame.core.store_hdf5 import StoreHDF5
@@ -2752,6 +2990,10 @@ class Frame(ContainerOperand):
                 index_constructors=index_constructors,
                 columns_depth=columns_depth,
                 columns_constructors=columns_constructors,
+                columns_select=columns_select,
+                rows_start=rows_start,
+                rows_stop=rows_stop,
+                rows_where=rows_where,
                 consolidate_blocks=consolidate_blocks,
                 )
         return st.read(label, # type: ignore
@@ -3411,6 +3653,15 @@ class Frame(ContainerOperand):
         memo[id(self)] = obj
         return obj
 
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        # NOTE: cached group plans are derived from values and are not pickled
+        state = {}
+        for cls in self.__class__.__mro__:
+            for attr in getattr(cls, '__slots__', ()):
+                if attr != '__weakref__' and attr != '_group_plans' and hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+        return None, state
+
     # def __copy__(self) -> 'Frame':
     #     '''
     #     Return shallow copy of this Frame.
@@ -3731,6 +3982,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=self._axis_group_loc,
                 function_items=self._axis_group_loc_items,
+                function_reduce=self._axis_group_reduce,
+                function_transform=self._axis_group_transform,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3744,6 +3997,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=self._axis_group_loc,
                 function_items=self._axis_group_loc_items,
+                function_reduce=self._axis_group_reduce,
+                function_transform=self._axis_group_transform,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3758,6 +4013,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=partial(self._axis_group_loc, as_array=True),
                 function_items=partial(self._axis_group_loc_items, as_array=True),
+                function_reduce=self._axis_group_reduce,
+                function_transform=self._axis_group_transform,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3771,6 +4028,8 @@ class Frame(ContainerOperand):
                 container=self,
                 function_values=partial(self._axis_group_loc, as_array=True),
                 function_items=partial(self._axis_group_loc_items, as_array=True),
+                function_reduce=self._axis_group_reduce,
+                function_transform=self._axis_group_transform,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
@@ -3888,10 +4147,72 @@ class Frame(ContainerOperand):
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
                 )
 
+    #---------------------------------------------------------------------------
+    @property
+    def iter_resample(self) -> IterNodeResample['Frame']:
+        '''
+        Iterator of :obj:`Frame` grouped by buckets of a unit of time, found from a datetime64 index (axis=0) or columns (axis=1).
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=self._axis_resample,
+                function_items=self._axis_resample_items,
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.VALUES,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    @property
+    def iter_resample_items(self) -> IterNodeResample['Frame']:
+        '''
+        Iterator of pairs of bucket label, :obj:`Frame` grouped by buckets of a unit of time, found from a datetime64 index (axis=0) or columns (axis=1).
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=self._axis_resample,
+                function_items=self._axis_resample_items,
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.ITEMS,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    #---------------------------------------------------------------------------
+    @property
+    def iter_resample_array(self) -> IterNodeResample['Frame']:
+        '''
+        Iterator of ``np.ndarray`` grouped by buckets of a unit of time, found from a datetime64 index (axis=0) or columns (axis=1).
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=partial(self._axis_resample, as_array=True),
+                function_items=partial(self._axis_resample_items, as_array=True),
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.VALUES,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    @property
+    def iter_resample_array_items(self) -> IterNodeResample['Frame']:
+        '''
+        Iterator of pairs of bucket label, ``np.ndarray`` grouped by buckets of a unit of time, found from a datetime64 index (axis=0) or columns (axis=1).
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=partial(self._axis_resample, as_array=True),
+                function_items=partial(self._axis_resample_items, as_array=True),
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.ITEMS,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
     #---------------------------------------------------------------------------
     @property # type: ignore
     @doc_inject(selector='window')
-    def iter_window(self) -> IterNodeWindow['Frame']:
+    def iter_window(self) -> IterNodeWindowReducible['Frame']:
         '''
         Iterator of windowed values, where values are given as a :obj:`Frame`.
 
@@ -3899,17 +4220,18 @@ class Frame(ContainerOperand):
         '''
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
                 )
 
     @property # type: ignore
     @doc_inject(selector='window')
-    def iter_window_items(self) -> IterNodeWindow['Frame']:
+    def iter_window_items(self) -> IterNodeWindowReducible['Frame']:
         '''
         Iterator of pairs of label, windowed values, where values are given as a :obj:`Frame`.
 
@@ -3917,17 +4239,18 @@ class Frame(ContainerOperand):
         '''
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
                 )
 
     @property # type: ignore
     @doc_inject(selector='window')
-    def iter_window_array(self) -> IterNodeWindow['Frame']:
+    def iter_window_array(self) -> IterNodeWindowArray['Frame']:
         '''
         Iterator of windowed values, where values are given as a :obj:`np.array`.
 
@@ -3935,17 +4258,19 @@ class Frame(ContainerOperand):
         '''
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowArray(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
+                function_view=self._axis_window_view,
                 )
 
     @property # type: ignore
     @doc_inject(selector='window')
-    def iter_window_array_items(self) -> IterNodeWindow['Frame']:
+    def iter_window_array_items(self) -> IterNodeWindowArray['Frame']:
         '''
         Iterator of pairs of label, windowed values, where values are given as a :obj:`np.array`.
 
@@ -3953,12 +4278,14 @@ class Frame(ContainerOperand):
         '''
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowArray(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
+                function_view=self._axis_window_view,
                 )
 
     #---------------------------------------------------------------------------
@@ -5539,6 +5866,52 @@ class Frame(ContainerOperand):
     #---------------------------------------------------------------------------
     # grouping methods
 
+    def _group_plan_iloc(self,
+            key: GetItemKeyType,
+            *,
+            axis: int,
+            ) -> GroupPlan:
+        '''
+        Return the :obj:`GroupPlan` for grouping rows (axis 0) by the column(s), or columns (axis 1) by the row(s), selected by iloc ``key``. As a ``Frame`` is immutable, plans are cached and reused for all subsequent groupings on the same key.
+        '''
+        if isinstance(key, INT_TYPES):
+            key_cache: tp.Hashable = int(key)
+        else: # normalize slices, lists, and arrays to a tuple of positions
+            count = self._blocks._shape[1] if axis == 0 else self._blocks._shape[0]
+            key_cache = tuple(PositionsAllocator.get(count)[key].tolist())
+
+        if self.STATIC:
+            if not hasattr(self, '_group_plans'):
+                self._group_plans = {}
+            plan = self._group_plans.get((axis, key_cache))
+            if plan is not None:
+                return plan
+
+        plan = self._blocks.group_plan(axis=axis, key=key)
+        if self.STATIC:
+            self._group_plans[(axis, key_cache)] = plan
+        return plan
+
+    def group_plan(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0,
+            ) -> GroupPlan:
+        '''
+        Return a :obj:`GroupPlan`, describing the ordering, boundaries, and labels of groups formed by the values selected by ``key``. Plans are cached on immutable ``Frame`` and reused by ``iter_group``, ``iter_group_array``, grouped reductions, and ``pivot``.
+
+        Args:
+            key: label(s) of the column(s) (axis 0) or row(s) (axis 1) to group by.
+            axis: 0 groups rows, 1 groups columns.
+        '''
+        if axis == 0:
+            iloc_key = self._columns._loc_to_iloc(key)
+        elif axis == 1:
+            iloc_key = self._index._loc_to_iloc(key)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+        return self._group_plan_iloc(iloc_key, axis=axis)
+
     def _axis_group_final_iter(self, *,
             axis: int,
             as_array: bool,
@@ -5599,47 +5972,30 @@ class Frame(ContainerOperand):
             drop_mask = np.full(shape, True, dtype=DTYPE_BOOL)
             drop_mask[key] = False
 
-        # NOTE: in limited studies using stable does not show significant overhead
-        kind = DEFAULT_STABLE_SORT_KIND if stable else DEFAULT_FAST_SORT_KIND
-        try:
-            blocks, ordering = blocks.sort(key=key, axis=not axis, kind=kind)
-            use_sorted = True
-        except TypeError:
-            use_sorted = False
-            ordering = None
+        # NOTE: plans always use a stable sort; in limited studies using stable does not show significant overhead
+        plan = self._group_plan_iloc(key, axis=axis)
+        if axis == 0:
+            blocks = blocks._extract(row_key=plan.ordering)
+        else:
+            blocks = blocks._extract(column_key=plan.ordering)
+
+        group_iter = group_sorted(
+                blocks=blocks,
+                axis=axis,
+                key=key,
+                drop=drop,
+                as_array=as_array,
+                group_plan=plan,
+                )
 
         columns: IndexBase
         index: IndexBase
-
-        if use_sorted:
-            group_iter = group_sorted(
-                    blocks=blocks,
-                    axis=axis,
-                    key=key,
-                    drop=drop,
-                    as_array=as_array,
-                    )
-            if axis == 0:
-                index = self._index
-                columns = self._columns if not drop else self._columns[drop_mask] # type: ignore
-            else:
-                index = self._index if not drop else self._index[drop_mask] # type: ignore
-                columns = self._columns
-
+        if axis == 0:
+            index = self._index
+            columns = self._columns if not drop else self._columns[drop_mask] # type: ignore
         else:
-            group_iter = group_match(
-                    blocks=blocks,
-                    axis=axis,
-                    key=key,
-                    drop=drop,
-                    as_array=as_array,
-                    )
-            if axis == 0:
-                index = self._index
-                columns = self._columns if not drop else self._columns[drop_mask] # type: ignore
-            else:
-                index = self._index if not drop else self._index[drop_mask] # type: ignore
-                columns = self._columns
+            index = self._index if not drop else self._index[drop_mask] # type: ignore
+            columns = self._columns
 
         yield from self._axis_group_final_iter(
                 axis=axis,
@@ -5647,7 +6003,7 @@ class Frame(ContainerOperand):
                 group_iter=group_iter,
                 index=index,
                 columns=columns,
-                ordering=ordering,
+                ordering=plan.ordering,
                 )
 
     def _axis_group_loc_items(self,
@@ -5691,6 +6047,251 @@ class Frame(ContainerOperand):
                 as_array=as_array,
                 ))
 
+    def _axis_group_reduce(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            func: tp.Union[str, tp.Mapping[tp.Hashable, tp.Any]],
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> 'Frame':
+        '''
+        Reduce each group to a single row (axis 0) or column (axis 1) with ``group_reduce()``, without creating a container per group.
+
+        Args:
+            key: as given to ``iter_group``.
+            func: name of a reduction in ``GROUP_REDUCTIONS``, applied to all columns (axis 0) or rows (axis 1); or, a mapping of column (axis 0) or row (axis 1) label to one or more reduction names or functions, to be applied to only those columns or rows.
+        '''
+        if axis == 0: # row groups, selecting columns for group by
+            iloc_key = self._columns._loc_to_iloc(key)
+        elif axis == 1: # column groups, selecting rows for group by
+            iloc_key = self._index._loc_to_iloc(key)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        plan = self._group_plan_iloc(iloc_key, axis=axis)
+        if axis == 0:
+            blocks = self._blocks._extract(row_key=plan.ordering)
+        else:
+            blocks = self._blocks._extract(column_key=plan.ordering)
+        starts = plan.starts
+        labels = plan.labels
+
+        try:
+            name_index = name_filter(key)
+        except TypeError:
+            name_index = None
+        index_group = Index(
+                array2d_to_tuples(labels) if labels.ndim == 2 else labels,
+                name=name_index,
+                )
+
+        drop_mask = None
+        if drop:
+            shape = blocks._shape[1] if axis == 0 else blocks._shape[0]
+            drop_mask = np.full(shape, True, dtype=DTYPE_BOOL)
+            drop_mask[iloc_key] = False
+
+        return self._axis_group_blocks_reduce(
+                blocks=blocks,
+                starts=starts,
+                index_group=index_group,
+                axis=axis,
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                drop_mask=drop_mask,
+                )
+
+    def _axis_group_blocks_reduce(self, *,
+            blocks: TypeBlocks,
+            starts: np.ndarray,
+            index_group: IndexBase,
+            axis: int,
+            func: tp.Union[str, tp.Mapping[tp.Hashable, tp.Any]],
+            skipna: bool,
+            ddof: int,
+            drop_mask: tp.Optional[np.ndarray] = None,
+            ) -> 'Frame':
+        '''
+        Given ``blocks`` ordered such that groups are contiguous, beginning at ``starts``, reduce each group to a single row (axis 0) or column (axis 1) labelled by ``index_group``.
+
+        Args:
+            drop_mask: if provided, a Boolean array of the columns (axis 0) or rows (axis 1) to retain; not used with a mapping of reductions.
+        '''
+        if not isinstance(func, str):
+            return self._axis_group_aggregate(
+                    blocks=blocks,
+                    starts=starts,
+                    index_group=index_group,
+                    axis=axis,
+                    func_map=func,
+                    skipna=skipna,
+                    ddof=ddof,
+                    )
+
+        if axis == 0:
+            if drop_mask is not None:
+                blocks = blocks._extract(column_key=drop_mask)
+            tb = TypeBlocks.from_blocks(
+                    group_reduce(b, starts, func=func, skipna=skipna, ddof=ddof)
+                    for b in blocks._blocks
+                    )
+            return self.__class__(tb,
+                    index=index_group,
+                    columns=self._columns if drop_mask is None else self._columns[drop_mask],
+                    own_data=True,
+                    own_index=True,
+                    )
+
+        # NOTE: for axis 1, reduce a consolidated array of the sorted columns
+        values = blocks.values if drop_mask is None else blocks._extract_array(row_key=drop_mask)
+        array = group_reduce(values.T, starts, func=func, skipna=skipna, ddof=ddof).T
+        return self.__class__(array,
+                index=self._index if drop_mask is None else self._index[drop_mask],
+                columns=index_group,
+                )
+
+    def _axis_group_transform(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            func: str,
+            **kwargs: tp.Any,
+            ) -> 'Frame':
+        '''
+        Transform the values of each group with ``group_transform()``, returning a ``Frame`` of the same shape, aligned to the original index (axis 0) or columns (axis 1).
+
+        Args:
+            key: as given to ``iter_group``.
+            func: name of a transform in ``GROUP_TRANSFORMS``.
+            kwargs: passed to ``group_transform()``.
+        '''
+        if axis == 0: # row groups, selecting columns for group by
+            iloc_key = self._columns._loc_to_iloc(key)
+        elif axis == 1: # column groups, selecting rows for group by
+            iloc_key = self._index._loc_to_iloc(key)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        drop_mask = None
+        if drop:
+            shape = self._blocks._shape[1] if axis == 0 else self._blocks._shape[0]
+            drop_mask = np.full(shape, True, dtype=DTYPE_BOOL)
+            drop_mask[iloc_key] = False
+
+        return self._axis_group_plan_transform(
+                plan=self._group_plan_iloc(iloc_key, axis=axis),
+                axis=axis,
+                func=func,
+                drop_mask=drop_mask,
+                **kwargs,
+                )
+
+    def _axis_group_plan_transform(self, *,
+            plan: GroupPlan,
+            axis: int,
+            func: str,
+            drop_mask: tp.Optional[np.ndarray] = None,
+            **kwargs: tp.Any,
+            ) -> 'Frame':
+        '''
+        Transform the values of each group of ``plan`` with ``group_transform()``, returning a ``Frame`` aligned to the original index (axis 0) or columns (axis 1).
+
+        Args:
+            drop_mask: if provided, a Boolean array of the columns (axis 0) or rows (axis 1) to retain.
+        '''
+        # positions that restore the original order from the group order
+        restore = np.empty(len(plan.ordering), dtype=DTYPE_INT_DEFAULT)
+        restore[plan.ordering] = PositionsAllocator.get(len(plan.ordering))
+
+        if axis == 0:
+            blocks = self._blocks._extract(row_key=plan.ordering, column_key=drop_mask)
+            tb = TypeBlocks.from_blocks(
+                    group_transform(b, plan.starts, func=func, **kwargs)
+                    for b in blocks._blocks
+                    )
+            return self.__class__(tb._extract(row_key=restore),
+                    index=self._index,
+                    columns=self._columns if drop_mask is None else self._columns[drop_mask],
+                    name=self._name,
+                    own_data=True,
+                    )
+
+        # NOTE: for axis 1, transform a consolidated array of the ordered columns
+        values = self._blocks._extract_array(
+                row_key=drop_mask,
+                column_key=plan.ordering,
+                )
+        array = group_transform(values.T, plan.starts, func=func, **kwargs).T[:, restore]
+        array.flags.writeable = False
+        return self.__class__(array,
+                index=self._index if drop_mask is None else self._index[drop_mask],
+                columns=self._columns,
+                name=self._name,
+                own_data=True,
+                )
+
+    def _axis_group_aggregate(self, *,
+            blocks: TypeBlocks,
+            starts: np.ndarray,
+            index_group: IndexBase,
+            axis: int,
+            func_map: tp.Mapping[tp.Hashable, tp.Any],
+            skipna: bool,
+            ddof: int,
+            ) -> 'Frame':
+        '''
+        Given ``blocks`` ordered such that groups are contiguous, apply one or more reductions to each selected column (axis 0) or row (axis 1). If any label is given more than one function, the labels of the result are hierarchical, pairing each label with the name of the function.
+        '''
+        if not func_map:
+            if axis == 0:
+                return self.__class__(index=index_group)
+            return self.__class__(columns=index_group)
+
+        labels = self._columns if axis == 0 else self._index
+        arrays = []
+        labels_result = []
+        hierarchical = False
+
+        for label, funcs in func_map.items():
+            iloc_key = labels._loc_to_iloc(label)
+            if not isinstance(iloc_key, INT_TYPES):
+                raise KeyError(f'label {label!r} does not select a single {"column" if axis == 0 else "row"}')
+            if isinstance(funcs, str) or callable(funcs):
+                funcs = (funcs,)
+            else:
+                hierarchical = True
+            if axis == 0:
+                array = blocks._extract_array_column(iloc_key)
+            else:
+                array = blocks._extract_array(row_key=iloc_key)
+            names = set()
+            for f in funcs:
+                name = f if isinstance(f, str) else f.__name__
+                if name in names:
+                    raise RuntimeError(f'reductions of label {label!r} must have unique names; {name!r} is repeated (use named functions rather than lambdas)')
+                names.add(name)
+                arrays.append(group_reduce(array, starts, func=f, skipna=skipna, ddof=ddof))
+                labels_result.append((label, name))
+
+        index_result: IndexBase
+        if hierarchical:
+            index_result = self._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels(labels_result)
+        else:
+            index_result = self._COLUMNS_CONSTRUCTOR(label for label, _ in labels_result)
+
+        frame = self.__class__(TypeBlocks.from_blocks(arrays),
+                index=index_group,
+                columns=index_result,
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+        return frame if axis == 0 else frame.T
+
     #-----------------------------------------------------------------------
     def _axis_group_labels_items(self,
             depth_level: DepthLevelSpecifier = 0,
@@ -5857,6 +6458,118 @@ class Frame(ContainerOperand):
                 group_source=group_source,
                 ))
 
+    #---------------------------------------------------------------------------
+    def _axis_resample_items(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            as_array: bool = False,
+            ) -> tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]:
+        '''
+        Args:
+            unit: a datetime64 unit, such as "h" or "D", by which the datetime64 index (axis 0) or columns (axis 1) are bucketed.
+            step: the number of units per bucket.
+        '''
+        if axis == 0:
+            labels = self._index
+        elif axis == 1:
+            labels = self._columns
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        plan, index_group, contiguous = index_resample_plan(labels, unit, step)
+        extractor = self._extract_array if as_array else self._extract
+        ends = plan.starts + plan.sizes
+
+        for label, start, end in zip(index_group, plan.starts, ends):
+            key = slice(start, end) if contiguous else plan.ordering[start: end]
+            if axis == 0:
+                yield label, extractor(row_key=key)
+            else:
+                yield label, extractor(column_key=key)
+
+    def _axis_resample(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            as_array: bool = False,
+            ) -> tp.Iterator[tp.Any]:
+        yield from (x for _, x in self._axis_resample_items(
+                unit,
+                step=step,
+                axis=axis,
+                as_array=as_array,
+                ))
+
+    def _axis_resample_reduce(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            func: tp.Union[str, tp.Mapping[tp.Hashable, tp.Any]],
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> 'Frame':
+        '''
+        Reduce each bucket to a single row (axis 0) or column (axis 1) with ``group_reduce()``, without creating a container per bucket.
+
+        Args:
+            unit: as given to ``iter_resample``.
+            func: name of a reduction in ``GROUP_REDUCTIONS``, or a mapping of column (axis 0) or row (axis 1) label to one or more reduction names or functions.
+        '''
+        if axis == 0:
+            labels = self._index
+        elif axis == 1:
+            labels = self._columns
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        plan, index_group, contiguous = index_resample_plan(labels, unit, step)
+        if contiguous:
+            blocks = self._blocks
+        elif axis == 0:
+            blocks = self._blocks._extract(row_key=plan.ordering)
+        else:
+            blocks = self._blocks._extract(column_key=plan.ordering)
+
+        return self._axis_group_blocks_reduce(
+                blocks=blocks,
+                starts=plan.starts,
+                index_group=index_group,
+                axis=axis,
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                )
+
+    def _axis_resample_transform(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            func: str,
+            **kwargs: tp.Any,
+            ) -> 'Frame':
+        '''
+        Transform the values of each bucket with ``group_transform()``, returning a ``Frame`` of the same shape, aligned to the original index (axis 0) or columns (axis 1).
+        '''
+        if axis == 0:
+            labels = self._index
+        elif axis == 1:
+            labels = self._columns
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        plan, _, _ = index_resample_plan(labels, unit, step)
+        return self._axis_group_plan_transform(
+                plan=plan,
+                axis=axis,
+                func=func,
+                **kwargs,
+                )
+
     #---------------------------------------------------------------------------
     def _axis_window_items(self, *,
             size: int,
@@ -5912,6 +6625,130 @@ class Frame(ContainerOperand):
                 as_array=as_array
                 ))
 
+    def _axis_window_reduce(self, *,
+            func: str,
+            skipna: bool = True,
+            ddof: int = 0,
+            min_periods: tp.Optional[int] = None,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> 'Frame':
+        '''
+        Reduce each window to a row (axis 0) or a column (axis 1), returning a ``Frame`` labelled by window labels. Unless windows are defined with ``window_func``, ``window_valid``, or ``size_increment``, all windows are reduced per block with ``window_reduce()``, without creating a window per iteration.
+        '''
+        if axis == 0:
+            labels = self._index
+        elif axis == 1:
+            labels = self._columns
+        else:
+            raise AxisInvalid(f'no support for axis {axis}')
+
+        if window_func is not None or window_valid is not None or size_increment:
+            # windows can only be determined by iteration
+            items = window_reduce_items(
+                    self._axis_window_items(
+                            size=size,
+                            axis=axis,
+                            step=step,
+                            window_sized=window_sized,
+                            window_func=window_func,
+                            window_valid=window_valid,
+                            label_shift=label_shift,
+                            start_shift=start_shift,
+                            size_increment=size_increment,
+                            as_array=True,
+                            ),
+                    func=func,
+                    skipna=skipna,
+                    ddof=ddof,
+                    min_periods=min_periods,
+                    axis=axis,
+                    )
+            labels_constructor = partial(labels.from_labels, name=labels._name)
+            if axis == 0:
+                return self.__class__.from_records_items(items, # type: ignore
+                        columns=self._columns,
+                        name=self._name,
+                        index_constructor=labels_constructor,
+                        )
+            return self.__class__.from_items(items, # type: ignore
+                    index=self._index,
+                    name=self._name,
+                    columns_constructor=labels_constructor,
+                    )
+
+        lefts, positions = window_positions(
+                count=len(labels),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                )
+        func_reduce = partial(window_reduce,
+                lefts=lefts,
+                size=size,
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                min_periods=min_periods,
+                )
+        if axis == 0:
+            tb = TypeBlocks.from_blocks(func_reduce(b) for b in self._blocks._blocks)
+            return self.__class__(tb,
+                    index=labels._extract_iloc(positions),
+                    columns=self._columns,
+                    name=self._name,
+                    own_data=True,
+                    own_index=True,
+                    )
+
+        # NOTE: for axis 1, reduce a consolidated array of the columns
+        return self.__class__(func_reduce(self._blocks.values.T).T,
+                index=self._index,
+                columns=labels._extract_iloc(positions),
+                name=self._name,
+                )
+
+    def _axis_window_view(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> tp.Tuple[IndexBase, np.ndarray, np.ndarray]:
+        '''
+        Return the labels of the windowed axis, the positions of the labels of all windows, and an immutable view of all windows, with windows along axis 0. Windows are a view of the consolidated values, and thus only avoid copying values if the ``Frame`` has a single block.
+        '''
+        if axis == 0:
+            labels = self._index
+        elif axis == 1:
+            labels = self._columns
+        else:
+            raise AxisInvalid(f'no support for axis {axis}')
+        if window_func is not None or window_valid is not None or size_increment:
+            raise RuntimeError('windows defined by window_func, window_valid, or size_increment cannot be viewed')
+        lefts, positions = window_positions(
+                count=len(labels),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                )
+        view = window_view(self._blocks.values, lefts, size, step, axis=axis)
+        return labels, positions, view
 
     #---------------------------------------------------------------------------
 
@@ -7592,6 +8429,13 @@ class Frame(ContainerOperand):
             frame = self._extract_loc_columns(all_fields)
         else:
             frame = self
+        # the outer grouping is on columns fields if provided, else index fields; rows are the same in frame and self, so a (cached) plan from self can be used
+        group_fields = columns_fields if columns_fields else index_fields
+        group_plan = self._group_plan_iloc(
+                self._columns._loc_to_iloc(group_fields if len(group_fields) > 1 else group_fields[0]),
+                axis=0,
+                )
+
         from static_frame.core.pivot import pivot_core
         return pivot_core(frame=frame,
                 index_fields=index_fields,
@@ -7602,6 +8446,7 @@ class Frame(ContainerOperand):
                 func_map=func_map,
                 fill_value=fill_value,
                 index_constructor=index_constructor,
+                group_plan=group_plan,
                 )
 
 
@@ -7619,75 +8464,34 @@ class Frame(ContainerOperand):
         Args:
             depth_level: selection of columns depth or depth to move onto the index.
         '''
-        values_src = self._blocks
-        index_src = self.index
-        columns_src = self.columns
-        dtype_fill = np.array(fill_value).dtype
-        dtypes_src = self.dtypes.values
-
         if is_fill_value_factory_initializer(fill_value):
             raise InvalidFillValue(fill_value, 'pivot_stack')
 
-        pim = pivot_index_map(
-                index_src=columns_src,
+        # NOTE: groups of the columns remain as columns; targets of the columns extend the index
+        pac = pivot_axis_codes(
+                index_src=self._columns,
                 depth_level=depth_level,
-                dtypes_src=dtypes_src,
-                )
-        targets_unique = pim.targets_unique
-        group_to_target_map = pim.group_to_target_map
-        group_to_dtype = pim.group_to_dtype
-
-        pdc = pivot_derive_constructors(
-                contract_src=columns_src,
-                expand_src=index_src,
-                group_select=pim.group_select,
-                group_depth=pim.group_depth,
-                target_select=pim.target_select,
-                group_to_target_map=group_to_target_map,
-                expand_is_columns=False,
-                frame_cls=self.__class__,
-                )
-
-        group_has_fill = {g: False for g in group_to_target_map}
-
-        # We produce the resultant frame by iterating over the source index labels (providing outer-most hierarchical levels), we then extend each label of that index with each unique "target", or new labels coming from the columns.
-        def records_items() -> tp.Iterator[tp.Tuple[tp.Hashable, tp.Sequence[tp.Any]]]:
-            for row_idx, outer in enumerate(index_src): # iter tuple or label
-                for target in targets_unique: # target is always a tuple
-                    # derive the new index
-                    if index_src.depth == 1:
-                        key = (outer,) + target # type: ignore
-                    else:
-                        key = outer + target # type: ignore
-                    record = []
-                    # this is equivalent to iterating over the new columns to get a row of data
-                    for group, target_map in group_to_target_map.items():
-                        if target in target_map:
-                            col_idx = target_map[target]
-                            record.append(values_src._extract(row_idx, col_idx))
-                        else:
-                            record.append(fill_value)
-                            group_has_fill[group] = True
-                    yield key, record
-
-        # NOTE: this is a generator to defer evaluation until after records_items() is run, whereby group_has_fill is populated
-        def dtypes() -> tp.Iterator[np.dtype]:
-            for g, dtype in group_to_dtype.items():
-                if group_has_fill[g]:
-                    yield resolve_dtype(dtype, dtype_fill)
-                else:
-                    yield dtype
-
-        return self.from_records_items( # type: ignore
-                records_items(),
-                index_constructor=pdc.expand_constructor,
-                columns=pdc.contract_dst,
-                columns_constructor=pdc.contract_constructor,
+                hierarchy_cls=self._COLUMNS_HIERARCHY_CONSTRUCTOR,
+                )
+        index = pivot_expand_index(
+                expand_src=self._index,
+                target_levels=pac.target_levels,
+                target_indexers=pac.target_indexers,
+                hierarchy_cls=IndexHierarchy,
+                )
+        blocks = TypeBlocks.from_blocks(pivot_stack_blocks(
+                blocks=self._blocks,
+                table=pac.table,
+                fill_value=fill_value,
+                ))
+        return self.__class__(blocks,
+                index=index,
+                columns=pac.group_index,
                 name=self.name,
-                dtypes=dtypes(),
+                own_data=True,
+                own_index=True,
                 )
 
-
     def pivot_unstack(self,
             depth_level: DepthLevelSpecifier = -1,
             *,
@@ -7699,67 +8503,32 @@ class Frame(ContainerOperand):
         Args:
             depth_level: selection of index depth or depth to move onto the columns.
         '''
-        values_src = self._blocks
-        index_src = self.index
-        columns_src = self.columns
-
-        dtype_fill = np.array(fill_value).dtype
-        dtypes_src = self.dtypes.values # dtypes need to be "exploded" into new columns
-
         if is_fill_value_factory_initializer(fill_value):
             raise InvalidFillValue(fill_value, 'pivot_unstack')
 
-        # We produce the resultant frame by iterating over the source index labels (providing outer-most hierarchical levels), we then extend each label of that index with each unique "target", or new labels coming from the columns.
-
-        pim = pivot_index_map(
-                index_src=index_src,
+        # NOTE: groups of the index remain as the index; targets of the index extend the columns
+        pac = pivot_axis_codes(
+                index_src=self._index,
                 depth_level=depth_level,
-                dtypes_src=None,
+                hierarchy_cls=IndexHierarchy,
                 )
-        targets_unique = pim.targets_unique
-        group_to_target_map = pim.group_to_target_map
-
-        pdc = pivot_derive_constructors(
-                contract_src=index_src,
-                expand_src=columns_src,
-                group_select=pim.group_select,
-                group_depth=pim.group_depth,
-                target_select=pim.target_select,
-                group_to_target_map=group_to_target_map,
-                expand_is_columns=True,
-                frame_cls=self.__class__,
+        columns = pivot_expand_index(
+                expand_src=self._columns,
+                target_levels=pac.target_levels,
+                target_indexers=pac.target_indexers,
+                hierarchy_cls=self._COLUMNS_HIERARCHY_CONSTRUCTOR,
                 )
-
-        def items() -> tp.Iterator[tp.Tuple[tp.Hashable, np.ndarray]]:
-            for col_idx, outer in enumerate(columns_src): # iter tuple or label
-                dtype_src_col = dtypes_src[col_idx]
-
-                for target in targets_unique: # target is always a tuple
-                    if columns_src.depth == 1:
-                        key = (outer,) + target # type: ignore
-                    else:
-                        key = outer + target # type: ignore
-                    # cannot allocate array as do not know dtype until after fill_value
-                    values = []
-                    for group, target_map in group_to_target_map.items():
-                        if target in target_map:
-                            row_idx = target_map[target]
-                            dtype = dtype_src_col
-                            values.append(values_src._extract(row_idx, col_idx))
-                        else:
-                            values.append(fill_value)
-                            dtype = resolve_dtype(dtype_src_col, dtype_fill)
-
-                    array = np.array(values, dtype=dtype)
-                    array.flags.writeable = False
-                    yield key, array
-
-        return self.from_items( # type: ignore
-                items(),
-                index=pdc.contract_dst,
-                index_constructor=pdc.contract_constructor,
-                columns_constructor=pdc.expand_constructor,
+        blocks = TypeBlocks.from_blocks(pivot_unstack_blocks(
+                blocks=self._blocks,
+                table=pac.table,
+                fill_value=fill_value,
+                ))
+        return self.__class__(blocks,
+                index=pac.group_index,
+                columns=columns,
                 name=self.name,
+                own_data=True,
+                own_columns=True,
                 )
 
     #---------------------------------------------------------------------------
@@ -8846,9 +9615,10 @@ class Frame(ContainerOperand):
             include_columns_name: bool = False,
             merge_hierarchical_labels: bool = True,
             store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            constant_memory: bool = False,
             ) -> None:
         '''
-        Write the Frame as single-sheet XLSX file.
+        Write the Frame as single-sheet XLSX file. If ``constant_memory`` is True, the sheet is written row by row with bounded memory; hierarchical index labels are not merged.
         '''
         from static_frame.core.store_config import StoreConfig
         from static_frame.core.store_xlsx import StoreXLSX
@@ -8864,6 +9634,7 @@ class Frame(ContainerOperand):
         st.write(((label, self),),
                 config=config,
                 store_filter=store_filter,
+                constant_memory=constant_memory,
                 )
 
     def to_sqlite(self,
@@ -8872,10 +9643,13 @@ class Frame(ContainerOperand):
             label: tp.Hashable = STORE_LABEL_DEFAULT,
             include_index: bool = True,
             include_columns: bool = True,
+            journal_mode: tp.Optional[str] = None,
+            synchronous: tp.Optional[str] = None,
+            blob_layout: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
             ) -> None:
         '''
-        Write the Frame as single-table SQLite file.
+        Write the Frame as single-table SQLite file. Optionally, ``journal_mode`` and ``synchronous`` PRAGMA values (such as "WAL" and "OFF") can be set for faster writing. If ``blob_layout`` is True, the table is written as NPY bytes, one BLOB per array, rather than as rows.
         '''
         from static_frame.core.store_config import StoreConfig
         from static_frame.core.store_sqlite import StoreSQLite
@@ -8893,6 +9667,9 @@ class Frame(ContainerOperand):
         st = StoreSQLite(fp)
         st.write(((label, self),),
                 config=config,
+                journal_mode=journal_mode,
+                synchronous=synchronous,
+                blob_layout=blob_layout,
                 # store_filter=store_filter,
                 )
 
@@ -8902,10 +9679,11 @@ class Frame(ContainerOperand):
             label: tp.Hashable = STORE_LABEL_DEFAULT,
             include_index: bool = True,
             include_columns: bool = True,
+            append: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
             ) -> None:
         '''
-        Write the Frame as single-table SQLite file.
+        Write the Frame as single-table HDF5 file. If ``append`` is True, rows are appended to an existing table of the same ``label``, or a new table is added to an existing file.
         '''
         from static_frame.core.store_config import StoreConfig
         from static_frame.core.store_hdf5 import StoreHDF5
@@ -8923,6 +9701,7 @@ class Frame(ContainerOperand):
         st = StoreHDF5(fp)
         st.write(((label, self),),
                 config=config,
+                append=append,
                 # store_filter=store_filter,
                 )
 
@@ -0,0 +1,686 @@
+import typing as tp
+from functools import partial
+
+import numpy as np
+from arraykit import resolve_dtype_iter
+
+from static_frame.core.rank import RankMethod
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_DATETIME_KIND
+from static_frame.core.util import DTYPE_INEXACT_KINDS
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_NA_KINDS
+from static_frame.core.util import DTYPE_NAT_KINDS
+from static_frame.core.util import DTYPE_NUMERICABLE_KINDS
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import EMPTY_ARRAY
+from static_frame.core.util import EMPTY_ARRAY_INT
+from static_frame.core.util import AnyCallable
+from static_frame.core.util import PositionsAllocator
+from static_frame.core.util import UFunc
+from static_frame.core.util import array_factorize
+from static_frame.core.util import array_ufunc_axis_skipna
+from static_frame.core.util import full_for_fill
+from static_frame.core.util import isna_array
+from static_frame.core.util import iterable_to_array_1d
+from static_frame.core.util import ufunc_dtype_to_dtype
+from static_frame.core.util import ufunc_unique1d
+
+NAT_INT = np.iinfo(DTYPE_INT_DEFAULT).min
+
+# names of reductions supported by group_reduce()
+GROUP_REDUCTIONS = (
+        'count',
+        'first',
+        'last',
+        'max',
+        'mean',
+        'min',
+        'nunique',
+        'std',
+        'sum',
+        'var',
+        )
+
+def group_starts(group_source: np.ndarray) -> np.ndarray:
+    '''
+    Given a sorted group source (1D, or 2D with a group per row), return the positions at which each contiguous group starts.
+    '''
+    count = len(group_source)
+    if count == 0:
+        return np.empty(0, dtype=DTYPE_INT_DEFAULT)
+
+    if group_source.ndim == 2:
+        change = (group_source[1:] != group_source[:-1]).any(axis=1)
+    else:
+        change = group_source[1:] != group_source[:-1]
+
+    starts = np.empty(change.sum() + 1, dtype=DTYPE_INT_DEFAULT)
+    starts[0] = 0
+    starts[1:] = np.flatnonzero(change) + 1
+    return starts
+
+class GroupPlan:
+    '''
+    A reusable description of how the positions of an axis form groups: the ``ordering`` that makes each group contiguous (retaining the original order within each group), the ``starts`` of each group in that ordering, and the group ``labels``. Groups are ordered by sorted label when labels are sortable, else by first appearance.
+    '''
+    __slots__ = (
+            'ordering',
+            'starts',
+            'labels',
+            )
+
+    ordering: np.ndarray
+    starts: np.ndarray
+    labels: np.ndarray
+
+    @classmethod
+    def from_ordering(cls,
+            group_source: np.ndarray,
+            ordering: np.ndarray,
+            ) -> 'GroupPlan':
+        '''
+        Args:
+            group_source: 1D array, or 2D array with a group per row, in original order.
+            ordering: stable sort positions of ``group_source``.
+        '''
+        ordered = group_source[ordering]
+        starts = group_starts(ordered)
+        return cls(ordering, starts, ordered[starts])
+
+    @classmethod
+    def from_locations(cls,
+            labels: np.ndarray,
+            locations: np.ndarray,
+            ) -> 'GroupPlan':
+        '''
+        Args:
+            labels: unique group labels.
+            locations: for each position, the index of its label in ``labels``.
+        '''
+        ordering = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+        return cls(ordering, group_starts(locations[ordering]), labels)
+
+    @classmethod
+    def from_factorize(cls,
+            group_source: np.ndarray,
+            ) -> 'GroupPlan':
+        '''
+        Derive a plan without sorting by hashing values; groups are ordered by first appearance.
+
+        Args:
+            group_source: 1D array, or 2D array with a group per row, in original order.
+        '''
+        first, codes = array_factorize(group_source)
+        return cls.from_locations(group_source[first], codes)
+
+    def __init__(self,
+            ordering: np.ndarray,
+            starts: np.ndarray,
+            labels: np.ndarray,
+            ) -> None:
+        for array in (ordering, starts, labels):
+            array.flags.writeable = False
+        self.ordering = ordering
+        self.starts = starts
+        self.labels = labels
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} groups={len(self.starts)} count={len(self.ordering)}>'
+
+    @property
+    def sizes(self) -> np.ndarray:
+        '''The number of positions in each group.'''
+        return _group_sizes(self.starts, len(self.ordering))
+
+    @property
+    def codes(self) -> np.ndarray:
+        '''For each position in original order, the integer index of its group.'''
+        codes = np.empty(len(self.ordering), dtype=DTYPE_INT_DEFAULT)
+        codes[self.ordering] = np.repeat(
+                np.arange(len(self.starts), dtype=DTYPE_INT_DEFAULT),
+                self.sizes,
+                )
+        codes.flags.writeable = False
+        return codes
+
+def resample_plan(
+        values: np.ndarray,
+        unit: str,
+        step: int = 1,
+        ) -> GroupPlan:
+    '''
+    Return a :obj:`GroupPlan` of buckets of ``step`` ``unit`` (a datetime64 unit, such as "h" or "D") for an array of datetime64 ``values``, where each bucket is labelled by its start as a datetime64 of ``unit``. Buckets of more than one unit are aligned to multiples of ``step`` from the epoch; weeks ("W") are also aligned to the epoch, 1970-01-01, and thus begin on Thursdays. If values are non-decreasing, as is common for time series, each bucket is already contiguous and boundaries are found in one pass without sorting; otherwise, values are ordered with a stable sort.
+    '''
+    if values.dtype.kind != DTYPE_DATETIME_KIND:
+        raise RuntimeError(f'resampling requires datetime64 values, not {values.dtype}')
+    if step < 1:
+        raise RuntimeError('resampling step must be greater than 0')
+
+    dtype = np.dtype(f'datetime64[{unit}]')
+    # casting to a coarser unit floors values; NaT is the minimum integer, and sorts first
+    buckets = values.astype(dtype).view(DTYPE_INT_DEFAULT)
+    if step > 1:
+        is_nat = buckets == NAT_INT
+        buckets = buckets - buckets % step
+        buckets[is_nat] = NAT_INT
+
+    if len(buckets) < 2 or (buckets[1:] >= buckets[:-1]).all():
+        ordering = PositionsAllocator.get(len(buckets))
+        starts = group_starts(buckets)
+        return GroupPlan(ordering, starts, buckets[starts].view(dtype))
+
+    ordering = np.argsort(buckets, kind=DEFAULT_STABLE_SORT_KIND)
+    plan = GroupPlan.from_ordering(buckets, ordering)
+    return GroupPlan(plan.ordering, plan.starts, plan.labels.view(dtype))
+
+#-------------------------------------------------------------------------------
+
+def _group_sizes(starts: np.ndarray, count: int) -> np.ndarray:
+    ends = np.empty(len(starts), dtype=DTYPE_INT_DEFAULT)
+    ends[:-1] = starts[1:]
+    ends[-1:] = count
+    return ends - starts
+
+def _group_count_valid(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''Return the count of values per group, excluding NA values if ``skipna``.'''
+    if skipna and array.dtype.kind in DTYPE_NA_KINDS:
+        return np.add.reduceat(~isna_array(array), starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+    if array.ndim == 2:
+        return np.repeat(sizes[:, np.newaxis], array.shape[1], axis=1)
+    return sizes
+
+def _group_sum(
+        array: np.ndarray,
+        starts: np.ndarray,
+        skipna: bool,
+        ) -> np.ndarray:
+    if skipna and array.dtype.kind in DTYPE_INEXACT_KINDS:
+        array = np.where(np.isnan(array), 0, array)
+    return np.add.reduceat(array,
+            starts,
+            axis=0,
+            dtype=ufunc_dtype_to_dtype(np.sum, array.dtype),
+            )
+
+def _group_mean(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        skipna: bool,
+        ) -> np.ndarray:
+    dtype = ufunc_dtype_to_dtype(np.mean, array.dtype)
+    total = _group_sum(array, starts, skipna).astype(dtype, copy=False)
+    count = _group_count_valid(array, starts, sizes, skipna)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (total / count).astype(dtype, copy=False)
+
+def _group_var(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        skipna: bool,
+        ddof: int,
+        ) -> np.ndarray:
+    dtype = ufunc_dtype_to_dtype(np.var, array.dtype)
+    mean = _group_mean(array, starts, sizes, skipna)
+    # two-pass algorithm: sum the squared deviations from the mean of each group
+    deviation = array - np.repeat(mean, sizes, axis=0)
+    if skipna and array.dtype.kind in DTYPE_INEXACT_KINDS:
+        deviation[np.isnan(deviation)] = 0
+    squares = np.add.reduceat(deviation * deviation, starts, axis=0)
+    count = _group_count_valid(array, starts, sizes, skipna) - ddof
+    with np.errstate(divide='ignore', invalid='ignore'):
+        post = squares / count
+    post[count <= 0] = np.nan
+    return post.astype(dtype, copy=False)
+
+def _group_nunique(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''Count of unique values per group for a 1D array.'''
+    # order values within each group, retaining the order of groups
+    codes = np.repeat(np.arange(len(starts)), sizes)
+    values = array[np.lexsort((array, codes))]
+
+    distinct = np.empty(len(values), dtype=DTYPE_BOOL)
+    distinct[:1] = True
+    # NOTE: np.not_equal has no loop for str dtypes before NumPy 1.25; the operator does
+    distinct[1:] = values[1:] != values[:-1]
+    distinct[starts] = True
+    if skipna and array.dtype.kind in DTYPE_NA_KINDS:
+        distinct &= ~isna_array(values)
+    return np.add.reduceat(distinct, starts, dtype=DTYPE_INT_DEFAULT)
+
+def _group_reduce_iter(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        func: tp.Callable[[np.ndarray], tp.Any],
+        ) -> np.ndarray:
+    '''Fallback for dtypes without vectorized kernels: call ``func`` on each group of a 1D array.'''
+    values = (func(array[start: start + size]) for start, size in zip(starts, sizes))
+    post, _ = iterable_to_array_1d(values, count=len(starts))
+    return post
+
+def _group_reduce_columns(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        func: tp.Callable[[np.ndarray], tp.Any],
+        ) -> np.ndarray:
+    if array.ndim == 1:
+        return _group_reduce_iter(array, starts, sizes, func)
+
+    columns = [_group_reduce_iter(array[:, i], starts, sizes, func)
+            for i in range(array.shape[1])]
+    if not columns:
+        return np.empty((len(starts), 0), dtype=array.dtype)
+    dtypes = {c.dtype for c in columns}
+    post = np.empty((len(starts), len(columns)),
+            dtype=dtypes.pop() if len(dtypes) == 1 else object)
+    for i, column in enumerate(columns):
+        post[:, i] = column
+    return post
+
+def _nunique(array: np.ndarray, skipna: bool) -> int:
+    if skipna:
+        array = array[~isna_array(array)]
+    return len(ufunc_unique1d(array))
+
+UFUNC_GROUP_REDUCE: tp.Dict[str, tp.Tuple[UFunc, UFunc]] = {
+        'max': (np.max, np.nanmax),
+        'mean': (np.mean, np.nanmean),
+        'min': (np.min, np.nanmin),
+        'std': (np.std, np.nanstd),
+        'sum': (np.sum, np.nansum),
+        'var': (np.var, np.nanvar),
+        }
+
+def group_reduce(
+        array: np.ndarray,
+        starts: np.ndarray,
+        *,
+        func: tp.Union[str, AnyCallable],
+        skipna: bool = True,
+        ddof: int = 0,
+        ) -> np.ndarray:
+    '''
+    Reduce each group of ``array`` to a single row, where groups are contiguous runs of rows beginning at the positions in ``starts``. Numeric (and, for ``min`` and ``max``, datetime64) arrays are reduced in one vectorized pass with ``reduceat``; other arrays are reduced per group with the same functions used by :obj:`Frame` reductions.
+
+    Args:
+        array: 1D or 2D array, ordered such that each group is contiguous; 2D arrays are reduced per column.
+        starts: ascending positions at which each group starts, beginning with 0.
+        func: name of a reduction in ``GROUP_REDUCTIONS``, or a function that, given a 1D array of the values of a group, returns an element.
+        skipna: exclude NA values.
+        ddof: delta degrees of freedom, for ``std`` and ``var``.
+    '''
+    if not callable(func) and func not in GROUP_REDUCTIONS:
+        raise NotImplementedError(f'no group reduction for {func}')
+
+    kind = array.dtype.kind
+    sizes = _group_sizes(starts, len(array))
+    post: np.ndarray
+
+    if not len(starts): # no groups
+        post = array[:0]
+    elif callable(func):
+        post = _group_reduce_columns(array, starts, sizes, func)
+    elif func == 'first':
+        post = array[starts]
+    elif func == 'last':
+        post = array[starts + sizes - 1]
+    elif func == 'count':
+        post = _group_count_valid(array, starts, sizes, skipna)
+    elif func == 'nunique':
+        if kind == 'O':
+            func_group = partial(_nunique, skipna=skipna)
+            post = _group_reduce_columns(array, starts, sizes, func_group)
+        elif array.ndim == 2:
+            post = np.array([_group_nunique(array[:, i], starts, sizes, skipna)
+                    for i in range(array.shape[1])]).T
+        else:
+            post = _group_nunique(array, starts, sizes, skipna)
+    elif kind in DTYPE_NUMERICABLE_KINDS and kind != 'c' or (
+            kind in DTYPE_NAT_KINDS and (func == 'min' or func == 'max')):
+        if func == 'sum':
+            post = _group_sum(array, starts, skipna)
+        elif func == 'mean':
+            post = _group_mean(array, starts, sizes, skipna)
+        elif func == 'var':
+            post = _group_var(array, starts, sizes, skipna, ddof)
+        elif func == 'std':
+            post = np.sqrt(_group_var(array, starts, sizes, skipna, ddof))
+        else: # min, max: fmin, fmax ignore NaN
+            if func == 'min':
+                ufunc = np.fmin if skipna and kind in DTYPE_INEXACT_KINDS else np.minimum
+            else:
+                ufunc = np.fmax if skipna and kind in DTYPE_INEXACT_KINDS else np.maximum
+            post = ufunc.reduceat(array, starts, axis=0)
+    else:
+        ufunc, ufunc_skipna = UFUNC_GROUP_REDUCE[func]
+        if func == 'std' or func == 'var':
+            ufunc = partial(ufunc, ddof=ddof)
+            ufunc_skipna = partial(ufunc_skipna, ddof=ddof)
+        func_group = partial(array_ufunc_axis_skipna,
+                skipna=skipna,
+                axis=0,
+                ufunc=ufunc,
+                ufunc_skipna=ufunc_skipna,
+                )
+        post = _group_reduce_columns(array, starts, sizes, func_group)
+
+    post.flags.writeable = False
+    return post
+
+#-------------------------------------------------------------------------------
+# transforms: results have the same shape as the source, with each value derived from only the values of its group
+
+# names of transforms supported by group_transform()
+GROUP_TRANSFORMS = (
+        'cumprod',
+        'cumsum',
+        'fillna_backward',
+        'fillna_forward',
+        'rank_dense',
+        'rank_max',
+        'rank_mean',
+        'rank_min',
+        'rank_ordinal',
+        'shift',
+        )
+
+def _group_offsets(starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    '''For each position, the distance from the start of its group.'''
+    return PositionsAllocator.get(sizes.sum()) - np.repeat(starts, sizes)
+
+def _group_scan(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        ufunc: UFunc,
+        ) -> np.ndarray:
+    '''
+    Inclusive scan of an associative ``ufunc`` that restarts at each group. Rather than a per-group loop, in each of log2(max group size) passes every value is combined with the value at a doubling distance behind it in the same group. Used for products, object values, and many small groups of inexact sums.
+    '''
+    post = array.copy()
+    offsets = _group_offsets(starts, sizes)
+    if array.ndim == 2:
+        offsets = offsets[:, np.newaxis]
+    size_max = sizes.max() if len(sizes) else 0
+    distance = 1
+    while distance < size_max:
+        np.copyto(post[distance:],
+                ufunc(post[:-distance], post[distance:]),
+                where=offsets[distance:] >= distance,
+                )
+        distance *= 2
+    return post
+
+# the minimum mean size of groups for which cumulative sums of inexact values are taken per group, rather than with _group_scan()
+GROUP_CUMSUM_LOOP_SIZE = 64
+
+def _group_cumsum(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        ) -> np.ndarray:
+    '''
+    Cumulative sum that restarts at each group. For integers, one cumulative sum of all values is taken, and the total preceding each group is subtracted; as integer sums wrap, this is exact. For inexact values, where subtracting a large preceding total would lose precision, a cumulative sum is taken per group if groups are large, otherwise the values are scanned.
+    '''
+    if array.dtype.kind in DTYPE_INT_KINDS:
+        totals = np.cumsum(array, axis=0)
+        prefix = np.zeros((len(starts),) + array.shape[1:], dtype=totals.dtype)
+        prefix[1:] = totals[starts[1:] - 1]
+        totals -= np.repeat(prefix, sizes, axis=0)
+        return totals
+
+    if array.dtype.kind in DTYPE_INEXACT_KINDS and len(array) >= len(starts) * GROUP_CUMSUM_LOOP_SIZE:
+        post = np.empty_like(array)
+        for start, size in zip(starts, sizes):
+            np.cumsum(array[start: start + size], axis=0, out=post[start: start + size])
+        return post
+
+    return _group_scan(array, starts, sizes, np.add)
+
+def _group_cumulative(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        skipna: bool,
+        ufunc: UFunc,
+        unity: int,
+        ) -> np.ndarray:
+    if array.dtype.kind in DTYPE_STR_KINDS:
+        # as with Frame.cumsum(), strings are concatenated as objects
+        array = array.astype(DTYPE_OBJECT)
+    dtype = ufunc_dtype_to_dtype(np.cumsum, array.dtype)
+    if dtype is not None:
+        array = array.astype(dtype, copy=False)
+    if skipna and array.dtype.kind in DTYPE_INEXACT_KINDS:
+        array = np.where(np.isnan(array), unity, array)
+    if ufunc is np.add:
+        return _group_cumsum(array, starts, sizes)
+    return _group_scan(array, starts, sizes, ufunc)
+
+def _group_shift(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        shift: int,
+        fill_value: tp.Any,
+        ) -> np.ndarray:
+    offsets = _group_offsets(starts, sizes)
+    if shift >= 0:
+        targets = np.flatnonzero(offsets >= shift)
+    else:
+        targets = np.flatnonzero(offsets < np.repeat(sizes, sizes) + shift)
+    post = full_for_fill(array.dtype, array.shape, fill_value)
+    post[targets] = array[targets - shift]
+    return post
+
+def _group_fillna_directional(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        forward: bool,
+        limit: int,
+        ) -> np.ndarray:
+    '''Fill NA values with the nearest preceding (or following) non-NA value in the same group, filling at most ``limit`` consecutive values if ``limit`` is greater than zero.'''
+    isna = isna_array(array)
+    if not isna.any():
+        return array
+
+    count = len(array)
+    positions = PositionsAllocator.get(count)
+    bounds = np.repeat(starts if forward else starts + sizes, sizes)
+    if array.ndim == 2:
+        positions = positions[:, np.newaxis]
+        bounds = bounds[:, np.newaxis]
+
+    # for each position, the position of the nearest non-NA value in the fill direction
+    if forward:
+        source = np.maximum.accumulate(np.where(isna, -1, positions), axis=0)
+        fill = isna & (source >= bounds)
+        if limit > 0:
+            fill &= positions - source <= limit
+    else:
+        source = np.minimum.accumulate(np.where(isna, count, positions)[::-1], axis=0)[::-1]
+        fill = isna & (source < bounds)
+        if limit > 0:
+            fill &= source - positions <= limit
+
+    post = array.copy()
+    if array.ndim == 1:
+        post[fill] = array[source[fill]]
+    else:
+        rows, columns = np.nonzero(fill)
+        post[rows, columns] = array[source[rows, columns], columns]
+    return post
+
+def _group_rank(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        method: RankMethod,
+        ascending: bool,
+        start: int,
+        ) -> np.ndarray:
+    '''Rank the values of a 1D array within each group, following the conventions of ``rank_1d()``.'''
+    count = len(array)
+    if count == 0:
+        return EMPTY_ARRAY if method == RankMethod.MEAN else EMPTY_ARRAY_INT
+
+    codes = np.repeat(PositionsAllocator.get(len(starts)), sizes)
+    # order by value within each group; lexsort is stable, retaining order of ties
+    order = np.lexsort((array, codes))
+    group_first = np.repeat(starts, sizes)
+    positions = PositionsAllocator.get(count)
+
+    if method == RankMethod.ORDINAL:
+        ranks = positions - group_first
+    else:
+        values = array[order]
+        is_unique = np.empty(count, dtype=DTYPE_BOOL)
+        is_unique[0] = True
+        is_unique[1:] = values[1:] != values[:-1]
+        is_unique[starts] = True
+        run = np.cumsum(is_unique) - 1 # index of each run of ties
+
+        if method == RankMethod.DENSE:
+            ranks = run - run[group_first]
+        else:
+            run_first = np.flatnonzero(is_unique)
+            run_last = np.empty(len(run_first), dtype=DTYPE_INT_DEFAULT)
+            run_last[:-1] = run_first[1:] - 1
+            run_last[-1] = count - 1
+            low = run_first[run] - group_first
+            high = run_last[run] - group_first
+            if method == RankMethod.MEAN:
+                ranks = 0.5 * (low + high)
+            elif (method == RankMethod.MAX) == ascending:
+                ranks = high
+            else:
+                ranks = low
+
+    if not ascending:
+        ranks = np.repeat(np.maximum.reduceat(ranks, starts), sizes) - ranks
+    if start != 0:
+        ranks = ranks + start
+
+    post = np.empty(count, dtype=ranks.dtype)
+    post[order] = ranks
+    return post
+
+def _group_rank_skipna(
+        array: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        *,
+        method: RankMethod,
+        skipna: bool,
+        ascending: bool,
+        start: int,
+        fill_value: tp.Any,
+        ) -> np.ndarray:
+    if not skipna or array.dtype.kind not in DTYPE_NA_KINDS:
+        return _group_rank(array, starts, sizes, method, ascending, start)
+
+    isna = isna_array(array)
+    if not isna.any():
+        return _group_rank(array, starts, sizes, method, ascending, start)
+
+    # rank only non-NA values, within the groups that remain
+    valid = ~isna
+    codes = np.repeat(PositionsAllocator.get(len(starts)), sizes)[valid]
+    starts_valid = group_starts(codes)
+    ranks = _group_rank(array[valid],
+            starts_valid,
+            _group_sizes(starts_valid, len(codes)),
+            method,
+            ascending,
+            start,
+            )
+    post = full_for_fill(ranks.dtype, len(array), fill_value)
+    post[valid] = ranks
+    return post
+
+def group_transform(
+        array: np.ndarray,
+        starts: np.ndarray,
+        *,
+        func: str,
+        skipna: bool = True,
+        shift: int = 1,
+        limit: int = 0,
+        ascending: bool = True,
+        start: int = 0,
+        fill_value: tp.Any = np.nan,
+        ) -> np.ndarray:
+    '''
+    Transform each group of ``array``, where groups are contiguous runs of rows beginning at the positions in ``starts``, returning an array of the same shape in which each value is derived only from values of its group.
+
+    Args:
+        array: 1D or 2D array, ordered such that each group is contiguous; 2D arrays are transformed per column.
+        starts: ascending positions at which each group starts, beginning with 0.
+        func: name of a transform in ``GROUP_TRANSFORMS``.
+        skipna: for cumulative transforms, treat NA as unity; for ranks, do not rank NA values, filling them with ``fill_value``.
+        shift: for ``shift``, the count of positions to shift values within each group.
+        limit: for fills, the maximum count of consecutive NA values to fill; 0 fills all.
+        ascending: for ranks, rank values from smallest to largest.
+        start: for ranks, the value of the first rank.
+        fill_value: for ``shift``, the value of positions with no shifted value; for ranks, the value of NA positions.
+    '''
+    if func not in GROUP_TRANSFORMS:
+        raise NotImplementedError(f'no group transform for {func}')
+
+    sizes = _group_sizes(starts, len(array))
+    post: np.ndarray
+
+    if not len(starts): # no groups
+        post = array[:0]
+    elif func == 'cumsum':
+        post = _group_cumulative(array, starts, sizes, skipna, np.add, 0)
+    elif func == 'cumprod':
+        post = _group_cumulative(array, starts, sizes, skipna, np.multiply, 1)
+    elif func == 'shift':
+        post = _group_shift(array, starts, sizes, shift, fill_value)
+    elif func == 'fillna_forward' or func == 'fillna_backward':
+        post = _group_fillna_directional(array, starts, sizes, func == 'fillna_forward', limit)
+    else: # rank
+        func_rank = partial(_group_rank_skipna,
+                starts=starts,
+                sizes=sizes,
+                method=RankMethod(func[5:]),
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+        if array.ndim == 1:
+            post = func_rank(array)
+        else:
+            columns = [func_rank(array[:, i]) for i in range(array.shape[1])]
+            post = np.empty(array.shape,
+                    dtype=resolve_dtype_iter(c.dtype for c in columns) if columns else array.dtype)
+            for i, column in enumerate(columns):
+                post[:, i] = column
+
+    if post is array:
+        return array
+    post.flags.writeable = False
+    return post
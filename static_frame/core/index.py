@@ -64,8 +64,10 @@ from static_frame.core.util import UFunc
 from static_frame.core.util import argsort_array
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_from_pickle
 from static_frame.core.util import array_sample
 from static_frame.core.util import array_shift
+from static_frame.core.util import array_to_pickle
 from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import arrays_equal
 from static_frame.core.util import concat_resolved
@@ -358,6 +360,28 @@ class Index(IndexBase):
             setattr(self, key, value)
         self._labels.flags.writeable = False
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]: #type: ignore
+        '''
+        Reduce to labels and name, such that, with pickle protocol 5, labels can be transferred as an out-of-band buffer; the mapping and positions are recreated when unpickled.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        return (self.__class__._from_pickle,
+                (array_to_pickle(self._labels), self._labels.dtype, self._name, self._map is None),
+                )
+
+    @classmethod
+    def _from_pickle(cls,
+            labels: np.ndarray,
+            dtype: np.dtype,
+            name: NameType,
+            loc_is_iloc: bool,
+            ) -> 'Index':
+        labels = array_from_pickle(labels, dtype)
+        if loc_is_iloc:
+            return cls(labels, name=name, loc_is_iloc=True)
+        return cls(labels, name=name)
+
     def __deepcopy__(self: I, memo: tp.Dict[int, tp.Any]) -> I:
         assert not self._recache # __deepcopy__ is implemented on derived GO class
         obj = self.__class__.__new__(self.__class__)
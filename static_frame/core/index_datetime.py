@@ -569,6 +569,21 @@ _DTYPE_TO_CLASS = {cls._DTYPE: cls for cls in (
         IndexNanosecond
         )}
 
+def resample_unit_to_index_cls(unit: str) -> tp.Type[IndexDatetime]:
+    '''
+    Return the :obj:`IndexDatetime` subclass with which to label buckets of a resampling ``unit``. Weeks, which have no :obj:`IndexDatetime` subclass, are labelled by their first day with :obj:`IndexDate`; as weeks are aligned to the epoch (1970-01-01), they begin on Thursdays.
+    '''
+    if unit == 'W':
+        return IndexDate
+    try:
+        cls = _DTYPE_TO_CLASS.get(np.dtype(f'datetime64[{unit}]'))
+    except TypeError:
+        cls = None
+    if cls is None:
+        units = ', '.join(repr(np.datetime_data(dtype)[0]) for dtype in _DTYPE_TO_CLASS)
+        raise RuntimeError(f'resampling unit must be one of {units}, or \'W\', not {unit!r}')
+    return cls
+
 def dtype_to_index_cls(static: bool, dtype: np.dtype) -> tp.Type[Index]:
     '''
     Given an the class of the Index from which this is valled, as well as the dtype of the resultant array, return the appropriate Index class.
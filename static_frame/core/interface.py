@@ -334,6 +334,7 @@ class Features:
         '__dict__',
         '__format__',
         '__getattribute__',
+        '__getstate__',
         '__hash__',
         '__init_sbclass__',
         '__lshift__',
@@ -645,7 +646,7 @@ class InterfaceRecord(tp.NamedTuple):
         # TypeBlocks as iter_* methods that are just functions
         if hasattr(obj, 'CLS_DELEGATE'):
             cls_interface = obj.CLS_DELEGATE #type: ignore
-            # IterNodeDelegate or IterNodeDelegateMapable
+            # IterNodeDelegate, IterNodeDelegateMapable, IterNodeDelegateReducible, IterNodeDelegateWindowReducible, or IterNodeDelegateWindowArray
 
             for field in cls_interface.INTERFACE: # apply, map, etc
                 delegate_obj = getattr(cls_interface, field)
@@ -1078,6 +1079,9 @@ class InterfaceSummary(Features):
                 yield from InterfaceRecord.gen_from_astype(**kwargs)
             elif callable(obj) and name.startswith('from_') or name == '__init__':
                 yield from InterfaceRecord.gen_from_constructor(**kwargs)
+            elif name.startswith('iter_') and inspect.ismethod(obj) and isinstance(obj.__self__, type):
+                # class methods that return iterators of containers (e.g. iter_sql) are constructors
+                yield from InterfaceRecord.gen_from_constructor(**kwargs)
             elif callable(obj) and name.startswith('to_'):
                 yield from InterfaceRecord.gen_from_exporter(**kwargs)
             elif name.startswith('iter_'):
@@ -3,8 +3,7 @@ Tools for iterators in Series and Frame. These components are imported by both s
 '''
 
 import typing as tp
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
 from enum import Enum
 from functools import partial
 
@@ -13,19 +12,22 @@ from arraykit import name_filter
 
 from static_frame.core.container_util import group_from_container
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.util import CHUNKSIZE_AUTO
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import AnyCallable
+from static_frame.core.util import ChunkSize
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import Mapping
 from static_frame.core.util import NameType
 from static_frame.core.util import TupleConstructorType
+from static_frame.core.util import estimate_cost
+from static_frame.core.util import get_executor
 from static_frame.core.util import iterable_to_array_1d
-
-# import multiprocessing as mp
-# mp_context = mp.get_context('spawn')
-
+from static_frame.core.util import map_by_cost
+from static_frame.core.window import WINDOW_VIEW_REDUCTIONS
+from static_frame.core.window import window_view_reduce
 
 # from static_frame.core.util import array_from_iterator
 
@@ -34,6 +36,7 @@ if tp.TYPE_CHECKING:
     from static_frame.core.bus import Bus  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.index import Index  # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.quilt import Quilt  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.series import Series  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.yarn import Yarn  # pylint: disable=W0611 #pragma: no cover
@@ -56,6 +59,7 @@ class IterNodeApplyType(Enum):
     SERIES_ITEMS_GROUP_LABELS = 3
     FRAME_ELEMENTS = 4
     INDEX_LABELS = 5
+    SERIES_ITEMS_RESAMPLE = 6
 
     @classmethod
     def is_items(cls, apply_type: 'IterNodeApplyType') -> bool:
@@ -108,15 +112,37 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
 
     #---------------------------------------------------------------------------
 
+    @staticmethod
+    def _pool_map(
+            pool: Executor,
+            func: AnyCallable,
+            args: tp.Iterable[tp.Any],
+            *,
+            max_workers: tp.Optional[int],
+            chunksize: ChunkSize,
+            cost: tp.Callable[[tp.Any], int],
+            ) -> tp.Iterator[tp.Any]:
+        '''
+        Map ``func`` over ``args`` with ``pool``, in chunks of ``chunksize`` or, if ``chunksize`` is ``'auto'``, in chunks of balanced ``cost``.
+        '''
+        if chunksize == CHUNKSIZE_AUTO:
+            return map_by_cost(pool,
+                    func,
+                    args,
+                    cost=cost,
+                    max_workers=max_workers,
+                    )
+        return pool.map(func, args, chunksize=chunksize)
+
     def _apply_iter_items_parallel(self,
             func: AnyCallable,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
 
-        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
-
         if not callable(func): # support array, Series mapping
             func = getattr(func, '__getitem__')
 
@@ -129,34 +155,61 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
                 for k, v in self._func_items():
                     func_keys.append(k)
                     yield v
+            cost = estimate_cost
         else:
             def arg_gen() -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]: #pylint: disable=E0102
                 for k, v in self._func_items():
                     func_keys.append(k)
                     yield k, v
-
-        with pool_executor(max_workers=max_workers) as executor:
-            yield from zip(func_keys,
-                    executor.map(func, arg_gen(), chunksize=chunksize)
+            cost = lambda arg: estimate_cost(arg[1])
+
+        with get_executor(executor,
+                max_workers=max_workers,
+                use_threads=use_threads,
+                mp_context=mp_context,
+                ) as pool:
+            results = self._pool_map(pool,
+                    func,
+                    arg_gen(),
+                    max_workers=max_workers,
+                    chunksize=chunksize,
+                    cost=cost,
                     )
+            # keys are appended as args are consumed, always before the corresponding result is yielded
+            for v, k in zip(results, func_keys):
+                yield k, v
 
     def _apply_iter_parallel(self,
             func: AnyCallable,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> tp.Iterator[tp.Any]:
 
-        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
         if not callable(func): # support array, Series mapping
             func = getattr(func, '__getitem__')
 
-        # use side effect list population to create keys when iterating over values
-        arg_gen = (self._func_values if self._yield_type is IterNodeType.VALUES
-                else self._func_items)
-
-        with pool_executor(max_workers=max_workers) as executor:
-            yield from executor.map(func, arg_gen(), chunksize=chunksize)
+        if self._yield_type is IterNodeType.VALUES:
+            arg_gen = self._func_values
+            cost = estimate_cost
+        else:
+            arg_gen = self._func_items
+            cost = lambda arg: estimate_cost(arg[1])
+
+        with get_executor(executor,
+                max_workers=max_workers,
+                use_threads=use_threads,
+                mp_context=mp_context,
+                ) as pool:
+            yield from self._pool_map(pool,
+                    func,
+                    arg_gen(),
+                    max_workers=max_workers,
+                    chunksize=chunksize,
+                    cost=cost,
+                    )
 
     #---------------------------------------------------------------------------
     @doc_inject(selector='apply')
@@ -234,8 +287,10 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             name: NameType = None,
             index_constructor: tp.Optional[IndexConstructor]= None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
-            use_threads: bool = False
+            chunksize: ChunkSize = 1,
+            use_threads: bool = False,
+            executor: tp.Optional[Executor] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> FrameOrSeries:
         '''
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -248,6 +303,8 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {max_workers}
             {chunksize}
             {use_threads}
+            {executor}
+            {mp_context}
         '''
         # only use when we need pairs of values to dynamically create an Index
         if IterNodeApplyType.is_items(self._apply_type):
@@ -259,6 +316,8 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
                         max_workers=max_workers,
                         chunksize=chunksize,
                         use_threads=use_threads,
+                        executor=executor,
+                        mp_context=mp_context,
                         ),
                 dtype=dtype,
                 name=name,
@@ -492,6 +551,501 @@ class IterNodeDelegateMapable(IterNodeDelegate[FrameOrSeries]):
                 index_constructor=index_constructor,
                 )
 
+
+class IterNodeDelegateReducible(IterNodeDelegate[FrameOrSeries]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode` for groups, providing iteration, a family of apply methods, and reductions and transforms of all groups that do not create a container per group.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            '_func_transform',
+            )
+
+    INTERFACE = IterNodeDelegate.INTERFACE + (
+            'aggregate',
+            'count',
+            'cumprod',
+            'cumsum',
+            'fillna_backward',
+            'fillna_forward',
+            'first',
+            'last',
+            'max',
+            'mean',
+            'min',
+            'nunique',
+            'rank_dense',
+            'rank_max',
+            'rank_mean',
+            'rank_min',
+            'rank_ordinal',
+            'shift',
+            'std',
+            'sum',
+            'var',
+            )
+
+    def __init__(self,
+            func_reduce: tp.Callable[..., FrameOrSeries],
+            func_transform: tp.Callable[..., FrameOrSeries],
+            **kwargs: tp.Any,
+            ) -> None:
+        '''
+        Args:
+            func_reduce: Callable that, given the name of a reduction and its arguments, returns a container with a row (or column) per group.
+            func_transform: Callable that, given the name of a transform and its arguments, returns a container aligned to the source container.
+        '''
+        IterNodeDelegate.__init__(self, **kwargs)
+        self._func_reduce: tp.Callable[..., FrameOrSeries] = func_reduce
+        self._func_transform: tp.Callable[..., FrameOrSeries] = func_transform
+
+    #---------------------------------------------------------------------------
+
+    def aggregate(self,
+            func_map: tp.Mapping[tp.Hashable, tp.Any],
+            *,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> FrameOrSeries:
+        '''
+        Return one or more reductions of each group, for each selected column (axis 0) or row (axis 1), from a single ordering of groups.
+
+        Args:
+            func_map: A mapping of label to a reduction, or to an iterable of reductions, where a reduction is the name of a reduction method (i.e., "sum" or "max") or a function that, given a 1D array of the values of a group, returns an element. If any label is given an iterable of reductions, labels are hierarchical, pairing each label with the name of the reduction; the reductions of a label must thus have unique names. If ``func_map`` is empty, a container of only the groups is returned.
+            skipna: Exclude NA values from named reductions.
+            ddof: Delta degrees of freedom for "std" and "var".
+        '''
+        return self._func_reduce(func=func_map, skipna=skipna, ddof=ddof)
+
+    def count(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the count of non-NA values in each group.
+        '''
+        return self._func_reduce(func='count', skipna=skipna)
+
+    def cumprod(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the cumulative product of the values of each group, aligned to the source container.
+        '''
+        return self._func_transform(func='cumprod', skipna=skipna)
+
+    def cumsum(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the cumulative sum of the values of each group, aligned to the source container.
+        '''
+        return self._func_transform(func='cumsum', skipna=skipna)
+
+    def fillna_backward(self,
+            limit: int = 0,
+            ) -> FrameOrSeries:
+        '''
+        Return the values of each group after feeding backward the next non-null (NaN or None) observation of the same group across contiguous nulls, aligned to the source container.
+
+        Args:
+            limit: Maximum count of consecutive nulls to fill; 0 fills all.
+        '''
+        return self._func_transform(func='fillna_backward', limit=limit)
+
+    def fillna_forward(self,
+            limit: int = 0,
+            ) -> FrameOrSeries:
+        '''
+        Return the values of each group after feeding forward the last non-null (NaN or None) observation of the same group across contiguous nulls, aligned to the source container.
+
+        Args:
+            limit: Maximum count of consecutive nulls to fill; 0 fills all.
+        '''
+        return self._func_transform(func='fillna_forward', limit=limit)
+
+    def first(self) -> FrameOrSeries:
+        '''
+        Return the first values of each group.
+        '''
+        return self._func_reduce(func='first')
+
+    def last(self) -> FrameOrSeries:
+        '''
+        Return the last values of each group.
+        '''
+        return self._func_reduce(func='last')
+
+    def max(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the maximum of each group.
+        '''
+        return self._func_reduce(func='max', skipna=skipna)
+
+    def mean(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the mean of each group.
+        '''
+        return self._func_reduce(func='mean', skipna=skipna)
+
+    def min(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the minimum of each group.
+        '''
+        return self._func_reduce(func='min', skipna=skipna)
+
+    def nunique(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the count of unique values in each group.
+        '''
+        return self._func_reduce(func='nunique', skipna=skipna)
+
+    def rank_dense(self, *,
+            skipna: bool = True,
+            ascending: bool = True,
+            start: int = 0,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Rank the values of each group as compactly as possible, where ties get the same value, and ranks are contiguous (potentially non-unique) integers, aligned to the source container.
+
+        Args:
+            skipna: If True, NA values are not ranked and are filled with ``fill_value``.
+            ascending: If True, rank from smallest to largest.
+            start: The value of the first rank.
+            fill_value: The value of NA positions if ``skipna`` is True.
+        '''
+        return self._func_transform(func='rank_dense',
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+
+    def rank_max(self, *,
+            skipna: bool = True,
+            ascending: bool = True,
+            start: int = 0,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Rank the values of each group, where tied values are assigned the maximum ordinal rank; ranks are potentially non-contiguous and non-unique integers, aligned to the source container.
+
+        Args:
+            skipna: If True, NA values are not ranked and are filled with ``fill_value``.
+            ascending: If True, rank from smallest to largest.
+            start: The value of the first rank.
+            fill_value: The value of NA positions if ``skipna`` is True.
+        '''
+        return self._func_transform(func='rank_max',
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+
+    def rank_mean(self, *,
+            skipna: bool = True,
+            ascending: bool = True,
+            start: int = 0,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Rank the values of each group, where tied values are assigned the mean of the ordinal ranks; ranks are potentially non-contiguous and non-unique floats, aligned to the source container.
+
+        Args:
+            skipna: If True, NA values are not ranked and are filled with ``fill_value``.
+            ascending: If True, rank from smallest to largest.
+            start: The value of the first rank.
+            fill_value: The value of NA positions if ``skipna`` is True.
+        '''
+        return self._func_transform(func='rank_mean',
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+
+    def rank_min(self, *,
+            skipna: bool = True,
+            ascending: bool = True,
+            start: int = 0,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Rank the values of each group, where tied values are assigned the minimum ordinal rank; ranks are potentially non-contiguous and non-unique integers, aligned to the source container.
+
+        Args:
+            skipna: If True, NA values are not ranked and are filled with ``fill_value``.
+            ascending: If True, rank from smallest to largest.
+            start: The value of the first rank.
+            fill_value: The value of NA positions if ``skipna`` is True.
+        '''
+        return self._func_transform(func='rank_min',
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+
+    def rank_ordinal(self, *,
+            skipna: bool = True,
+            ascending: bool = True,
+            start: int = 0,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Rank the values of each group distinctly, where ties get distinct values that maintain their ordering, and ranks are contiguous unique integers, aligned to the source container.
+
+        Args:
+            skipna: If True, NA values are not ranked and are filled with ``fill_value``.
+            ascending: If True, rank from smallest to largest.
+            start: The value of the first rank.
+            fill_value: The value of NA positions if ``skipna`` is True.
+        '''
+        return self._func_transform(func='rank_ordinal',
+                skipna=skipna,
+                ascending=ascending,
+                start=start,
+                fill_value=fill_value,
+                )
+
+    def shift(self,
+            shift: int = 1,
+            *,
+            fill_value: tp.Any = np.nan,
+            ) -> FrameOrSeries:
+        '''
+        Return the values of each group shifted by ``shift`` positions within the group, aligned to the source container; positions without a shifted value are filled with ``fill_value``.
+        '''
+        return self._func_transform(func='shift', shift=shift, fill_value=fill_value)
+
+    def std(self, *,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> FrameOrSeries:
+        '''
+        Return the standard deviation of each group.
+        '''
+        return self._func_reduce(func='std', skipna=skipna, ddof=ddof)
+
+    def sum(self, *,
+            skipna: bool = True,
+            ) -> FrameOrSeries:
+        '''
+        Return the sum of each group.
+        '''
+        return self._func_reduce(func='sum', skipna=skipna)
+
+    def var(self, *,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> FrameOrSeries:
+        '''
+        Return the variance of each group.
+        '''
+        return self._func_reduce(func='var', skipna=skipna, ddof=ddof)
+
+
+class IterNodeDelegateWindowReducible(IterNodeDelegate[FrameOrSeries]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode` for windows, providing iteration, a family of apply methods, and reductions of all windows that do not create a container per window.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            )
+
+    INTERFACE = IterNodeDelegate.INTERFACE + (
+            'count',
+            'max',
+            'mean',
+            'min',
+            'std',
+            'sum',
+            'var',
+            )
+
+    def __init__(self,
+            func_reduce: tp.Callable[..., FrameOrSeries],
+            **kwargs: tp.Any,
+            ) -> None:
+        '''
+        Args:
+            func_reduce: Callable that, given the name of a reduction and its arguments, returns a container with a row (or column) per window.
+        '''
+        IterNodeDelegate.__init__(self, **kwargs)
+        self._func_reduce: tp.Callable[..., FrameOrSeries] = func_reduce
+
+    #---------------------------------------------------------------------------
+
+    def count(self, *,
+            skipna: bool = True,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the count of non-NA values in each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='count', skipna=skipna, min_periods=min_periods)
+
+    def max(self, *,
+            skipna: bool = True,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the maximum of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='max', skipna=skipna, min_periods=min_periods)
+
+    def mean(self, *,
+            skipna: bool = True,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the mean of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='mean', skipna=skipna, min_periods=min_periods)
+
+    def min(self, *,
+            skipna: bool = True,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the minimum of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='min', skipna=skipna, min_periods=min_periods)
+
+    def std(self, *,
+            skipna: bool = True,
+            ddof: int = 0,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the standard deviation of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='std', skipna=skipna, ddof=ddof, min_periods=min_periods)
+
+    def sum(self, *,
+            skipna: bool = True,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the sum of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='sum', skipna=skipna, min_periods=min_periods)
+
+    def var(self, *,
+            skipna: bool = True,
+            ddof: int = 0,
+            min_periods: tp.Optional[int] = None,
+            ) -> FrameOrSeries:
+        '''
+        Return the variance of each window.
+
+        Args:
+            min_periods: Minimum count of non-NA values required in a window to produce a value; windows with fewer are NaN.
+        '''
+        return self._func_reduce(func='var', skipna=skipna, ddof=ddof, min_periods=min_periods)
+
+
+class IterNodeDelegateWindowArray(IterNodeDelegateWindowReducible[FrameOrSeries]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode` for windows of arrays, additionally providing a view of all windows as one array.
+    '''
+
+    __slots__ = (
+            '_func_view',
+            )
+
+    INTERFACE = IterNodeDelegateWindowReducible.INTERFACE + (
+            'array_view',
+            )
+
+    def __init__(self,
+            func_view: tp.Callable[[], tp.Tuple['IndexBase', np.ndarray, np.ndarray]],
+            **kwargs: tp.Any,
+            ) -> None:
+        '''
+        Args:
+            func_view: Callable that returns the labels of the windowed axis, the positions of the labels of all windows, and an immutable array view of all windows.
+        '''
+        IterNodeDelegateWindowReducible.__init__(self, **kwargs)
+        self._func_view = func_view
+
+    #---------------------------------------------------------------------------
+
+    def array_view(self) -> np.ndarray:
+        '''
+        Return all windows as one immutable array that is a view of the values of the container (consolidated, for a :obj:`Frame` of multiple blocks), without copying. Windows are along axis 0, in the order of iteration, with each window of the shape of an iterated window; NumPy functions can thus be applied to all windows at once (e.g. with ``axis=1``). Windows must all be of ``size``, and cannot be defined with ``window_func``, ``window_valid``, or ``size_increment``.
+        '''
+        _, _, view = self._func_view()
+        return view
+
+    @doc_inject(selector='apply')
+    def apply(self,
+            func: AnyCallable,
+            *,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            index_constructor: tp.Optional[IndexConstructor]= None,
+            ) -> FrameOrSeries:
+        '''
+        {doc} Returns a new container. NumPy reductions that take an ``axis`` argument (such as ``np.sum`` or ``np.median``) are applied to a view of all windows in one call per chunk of windows.
+
+        Args:
+            {func}
+            {dtype}
+        '''
+        if self._yield_type is IterNodeType.VALUES and func in WINDOW_VIEW_REDUCTIONS:
+            try:
+                labels, positions, view = self._func_view()
+            except RuntimeError: # windows cannot be viewed
+                pass
+            else:
+                from static_frame.core.series import Series
+                values = window_view_reduce(view, func)
+                labels = tp.cast('IndexBase', labels._extract_iloc(positions))
+                if dtype is not None:
+                    values = values.astype(dtype)
+                    values.flags.writeable = False
+                if index_constructor is not None:
+                    labels = index_constructor(labels, name=labels.name)
+                return Series(values, index=labels, name=name) # type: ignore
+
+        post = IterNodeDelegateWindowReducible.apply(self,
+                func,
+                dtype=dtype,
+                name=name,
+                index_constructor=index_constructor,
+                )
+        return tp.cast(FrameOrSeries, post)
+
 #-------------------------------------------------------------------------------
 
 class IterNode(tp.Generic[FrameOrSeries]):
@@ -505,8 +1059,12 @@ class IterNode(tp.Generic[FrameOrSeries]):
         '_func_items',
         '_yield_type',
         '_apply_type',
+        '_func_reduce',
+        '_func_transform',
+        '_func_view',
         )
-    CLS_DELEGATE = IterNodeDelegate
+    # delegate subclasses take additional constructor arguments, and are not compatible with Type[IterNodeDelegate]
+    CLS_DELEGATE: tp.Type[tp.Any] = IterNodeDelegate
 
     def __init__(self, *,
             container: FrameOrSeries,
@@ -514,17 +1072,26 @@ class IterNode(tp.Generic[FrameOrSeries]):
             function_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
             apply_type: IterNodeApplyType,
+            function_reduce: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
+            function_transform: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
+            function_view: tp.Optional[tp.Callable[..., tp.Tuple['IndexBase', np.ndarray, np.ndarray]]] = None,
             ) -> None:
         '''
         Args:
             function_values: will be partialed with arguments given with __call__.
             function_items: will be partialed with arguments given with __call__.
+            function_reduce: will be partialed with arguments given with __call__; only used by :obj:`IterNodeDelegateReducible` and :obj:`IterNodeDelegateWindowReducible`.
+            function_transform: will be partialed with arguments given with __call__; only used by :obj:`IterNodeDelegateReducible`.
+            function_view: will be partialed with arguments given with __call__; only used by :obj:`IterNodeDelegateWindowArray`.
         '''
         self._container: FrameOrSeries = container
         self._func_values = function_values
         self._func_items = function_items
         self._yield_type = yield_type
         self._apply_type = apply_type
+        self._func_reduce: tp.Optional[tp.Callable[..., FrameOrSeries]] = function_reduce
+        self._func_transform: tp.Optional[tp.Callable[..., FrameOrSeries]] = function_transform
+        self._func_view = function_view
 
     #---------------------------------------------------------------------------
     # apply constructors
@@ -622,6 +1189,34 @@ class IterNode(tp.Generic[FrameOrSeries]):
                 index_constructor=index_constructor
                 )
 
+    def to_series_from_resample_items(self,
+            pairs: tp.Iterable[tp.Tuple[tp.Hashable, tp.Any]],
+            *,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            index_constructor: tp.Optional[IndexConstructor]= None,
+            unit: str,
+            axis: int = 0,
+            ) -> 'Series':
+        from static_frame.core.index_datetime import resample_unit_to_index_cls
+
+        # bucket labels are datetime64 of the resampled unit; by default, use the IndexDatetime subclass of that unit (or IndexDate for weeks), named as the resampled axis
+        if self._container._NDIM == 2 and axis == 1:
+            name_index = self._container._columns._name #type: ignore
+        else:
+            name_index = self._container._index._name
+
+        if index_constructor is None:
+            index_constructor = resample_unit_to_index_cls(unit)
+
+        return self.to_series_from_group_items(
+                pairs,
+                dtype=dtype,
+                name=name,
+                index_constructor=index_constructor,
+                name_index=name_index,
+                )
+
     def to_frame_from_elements(self,
             items: tp.Iterable[tp.Tuple[
                     tp.Tuple[tp.Hashable, tp.Hashable], tp.Any]],
@@ -704,6 +1299,12 @@ class IterNode(tp.Generic[FrameOrSeries]):
                     name_index=name_index,
                     )
 
+        elif self._apply_type is IterNodeApplyType.SERIES_ITEMS_RESAMPLE:
+            apply_constructor = partial(self.to_series_from_resample_items,
+                    unit=kwargs['unit'],
+                    axis=axis,
+                    )
+
         elif self._apply_type is IterNodeApplyType.FRAME_ELEMENTS:
             assert isinstance(self._container, Frame) # for typing
             apply_constructor = partial(self.to_frame_from_elements, axis=axis)
@@ -732,6 +1333,35 @@ class IterNode(tp.Generic[FrameOrSeries]):
             ) -> IterNodeDelegateMapable[FrameOrSeries]:
         return IterNodeDelegateMapable(**self._get_delegate_kwargs(**kwargs))
 
+    def get_delegate_reducible(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        assert self._func_reduce is not None and self._func_transform is not None
+        return IterNodeDelegateReducible(
+                func_reduce=partial(self._func_reduce, **kwargs),
+                func_transform=partial(self._func_transform, **kwargs),
+                **self._get_delegate_kwargs(**kwargs),
+                )
+
+    def get_delegate_window_reducible(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateWindowReducible[FrameOrSeries]:
+        assert self._func_reduce is not None
+        return IterNodeDelegateWindowReducible(
+                func_reduce=partial(self._func_reduce, **kwargs),
+                **self._get_delegate_kwargs(**kwargs),
+                )
+
+    def get_delegate_window_array(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateWindowArray[FrameOrSeries]:
+        assert self._func_reduce is not None and self._func_view is not None
+        return IterNodeDelegateWindowArray(
+                func_reduce=partial(self._func_reduce, **kwargs),
+                func_view=partial(self._func_view, **kwargs),
+                **self._get_delegate_kwargs(**kwargs),
+                )
+
 #-------------------------------------------------------------------------------
 # specialize IterNode based on arguments given to __call__
 
@@ -809,14 +1439,32 @@ class IterNodeGroupAxis(IterNode[FrameOrSeries]):
     '''
 
     __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
 
     def __call__(self,
             key: KEY_ITERABLE_TYPES, # type: ignore
             *,
             axis: int = 0,
             drop: bool = False,
-            ) -> IterNodeDelegate[FrameOrSeries]:
-        return IterNode.get_delegate(self, key=key, axis=axis, drop=drop)
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        return IterNode.get_delegate_reducible(self, key=key, axis=axis, drop=drop)
+
+
+class IterNodeResample(IterNode[FrameOrSeries]):
+    '''
+    Iterator on groups of buckets of a datetime64 index, where the unit of buckets is required. Buckets of weeks ("W") are aligned to the epoch, and thus begin on Thursdays; they are labelled by their first day with :obj:`IndexDate`.
+    '''
+
+    __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
+
+    def __call__(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        return IterNode.get_delegate_reducible(self, unit=unit, step=step, axis=axis)
 
 
 class IterNodeGroupOther(IterNode[FrameOrSeries]):
@@ -898,3 +1546,66 @@ class IterNodeWindow(IterNode[FrameOrSeries]):
                 size_increment=size_increment,
                 )
 
+
+class IterNodeWindowReducible(IterNodeWindow[FrameOrSeries]):
+    '''
+    Iterator on windows that additionally provides reductions of all windows.
+    '''
+
+    __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateWindowReducible
+
+    def __call__(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> IterNodeDelegateWindowReducible[FrameOrSeries]:
+        return IterNode.get_delegate_window_reducible(self,
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
+
+
+class IterNodeWindowArray(IterNodeWindow[FrameOrSeries]):
+    '''
+    Iterator on windows of arrays that additionally provides reductions of all windows and a view of all windows.
+    '''
+
+    __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateWindowArray
+
+    def __call__(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> IterNodeDelegateWindowArray[FrameOrSeries]:
+        return IterNode.get_delegate_window_array(self,
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                )
@@ -1,35 +1,57 @@
 import typing as tp
-from collections import defaultdict
 from functools import partial
 from itertools import chain
 from itertools import product
-from itertools import repeat
 
 import numpy as np
 from arraykit import resolve_dtype
 from arraykit import resolve_dtype_iter
 
 from static_frame.core.container_util import index_from_optional_constructor
+from static_frame.core.group import GroupPlan
 from static_frame.core.index import Index
 from static_frame.core.index_base import IndexBase
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import EMPTY_ARRAY_INT
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import NameType
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import UFunc
+from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import dtype_from_element
+from static_frame.core.util import full_for_fill
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import ufunc_dtype_to_dtype
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import ufunc_unique1d
+from static_frame.core.util import ufunc_unique1d_indexer
+from static_frame.core.util import ufunc_unique2d_indexer
 
 if tp.TYPE_CHECKING:
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.series import Series  # pylint: disable=W0611 #pragma: no cover
 
 
+# functions that pivot_scatter_blocks() can perform, mapped to a reduction name and if NaN values are skipped
+PIVOT_SCATTER_FUNCS: tp.Dict[tp.Callable[..., tp.Any], tp.Tuple[str, bool]] = {
+        len: ('count', False),
+        np.max: ('max', False),
+        np.mean: ('mean', False),
+        np.min: ('min', False),
+        np.nanmax: ('max', True),
+        np.nanmean: ('mean', True),
+        np.nanmin: ('min', True),
+        np.nansum: ('sum', True),
+        np.sum: ('sum', False),
+        }
+
+# dtype kinds of data fields that pivot_scatter_blocks() can reduce
+PIVOT_SCATTER_KINDS = frozenset(('b', 'i', 'u', 'f'))
 
 #-------------------------------------------------------------------------------
 def extrapolate_column_fields(
@@ -107,6 +129,7 @@ def pivot_records_items_to_frame(
         index_constructor: IndexConstructor,
         dtypes: tp.Tuple[tp.Optional[np.dtype]],
         frame_cls: tp.Type['Frame'],
+        group_plan: tp.Optional[GroupPlan] = None,
         ) -> 'Frame':
     '''
     Given a Frame and pivot parameters, perform the group by ont he group_fields and within each group,
@@ -117,7 +140,12 @@ def pivot_records_items_to_frame(
     index_labels = []
     arrays: tp.List[tp.List[tp.Any]] = [list() for _ in range(record_size)]
 
-    for label, _, part in blocks.group(axis=0, key=group_key, kind=kind):
+    for label, _, part in blocks.group(
+            axis=0,
+            key=group_key,
+            kind=kind,
+            group_plan=group_plan,
+            ):
         index_labels.append(label)
         if func_no:
             if len(part) != 1:
@@ -220,8 +248,8 @@ def pivot_records_items_to_blocks(*,
                 dtype_resolved = resolve_dtype(array.dtype, fill_value_dtype) # type: ignore
                 if array.dtype != dtype_resolved: # type: ignore
                     array = array.astype(dtype_resolved) #type: ignore
-                    array[fill_targets] = fill_value
                     arrays[arrays_key] = array # re-assign new array
+                array[fill_targets] = fill_value # type: ignore
             array.flags.writeable = False # type: ignore
     else:
         for arrays_key in range(len(arrays)): #pylint: disable=C0200
@@ -319,6 +347,7 @@ def pivot_items_to_frame(*,
         index_constructor: IndexConstructor,
         columns_constructor: IndexConstructor,
         kind: str,
+        group_plan: tp.Optional[GroupPlan] = None,
         ) -> 'Frame':
     '''
     Specialized generator of pairs for when we have only one data_field and one function.
@@ -336,6 +365,7 @@ def pivot_items_to_frame(*,
                 key=group_key,
                 extract=data_field_iloc,
                 kind=kind,
+                group_plan=group_plan,
                 ):
             labels.append(label)
             values.append(func_single(v))
@@ -367,6 +397,148 @@ def pivot_items_to_frame(*,
             )
 
 
+def pivot_index_codes(*,
+        blocks: TypeBlocks,
+        group_fields_iloc: tp.Sequence[int],
+        group_depth: int,
+        index_outer: 'IndexBase',
+        ) -> np.ndarray:
+    '''
+    For each row of ``blocks``, return the position in ``index_outer`` of the label formed by the group fields. Each unique label is looked up only once.
+    '''
+    labels: tp.Iterable[tp.Hashable]
+    if group_depth == 1:
+        unique, codes = ufunc_unique1d_indexer(
+                blocks._extract_array_column(group_fields_iloc[0]))
+        labels = unique
+    else:
+        unique, codes = ufunc_unique2d_indexer(
+                blocks._extract_array(column_key=group_fields_iloc))
+        labels = array2d_to_tuples(unique)
+
+    loc_to_iloc = index_outer._loc_to_iloc
+    positions = np.fromiter(
+            (loc_to_iloc(label) for label in labels),
+            dtype=DTYPE_INT_DEFAULT,
+            count=len(unique),
+            )
+    return positions[codes]
+
+
+def _pivot_scatter_reduce(
+        values: np.ndarray,
+        cells: np.ndarray,
+        count: int,
+        func: str,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''
+    Reduce ``values`` into an array of ``count`` cells, where ``cells`` gives the destination of each value. The values of cells that receive no values are undefined.
+    '''
+    if func == 'count':
+        return np.bincount(cells, minlength=count)
+
+    kind = values.dtype.kind
+    if skipna and kind == 'f':
+        valid = ~np.isnan(values)
+        if not valid.all():
+            values = values[valid]
+            cells = cells[valid]
+
+    if func == 'sum':
+        if kind == 'f':
+            return np.bincount(cells, weights=values, minlength=count)
+        post = np.zeros(count, dtype=ufunc_dtype_to_dtype(np.sum, values.dtype))
+        np.add.at(post, cells, values)
+        return post
+    if func == 'mean':
+        total = np.bincount(cells, weights=values, minlength=count)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total / np.bincount(cells, minlength=count)
+
+    # min, max: start from the identity of the reduction; with skipna, start from NaN so that cells of only NaN remain NaN
+    is_min = func == 'min'
+    if kind == 'f':
+        if skipna:
+            post = np.full(count, np.nan, dtype=values.dtype)
+            ufunc = np.fmin if is_min else np.fmax
+        else:
+            post = np.full(count, np.inf if is_min else -np.inf, dtype=values.dtype)
+            ufunc = np.minimum if is_min else np.maximum
+    else:
+        if kind == 'b':
+            initial = is_min
+        else:
+            info = np.iinfo(values.dtype)
+            initial = info.max if is_min else info.min
+        post = np.full(count, initial, dtype=values.dtype)
+        ufunc = np.minimum if is_min else np.maximum
+    ufunc.at(post, cells, values)
+    return post
+
+
+def pivot_scatter_blocks(*,
+        blocks: TypeBlocks,
+        index_codes: np.ndarray,
+        index_count: int,
+        columns_codes: np.ndarray,
+        columns_count: int,
+        data_fields_iloc: tp.Sequence[int],
+        funcs: tp.Sequence[tp.Tuple[str, bool]],
+        dtypes: tp.Sequence[tp.Optional[np.dtype]],
+        fill_value: tp.Any,
+        fill_value_dtype: np.dtype,
+        fill_always: bool,
+        ) -> tp.List[np.ndarray]:
+    '''
+    Reduce each data field with each function into a 2D result of columns groups by index labels, scattering values by their integer codes in a single pass per data field and function. Returns arrays ordered by columns group, then data field, then function.
+
+    Args:
+        funcs: pairs of reduction name and skipna, from ``PIVOT_SCATTER_FUNCS``.
+        dtypes: the resultant dtype per data field and function, or None if not known.
+        fill_always: if True, resolve the dtype of every array with ``fill_value_dtype``; if False, resolve only arrays that have cells to fill.
+    '''
+    count = index_count * columns_count
+    # cells are ordered such that each columns group is a contiguous row of the 2D result
+    cells = columns_codes * index_count + index_codes
+    observed = (np.bincount(cells, minlength=count) > 0).reshape(columns_count, index_count)
+    unobserved = ~observed
+    columns_missing = unobserved.any(axis=1)
+
+    results = []
+    dtypes_iter = iter(dtypes)
+    for column_key in data_fields_iloc:
+        values = blocks._extract_array_column(column_key)
+        for func, skipna in funcs:
+            post = _pivot_scatter_reduce(values, cells, count, func, skipna)
+            dtype = next(dtypes_iter)
+            if dtype is not None and post.dtype != dtype:
+                post = post.astype(dtype)
+            post = post.reshape(columns_count, index_count)
+
+            dtype_resolved = resolve_dtype(post.dtype, fill_value_dtype)
+            if dtype_resolved != post.dtype and fill_always:
+                post = post.astype(dtype_resolved)
+            if dtype_resolved == post.dtype:
+                post[unobserved] = fill_value
+                post.flags.writeable = False
+                results.append(list(post))
+                continue
+            # only resolve the dtype of columns with cells to fill
+            post.flags.writeable = False
+            arrays = []
+            for array, missing, mask in zip(post, columns_missing, unobserved):
+                if missing:
+                    array = array.astype(dtype_resolved)
+                    array[mask] = fill_value
+                    array.flags.writeable = False
+                arrays.append(array)
+            results.append(arrays)
+
+    # interleave such that, per columns group, each data field and function is adjacent
+    return [arrays[i] for i in range(columns_count) for arrays in results]
+
+
 def pivot_core(
         *,
         frame: 'Frame',
@@ -379,8 +551,12 @@ def pivot_core(
         fill_value: object = np.nan,
         index_constructor: IndexConstructor = None,
         kind: str = DEFAULT_FAST_SORT_KIND,
+        group_plan: tp.Optional[GroupPlan] = None,
         ) -> 'Frame':
     '''Core implementation of Frame.pivot(). The Frame has already been reduced to just relevant columns, and all fields groups are normalized as lists of hashables.
+
+    Args:
+        group_plan: optional :obj:`GroupPlan` of the rows of ``frame`` grouped by ``columns_fields`` or, if no ``columns_fields``, ``index_fields``.
     '''
     from static_frame.core.frame import Frame
     from static_frame.core.series import Series
@@ -458,6 +634,7 @@ def pivot_core(
                     index_constructor=index_constructor,
                     columns_constructor=columns_constructor,
                     kind=kind,
+                    group_plan=group_plan,
                     )
         else:
             f = pivot_records_items_to_frame(
@@ -474,6 +651,7 @@ def pivot_core(
                     index_constructor=index_constructor,
                     dtypes=dtypes_per_data_fields,
                     frame_cls=frame.__class__,
+                    group_plan=group_plan,
                     )
         columns_final = (f.columns.rename(columns_name) if columns_depth == 1
                 else columns_constructor(f.columns))
@@ -490,7 +668,6 @@ def pivot_core(
 
     columns_loc_to_iloc = frame.columns._loc_to_iloc
     # group by on 1 or more columns fields
-    # NOTE: explored doing one group on index and columns that insert into pre-allocated arrays, but that proved slower than this approach
     group_key = columns_fields_iloc if len(columns_fields_iloc) > 1 else columns_fields_iloc[0]
 
     index_outer = pivot_outer_index(frame=frame,
@@ -503,7 +680,59 @@ def pivot_core(
     sub_blocks = []
     sub_columns_collected: tp.List[tp.Hashable] = []
 
-    for group, _, sub in frame._blocks.group(axis=0, key=group_key, kind=kind):
+    funcs = (func_single,) if func_single else tuple(func for _, func in func_map)
+    if (not func_no
+            and len(frame)
+            and all(func in PIVOT_SCATTER_FUNCS for func in funcs)
+            and all(dtype_map[field].kind in PIVOT_SCATTER_KINDS for field in data_fields)
+            ):
+        # factorize index and columns fields into integer codes once and reduce all data fields by scattering into preallocated arrays
+        if group_plan is None:
+            group_plan = frame._blocks.group_plan(axis=0, key=group_key, kind=kind)
+        group_to_tuple = group_plan.labels.ndim == 2
+        for group in group_plan.labels:
+            if group_to_tuple:
+                group = tuple(group)
+            sub_columns_collected.extend(extrapolate_column_fields(
+                    columns_fields,
+                    group if not retuple_group_label else (group,),
+                    data_fields,
+                    func_fields,
+                    ))
+        sub_blocks = pivot_scatter_blocks(
+                blocks=frame._blocks,
+                index_codes=pivot_index_codes(
+                        blocks=frame._blocks,
+                        group_fields_iloc=index_fields_iloc,
+                        group_depth=index_depth,
+                        index_outer=index_outer,
+                        ),
+                index_count=len(index_outer),
+                columns_codes=group_plan.codes,
+                columns_count=len(group_plan),
+                data_fields_iloc=data_fields_iloc,
+                funcs=[PIVOT_SCATTER_FUNCS[func] for func in funcs],
+                dtypes=dtypes_per_data_fields,
+                fill_value=fill_value,
+                fill_value_dtype=fill_value_dtype,
+                # the single data field, single function path always resolves a known dtype with the fill value
+                fill_always=data_fields_len == 1 and func_single is not None and dtype_single is not None,
+                )
+        tb = TypeBlocks.from_blocks(sub_blocks)
+        return frame.__class__(tb,
+                index=index_outer,
+                columns=columns_constructor(sub_columns_collected),
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+
+    for group, _, sub in frame._blocks.group(
+            axis=0,
+            key=group_key,
+            kind=kind,
+            group_plan=group_plan,
+            ):
         # derive the column fields represented by this group
         sub_columns = extrapolate_column_fields(
                 columns_fields,
@@ -598,160 +827,224 @@ def pivot_outer_index(
 
 #-------------------------------------------------------------------------------
 
-class PivotIndexMap(tp.NamedTuple):
-    targets_unique: tp.Iterable[tp.Hashable]
-    target_depth: int
-    target_select: np.ndarray
-    group_to_target_map: tp.Dict[tp.Optional[tp.Hashable], tp.Dict[tp.Any, int]]
-    group_depth: int
-    group_select: np.ndarray
-    group_to_dtype: tp.Dict[tp.Optional[tp.Hashable], np.dtype]
+def pivot_codes_first_seen(
+        indexers: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given a 2D array of integer indexers, one row per depth, return, for each position, an integer code of its combination of indexers, where codes are assigned in the order combinations are first seen, as well as the position of the first occurrence of each combination.
+    '''
+    count = indexers.shape[1]
+    if count == 0:
+        return EMPTY_ARRAY_INT, EMPTY_ARRAY_INT
+    if indexers.shape[0] == 1:
+        _, codes = ufunc_unique1d_indexer(indexers[0])
+    else:
+        _, codes = ufunc_unique2d_indexer(indexers, axis=1)
+
+    unique_count = codes.max() + 1
+    first = np.full(unique_count, count, dtype=DTYPE_INT_DEFAULT)
+    np.minimum.at(first, codes, PositionsAllocator.get(count))
 
-def pivot_index_map(*,
+    order = np.argsort(first, kind=DEFAULT_STABLE_SORT_KIND)
+    remap = np.empty(unique_count, dtype=DTYPE_INT_DEFAULT)
+    remap[order] = PositionsAllocator.get(unique_count)
+    return remap[codes], first[order]
+
+
+def pivot_level_from_codes(
+        index: Index,
+        codes: np.ndarray,
+        ) -> tp.Tuple[Index, np.ndarray]:
+    '''
+    Given a depth-level :obj:`Index` and codes into it, return a new :obj:`Index` of the same class with only the labels used, as well as codes into that :obj:`Index`.
+    '''
+    used, codes = ufunc_unique1d_indexer(codes)
+    codes.flags.writeable = False
+    return index.__class__(index.values[used]), codes
+
+
+class PivotAxisCodes(tp.NamedTuple):
+    group_index: tp.Optional[IndexBase]
+    target_levels: tp.List[Index]
+    target_indexers: np.ndarray
+    table: np.ndarray
+
+
+def pivot_axis_codes(*,
         index_src: IndexBase,
         depth_level: DepthLevelSpecifier,
-        dtypes_src: tp.Optional[tp.Sequence[np.dtype]],
-        ) -> PivotIndexMap:
+        hierarchy_cls: tp.Type[IndexHierarchy],
+        ) -> PivotAxisCodes:
     '''
+    Derive, from the integer indexers of the contract axis, the unique groups (combinations of the depths that remain) and targets (combinations of the depths that are moved), each in the order first seen, and a table of the contract axis position of each group and target.
+
     Args:
-        dtypes_src: must be of length equal to axis
+        hierarchy_cls: the class used if groups form an :obj:`IndexHierarchy`.
     '''
-    # We are always moving levels from one axis to another; after application, the expanded axis will always be hierarchical, while the contracted axis may or may not be. From the contract axis, we need to divide the depths into two categories: targets (the depths to be moved and added to expand axis) and groups (unique combinations that remain on the contract axis after removing targets).
-
-    # Unique target labels are added to labels on the expand axis; unique group labels become the new contract axis.
-
+    # We are always moving levels from one axis to another; after application, the expand axis will always be hierarchical, while the contract axis may or may not be. From the contract axis, we need to divide the depths into two categories: targets (the depths to be moved and added to expand axis) and groups (unique combinations that remain on the contract axis after removing targets).
+    count = len(index_src)
     target_select = np.full(index_src.depth, False)
     target_select[depth_level] = True
-    group_select = ~target_select
+    group_depths = np.flatnonzero(~target_select)
+    target_depths = np.flatnonzero(target_select)
+
+    group_index: tp.Optional[IndexBase]
+    target_levels: tp.List[Index]
+
+    if index_src.depth == 1: # all labels are targets
+        group_codes = np.zeros(count, dtype=DTYPE_INT_DEFAULT)
+        group_count = 1 if count else 0
+        group_index = None
+        target_codes = PositionsAllocator.get(count)
+        target_levels = [index_src] # type: ignore
+        target_indexers = target_codes.reshape(1, count)
+    else:
+        indexers = index_src.indexer_at_depth(list(range(index_src.depth))) # type: ignore
+        levels = index_src.index_at_depth(list(range(index_src.depth))) # type: ignore
 
-    group_arrays = []
-    target_arrays = []
-    for i, v in enumerate(target_select):
-        if v:
-            target_arrays.append(index_src.values_at_depth(i))
+        if len(group_depths) == 0:
+            group_codes = np.zeros(count, dtype=DTYPE_INT_DEFAULT)
+            group_count = 1 if count else 0
+            group_index = None
         else:
-            group_arrays.append(index_src.values_at_depth(i))
-
-    group_depth = len(group_arrays)
-    target_depth = len(target_arrays)
-    group_to_dtype: tp.Dict[tp.Optional[tp.Hashable], np.dtype] = {}
-    targets_unique: tp.Iterable[tp.Hashable]
-
-    if group_depth == 0:
-        # targets must be a tuple
-        group_to_target_map = {
-                None: {v: idx for idx, v in enumerate(zip(*target_arrays))}
-                }
-        targets_unique = [k for k in group_to_target_map[None]]
-        if dtypes_src is not None:
-            group_to_dtype[None] = resolve_dtype_iter(dtypes_src)
-    else:
-        group_to_target_map = defaultdict(dict)
-        targets_unique = {} # Store targets in order observed
-
-        for axis_idx, (group, target, dtype) in enumerate(zip(
-                zip(*group_arrays), # get tuples of len 1 to depth
-                zip(*target_arrays),
-                (dtypes_src if dtypes_src is not None else repeat(None)),
-                )):
-            if group_depth == 1:
-                group = group[0]
-            # targets are transfered labels; groups are the new columns
-            group_to_target_map[group][target] = axis_idx
-            targets_unique[target] = None #type: ignore
-
-            if dtypes_src is not None:
-                if group in group_to_dtype:
-                    group_to_dtype[group] = resolve_dtype(group_to_dtype[group], dtype)
-                else:
-                    group_to_dtype[group] = dtype
-
-    return PivotIndexMap( #pylint: disable=E1120
-            targets_unique=targets_unique,
-            target_depth=target_depth,
-            target_select=target_select,
-            group_to_target_map=group_to_target_map, #type: ignore
-            group_depth=group_depth,
-            group_select=group_select,
-            group_to_dtype=group_to_dtype
+            group_codes, group_first = pivot_codes_first_seen(indexers[group_depths])
+            group_count = len(group_first)
+            if len(group_depths) == 1:
+                level = levels[group_depths[0]]
+                group_index = level.__class__(
+                        level.values[indexers[group_depths[0], group_first]])
+            else:
+                group_levels = []
+                group_indexers = []
+                for depth in group_depths:
+                    level, codes = pivot_level_from_codes(
+                            levels[depth],
+                            indexers[depth, group_first],
+                            )
+                    group_levels.append(level)
+                    group_indexers.append(codes)
+                group_indexers_array = np.array(group_indexers, dtype=DTYPE_INT_DEFAULT)
+                group_indexers_array.flags.writeable = False
+                group_index = hierarchy_cls(group_levels, indexers=group_indexers_array)
+
+        target_codes, target_first = pivot_codes_first_seen(indexers[target_depths])
+        target_levels = []
+        target_indexers_list = []
+        for depth in target_depths:
+            level, codes = pivot_level_from_codes(
+                    levels[depth],
+                    indexers[depth, target_first],
+                    )
+            target_levels.append(level)
+            target_indexers_list.append(codes)
+        target_indexers = np.array(target_indexers_list, dtype=DTYPE_INT_DEFAULT).reshape(
+                len(target_depths), len(target_first))
+
+    # for each group and target, the position on the contract axis, or -1 if not defined
+    table = np.full((group_count, target_indexers.shape[1]), -1, dtype=DTYPE_INT_DEFAULT)
+    table[group_codes, target_codes] = PositionsAllocator.get(count)
+
+    return PivotAxisCodes( #pylint: disable=E1120
+            group_index=group_index,
+            target_levels=target_levels,
+            target_indexers=target_indexers,
+            table=table,
             )
 
 
-#-------------------------------------------------------------------------------
-class PivotDeriveConstructors(tp.NamedTuple):
-    contract_dst: tp.Optional[tp.Iterable[tp.Hashable]]
-    contract_constructor: IndexConstructor
-    expand_constructor: IndexConstructor
-
-def pivot_derive_constructors(*,
-        contract_src: IndexBase,
+def pivot_expand_index(*,
         expand_src: IndexBase,
-        group_select: np.ndarray, # Boolean
-        group_depth: int,
-        target_select: np.ndarray,
-        # target_depth: int,
-        group_to_target_map: tp.Dict[tp.Hashable, tp.Tuple[tp.Hashable]],
-        expand_is_columns: bool,
-        frame_cls: tp.Type['Frame'],
-        ) -> PivotDeriveConstructors:
+        target_levels: tp.List[Index],
+        target_indexers: np.ndarray,
+        hierarchy_cls: tp.Type[IndexHierarchy],
+        ) -> IndexHierarchy:
     '''
-    pivot_stack: columns is contract, index is expand
-    pivot_unstack: index is contract, columns is expand
+    Extend each label of ``expand_src`` with each target, forming an :obj:`IndexHierarchy` from integer indexers alone.
     '''
-    # NOTE: group_select, target_select operate on the contract axis
-    if expand_is_columns:
-        contract_cls = Index
-        contract_cls_hierarchy = IndexHierarchy
-        expand_cls_hierarchy = frame_cls._COLUMNS_HIERARCHY_CONSTRUCTOR
-    else: # contract is columns
-        contract_cls = frame_cls._COLUMNS_CONSTRUCTOR
-        contract_cls_hierarchy = frame_cls._COLUMNS_HIERARCHY_CONSTRUCTOR
-        expand_cls_hierarchy = IndexHierarchy
-
-    # NOTE: not propagating name attr, as not obvious how it should when depths are exiting and entering
-
-    # contract axis may or may not be IndexHierarchy after extracting depths
-    if contract_src.depth == 1: # will removed that one level, thus need IndexAuto
-        contract_dst = None
-        contract_constructor = contract_cls
-    else:
-        contract_src_types = contract_src.index_types.values
-        contract_dst_types = contract_src_types[group_select]
-        if group_depth == 0:
-            contract_dst = None
-            contract_constructor = contract_cls
-        elif group_depth == 1:
-            contract_dst = list(group_to_target_map.keys())
-            contract_constructor = contract_dst_types[0]
-        else:
-            contract_dst = list(group_to_target_map.keys())
-            contract_constructor = partial( #type: ignore
-                    contract_cls_hierarchy.from_labels,
-                    index_constructors=contract_dst_types,
-                    )
+    outer_count = len(expand_src)
+    target_count = target_indexers.shape[1]
 
-    # expand axis will always be IndexHierarchy after adding depth
     if expand_src.depth == 1:
-        expand_types = [expand_src.__class__]
+        levels = [expand_src]
+        outer_indexers = PositionsAllocator.get(outer_count).reshape(1, outer_count)
     else:
-        expand_types = expand_src.index_types.values.tolist()
+        depths = list(range(expand_src.depth))
+        levels = list(expand_src.index_at_depth(depths)) # type: ignore
+        outer_indexers = expand_src.indexer_at_depth(depths) # type: ignore
 
-    if contract_src.depth == 1:
-        expand_types.append(contract_src.__class__)
-    else:
-        expand_types.extend(contract_src_types[target_select])
+    indexers = np.vstack((
+            np.repeat(outer_indexers, target_count, axis=1),
+            np.tile(target_indexers, outer_count),
+            ))
+    indexers.flags.writeable = False
+    return hierarchy_cls(levels + target_levels, indexers=indexers) # type: ignore
 
-    expand_constructor = partial(
-            expand_cls_hierarchy.from_labels,
-            index_constructors=expand_types,
-            # name=expand_src.name,
-            )
 
-    # NOTE: expand_dst labels will come from the values generator
-    return PivotDeriveConstructors( #pylint: disable=E1120
-            contract_dst=contract_dst,
-            contract_constructor=contract_constructor,
-            expand_constructor=expand_constructor,
-            )
+def pivot_stack_blocks(*,
+        blocks: TypeBlocks,
+        table: np.ndarray,
+        fill_value: tp.Any,
+        ) -> tp.Iterator[np.ndarray]:
+    '''
+    For each group, take the columns of its targets and ravel them into one array, such that each row is followed by its targets.
+    '''
+    rows = blocks.shape[0]
+    for positions in table:
+        present = positions >= 0
+        if present.all():
+            array = blocks._extract_array(column_key=positions)
+        else:
+            dtype = resolve_dtype_iter(blocks.dtypes[positions[present]])
+            # NOTE: only consider the fill_value dtype if there are rows to fill
+            array = full_for_fill(dtype,
+                    (rows, len(positions)),
+                    fill_value,
+                    resolve_fill_value_dtype=rows > 0,
+                    )
+            # assign per column such that values retain their type if the array is object
+            for target in np.flatnonzero(present):
+                array[:, target] = blocks._extract_array_column(positions[target])
+        array = array.ravel()
+        array.flags.writeable = False
+        yield array
 
 
+def pivot_unstack_blocks(*,
+        blocks: TypeBlocks,
+        table: np.ndarray,
+        fill_value: tp.Any,
+        ) -> tp.Iterator[np.ndarray]:
+    '''
+    For each column, take the rows of each target for each group, such that each column is followed by its targets.
+    '''
+    group_count, target_count = table.shape
+    missing = table < 0
+    targets_missing = missing.any(axis=0)
+    fill_value_dtype = dtype_from_element(fill_value)
+    positions = np.where(missing, 0, table) if targets_missing.any() else table
+
+    for block in blocks._blocks:
+        values = block if block.ndim == 2 else block.reshape(block.shape[0], 1)
+        width = values.shape[1]
+        # take is by group and target, then transpose to by group, column, and target
+        array = values[positions].transpose(0, 2, 1)
+        if not targets_missing.any():
+            array = array.reshape(group_count, width * target_count)
+            array.flags.writeable = False
+            yield array
+            continue
+
+        dtype = resolve_dtype(array.dtype, fill_value_dtype)
+        filled = array.astype(dtype)
+        filled.transpose(1, 0, 2)[:, missing] = fill_value
+        filled = filled.reshape(group_count, width * target_count)
+        filled.flags.writeable = False
+
+        if dtype == array.dtype or targets_missing.all():
+            yield filled
+            continue
+        # only columns of targets that have missing values take the resolved dtype
+        array = array.reshape(group_count, width * target_count)
+        array.flags.writeable = False
+        for column, is_missing in enumerate(np.tile(targets_missing, width)):
+            yield filled[:, column] if is_missing else array[:, column]
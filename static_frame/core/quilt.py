@@ -36,6 +36,7 @@ from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.store_directory import StoreDirectoryNPY
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -301,6 +302,32 @@ class Quilt(ContainerBase, StoreClientMixin):
                 max_persist=max_persist,
                 )
 
+    @classmethod
+    @doc_inject(selector='quilt_constructor_directory')
+    def from_directory_npy(cls,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            axis: int = 0,
+            retain_labels: bool,
+            deepcopy_from_bus: bool = False,
+            max_persist: tp.Optional[int] = None,
+            memory_map: bool = False,
+            ) -> 'Quilt':
+        '''
+        Given a file path to a directory of NPY directories :obj:`Quilt` store, return a :obj:`Quilt` instance.
+
+        {args}
+        '''
+        store = StoreDirectoryNPY(fp, memory_map=memory_map)
+        return cls._from_store(store,
+                config=config,
+                axis=axis,
+                retain_labels=retain_labels,
+                deepcopy_from_bus=deepcopy_from_bus,
+                max_persist=max_persist,
+                )
+
     @classmethod
     @doc_inject(selector='quilt_constructor')
     def from_zip_parquet(cls,
@@ -22,6 +22,7 @@ from static_frame.core.container_util import get_col_fill_value_factory
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
+from static_frame.core.container_util import index_resample_plan
 from static_frame.core.container_util import is_fill_value_factory_initializer
 from static_frame.core.container_util import iter_component_signature_bytes
 from static_frame.core.container_util import matmul
@@ -38,6 +39,8 @@ from static_frame.core.doc_str import doc_inject
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitSeries
 from static_frame.core.exception import RelabelInvalid
+from static_frame.core.group import group_reduce
+from static_frame.core.group import group_transform
 from static_frame.core.index import Index
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.index_auto import IndexAutoFactoryType
@@ -54,8 +57,10 @@ from static_frame.core.node_iter import IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeGroup
 from static_frame.core.node_iter import IterNodeGroupOther
 from static_frame.core.node_iter import IterNodeNoArgMapable
+from static_frame.core.node_iter import IterNodeResample
 from static_frame.core.node_iter import IterNodeType
-from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_iter import IterNodeWindowArray
+from static_frame.core.node_iter import IterNodeWindowReducible
 from static_frame.core.node_re import InterfaceRe
 from static_frame.core.node_selector import InterfaceAssignTrio
 from static_frame.core.node_selector import InterfaceGetItem
@@ -112,6 +117,10 @@ from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import slices_from_targets
 from static_frame.core.util import ufunc_unique1d
 from static_frame.core.util import write_optional_file
+from static_frame.core.window import window_positions
+from static_frame.core.window import window_reduce
+from static_frame.core.window import window_reduce_items
+from static_frame.core.window import window_view
 
 if tp.TYPE_CHECKING:
     import pandas  # pylint: disable=W0611 #pragma: no cover
@@ -1011,52 +1020,120 @@ class Series(ContainerOperand):
 
     #---------------------------------------------------------------------------
     @property
-    def iter_window(self) -> IterNodeWindow['Series']:
+    def iter_resample(self) -> IterNodeResample['Series']:
+        '''
+        Iterator of :obj:`Series` grouped by buckets of a unit of time, found from a datetime64 index.
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=self._axis_resample,
+                function_items=self._axis_resample_items,
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.VALUES,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    @property
+    def iter_resample_items(self) -> IterNodeResample['Series']:
+        '''
+        Iterator of pairs of bucket label, :obj:`Series` grouped by buckets of a unit of time, found from a datetime64 index.
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=self._axis_resample,
+                function_items=self._axis_resample_items,
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.ITEMS,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    #---------------------------------------------------------------------------
+    @property
+    def iter_resample_array(self) -> IterNodeResample['Series']:
+        '''
+        Iterator of ``np.ndarray`` grouped by buckets of a unit of time, found from a datetime64 index.
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=partial(self._axis_resample, as_array=True),
+                function_items=partial(self._axis_resample_items, as_array=True),
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.VALUES,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    @property
+    def iter_resample_array_items(self) -> IterNodeResample['Series']:
+        '''
+        Iterator of pairs of bucket label, ``np.ndarray`` grouped by buckets of a unit of time, found from a datetime64 index.
+        '''
+        return IterNodeResample(
+                container=self,
+                function_values=partial(self._axis_resample, as_array=True),
+                function_items=partial(self._axis_resample_items, as_array=True),
+                function_reduce=self._axis_resample_reduce,
+                function_transform=self._axis_resample_transform,
+                yield_type=IterNodeType.ITEMS,
+                apply_type=IterNodeApplyType.SERIES_ITEMS_RESAMPLE,
+                )
+
+    #---------------------------------------------------------------------------
+    @property
+    def iter_window(self) -> IterNodeWindowReducible['Series']:
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
                 )
 
     @property
-    def iter_window_items(self) -> IterNodeWindow['Series']:
+    def iter_window_items(self) -> IterNodeWindowReducible['Series']:
         function_values = partial(self._axis_window, as_array=False)
         function_items = partial(self._axis_window_items, as_array=False)
-        return IterNodeWindow(
+        return IterNodeWindowReducible(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
                 )
 
 
     @property
-    def iter_window_array(self) -> IterNodeWindow['Series']:
+    def iter_window_array(self) -> IterNodeWindowArray['Series']:
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowArray(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
+                function_view=self._axis_window_view,
                 )
 
     @property
-    def iter_window_array_items(self) -> IterNodeWindow['Series']:
+    def iter_window_array_items(self) -> IterNodeWindowArray['Series']:
         function_values = partial(self._axis_window, as_array=True)
         function_items = partial(self._axis_window_items, as_array=True)
-        return IterNodeWindow(
+        return IterNodeWindowArray(
                 container=self,
                 function_values=function_values,
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=self._axis_window_reduce,
+                function_view=self._axis_window_view,
                 )
     #---------------------------------------------------------------------------
     # index manipulation
@@ -2057,6 +2134,98 @@ class Series(ContainerOperand):
 
 
 
+    def _axis_resample_items(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            as_array: bool = False,
+            ) -> tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]:
+        '''
+        Args:
+            unit: a datetime64 unit, such as "h" or "D", by which the datetime64 index is bucketed.
+            step: the number of units per bucket.
+        '''
+        if axis != 0:
+            raise AxisInvalid(f'invalid axis {axis}')
+
+        plan, index_group, contiguous = index_resample_plan(self._index, unit, step)
+        func = self.values.__getitem__ if as_array else self._extract_iloc
+        ends = plan.starts + plan.sizes
+
+        for label, start, end in zip(index_group, plan.starts, ends):
+            yield label, func(slice(start, end) if contiguous else plan.ordering[start: end])
+
+    def _axis_resample(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            as_array: bool = False,
+            ) -> tp.Iterator[tp.Any]:
+        yield from (x for _, x in self._axis_resample_items(
+                unit,
+                step=step,
+                axis=axis,
+                as_array=as_array,
+                ))
+
+    def _axis_resample_reduce(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            func: tp.Union[str, tp.Mapping[tp.Hashable, tp.Any]],
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> tp.Union['Series', 'Frame']:
+        '''Reduce each bucket to an element with ``group_reduce()``, returning a :obj:`Series` indexed by bucket labels. A mapping of reductions, keyed by the name of this :obj:`Series`, returns a :obj:`Frame`.
+        '''
+        if axis != 0:
+            raise AxisInvalid(f'invalid axis {axis}')
+        if not isinstance(func, str):
+            return self.to_frame()._axis_resample_reduce(unit,
+                    step=step,
+                    func=func,
+                    skipna=skipna,
+                    ddof=ddof,
+                    )
+
+        plan, index_group, contiguous = index_resample_plan(self._index, unit, step)
+        values = self.values if contiguous else self.values[plan.ordering]
+        post = group_reduce(values, plan.starts, func=func, skipna=skipna, ddof=ddof)
+        return self.__class__(post,
+                index=index_group,
+                name=self._name,
+                own_index=True,
+                )
+
+    def _axis_resample_transform(self,
+            unit: str,
+            *,
+            step: int = 1,
+            axis: int = 0,
+            func: str,
+            **kwargs: tp.Any,
+            ) -> 'Series':
+        '''Transform the values of each bucket with ``group_transform()``, returning a :obj:`Series` aligned to the index.
+        '''
+        if axis != 0:
+            raise AxisInvalid(f'invalid axis {axis}')
+
+        plan, _, contiguous = index_resample_plan(self._index, unit, step)
+        if contiguous:
+            post = group_transform(self.values, plan.starts, func=func, **kwargs)
+        else:
+            array = group_transform(self.values[plan.ordering], plan.starts, func=func, **kwargs)
+            post = np.empty(len(array), dtype=array.dtype)
+            post[plan.ordering] = array
+            post.flags.writeable = False
+        return self.__class__(post,
+                index=self._index,
+                name=self._name,
+                )
+
     def _axis_window_items(self, *,
             size: int,
             axis: int = 0,
@@ -2110,6 +2279,97 @@ class Series(ContainerOperand):
                 as_array=as_array
                 ))
 
+    def _axis_window_reduce(self, *,
+            func: str,
+            skipna: bool = True,
+            ddof: int = 0,
+            min_periods: tp.Optional[int] = None,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> 'Series':
+        '''Reduce each window to an element, returning a :obj:`Series` indexed by window labels.
+        '''
+        if window_func is not None or window_valid is not None or size_increment:
+            # windows can only be determined by iteration
+            items = window_reduce_items(
+                    self._axis_window_items(
+                            size=size,
+                            step=step,
+                            window_sized=window_sized,
+                            window_func=window_func,
+                            window_valid=window_valid,
+                            label_shift=label_shift,
+                            start_shift=start_shift,
+                            size_increment=size_increment,
+                            as_array=True,
+                            ),
+                    func=func,
+                    skipna=skipna,
+                    ddof=ddof,
+                    min_periods=min_periods,
+                    )
+            return self.__class__.from_items(items,
+                    name=self._name,
+                    index_constructor=partial(self._index.from_labels,
+                            name=self._index._name,
+                            ),
+                    )
+
+        lefts, positions = window_positions(
+                count=len(self._index),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                )
+        values = window_reduce(self.values,
+                lefts,
+                size,
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                min_periods=min_periods,
+                )
+        return self.__class__(values,
+                index=self._index._extract_iloc(positions),
+                name=self._name,
+                own_index=True,
+                )
+
+    def _axis_window_view(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            ) -> tp.Tuple[IndexBase, np.ndarray, np.ndarray]:
+        '''Return the labels of the windowed axis, the positions of the labels of all windows, and an immutable view of all windows, with windows along axis 0.
+        '''
+        if window_func is not None or window_valid is not None or size_increment:
+            raise RuntimeError('windows defined by window_func, window_valid, or size_increment cannot be viewed')
+        lefts, positions = window_positions(
+                count=len(self._index),
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                )
+        view = window_view(self.values, lefts, size, step)
+        return self._index, positions, view
+
     #---------------------------------------------------------------------------
 
     @property
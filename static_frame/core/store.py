@@ -9,10 +9,12 @@ from weakref import WeakValueDictionary
 import numpy as np
 
 from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.exception import StoreFileMutation
 from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import PathSpecifier
@@ -47,7 +49,10 @@ def store_coherent_write(f: AnyCallable) -> AnyCallable:
 #-------------------------------------------------------------------------------
 class Store:
 
-    _EXT: tp.FrozenSet[str]
+    # the extensions of accepted paths, or None if paths are not identified by extension
+    _EXT: tp.Optional[tp.FrozenSet[str]]
+    # if the store can read a selection of rows with rows_start, rows_stop, and rows_where
+    _ROWS_SELECTABLE: bool = False
 
     __slots__ = (
             '_fp',
@@ -59,7 +64,7 @@ class Store:
         # Redefine fp variable as only string after the filter.
         fp = tp.cast(str, path_filter(fp))
 
-        if not os.path.splitext(fp)[1] in self._EXT:
+        if self._EXT is not None and not os.path.splitext(fp)[1] in self._EXT:
             raise ErrorInitStore(
                     f'file path {fp} does not match one of the required extensions: {self._EXT}')
 
@@ -205,6 +210,18 @@ class Store:
         return frame._blocks.axis_values(0)
 
     #---------------------------------------------------------------------------
+    def _config_map_read(self,
+            config: StoreConfigMapInitializer,
+            ) -> StoreConfigMap:
+        '''Return a StoreConfigMap for reading, raising if any StoreConfig selects rows and this Store cannot read a selection of rows.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+        if not self._ROWS_SELECTABLE:
+            for c in chain((config_map.default,), config_map._map.values()):
+                if c.rows_start is not None or c.rows_stop is not None or c.rows_where is not None:
+                    raise ErrorInitStoreConfig(f'{self.__class__.__name__} does not support rows_start, rows_stop, or rows_where; use StoreHDF5.')
+        return config_map
+
     def read_many(self,
             labels: tp.Iterable[tp.Hashable],
             *,
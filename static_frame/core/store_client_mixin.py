@@ -5,6 +5,7 @@ import zipfile
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.store_directory import StoreDirectoryNPY
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
@@ -124,6 +125,21 @@ class StoreClientMixin:
         config = self._filter_config(config)
         store.write(self._items_store(), config=config, compression=compression)
 
+    @doc_inject(selector='store_client_exporter_directory')
+    def to_directory_npy(self,
+            fp: PathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            ) -> None:
+        '''
+        Write the complete :obj:`Bus` as a directory of NPY directories, one per :obj:`Frame`. The directory must not already exist.
+
+        {args}
+        '''
+        store = StoreDirectoryNPY(fp)
+        config = self._filter_config(config)
+        store.write(self._items_store(), config=config)
+
     @doc_inject(selector='store_client_exporter')
     def to_zip_parquet(self,
             fp: PathSpecifier,
@@ -140,11 +156,12 @@ class StoreClientMixin:
         config = self._filter_config(config)
         store.write(self._items_store(), config=config, compression=compression)
 
-    @doc_inject(selector='store_client_exporter')
+    @doc_inject(selector='store_client_exporter_xlsx')
     def to_xlsx(self,
             fp: PathSpecifier,
             *,
             config: StoreConfigMapInitializer = None,
+            constant_memory: bool = False,
             ) -> None:
         '''
         Write the complete :obj:`Bus` as a XLSX workbook.
@@ -153,13 +170,19 @@ class StoreClientMixin:
         '''
         store = StoreXLSX(fp)
         config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
+        store.write(self._items_store(),
+                config=config,
+                constant_memory=constant_memory,
+                )
 
-    @doc_inject(selector='store_client_exporter')
+    @doc_inject(selector='store_client_exporter_sqlite')
     def to_sqlite(self,
             fp: PathSpecifier,
             *,
             config: StoreConfigMapInitializer = None,
+            journal_mode: tp.Optional[str] = None,
+            synchronous: tp.Optional[str] = None,
+            blob_layout: bool = False,
             ) -> None:
         '''
         Write the complete :obj:`Bus` as an SQLite database file.
@@ -168,13 +191,19 @@ class StoreClientMixin:
         '''
         store = StoreSQLite(fp)
         config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
-
-    @doc_inject(selector='store_client_exporter')
+        store.write(self._items_store(),
+                config=config,
+                journal_mode=journal_mode,
+                synchronous=synchronous,
+                blob_layout=blob_layout,
+                )
+
+    @doc_inject(selector='store_client_exporter_hdf5')
     def to_hdf5(self,
             fp: PathSpecifier,
             *,
             config: StoreConfigMapInitializer = None,
+            append: bool = False,
             ) -> None:
         '''
         Write the complete :obj:`Bus` as an HDF5 table.
@@ -183,4 +212,4 @@ class StoreClientMixin:
         '''
         store = StoreHDF5(fp)
         config = self._filter_config(config)
-        store.write(self._items_store(), config=config)
+        store.write(self._items_store(), config=config, append=append)
@@ -22,6 +22,9 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     columns_name_depth_level: tp.Optional[DepthLevelSpecifier]
     columns_constructors: IndexConstructors
     columns_select: tp.Optional[tp.Iterable[str]]
+    rows_start: tp.Optional[int]
+    rows_stop: tp.Optional[int]
+    rows_where: tp.Optional[str]
     dtypes: DtypesSpecifier
     consolidate_blocks: bool
     skip_header: int
@@ -36,6 +39,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     read_chunksize: int
     write_max_workers: tp.Optional[int]
     write_chunksize: int
+    mp_context: tp.Optional[str]
     _hash: tp.Optional[int]
 
     __slots__ = (
@@ -46,6 +50,9 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'columns_name_depth_level',
             'columns_constructors',
             'columns_select',
+            'rows_start',
+            'rows_stop',
+            'rows_where',
             'dtypes',
             'consolidate_blocks',
             'skip_header',
@@ -60,6 +67,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'read_chunksize',
             'write_max_workers',
             'write_chunksize',
+            'mp_context',
             '_hash'
             )
 
@@ -75,6 +83,9 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             dtypes: DtypesSpecifier = None,
             consolidate_blocks: bool = False,
             # not used by all constructors
+            rows_start: tp.Optional[int] = None,
+            rows_stop: tp.Optional[int] = None,
+            rows_where: tp.Optional[str] = None,
             skip_header: int = 0,
             skip_footer: int = 0,
             trim_nadir: bool = False,
@@ -90,11 +101,16 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             read_chunksize: int = 1,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            mp_context: tp.Optional[str] = None,
             ):
         '''
         Args:
+            rows_start: Optionally, the position of the first row to read; only supported by StoreHDF5, as other stores raise ErrorInitStoreConfig.
+            rows_stop: Optionally, the position after the last row to read; only supported by StoreHDF5, as other stores raise ErrorInitStoreConfig.
+            rows_where: Optionally, a condition expression to select rows; only supported by StoreHDF5, as other stores raise ErrorInitStoreConfig.
             include_index: Boolean to determine if the ``index`` is included in output.
             include_columns: Boolean to determine if the ``columns`` is included in output.
+            mp_context: Optionally, the name of the multiprocessing start method (``'spawn'``, ``'fork'``, or ``'forkserver'``) of process pools used for reading and writing.
         '''
         # constructor
         self.index_depth = index_depth
@@ -104,6 +120,9 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         self.columns_name_depth_level = columns_name_depth_level
         self.columns_constructors = columns_constructors
         self.columns_select = columns_select
+        self.rows_start = rows_start
+        self.rows_stop = rows_stop
+        self.rows_where = rows_where
         self.dtypes = dtypes
         self.consolidate_blocks = consolidate_blocks
         self.skip_header = skip_header
@@ -123,6 +142,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         self.read_chunksize = read_chunksize
         self.write_max_workers = write_max_workers
         self.write_chunksize = write_chunksize
+        self.mp_context = mp_context
 
         self._hash = None
 
@@ -167,6 +187,9 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self._hash_depth_specifier(self.columns_name_depth_level),
                     self.columns_constructors, # class or callable
                     self.columns_select if self.columns_select is None else tuple(self.columns_select),
+                    self.rows_start, # Optional[int]
+                    self.rows_stop, # Optional[int]
+                    self.rows_where, # Optional[str]
                     self._hash_dtypes_specifier(self.dtypes),
                     self.consolidate_blocks, # bool
                     self.skip_header, # int
@@ -181,6 +204,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.read_chunksize, # int
                     self.write_max_workers, # Optional[int]
                     self.write_chunksize, # int
+                    self.mp_context, # Optional[str]
             ))
         return self._hash
 
@@ -222,6 +246,9 @@ class StoreConfig(StoreConfigHE):
             columns_name_depth_level: tp.Optional[DepthLevelSpecifier] = None,
             columns_constructors: IndexConstructors = None,
             columns_select: tp.Optional[tp.Iterable[str]] = None,
+            rows_start: tp.Optional[int] = None,
+            rows_stop: tp.Optional[int] = None,
+            rows_where: tp.Optional[str] = None,
             dtypes: DtypesSpecifier = None,
             consolidate_blocks: bool = False,
             skip_header: int = 0,
@@ -238,6 +265,7 @@ class StoreConfig(StoreConfigHE):
             read_chunksize: int = 1,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            mp_context: tp.Optional[str] = None,
             ):
         StoreConfigHE.__init__(self,
                 index_depth=index_depth,
@@ -247,6 +275,9 @@ class StoreConfig(StoreConfigHE):
                 columns_name_depth_level=columns_name_depth_level,
                 columns_constructors=columns_constructors,
                 columns_select=columns_select,
+                rows_start=rows_start,
+                rows_stop=rows_stop,
+                rows_where=rows_where,
                 dtypes=dtypes,
                 consolidate_blocks=consolidate_blocks,
                 skip_header=skip_header,
@@ -261,6 +292,7 @@ class StoreConfig(StoreConfigHE):
                 read_chunksize=read_chunksize,
                 write_max_workers=write_max_workers,
                 write_chunksize=write_chunksize,
+                mp_context=mp_context,
         )
         self.label_encoder = label_encoder
         self.label_decoder = label_decoder
@@ -322,6 +354,7 @@ class StoreConfigMap:
             'read_chunksize',
             'write_max_workers',
             'write_chunksize',
+            'mp_context',
     )
 
     @classmethod
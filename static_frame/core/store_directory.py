@@ -0,0 +1,133 @@
+import json
+import os
+import shutil
+import typing as tp
+
+from static_frame.core.archive_npy import ArchiveDirectory
+from static_frame.core.archive_npy import ArchiveFrameConverter
+from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.frame import Frame
+from static_frame.core.store import Store
+from static_frame.core.store import store_coherent_non_write
+from static_frame.core.store import store_coherent_write
+from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigMap
+from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.store_zip import _StoreZip
+from static_frame.core.util import NOT_IN_CACHE_SENTINEL
+from static_frame.core.util import PathSpecifier
+
+
+class StoreDirectoryNPY(Store):
+    '''A directory of NPY directories, one per Frame label. If ``memory_map`` is True, Frames are read with memory-mapped, immutable blocks; memory maps are released when no references to the read Frame (or its arrays) remain.
+    '''
+    # a directory path has no extension semantics, and might contain a dot
+    _EXT = None
+
+    __slots__ = (
+            '_memory_map',
+            )
+
+    def __init__(self,
+            fp: PathSpecifier,
+            *,
+            memory_map: bool = False,
+            ):
+        Store.__init__(self, fp)
+        if os.path.exists(self._fp) and not os.path.isdir(self._fp):
+            raise ErrorInitStore(f'A directory must be provided, not {self._fp}')
+        self._memory_map = memory_map
+
+    def _fp_label(self, label_encoded: str) -> str:
+        return os.path.join(self._fp, label_encoded)
+
+    def _fp_meta(self) -> str:
+        return os.path.join(self._fp, ArchiveDirectory.FILE_META)
+
+    @store_coherent_write
+    def write(self,
+            items: tp.Iterable[tp.Tuple[tp.Hashable, Frame]],
+            *,
+            config: StoreConfigMapInitializer = None,
+            ) -> None:
+        config_map = StoreConfigMap.from_initializer(config)
+
+        # as an error in writing will remove the entire directory, we require the directory to be newly created
+        if os.path.exists(self._fp):
+            raise ErrorInitStore(f'Atttempting to write to an existant directory: {self._fp}')
+        os.mkdir(self._fp)
+
+        labels_encoded = []
+        try:
+            for label, frame in items:
+                c: StoreConfig = config_map[label]
+                label_encoded = config_map.default.label_encode(label)
+                labels_encoded.append(label_encoded)
+                archive = ArchiveDirectory(
+                        self._fp_label(label_encoded),
+                        writeable=True,
+                        memory_map=False,
+                        )
+                ArchiveFrameConverter.frame_encode(
+                        archive=archive,
+                        frame=frame,
+                        include_index=c.include_index,
+                        include_columns=c.include_columns,
+                        consolidate_blocks=c.consolidate_blocks,
+                        )
+        except ErrorNPYEncode:
+            # NOTE: catch NPY failures and remove self._fp to not leave a malformed directory
+            if os.path.exists(self._fp):
+                shutil.rmtree(self._fp)
+            raise
+
+        # retain the order of labels as written, as directory listings have no defined order
+        with open(self._fp_meta(), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(labels_encoded))
+
+    @store_coherent_non_write
+    def labels(self, *,
+            config: StoreConfigMapInitializer = None,
+            strip_ext: bool = True, # not used
+            ) -> tp.Iterator[tp.Hashable]:
+
+        config_map = StoreConfigMap.from_initializer(config)
+
+        fp_meta = self._fp_meta()
+        if os.path.exists(fp_meta):
+            with open(fp_meta, 'r', encoding='utf-8') as f:
+                names = json.loads(f.read())
+        else: # a directory not written by this Store
+            names = sorted(f.name for f in os.scandir(self._fp) if f.is_dir())
+        yield from (config_map.default.label_decode(name) for name in names)
+
+    @store_coherent_non_write
+    def read_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[Frame]:
+
+        config_map = self._config_map_read(config)
+
+        for label in labels:
+            cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+            if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                yield _StoreZip._set_container_type(cache_lookup, container_type)
+                continue
+
+            # NOTE: memory maps are held by the arrays of the returned Frame and are closed when those arrays are garbage collected; the archive is not explicitly closed.
+            archive = ArchiveDirectory(
+                    self._fp_label(config_map.default.label_encode(label)),
+                    writeable=False,
+                    memory_map=self._memory_map,
+                    )
+            frame = ArchiveFrameConverter.frame_decode(
+                        archive=archive,
+                        constructor=container_type,
+                        )
+            # Newly read frame, add it to our weak_cache
+            self._weak_cache[label] = frame
+            yield frame
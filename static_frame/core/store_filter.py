@@ -1,5 +1,6 @@
 
 import typing as tp
+from functools import partial
 
 import numpy as np
 
@@ -159,6 +160,27 @@ class StoreFilter(metaclass=InterfaceMeta):
                 (-np.inf, tuple(self.to_neginf)),
                 )
 
+    def __reduce__(self) -> tp.Tuple[tp.Any, tp.Tuple[()]]:
+        '''
+        Reduce to the initializer and its arguments, as reference collections include functions that cannot be pickled.
+        '''
+        return (partial(self.__class__,
+                from_nan=self.from_nan,
+                from_nat=self.from_nat,
+                from_none=self.from_none,
+                from_posinf=self.from_posinf,
+                from_neginf=self.from_neginf,
+                to_nan=self.to_nan,
+                to_nat=self.to_nat,
+                to_none=self.to_none,
+                to_posinf=self.to_posinf,
+                to_neginf=self.to_neginf,
+                value_format_float_positional=self.value_format_float_positional,
+                value_format_float_scientific=self.value_format_float_scientific,
+                value_format_complex_positional=self.value_format_complex_positional,
+                value_format_complex_scientific=self.value_format_complex_scientific,
+                ), ())
+
     # --------------------------------------------------------------------------
     # converting from types (in memory) to datastore
 
@@ -1,8 +1,10 @@
 import typing as tp
+from functools import partial
 
 import numpy as np
 
 # from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
@@ -17,15 +19,68 @@ from static_frame.core.util import WarningsSilent
 class StoreHDF5(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.h5', '.hdf5'))
+    _ROWS_SELECTABLE = True
+
+    # the approximate size of each structured array appended to a table
+    _WRITE_CHUNK_BYTES = 2 ** 24
+
+    @classmethod
+    def _iter_table_chunks(cls,
+            frame: Frame,
+            include_index: bool,
+            dtype: np.dtype,
+            ) -> tp.Iterator[np.ndarray]:
+        '''
+        Yield structured arrays of ``dtype``, filled column-wise from the index and blocks of ``frame``, such that no row is ever materialized as a Python tuple.
+        '''
+        columns = list(cls.get_column_iterator(frame, include_index=include_index))
+        names = dtype.names
+        count = frame._blocks.shape[0]
+        step = max(1, cls._WRITE_CHUNK_BYTES // max(1, dtype.itemsize))
+
+        for start in range(0, count, step):
+            stop = min(start + step, count)
+            chunk = np.empty(stop - start, dtype=dtype)
+            for name, column in zip(names, columns):
+                chunk[name] = column[start: stop]
+            yield chunk
+
+    @staticmethod
+    def _validate_append(
+            label: str,
+            table_dtype: np.dtype,
+            field_names: tp.Sequence[tp.Hashable],
+            dtypes: tp.Sequence[np.dtype],
+            ) -> None:
+        '''
+        Raise if the fields of a :obj:`Frame` cannot be appended to a table of ``table_dtype`` without loss: fields must match by name and order, strings must fit the width of the table's byte strings, and other values must be safely cast to the table's dtypes.
+        '''
+        if list(table_dtype.names) != [str(k) for k in field_names]:
+            raise StoreParameterConflict(f'cannot append to table {label} with different fields: {field_names}')
+
+        for name, dtype in zip(table_dtype.names, dtypes):
+            dtype_table = table_dtype[name]
+            if dtype.kind in DTYPE_STR_KINDS:
+                # unicode is stored as one byte per character
+                width = dtype.itemsize // 4 if dtype.kind == 'U' else dtype.itemsize
+                valid = dtype_table.kind == 'S' and width <= dtype_table.itemsize
+            else:
+                valid = np.can_cast(dtype, dtype_table, casting='safe')
+            if not valid:
+                raise StoreParameterConflict(f'cannot append {dtype} values to field {name} of {dtype_table} in table {label}')
 
     @store_coherent_write
     def write(self,
             items: tp.Iterable[tp.Tuple[tp.Hashable, Frame]],
             *,
             config: StoreConfigMapInitializer = None,
+            append: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
             ) -> None:
-
+        '''
+        Args:
+            append: If True, open the file for appending: tables not found are created, and rows are appended to existing tables with the same fields, if values can be stored in those fields without truncation or unsafe casting. If False, the file is overwritten.
+        '''
         config_map = StoreConfigMap.from_initializer(config)
 
         with WarningsSilent():
@@ -33,7 +88,9 @@ class StoreHDF5(Store):
 
             # silence: DeprecationWarning: `np.typeDict` is a deprecated alias for `np.sctypeDict`.
 
-        with tables.open_file(self._fp, mode='w') as file, WarningsSilent():
+        mode = 'a' if append else 'w'
+
+        with tables.open_file(self._fp, mode=mode) as file, WarningsSilent():
             # silence NaturalNameWarning: object name is not a valid Python identifier:
 
             for label, frame in items:
@@ -49,22 +106,29 @@ class StoreHDF5(Store):
                         include_columns_name=False,
                         )
 
-                # Must set pos to have stable position
-                description = {}
-                for i, (k, v) in enumerate(zip(field_names, dtypes)):
-                    if v == object:
-                        raise RuntimeError('cannot store object dtypes in HDF5')
-                    description[k] = tables.Col.from_dtype(v, pos=i)
-
-                table = file.create_table('/', # create off root from sring
-                        name=label,
-                        description=description,
-                        expectedrows=len(frame),
-                        )
-
-                values = self._get_row_iterator(frame=frame,
-                        include_index=c.include_index)
-                table.append(tuple(values()))
+                if append and f'/{label}' in file:
+                    table = file.get_node(f'/{label}')
+                    self._validate_append(label, table.dtype, field_names, dtypes)
+                else:
+                    # Must set pos to have stable position
+                    description = {}
+                    for i, (k, v) in enumerate(zip(field_names, dtypes)):
+                        if v == object:
+                            raise RuntimeError('cannot store object dtypes in HDF5')
+                        description[k] = tables.Col.from_dtype(v, pos=i)
+
+                    table = file.create_table('/', # create off root from sring
+                            name=label,
+                            description=description,
+                            expectedrows=len(frame),
+                            )
+
+                for chunk in self._iter_table_chunks(
+                        frame=frame,
+                        include_index=c.include_index,
+                        dtype=table.dtype,
+                        ):
+                    table.append(chunk)
                 table.flush()
 
     @store_coherent_non_write
@@ -75,7 +139,7 @@ class StoreHDF5(Store):
             container_type: tp.Type[Frame] = Frame,
             ) -> tp.Iterator[Frame]:
         import tables
-        config_map = StoreConfigMap.from_initializer(config)
+        config_map = self._config_map_read(config)
 
         with tables.open_file(self._fp, mode='r') as file:
             for label in labels:
@@ -96,10 +160,34 @@ class StoreHDF5(Store):
                 table = file.get_node(f'/{label_encoded}')
                 colnames = table.cols._v_colnames
 
+                if c.columns_select is not None:
+                    # index columns are always read
+                    columns_select = set(c.columns_select)
+                    colnames = colnames[:index_depth] + [n for n in colnames[index_depth:]
+                            if n in columns_select]
+
+                # NOTE: PyTables reads only one row if start is given without stop
+                rows_start = c.rows_start
+                rows_stop = c.rows_stop
+                if rows_start is not None and rows_stop is None:
+                    rows_stop = table.nrows
+
+                if c.rows_where is not None:
+                    # evaluate the condition once, then read only matching rows per column
+                    coords = table.get_where_list(c.rows_where,
+                            start=rows_start,
+                            stop=rows_stop,
+                            )
+                    read_column = partial(table.read_coordinates, coords)
+                else:
+                    read_column = partial(table.read,
+                            start=rows_start,
+                            stop=rows_stop,
+                            )
+
                 def blocks() -> tp.Iterator[np.ndarray]:
                     for col_idx, colname in enumerate(colnames):
-                        # can also do: table.read(field=colname)
-                        array = table.col(colname)
+                        array = read_column(field=colname)
                         if array.dtype.kind in DTYPE_STR_KINDS:
                             array = array.astype(str)
                         array.flags.writeable = False
@@ -1,28 +1,267 @@
+import json
 import os
 import sqlite3
+import threading
 import typing as tp
 from contextlib import suppress
 from fractions import Fraction
+from io import BytesIO
+from pathlib import Path
 
 import numpy as np
 
+from static_frame.core.archive_npy import Archive
+from static_frame.core.archive_npy import ArchiveFrameConverter
+from static_frame.core.archive_npy import HeaderType
+from static_frame.core.archive_npy import NPYConverter
 # from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import ErrorInitStore
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
+from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_DATETIME_KIND
 from static_frame.core.util import DTYPE_INEXACT_KINDS
 from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import PathSpecifier
 
 
+#-------------------------------------------------------------------------------
+class ArchiveSQLite(Archive):
+    '''Archive interface to an SQLite table of two fields, where each array is stored as NPY bytes in a BLOB, and metadata is stored as JSON in a BLOB.
+    '''
+    __slots__ = (
+            '_label',
+            )
+
+    _archive: sqlite3.Cursor # type: ignore
+    _label: str
+
+    FIELD_NAME = '__name__'
+    FIELD_VALUE = '__value__'
+
+    def __init__(self, # pylint: disable=W0231
+            cursor: sqlite3.Cursor,
+            label: str,
+            writeable: bool,
+            ):
+        self._archive = cursor
+        self._label = label
+        self._memory_map = False
+
+        if writeable:
+            cursor.execute(f'CREATE TABLE "{label}" ({self.FIELD_NAME} TEXT PRIMARY KEY, {self.FIELD_VALUE} BLOB)')
+        else:
+            self._header_decode_cache = {}
+
+    @classmethod
+    def is_archive(cls, cursor: sqlite3.Cursor, label: str) -> bool:
+        '''Return True if the table ``label`` has the fields of an :obj:`ArchiveSQLite`.
+        '''
+        cursor.execute(f'PRAGMA table_info("{label}")')
+        return [row[1] for row in cursor.fetchall()] == [cls.FIELD_NAME, cls.FIELD_VALUE]
+
+    def _read(self, name: str) -> bytes:
+        self._archive.execute(
+                f'SELECT {self.FIELD_VALUE} FROM "{self._label}" WHERE {self.FIELD_NAME} = ?',
+                (name,),
+                )
+        row = self._archive.fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0] # type: ignore
+
+    def _write(self, name: str, value: tp.Union[bytes, memoryview]) -> None:
+        self._archive.execute(
+                f'INSERT INTO "{self._label}" ({self.FIELD_NAME}, {self.FIELD_VALUE}) VALUES (?, ?)',
+                (name, value),
+                )
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self._read(name)
+        except KeyError:
+            return False
+        return True
+
+    def labels(self) -> tp.Iterator[str]:
+        self._archive.execute(f'SELECT {self.FIELD_NAME} FROM "{self._label}"')
+        yield from (row[0] for row in self._archive.fetchall())
+
+    def write_array(self, name: str, array: np.ndarray) -> None:
+        f = BytesIO()
+        NPYConverter.to_npy(f, array)
+        self._write(name, f.getbuffer())
+
+    def read_array(self, name: str) -> np.ndarray:
+        array, _ = NPYConverter.from_npy(BytesIO(self._read(name)), self._header_decode_cache)
+        array.flags.writeable = False
+        return array
+
+    def read_array_header(self, name: str) -> HeaderType:
+        '''Alternate reader for status displays.
+        '''
+        return NPYConverter.header_from_npy(BytesIO(self._read(name)), self._header_decode_cache)
+
+    def size_array(self, name: str) -> int:
+        return len(self._read(name))
+
+    def write_metadata(self, content: tp.Any) -> None:
+        self._write(self.FILE_META, json.dumps(content).encode())
+
+    def read_metadata(self) -> tp.Any:
+        return json.loads(self._read(self.FILE_META))
+
+    def size_metadata(self) -> int:
+        return len(self._read(self.FILE_META))
+
+
+#-------------------------------------------------------------------------------
 class StoreSQLite(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.db', '.sqlite'))
     _BYTES_ONE = b'1'
+    # number of rows fetched and converted to arrays at a time
+    _READ_CHUNKSIZE = 100_000
+    # number of rows converted to Python objects and inserted at a time
+    _WRITE_CHUNKSIZE = 100_000
+
+    _JOURNAL_MODES = frozenset(('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'))
+    _SYNCHRONOUS = frozenset(('OFF', 'NORMAL', 'FULL', 'EXTRA'))
+
+    _adapters_registered = False
+    # attributes specific to a thread and process, re-created rather than copied or pickled
+    _STATE_EXCLUDE = frozenset(('_connections', '_local', '_lock', '_pid'))
+    _converters_registered = False
+
+    __slots__ = (
+            '_connections',
+            '_local',
+            '_lock',
+            '_pid',
+            '_queries',
+            )
+
+    _connections: tp.Set[sqlite3.Connection]
+    _local: threading.local
+    _lock: threading.Lock
+    _pid: int
+    _queries: tp.Dict[str, tp.Optional[str]]
+
+    def __init__(self, fp: PathSpecifier):
+        Store.__init__(self, fp)
+        self._connections_reset()
+        # SELECT query per encoded label, or None for tables written with blob_layout
+        self._queries = {}
+
+    def __del__(self) -> None:
+        self._connections_close()
+
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        # NOTE: read-only connections are specific to a thread and process, and are neither copied nor pickled
+        state = {}
+        for cls in self.__class__.__mro__:
+            for attr in getattr(cls, '__slots__', ()):
+                if attr not in self._STATE_EXCLUDE and hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+        return None, state
+
+    def __setstate__(self, state: tp.Tuple[None, tp.Dict[str, tp.Any]]) -> None:
+        for key, value in state[1].items():
+            setattr(self, key, value)
+        self._connections_reset()
+
+    def _connections_reset(self) -> None:
+        '''Discard all read-only connections without closing them, as is necessary for connections inherited from a parent process. Each connection is held in thread-local storage of the thread that created it, and is registered in a set, protected by a lock, such that connections of all threads can be closed.
+        '''
+        self._connections = set()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _connections_close(self) -> None:
+        '''Close and discard all read-only connections, as must be done before the file is written.
+        '''
+        if getattr(self, '_lock', None) is None: # failed in __init__
+            return
+        if self._pid == os.getpid():
+            with self._lock:
+                connections = self._connections
+                self._connections = set()
+            for conn in connections:
+                conn.close()
+        self._connections_reset()
+        self._queries.clear()
+
+    def _connection_read(self) -> sqlite3.Connection:
+        '''Return a read-only connection for the calling thread, creating it on first usage. As SQLite releases the GIL while executing, threads reading with their own connections can read in parallel.
+        '''
+        if self._pid != os.getpid():
+            # connections inherited from a parent process are not used
+            self._connections_reset()
+
+        conn: tp.Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if conn is None:
+            self._register_converters()
+            conn = sqlite3.connect(f'{Path(self._fp).absolute().as_uri()}?mode=ro',
+                    uri=True,
+                    detect_types=sqlite3.PARSE_DECLTYPES,
+                    # permit closing from any thread in _connections_close
+                    check_same_thread=False,
+                    )
+            self._local.connection = conn
+            with self._lock:
+                self._connections.add(conn)
+        return conn
+
+    def _query(self,
+            cursor: sqlite3.Cursor,
+            label_encoded: str,
+            ) -> tp.Optional[str]:
+        '''Return the SELECT query for a table, or None if the table was written with ``blob_layout``. As queries are identical per table, SQLite's per-connection statement cache reuses the prepared statement.
+        '''
+        try:
+            return self._queries[label_encoded]
+        except KeyError:
+            pass
+        if ArchiveSQLite.is_archive(cursor, label_encoded):
+            query = None
+        else:
+            query = f'SELECT * from "{label_encoded}"'
+        self._queries[label_encoded] = query
+        return query
+
+    @classmethod
+    def _register_adapters(cls) -> None:
+        '''Register adapters for NumPy and other Python types, once per process. As column values are converted with ``tolist()``, these are only needed for elements of object arrays.
+        '''
+        if cls._adapters_registered:
+            return
+        # numpy types go in as blobs if they are not individually converted tp python types
+        sqlite3.register_adapter(np.int64, int)
+        sqlite3.register_adapter(np.int32, int)
+        sqlite3.register_adapter(np.int16, int)
+        sqlite3.register_adapter(np.bool_, bool)
+        # common python types
+        sqlite3.register_adapter(Fraction, str)
+        sqlite3.register_adapter(complex, lambda x: f'{x.real}:{x.imag}')
+        StoreSQLite._adapters_registered = True
+
+    @classmethod
+    def _register_converters(cls) -> None:
+        '''Register converters for declared types, once per process.
+        '''
+        if cls._converters_registered:
+            return
+        bytes_one = cls._BYTES_ONE
+        sqlite3.register_converter('BOOLEAN', lambda x: x == bytes_one)
+        StoreSQLite._converters_registered = True
 
     @staticmethod
     def _dtype_to_affinity_type(
@@ -53,7 +292,7 @@ class StoreSQLite(Store):
             # store_filter: tp.Optional[StoreFilter]
             ) -> None:
 
-        # here we provide a row-based represerntation that is externally usable as an slqite db; an alternative approach would be to store one cell pre column, where the column iststored as as binary BLOB; see here https://stackoverflow.com/questions/18621513/python-insert-numpy-array-into-sqlite3-database
+        # here we provide a row-based representation that is externally usable as an sqlite db; the alternative, with arrays stored as binary BLOBs, is provided by ArchiveSQLite
         field_names, dtypes = cls.get_field_names_and_dtypes(
                 frame=frame,
                 include_index=include_index,
@@ -87,51 +326,129 @@ class StoreSQLite(Store):
         insert_template = ', '.join('?' for _ in field_names)
         insert = f'INSERT INTO "{label}" ({insert_fields}) VALUES ({insert_template})'
 
-        values = cls._get_row_iterator(frame=frame, include_index=include_index)
-        cursor.executemany(insert, values())
+        arrays = []
+        for array in cls.get_column_iterator(frame=frame, include_index=include_index):
+            if array.dtype.kind == DTYPE_DATETIME_KIND:
+                # store as ISO 8601 strings, not as opaque bytes
+                array = array.astype(DTYPE_STR)
+            arrays.append(array)
+
+        # convert column-wise to Python objects, one chunk of rows at a time, avoiding boxing NumPy scalars per cell
+        count = len(frame)
+        for start in range(0, count, cls._WRITE_CHUNKSIZE):
+            stop = start + cls._WRITE_CHUNKSIZE
+            values = [a[start:stop].tolist() for a in arrays]
+            cursor.executemany(insert, zip(*values))
+
+    @staticmethod
+    def _frame_from_archive(
+            *,
+            archive: ArchiveSQLite,
+            config: StoreConfig,
+            constructor: tp.Type[Frame],
+            ) -> Frame:
+        '''Decode a table written with ``blob_layout``. As the index and columns are stored with their depths and types, ``index_depth`` and ``columns_depth``, if not the defaults, must match those stored, and constructors cannot be provided; ``columns_select``, ``dtypes``, and ``consolidate_blocks`` are applied after decoding.
+        '''
+        if config.index_constructors is not None or config.columns_constructors is not None:
+            raise ErrorInitStore('index_constructors and columns_constructors cannot be used with tables written with blob_layout.')
+
+        frame = ArchiveFrameConverter.frame_decode(
+                archive=archive,
+                constructor=constructor,
+                )
+        if config.index_depth and config.index_depth != frame.index.depth:
+            raise ErrorInitStore(f'index_depth {config.index_depth} does not match the stored index depth {frame.index.depth}.')
+        if config.columns_depth != 1 and config.columns_depth != frame.columns.depth:
+            raise ErrorInitStore(f'columns_depth {config.columns_depth} does not match the stored columns depth {frame.columns.depth}.')
+
+        if config.columns_select is not None:
+            frame = frame[frame.columns.isin(config.columns_select)]
+        if config.dtypes is not None:
+            frame = frame.astype(config.dtypes, consolidate_blocks=config.consolidate_blocks)
+        elif config.consolidate_blocks:
+            frame = frame.__class__(frame._blocks.consolidate(),
+                    index=frame._index,
+                    columns=frame._columns,
+                    name=frame._name,
+                    own_data=True,
+                    own_index=True,
+                    own_columns=True,
+                    )
+        return frame
 
     @store_coherent_write
     def write(self,
             items: tp.Iterable[tp.Tuple[tp.Hashable, Frame]],
             *,
             config: StoreConfigMapInitializer = None,
+            journal_mode: tp.Optional[str] = None,
+            synchronous: tp.Optional[str] = None,
+            blob_layout: bool = False,
             # store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
             ) -> None:
+        '''
+        Args:
+            journal_mode: Optionally, an SQLite ``journal_mode`` PRAGMA value, such as "WAL" or "OFF", set before writing.
+            synchronous: Optionally, an SQLite ``synchronous`` PRAGMA value, such as "OFF" or "NORMAL", set before writing.
+            blob_layout: If True, write each table as NPY bytes, one BLOB per index array, columns array, and block; such tables are faster to write and read, but are not usable as relational tables.
+        '''
+        if journal_mode is not None and journal_mode.upper() not in self._JOURNAL_MODES:
+            raise RuntimeError(f'Invalid journal_mode: {journal_mode}')
+        if synchronous is not None and synchronous.upper() not in self._SYNCHRONOUS:
+            raise RuntimeError(f'Invalid synchronous: {synchronous}')
 
         config_map = StoreConfigMap.from_initializer(config)
+        self._register_adapters()
 
-        # NOTE: register adapters for NP types:
-        # numpy types go in as blobs if they are not individually converted tp python types
-        sqlite3.register_adapter(np.int64, int)
-        sqlite3.register_adapter(np.int32, int)
-        sqlite3.register_adapter(np.int16, int)
-        sqlite3.register_adapter(np.bool_, bool)
-        # common python types
-        sqlite3.register_adapter(Fraction, str)
-        sqlite3.register_adapter(complex, lambda x: f'{x.real}:{x.imag}')
+        self._connections_close()
 
         # SQLite will naturally try to update, no replace, a DB found at an FP; this is not how all other stores work, so best to remove the file first.
         with suppress(FileNotFoundError):
             os.remove(self._fp)
 
         # hierarchical columns might be stored as tuples
-        with sqlite3.connect(self._fp, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        conn = sqlite3.connect(self._fp,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                isolation_level=None, # manage the transaction explicitly
+                )
+        try:
             cursor = conn.cursor()
-            for label, frame in items:
-                c = config_map[label]
-
-                # if label is STORE_LABEL_DEFAULT this will raise
-                label = config_map.default.label_encode(label)
-
-                self._frame_to_table(frame=frame,
-                        label=label,
-                        cursor=cursor,
-                        include_columns=c.include_columns,
-                        include_index=c.include_index,
-                        # store_filter=store_filter
-                        )
-
-            conn.commit()
+            if journal_mode is not None:
+                cursor.execute(f'PRAGMA journal_mode={journal_mode.upper()}')
+            if synchronous is not None:
+                cursor.execute(f'PRAGMA synchronous={synchronous.upper()}')
+
+            # write all tables in a single transaction
+            cursor.execute('BEGIN')
+            try:
+                for label, frame in items:
+                    c = config_map[label]
+
+                    # if label is STORE_LABEL_DEFAULT this will raise
+                    label = config_map.default.label_encode(label)
+
+                    if blob_layout:
+                        ArchiveFrameConverter.frame_encode(
+                                archive=ArchiveSQLite(cursor, label, writeable=True),
+                                frame=frame,
+                                include_index=c.include_index,
+                                include_columns=c.include_columns,
+                                consolidate_blocks=c.consolidate_blocks,
+                                )
+                    else:
+                        self._frame_to_table(frame=frame,
+                                label=label,
+                                cursor=cursor,
+                                include_columns=c.include_columns,
+                                include_index=c.include_index,
+                                # store_filter=store_filter
+                                )
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+        finally:
+            conn.close()
 
     @store_coherent_non_write
     def read_many(self,
@@ -141,32 +458,38 @@ class StoreSQLite(Store):
             container_type: tp.Type[Frame] = Frame,
             ) -> tp.Iterator[Frame]:
 
-        config_map = StoreConfigMap.from_initializer(config)
-        sqlite3.register_converter('BOOLEAN', lambda x: x == self._BYTES_ONE)
-
-        with sqlite3.connect(self._fp,
-                detect_types=sqlite3.PARSE_DECLTYPES
-                ) as conn:
-
-            for label in labels:
-                c = config_map[label]
+        config_map = self._config_map_read(config)
+        conn = self._connection_read()
+        cursor = conn.cursor()
 
-                label_encoded = config_map.default.label_encode(label)
-                name = label
+        for label in labels:
+            c = config_map[label]
 
-                query = f'SELECT * from "{label_encoded}"'
+            label_encoded = config_map.default.label_encode(label)
+            name = label
 
-                yield tp.cast(Frame, container_type.from_sql(query=query,
-                        connection=conn,
-                        index_depth=c.index_depth,
-                        index_constructors=c.index_constructors,
-                        columns_depth=c.columns_depth,
-                        columns_select=c.columns_select,
-                        columns_constructors=c.columns_constructors,
-                        dtypes=c.dtypes,
-                        name=name,
-                        consolidate_blocks=c.consolidate_blocks
-                        ))
+            query = self._query(cursor, label_encoded)
+            if query is None:
+                frame = self._frame_from_archive(
+                        archive=ArchiveSQLite(cursor, label_encoded, writeable=False),
+                        config=c,
+                        constructor=container_type,
+                        )
+                yield frame.rename(name)
+                continue
+
+            yield tp.cast(Frame, container_type.from_sql(query=query,
+                    connection=conn,
+                    index_depth=c.index_depth,
+                    index_constructors=c.index_constructors,
+                    columns_depth=c.columns_depth,
+                    columns_select=c.columns_select,
+                    columns_constructors=c.columns_constructors,
+                    dtypes=c.dtypes,
+                    name=name,
+                    consolidate_blocks=c.consolidate_blocks,
+                    chunksize=self._READ_CHUNKSIZE,
+                    ))
 
     @store_coherent_non_write
     def labels(self, *,
@@ -176,8 +499,7 @@ class StoreSQLite(Store):
 
         config_map = StoreConfigMap.from_initializer(config)
 
-        with sqlite3.connect(self._fp) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            for row in cursor:
-                yield config_map.default.label_decode(row[0])
+        cursor = self._connection_read().cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+        for row in cursor.fetchall():
+            yield config_map.default.label_decode(row[0])
@@ -15,6 +15,7 @@ from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigHE
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
@@ -22,6 +23,7 @@ from static_frame.core.store_filter import StoreFilter
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import COMPLEX_TYPES
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_COMPLEX_KIND
 from static_frame.core.util import DTYPE_INEXACT_KINDS
 from static_frame.core.util import DTYPE_INT_KINDS
 from static_frame.core.util import DTYPE_OBJECT
@@ -30,6 +32,8 @@ from static_frame.core.util import NUMERIC_TYPES
 from static_frame.core.util import STORE_LABEL_DEFAULT
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
+from static_frame.core.util import get_executor
+from static_frame.core.util import iter_chunk
 
 if tp.TYPE_CHECKING:
     from xlsxwriter.format import Format  # pylint: disable=W0611 #pragma: no cover
@@ -42,6 +46,16 @@ if tp.TYPE_CHECKING:
 MAX_XLSX_ROWS = 1048576
 MAX_XLSX_COLUMNS = 16384 #1024 on libre office
 
+class PayloadSheetsToFrames(tp.NamedTuple):
+    '''
+    Defines the necessary objects to read Frames from sheets of a workbook. Used for multiprocessing.
+    '''
+    fp: str
+    # triples of encoded label (None for the first sheet), name, and config
+    sheets: tp.Tuple[tp.Tuple[tp.Optional[str], tp.Hashable, StoreConfigHE], ...]
+    store_filter: tp.Optional[StoreFilter]
+    container_type: tp.Type[Frame]
+
 class FormatDefaults:
 
     @staticmethod
@@ -76,6 +90,8 @@ class FormatDefaults:
 class StoreXLSX(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.xlsx',))
+    # number of rows converted to Python objects at a time when writing rows
+    _WRITE_CHUNKSIZE = 10_000
 
     # _EXT: str = '.xlsx'
 
@@ -282,17 +298,152 @@ class StoreXLSX(Store):
                         ws.merge_range(row, col, row + width - 1, col, label, format_index)
                     row += width
 
+    @classmethod
+    def _frame_to_worksheet_rows(cls,
+            frame: Frame,
+            ws: 'Worksheet',
+            *,
+            include_columns: bool,
+            include_columns_name: bool = False,
+            include_index: bool,
+            include_index_name: bool = True,
+            format_columns: 'Format',
+            format_index: 'Format',
+            format_date: 'Format',
+            format_datetime: 'Format',
+            format_columns_date: 'Format',
+            format_columns_datetime: 'Format',
+            format_index_date: 'Format',
+            format_index_datetime: 'Format',
+            merge_hierarchical_labels: bool,
+            store_filter: tp.Optional[StoreFilter]
+            ) -> None:
+        '''
+        Write the Frame row by row, in chunks of rows converted column-wise to Python objects, as required by a workbook in ``constant_memory`` mode. Writers and formats are determined once per column. As rows cannot be written out of order, hierarchical index labels are not merged.
+        '''
+        if sum((include_columns_name, include_index_name)) > 1:
+            raise RuntimeError('cannot set both `include_columns_name` and `include_index_name`')
+
+        index_depth = frame._index.depth
+        index_depth_effective = 0 if not include_index else index_depth
+        index_names = frame._index.names # normalized presentation
+
+        columns_depth = frame._columns.depth
+        columns_names = frame._columns.names
+        columns_depth_effective = 0 if not include_columns else columns_depth
+
+        columns_total = frame.shape[1] + index_depth_effective
+        rows_total = frame.shape[0] + columns_depth_effective
+
+        if rows_total > MAX_XLSX_ROWS:
+            raise RuntimeError(f'Frame rows do not fit into XLSX sheet ({rows_total} > {MAX_XLSX_ROWS})')
+        if columns_total > MAX_XLSX_COLUMNS:
+            raise RuntimeError(f'Frame columns do not fit into XLSX sheet ({columns_total} > {MAX_XLSX_COLUMNS})')
+
+        def column_writer(
+                dtype: np.dtype,
+                format_cell: tp.Optional['Format'],
+                format_date: 'Format',
+                format_datetime: 'Format',
+                ) -> tp.Callable[[int, int, tp.Any], tp.Any]:
+            writer_attr, _ = cls._dtype_to_writer_attr(dtype)
+            if writer_attr != 'write' and dtype.kind != DTYPE_COMPLEX_KIND:
+                # values of this column can be given directly to the type-specific writer
+                writer_native = getattr(ws, writer_attr)
+                return lambda row, col, value: writer_native(row, col, value, format_cell)
+            writer = cls._get_writer(dtype, ws)
+            return lambda row, col, value: writer(row, col, value,
+                    format_date=format_date,
+                    format_datetime=format_datetime,
+                    format_cell=format_cell,
+                    )
+
+        #-----------------------------------------------------------------------
+        # header rows
+        if include_columns:
+            columns_values = frame._columns.values
+            if store_filter:
+                columns_values = store_filter.from_type_filter_array(columns_values)
+            writer_columns = column_writer(columns_values.dtype,
+                    format_columns,
+                    format_columns_date,
+                    format_columns_datetime,
+                    )
+            # for labels in apex, do not know type
+            writer_index_names = column_writer(DTYPE_OBJECT,
+                    format_index,
+                    format_index_date,
+                    format_index_datetime,
+                    )
+            writer_columns_names = column_writer(DTYPE_OBJECT,
+                    format_columns,
+                    format_columns_date,
+                    format_columns_datetime,
+                    )
+
+            for row in range(columns_depth):
+                if include_index_name and row == 0:
+                    for col in range(index_depth_effective):
+                        writer_index_names(row, col, index_names[col])
+                if include_columns_name and index_depth_effective:
+                    writer_columns_names(row, 0, columns_names[row])
+
+                for col in range(index_depth_effective, columns_total):
+                    if columns_depth == 1:
+                        writer_columns(row, col, columns_values[col - index_depth_effective])
+                    else:
+                        writer_columns(row, col, columns_values[col - index_depth_effective, row])
+
+                # merges within a row must be written before the next row
+                if merge_hierarchical_labels and row < columns_depth - 1:
+                    col = index_depth_effective # start after index
+                    for label, width in frame._columns.label_widths_at_depth(row):
+                        if width > 1:
+                            ws.merge_range(row, col, row, col + width - 1, label, format_columns)
+                        col += width
+
+        #-----------------------------------------------------------------------
+        # data rows
+        arrays = []
+        writers = []
+        for col, values in enumerate(cls.get_column_iterator(frame=frame,
+                include_index=include_index)):
+            if store_filter:
+                # this might change the dtype
+                values = store_filter.from_type_filter_array(values)
+            arrays.append(values)
+            if col < index_depth_effective:
+                writers.append(column_writer(values.dtype,
+                        format_index,
+                        format_index_date,
+                        format_index_datetime,
+                        ))
+            else:
+                writers.append(column_writer(values.dtype,
+                        None,
+                        format_date,
+                        format_datetime,
+                        ))
+
+        for start in range(0, frame.shape[0], cls._WRITE_CHUNKSIZE):
+            stop = start + cls._WRITE_CHUNKSIZE
+            chunk = [a[start:stop].tolist() for a in arrays]
+            for row, row_values in enumerate(zip(*chunk), start + columns_depth_effective):
+                for col, (writer, v) in enumerate(zip(writers, row_values)):
+                    writer(row, col, v)
+
     @store_coherent_write
     def write(self,
             items: tp.Iterable[tp.Tuple[tp.Hashable, Frame]],
             *,
             config: StoreConfigMapInitializer = None,
-            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            constant_memory: bool = False,
             ) -> None:
         '''
         Args:
             store_filter: a dictionary of objects to string, enabling replacement of NaN and None values when writng to XLSX.
-
+            constant_memory: If True, use the XlsxWriter ``constant_memory`` mode, writing each sheet row by row with bounded memory; hierarchical index labels are not merged.
         '''
         # format_data: tp.Optional[tp.Dict[tp.Hashable, tp.Dict[str, tp.Any]]]
         # format_data: dictionary of dictionaries, keyed by column label, that contains dictionaries of XlsxWriter format specifications.
@@ -303,7 +454,12 @@ class StoreXLSX(Store):
         import xlsxwriter
 
         # NOTE: can supply second argument: {'default_date_format': 'dd/mm/yy'}
-        wb = xlsxwriter.Workbook(self._fp, {'remove_timezone': True})
+        wb = xlsxwriter.Workbook(self._fp, {
+                'remove_timezone': True,
+                'constant_memory': constant_memory,
+                })
+        frame_to_worksheet = (self._frame_to_worksheet_rows if constant_memory
+                else self._frame_to_worksheet)
 
         for label, frame in items:
             c = config_map[label]
@@ -343,7 +499,7 @@ class StoreXLSX(Store):
                     format_funcs=(FormatDefaults.label, FormatDefaults.datetime,))
 
             ws = wb.add_worksheet(label) # label can be None
-            self._frame_to_worksheet(frame,
+            frame_to_worksheet(frame,
                     ws,
                     format_columns=format_columns,
                     format_index=format_index,
@@ -372,187 +528,245 @@ class StoreXLSX(Store):
                 data_only=True
                 )
 
-    # @doc_inject(selector='constructor_frame')
-    @store_coherent_non_write
-    def read_many(self,
-            labels: tp.Iterable[tp.Hashable],
+    @classmethod
+    def _sheet_to_frame(cls,
+            ws: tp.Any, # an openpyxl read-only worksheet
             *,
-            config: StoreConfigMapInitializer = None,
-            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
-            container_type: tp.Type[Frame] = Frame,
-            ) -> tp.Iterator[Frame]:
-
-        config_map = StoreConfigMap.from_initializer(config)
-        wb = self._load_workbook(self._fp)
-
-        for label in labels:
-            c = config_map[label]
-
-            index_depth = c.index_depth
-            index_name_depth_level = c.index_name_depth_level
-            index_constructors = c.index_constructors
-            columns_depth = c.columns_depth
-            columns_name_depth_level = c.columns_name_depth_level
-            columns_constructors = c.columns_constructors
-            trim_nadir = c.trim_nadir
-            skip_header = c.skip_header
-            skip_footer = c.skip_footer
-            dtypes = c.dtypes
-            consolidate_blocks = c.consolidate_blocks
+            name: tp.Hashable,
+            config: tp.Union[StoreConfig, StoreConfigHE],
+            store_filter: tp.Optional[StoreFilter],
+            container_type: tp.Type[Frame],
+            ) -> Frame:
+        '''
+        Create a Frame from an openpyxl worksheet.
+        '''
+        index_depth = config.index_depth
+        index_name_depth_level = config.index_name_depth_level
+        index_constructors = config.index_constructors
+        columns_depth = config.columns_depth
+        columns_name_depth_level = config.columns_name_depth_level
+        columns_constructors = config.columns_constructors
+        trim_nadir = config.trim_nadir
+        skip_header = config.skip_header
+        skip_footer = config.skip_footer
+        dtypes = config.dtypes
+        consolidate_blocks = config.consolidate_blocks
+
+        if ws.max_column <= 1 or ws.max_row <= 1:
+            # https://openpyxl.readthedocs.io/en/stable/optimized.html
+            # says that some clients might not report correct dimensions
+            ws.calculate_dimension()
+
+        max_column = ws.max_column
+        max_row = ws.max_row
+
+        # adjust for downward shift for skipping header, then reduce for footer; at this value and beyond we stop
+        last_row_count = max_row - skip_header - skip_footer
+
+        index_values: tp.List[tp.Any] = []
+        columns_values: tp.List[tp.Any] = []
+        data = []
+        apex_rows = []
+
+        if trim_nadir:
+            mask = np.full((last_row_count, max_column), False)
+
+        for row_count, row in enumerate(
+                ws.iter_rows(max_row=max_row), start=-skip_header):
+            if row_count < 0:
+                continue # due to skip header; preserves comparison to columns_depth
+            if row_count >= last_row_count:
+                break
 
-            if label is STORE_LABEL_DEFAULT:
-                ws = wb[wb.sheetnames[0]]
-                name = None # do not set to default sheet name
+            if trim_nadir:
+                row_data: tp.Sequence[tp.Any] = []
+                for col_count, cell in enumerate(row):
+                    if store_filter is None:
+                        value = cell.value
+                    else:
+                        value = store_filter.to_type_filter_element(cell.value)
+                    if value is None: # NOTE: only checking None, not np.nan
+                        mask[row_count, col_count] = True
+                    row_data.append(value) # type: ignore
+                if not row_data:
+                    # NOTE: there might be scenarios where there are empty ``row`` iterables that still increment the row_count; we cannot generate these directly for test
+                    mask[row_count] = True #pragma: no cover
             else:
-                label_encoded = config_map.default.label_encode(label)
-                ws = wb[label_encoded]
-                name = label # set name to the un-encoded hashable
-
-            if ws.max_column <= 1 or ws.max_row <= 1:
-                # https://openpyxl.readthedocs.io/en/stable/optimized.html
-                # says that some clients might not report correct dimensions
-                ws.calculate_dimension()
-
-            max_column = ws.max_column
-            max_row = ws.max_row
+                if store_filter is None:
+                    row_data = tuple(cell.value for cell in row)
+                else: # only need to filter string values, but probably too expensive to pre-check
+                    row_data = tuple(store_filter.to_type_filter_element(cell.value) for cell in row)
+
+            if row_count <= columns_depth - 1:
+                apex_rows.append(row_data[:index_depth])
+                if columns_depth == 1:
+                    columns_values.extend(row_data[index_depth:])
+                elif columns_depth > 1:
+                    columns_values.append(row_data[index_depth:])
+                continue
+
+            if index_depth == 0:
+                data.append(row_data)
+            elif index_depth == 1:
+                index_values.append(row_data[0])
+                data.append(row_data[1:])
+            else:
+                index_values.append(row_data[:index_depth])
+                data.append(row_data[index_depth:])
+
+        #-----------------------------------------------------------------------
+        # Trim all-empty trailing rows created from style formatting GH#146. As the wb is opened in read-only mode, reverse iterating on the wb is not an option, nor is direct row access by integer
+        if trim_nadir:
+            # NOTE: `mask` is all data, while `data` is post index/columns extraction; this means that if a non-None label is found, the row/column will not be trimmed.
+            row_mask = mask.all(axis=1)
+            row_trim_start = array1d_to_last_contiguous_to_edge(row_mask) - columns_depth
+            if row_trim_start < len(row_mask) - columns_depth:
+                data = data[:row_trim_start]
+                if index_depth > 0: # this handles depth 1 and greater
+                    index_values = index_values[:row_trim_start]
+
+            col_mask = mask.all(axis=0)
+            col_trim_start = array1d_to_last_contiguous_to_edge(col_mask) - index_depth
+            if col_trim_start < len(col_mask) - index_depth:
+                data = (r[:col_trim_start] for r in data) #type: ignore
+                if columns_depth == 1:
+                    columns_values = columns_values[:col_trim_start]
+                if columns_depth > 1:
+                    columns_values = (r[:col_trim_start] for r in columns_values) #type: ignore
+
+        #-----------------------------------------------------------------------
+        # continue with Index and Frame creation
+        index_name = None if columns_depth == 0 else apex_to_name(
+                rows=apex_rows,
+                depth_level=index_name_depth_level,
+                axis=0,
+                axis_depth=index_depth)
+
+        # index: tp.Optional[IndexBase] = None
+
+        if index_depth <= 1:
+            index_default_constructor = partial(Index, name=index_name)
+        else: # > 1
+            index_default_constructor = partial(IndexHierarchy.from_labels,
+                    name=index_name,
+                    continuation_token=None, # NOTE: needed
+                    )
+        index, own_index = index_from_optional_constructors(
+                index_values,
+                depth=index_depth,
+                default_constructor=index_default_constructor,
+                explicit_constructors=index_constructors, # cannot supply name
+                )
 
-            # adjust for downward shift for skipping header, then reduce for footer; at this value and beyond we stop
-            last_row_count = max_row - skip_header - skip_footer
+        columns_name = None if index_depth == 0 else apex_to_name(
+                    rows=apex_rows,
+                    depth_level=columns_name_depth_level,
+                    axis=1,
+                    axis_depth=columns_depth)
 
-            index_values: tp.List[tp.Any] = []
-            columns_values: tp.List[tp.Any] = []
-            data = []
-            apex_rows = []
+        # columns: tp.Optional[IndexBase] = None
+        # own_columns = False
 
-            if trim_nadir:
-                mask = np.full((last_row_count, max_column), False)
-
-            for row_count, row in enumerate(
-                    ws.iter_rows(max_row=max_row), start=-skip_header):
-                if row_count < 0:
-                    continue # due to skip header; preserves comparison to columns_depth
-                if row_count >= last_row_count:
-                    break
-
-                if trim_nadir:
-                    row_data: tp.Sequence[tp.Any] = []
-                    for col_count, cell in enumerate(row):
-                        if store_filter is None:
-                            value = cell.value
-                        else:
-                            value = store_filter.to_type_filter_element(cell.value)
-                        if value is None: # NOTE: only checking None, not np.nan
-                            mask[row_count, col_count] = True
-                        row_data.append(value) # type: ignore
-                    if not row_data:
-                        # NOTE: there might be scenarios where there are empty ``row`` iterables that still increment the row_count; we cannot generate these directly for test
-                        mask[row_count] = True #pragma: no cover
-                else:
-                    if store_filter is None:
-                        row_data = tuple(cell.value for cell in row)
-                    else: # only need to filter string values, but probably too expensive to pre-check
-                        row_data = tuple(store_filter.to_type_filter_element(cell.value) for cell in row)
+        if columns_depth <= 1:
+            columns_default_constructor = partial(
+                    container_type._COLUMNS_CONSTRUCTOR,
+                    name=columns_name,
+                    )
+        elif columns_depth > 1:
+            columns_default_constructor = partial(
+                    container_type._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels,
+                    name=columns_name,
+                    continuation_token=None, # NOTE: needed, not the default
+                    )
+            columns_values = zip(*columns_values) #type: ignore
 
-                if row_count <= columns_depth - 1:
-                    apex_rows.append(row_data[:index_depth])
-                    if columns_depth == 1:
-                        columns_values.extend(row_data[index_depth:])
-                    elif columns_depth > 1:
-                        columns_values.append(row_data[index_depth:])
-                    continue
-
-                if index_depth == 0:
-                    data.append(row_data)
-                elif index_depth == 1:
-                    index_values.append(row_data[0])
-                    data.append(row_data[1:])
-                else:
-                    index_values.append(row_data[:index_depth])
-                    data.append(row_data[index_depth:])
+        columns, own_columns = index_from_optional_constructors(
+                columns_values,
+                depth=columns_depth,
+                default_constructor=columns_default_constructor,
+                explicit_constructors=columns_constructors, # cannot supply name
+                )
 
-            #-----------------------------------------------------------------------
-            # Trim all-empty trailing rows created from style formatting GH#146. As the wb is opened in read-only mode, reverse iterating on the wb is not an option, nor is direct row access by integer
-            if trim_nadir:
-                # NOTE: `mask` is all data, while `data` is post index/columns extraction; this means that if a non-None label is found, the row/column will not be trimmed.
-                row_mask = mask.all(axis=1)
-                row_trim_start = array1d_to_last_contiguous_to_edge(row_mask) - columns_depth
-                if row_trim_start < len(row_mask) - columns_depth:
-                    data = data[:row_trim_start]
-                    if index_depth > 0: # this handles depth 1 and greater
-                        index_values = index_values[:row_trim_start]
-
-                col_mask = mask.all(axis=0)
-                col_trim_start = array1d_to_last_contiguous_to_edge(col_mask) - index_depth
-                if col_trim_start < len(col_mask) - index_depth:
-                    data = (r[:col_trim_start] for r in data) #type: ignore
-                    if columns_depth == 1:
-                        columns_values = columns_values[:col_trim_start]
-                    if columns_depth > 1:
-                        columns_values = (r[:col_trim_start] for r in columns_values) #type: ignore
+        return container_type.from_records(data, # type: ignore
+                index=index,
+                columns=columns,
+                dtypes=dtypes,
+                own_index=own_index,
+                own_columns=own_columns,
+                name=name,
+                consolidate_blocks=consolidate_blocks
+                )
 
-            #-----------------------------------------------------------------------
-            # continue with Index and Frame creation
-            index_name = None if columns_depth == 0 else apex_to_name(
-                    rows=apex_rows,
-                    depth_level=index_name_depth_level,
-                    axis=0,
-                    axis_depth=index_depth)
-
-            # index: tp.Optional[IndexBase] = None
-
-            if index_depth <= 1:
-                index_default_constructor = partial(Index, name=index_name)
-            else: # > 1
-                index_default_constructor = partial(IndexHierarchy.from_labels,
-                        name=index_name,
-                        continuation_token=None, # NOTE: needed
-                        )
-            index, own_index = index_from_optional_constructors(
-                    index_values,
-                    depth=index_depth,
-                    default_constructor=index_default_constructor,
-                    explicit_constructors=index_constructors, # cannot supply name
+    @classmethod
+    def _payload_to_frames(cls, payload: PayloadSheetsToFrames) -> tp.List[Frame]:
+        '''
+        Open the workbook read-only and read each sheet defined by the payload. Used for multiprocessing.
+        '''
+        wb = cls._load_workbook(payload.fp)
+        try:
+            return [cls._sheet_to_frame(
+                    wb[wb.sheetnames[0]] if label_encoded is None else wb[label_encoded],
+                    name=name,
+                    config=config,
+                    store_filter=payload.store_filter,
+                    container_type=payload.container_type,
                     )
+                    for label_encoded, name, config in payload.sheets]
+        finally:
+            wb.close()
 
-            columns_name = None if index_depth == 0 else apex_to_name(
-                        rows=apex_rows,
-                        depth_level=columns_name_depth_level,
-                        axis=1,
-                        axis_depth=columns_depth)
+    # @doc_inject(selector='constructor_frame')
+    @store_coherent_non_write
+    def read_many(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            store_filter: tp.Optional[StoreFilter] = STORE_FILTER_DEFAULT,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[Frame]:
 
-            # columns: tp.Optional[IndexBase] = None
-            # own_columns = False
+        config_map = self._config_map_read(config)
 
-            if columns_depth <= 1:
-                columns_default_constructor = partial(
-                        container_type._COLUMNS_CONSTRUCTOR,
-                        name=columns_name,
+        def sheets() -> tp.Iterator[tp.Tuple[tp.Optional[str], tp.Hashable, StoreConfig]]:
+            for label in labels:
+                if label is STORE_LABEL_DEFAULT:
+                    # read the first sheet; do not set name to default sheet name
+                    yield None, None, config_map[label]
+                else:
+                    # set name to the un-encoded hashable
+                    yield config_map.default.label_encode(label), label, config_map[label]
+
+        if config_map.default.read_max_workers is None:
+            wb = self._load_workbook(self._fp)
+            for label_encoded, name, c in sheets():
+                ws = wb[wb.sheetnames[0]] if label_encoded is None else wb[label_encoded]
+                yield self._sheet_to_frame(ws,
+                        name=name,
+                        config=c,
+                        store_filter=store_filter,
+                        container_type=container_type,
                         )
-            elif columns_depth > 1:
-                columns_default_constructor = partial(
-                        container_type._COLUMNS_HIERARCHY_CONSTRUCTOR.from_labels,
-                        name=columns_name,
-                        continuation_token=None, # NOTE: needed, not the default
+            wb.close()
+            return
+
+        # each payload defines read_chunksize sheets to be read from one workbook opened in a worker
+        chunksize = config_map.default.read_chunksize
+
+        def gen() -> tp.Iterator[PayloadSheetsToFrames]:
+            for chunk in iter_chunk(sheets(), chunksize):
+                yield PayloadSheetsToFrames( # pylint: disable=no-value-for-parameter
+                        fp=self._fp,
+                        sheets=tuple((label_encoded, name, c.to_store_config_he())
+                                for label_encoded, name, c in chunk),
+                        store_filter=store_filter,
+                        container_type=container_type,
                         )
-                columns_values = zip(*columns_values) #type: ignore
-
-            columns, own_columns = index_from_optional_constructors(
-                    columns_values,
-                    depth=columns_depth,
-                    default_constructor=columns_default_constructor,
-                    explicit_constructors=columns_constructors, # cannot supply name
-                    )
 
-            yield container_type.from_records(data,
-                    index=index,
-                    columns=columns,
-                    dtypes=dtypes,
-                    own_index=own_index,
-                    own_columns=own_columns,
-                    name=name,
-                    consolidate_blocks=consolidate_blocks
-                    )
-        wb.close()
+        with get_executor(max_workers=config_map.default.read_max_workers,
+                mp_context=config_map.default.mp_context,
+                ) as executor:
+            for frames in executor.map(self._payload_to_frames, gen()):
+                yield from frames
 
     @store_coherent_non_write
     def read(self,
@@ -2,7 +2,6 @@ import os
 import pickle
 import typing as tp
 import zipfile
-from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from io import StringIO
 
@@ -20,9 +19,8 @@ from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import NOT_IN_CACHE_SENTINEL
 from static_frame.core.util import AnyCallable
-
-# import multiprocessing as mp
-# mp_context = mp.get_context('spawn')
+from static_frame.core.util import get_executor
+from static_frame.core.util import map_bounded
 
 FrameExporter = AnyCallable # Protocol not supported yet...
 FrameConstructor = tp.Callable[[tp.Any], Frame]
@@ -149,7 +147,7 @@ class _StoreZip(Store):
             container_type: tp.Type[Frame] = Frame,
             ) -> tp.Iterator[Frame]:
 
-        config_map = StoreConfigMap.from_initializer(config)
+        config_map = self._config_map_read(config)
         multiprocess: bool = config_map.default.read_max_workers is not None
         constructor: FrameConstructor = self._container_type_to_constructor(container_type)
 
@@ -213,7 +211,9 @@ class _StoreZip(Store):
 
         chunksize = config_map.default.read_chunksize
 
-        with ProcessPoolExecutor(max_workers=config_map.default.read_max_workers) as executor:
+        with get_executor(max_workers=config_map.default.read_max_workers,
+                mp_context=config_map.default.mp_context,
+                ) as executor:
             frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
 
             for label, cached_frame in results_items():
@@ -253,10 +253,16 @@ class _StoreZip(Store):
 
         if multiprocess:
             def label_and_bytes() -> tp.Iterator[LabelAndBytes]:
-                with ProcessPoolExecutor(max_workers=config_map.default.write_max_workers) as executor:
-                    yield from executor.map(self._payload_to_bytes,
+                with get_executor(max_workers=config_map.default.write_max_workers,
+                        mp_context=config_map.default.mp_context,
+                        ) as executor:
+                    # payload Frames are submitted only as bytes are written
+                    yield from map_bounded(executor,
+                            self._payload_to_bytes,
                             gen(),
-                            chunksize=config_map.default.write_chunksize)
+                            chunksize=config_map.default.write_chunksize,
+                            max_workers=config_map.default.write_max_workers,
+                            )
         else:
             label_and_bytes = lambda: (self._payload_to_bytes(x) for x in gen())
 
@@ -535,7 +541,7 @@ class StoreZipNPY(Store):
             container_type: tp.Type[Frame] = Frame,
             ) -> tp.Iterator[Frame]:
 
-        config_map = StoreConfigMap.from_initializer(config)
+        config_map = self._config_map_read(config)
 
         with zipfile.ZipFile(self._fp) as zf:
             archive = ArchiveZipWrapper(zf,
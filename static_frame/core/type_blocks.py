@@ -24,11 +24,14 @@ from static_frame.core.display_config import DisplayConfig
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorInitTypeBlocks
+from static_frame.core.group import GroupPlan
+from static_frame.core.group import group_starts
 from static_frame.core.index_correspondence import IndexCorrespondence
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.style_config import StyleConfig
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
@@ -48,8 +51,10 @@ from static_frame.core.util import ShapeType
 from static_frame.core.util import UFunc
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_from_pickle
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_groups_and_locations
+from static_frame.core.util import array_to_pickle
 from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import arrays_equal
 from static_frame.core.util import binary_transition
@@ -63,11 +68,9 @@ from static_frame.core.util import isin_array
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_nd
-from static_frame.core.util import roll_1d
 from static_frame.core.util import slice_to_ascending_slice
 from static_frame.core.util import slices_from_targets
 from static_frame.core.util import ufunc_dtype_to_dtype
-from static_frame.core.util import view_2d_as_1d
 
 
 #---------------------------------------------------------------------------
@@ -170,6 +173,7 @@ def group_sorted(
         extract: tp.Optional[int] = None,
         as_array: bool = False,
         group_source: tp.Optional[np.ndarray] = None,
+        group_plan: tp.Optional[GroupPlan] = None,
         ) -> tp.Iterator[tp.Tuple[np.ndarray, slice, tp.Union['TypeBlocks', np.ndarray]]]:
     '''
     This method must be called on sorted TypeBlocks instance.
@@ -181,6 +185,7 @@ def group_sorted(
         drop: Optionally drop the target of the grouping as specified by ``key``.
         axis: if 0, key is column selection, yield groups of rows; if 1, key is row selection, yield gruops of columns
         kind: Type of sort; a stable sort is required to preserve original odering.
+        group_plan: if provided, ``blocks`` must be ordered by ``group_plan.ordering``; group boundaries and labels are taken from the plan.
 
     Returns:
         Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
@@ -192,7 +197,10 @@ def group_sorted(
     if blocks._shape[0] == 0 or blocks._shape[1] == 0: # zero sized
         return
 
-    if group_source is not None:
+    if group_plan is not None:
+        # NOTE: labels are ordered as group_source would be after transposition for axis 1
+        group_source = group_plan.labels
+    elif group_source is not None:
         pass
         # NOTE: axis 1 transposition is not required as group_source is already prepared by h-stacking 1D arrays
     elif axis == 0:
@@ -228,43 +236,27 @@ def group_sorted(
         else:
             row_key = None if not drop else drop_mask
 
-    # find iloc positions where new value is not equal to previous; drop the first as roll wraps
-    if group_source.ndim == 2:
-        group_to_tuple = True
-        if group_source.dtype == DTYPE_OBJECT:
-            # NOTE: cannot get view of object; use string
-            consolidated = view_2d_as_1d(group_source.astype(str))
-        else:
-            consolidated = view_2d_as_1d(group_source)
-        transitions = np.flatnonzero(consolidated != roll_1d(consolidated, 1))[1:]
+    group_to_tuple = group_source.ndim == 2
+    if group_plan is not None:
+        starts = group_plan.starts
+        labels = group_plan.labels
     else:
-        group_to_tuple = False
-        transitions = np.flatnonzero(group_source != roll_1d(group_source, 1))[1:]
+        # find iloc positions where a row is not equal to the previous; objects are compared directly, not as strings
+        starts = group_starts(group_source)
+        labels = group_source[starts]
 
-    start = 0
-    for t in transitions:
-        slc = slice(start, t)
+    ends = chain(starts[1:], (None,))
+    for label, start, end in zip(labels, starts, ends):
+        slc = slice(start, end)
         # slice order to get elemtns in original ordering that are selected
         if axis == 0:
             chunk = func(row_key=slc, column_key=column_key)
         else:
             chunk = func(row_key=row_key, column_key=slc)
         if group_to_tuple:
-            yield tuple(group_source[start]), slc, chunk
-        else:
-            yield group_source[start], slc, chunk
-        start = t
-
-    if start < len(group_source):
-        slc = slice(start, None)
-        if axis == 0:
-            chunk = func(row_key=slc, column_key=column_key)
-        else:
-            chunk = func(row_key=row_key, column_key=slc)
-        if group_to_tuple:
-            yield tuple(group_source[start]), slc, chunk
+            yield tuple(label), slc, chunk
         else:
-            yield group_source[start], slc, chunk
+            yield label, slc, chunk
 
 #-------------------------------------------------------------------------------
 
@@ -639,6 +631,27 @@ class TypeBlocks(ContainerOperand):
         for b in self._blocks:
             b.flags.writeable = False
 
+    def __reduce_ex__(self, protocol: int) -> tp.Tuple[tp.Any, ...]: #type: ignore
+        '''
+        Reduce to blocks and shape, such that, with pickle protocol 5, blocks can be transferred as out-of-band buffers; the per-column mappings are recreated when unpickled.
+        '''
+        return (self.__class__._from_pickle, (
+                [array_to_pickle(b) for b in self._blocks],
+                [b.dtype for b in self._blocks],
+                self._shape,
+                ))
+
+    @classmethod
+    def _from_pickle(cls,
+            blocks: tp.List[np.ndarray],
+            dtypes: tp.List[np.dtype],
+            shape: tp.Tuple[int, int],
+            ) -> 'TypeBlocks':
+        return cls.from_blocks(
+                (array_from_pickle(b, dtype) for b, dtype in zip(blocks, dtypes)),
+                shape_reference=shape,
+                )
+
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'TypeBlocks':
         obj = self.__class__.__new__(self.__class__)
         obj._blocks = [array_deepcopy(b, memo) for b in self._blocks]
@@ -1273,6 +1286,21 @@ class TypeBlocks(ContainerOperand):
             ) -> tp.Tuple['TypeBlocks', np.ndarray]:
         '''While sorting generally happens at the Frame level, some lower level operations will benefit from sorting on type blocks directly.
 
+        Args:
+            axis: 0 orders columns by row(s) given by ``key``; 1 orders rows by column(s) given by ``key``.
+        '''
+        order = self.sort_ordering(axis=axis, key=key, kind=kind)
+        if axis == 0:
+            return self._extract(column_key=order), order # order columns
+        return self._extract(row_key=order), order
+
+    def sort_ordering(self,
+            axis: int,
+            key: GetItemKeyTypeCompound,
+            kind: str = DEFAULT_SORT_KIND,
+            ) -> np.ndarray:
+        '''Return the positions that would sort this TypeBlocks, without extracting the sorted TypeBlocks.
+
         Args:
             axis: 0 orders columns by row(s) given by ``key``; 1 orders rows by column(s) given by ``key``.
         '''
@@ -1307,33 +1335,56 @@ class TypeBlocks(ContainerOperand):
             order = np.argsort(values_for_sort, kind=kind)
         else:
             raise RuntimeError('unable to resovle sort type') #pragma: no cover
+        return order
 
+    def group_plan(self,
+            axis: int,
+            key: GetItemKeyType,
+            kind: str = DEFAULT_STABLE_SORT_KIND,
+            ) -> GroupPlan:
+        '''
+        Derive a :obj:`GroupPlan`. Axis 0 groups rows on the values of column(s) given by ``key``; axis 1 groups columns on the values of row(s) given by ``key``. Sortable values are grouped by sorting; values that cannot be sorted (such as mixed-type objects) are factorized by hashing.
+        '''
         if axis == 0:
-            return self._extract(column_key=order), order # order columns
-        return self._extract(row_key=order), order
+            group_source = self._extract_array(column_key=key)
+        elif axis == 1: # present groups from top to bottom
+            group_source = self._extract_array(row_key=key).T
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        try:
+            ordering = self.sort_ordering(axis=not axis, key=key, kind=kind)
+        except TypeError: # raised on sorting issue
+            return GroupPlan.from_factorize(group_source)
+        return GroupPlan.from_ordering(group_source, ordering)
 
     def group(self,
             axis: int,
             key: GetItemKeyType,
             drop: bool = False,
             kind: str = DEFAULT_SORT_KIND,
+            group_plan: tp.Optional[GroupPlan] = None,
             ) -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, 'TypeBlocks']]:
         '''
         Axis 0 groups on column values, axis 1 groups on row values
 
         NOTE: this interface should only be called in situations when we do not need to align Index objects, as this does the sort and holds on to the ordering; the alternative is to sort and call group_sorted directly.
-        '''
-        # NOTE: using a stable sort is necessary for groups to retain initial ordering.
-        try:
-            blocks, _ = self.sort(key=key, axis=not axis, kind=kind)
-            use_sorted = True
-        except TypeError: # raised on sorting issue
-            use_sorted = False
 
-        if use_sorted:
-            yield from group_sorted(blocks, axis=axis, key=key, drop=drop)
+        Args:
+            group_plan: a previously derived :obj:`GroupPlan` for ``key``; if provided, no sort is performed.
+        '''
+        if group_plan is None:
+            group_plan = self.group_plan(axis=axis, key=key, kind=kind)
+        if axis == 0:
+            blocks = self._extract(row_key=group_plan.ordering)
         else:
-            yield from group_match(self, axis=axis, key=key, drop=drop)
+            blocks = self._extract(column_key=group_plan.ordering)
+        yield from group_sorted(blocks,
+                axis=axis,
+                key=key,
+                drop=drop,
+                group_plan=group_plan,
+                )
 
 
     def group_extract(self,
@@ -1341,36 +1392,30 @@ class TypeBlocks(ContainerOperand):
             key: int,
             extract: int,
             kind: str = DEFAULT_SORT_KIND,
+            group_plan: tp.Optional[GroupPlan] = None,
             ) -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         '''
         This interface will do an extraction on the opposite axis if the extraction is a single row/column.
 
         NOTE: this interface should only be called in situations when we do not need to align Index objects, as this does the sort and holds on to the ordering; the alternative is to sort and call group_sorted directly.
+
+        Args:
+            group_plan: a previously derived :obj:`GroupPlan` for ``key``; if provided, no sort is performed.
         '''
-        # might unpack keys that are lists of one element
-        # NOTE: using a stable sort is necssary for groups to retain initial ordering.
-        try:
-            blocks, _ = self.sort(key=key, axis=not axis, kind=kind)
-            use_sorted = True
-        except TypeError:
-            use_sorted = False
-
-        if use_sorted:
-            yield from group_sorted(blocks,
-                    axis=axis,
-                    key=key,
-                    drop=False,
-                    extract=extract,
-                    as_array=True,
-                    )
+        if group_plan is None:
+            group_plan = self.group_plan(axis=axis, key=key, kind=kind)
+        if axis == 0:
+            blocks = self._extract(row_key=group_plan.ordering)
         else:
-            yield from group_match(self,
-                    axis=axis,
-                    key=key,
-                    drop=False,
-                    extract=extract,
-                    as_array=True,
-                    )
+            blocks = self._extract(column_key=group_plan.ordering)
+        yield from group_sorted(blocks,
+                axis=axis,
+                key=key,
+                drop=False,
+                extract=extract,
+                as_array=True,
+                group_plan=group_plan,
+                )
 
     #---------------------------------------------------------------------------
     # transformations resulting in reduced dimensionality
@@ -1,15 +1,23 @@
 import contextlib
 import datetime
 import math
+import multiprocessing
 import operator
 import os
+import pickle
+import secrets
 import tempfile
 import typing as tp
 import warnings
 from collections import Counter
 from collections import abc
 from collections import defaultdict
+from collections import deque
 from collections import namedtuple
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from copy import deepcopy
 from enum import Enum
 from fractions import Fraction
@@ -17,6 +25,7 @@ from functools import partial
 from functools import reduce
 from io import StringIO
 from itertools import chain
+from itertools import islice
 from itertools import zip_longest
 from os import PathLike
 from types import TracebackType
@@ -31,6 +40,8 @@ from static_frame.core.exception import InvalidDatetime64Initializer
 from static_frame.core.exception import LocInvalid
 
 if tp.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory  # pylint: disable=W0611 #pragma: no cover
+
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.frame import FrameAsType  # pylint: disable=W0611 #pragma: no cover
     from static_frame.core.index import Index  # pylint: disable=W0611 #pragma: no cover
@@ -257,6 +268,7 @@ Bloc2DKeyType = tp.Union['Frame', np.ndarray]
 
 UFunc = tp.Callable[..., np.ndarray]
 AnyCallable = tp.Callable[..., tp.Any]
+ChunkSize = tp.Union[int, str] # an int, or CHUNKSIZE_AUTO
 
 Mapping = tp.Union[tp.Mapping[tp.Hashable, tp.Any], 'Series']
 CallableOrMapping = tp.Union[AnyCallable, tp.Mapping[tp.Hashable, tp.Any], 'Series']
@@ -393,6 +405,7 @@ STORE_LABEL_DEFAULT = object()
 
 #-------------------------------------------------------------------------------
 NOT_IN_CACHE_SENTINEL = object()
+FACTORIZE_NA_SENTINEL = object()
 
 #-------------------------------------------------------------------------------
 # operator mod does not have r methods; create complete method reference
@@ -988,6 +1001,42 @@ def array_ufunc_axis_skipna(
 #-------------------------------------------------------------------------------
 # unique value discovery; based on NP's arraysetops.py
 
+def array_factorize(
+        array: np.ndarray,
+        axis: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Hash-based factorization: without sorting or converting values, return the positions of the first occurrence of each unique value, and, for each position, an integer code of its value; codes are assigned in the order values are first seen. For 2D arrays, axis 0 factorizes rows and axis 1 factorizes columns. As distinct NaN (and NaT) objects are not equal, they are replaced by a single sentinel before hashing, such that all are given one code.
+    '''
+    is_na = isna_array(array, include_none=False)
+    if is_na.any():
+        array = array.astype(object)
+        array[is_na] = FACTORIZE_NA_SENTINEL
+
+    if array.ndim == 1:
+        values: tp.Iterable[tp.Hashable] = array
+    elif axis == 0:
+        values = array2d_to_tuples(array)
+    else:
+        values = array2d_to_tuples(array.T)
+
+    count = array.shape[axis] if array.ndim == 2 else len(array)
+    codes = np.empty(count, dtype=DTYPE_INT_DEFAULT)
+    positions: tp.List[int] = []
+    indices: tp.Dict[tp.Hashable, int] = {}
+    for i, v in enumerate(values):
+        code = indices.get(v)
+        if code is None:
+            code = indices[v] = len(positions)
+            positions.append(i)
+        codes[i] = code
+
+    first = np.array(positions, dtype=DTYPE_INT_DEFAULT)
+    first.flags.writeable = False
+    codes.flags.writeable = False
+    return first, codes
+
+
 def argsort_array(array: np.ndarray, kind: str = DEFAULT_STABLE_SORT_KIND) -> np.ndarray:
     # NOTE: must use stable sort when returning positions
     if array.dtype.kind == 'O':
@@ -995,15 +1044,8 @@ def argsort_array(array: np.ndarray, kind: str = DEFAULT_STABLE_SORT_KIND) -> np
             return array.argsort(kind=kind)
         except TypeError: # if unorderable types
             pass
-
-        array_sortable = np.empty(array.shape, dtype=DTYPE_INT_DEFAULT)
-
-        indices: tp.Dict[tp.Any, int] = {}
-        for i, v in enumerate(array):
-            array_sortable[i] = indices.setdefault(v, len(indices))
-        del indices
-
-        return np.argsort(array_sortable, kind=kind)
+        _, codes = array_factorize(array)
+        return np.argsort(codes, kind=kind)
 
     return array.argsort(kind=kind)
 
@@ -1039,7 +1081,14 @@ def ufunc_unique1d_indexer(array: np.ndarray,
     '''
     Find the unique elements of an array. Optimized from NumPy implementation based on assumption of 1D array. Returns unique values as well as index positions of those values in the original array.
     '''
-    positions = argsort_array(array)
+    if array.dtype.kind == 'O':
+        try:
+            positions = array.argsort(kind=DEFAULT_STABLE_SORT_KIND)
+        except TypeError: # if unorderable types, factorize in order of appearance
+            first, indexer = array_factorize(array)
+            return array[first], indexer
+    else:
+        positions = argsort_array(array)
 
     # get the sorted array
     array = array[positions]
@@ -1164,10 +1213,23 @@ def ufunc_unique2d_indexer(array: np.ndarray,
         array = array.T
 
     if array.dtype.kind == 'O':
-        # we must convert to string in order to extract positions data
-        consolidated = view_2d_as_1d(array.astype(str))
-        positions, indexer = ufunc_unique1d_positions(consolidated)
-        values = array[positions] # restore original values
+        # NOTE: object rows cannot be viewed as 1D; if sortable, order rows with a lexsort, else factorize in order of appearance
+        try:
+            order = np.lexsort([array[:, i] for i in range(array.shape[1] - 1, -1, -1)])
+        except TypeError:
+            order = None
+        if order is None:
+            positions, indexer = array_factorize(array)
+        else:
+            array_sorted = array[order]
+            mask = np.empty(len(array_sorted), dtype=DTYPE_BOOL)
+            mask[:1] = True
+            mask[1:] = (array_sorted[1:] != array_sorted[:-1]).any(axis=1)
+            positions = order[mask]
+            indexer = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+            indexer[order] = np.cumsum(mask) - 1
+            indexer.flags.writeable = False
+        values = array[positions] # retain original values
 
     else:
         consolidated = view_2d_as_1d(array)
@@ -1320,6 +1382,20 @@ def _argminmax_2d(
 argmin_2d = partial(_argminmax_2d, ufunc=np.argmin, ufunc_skipna=np.nanargmin)
 argmax_2d = partial(_argminmax_2d, ufunc=np.argmax, ufunc_skipna=np.nanargmax)
 
+def iter_chunk(
+        iterable: tp.Iterable[tp.Any],
+        size: int,
+        ) -> tp.Iterator[tp.List[tp.Any]]:
+    '''
+    Yield lists of up to ``size`` elements from ``iterable``.
+    '''
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 #-------------------------------------------------------------------------------
 # array constructors
 
@@ -2085,52 +2161,17 @@ def _array_to_duplicated_hashable(
     '''
     Algorithm for finding duplicates in unsortable arrays for hashables. This will always be an object array.
     '''
-    # np.unique fails under the same conditions that sorting fails, so there is no need to try np.unique: must go to set drectly.
-    len_axis = array.shape[axis]
-
-    if array.ndim == 1:
-        value_source = array
-        to_hashable = None
-    else:
-        if axis == 0:
-            value_source = array # will iterate rows
-        else:
-            value_source = (array[:, i] for i in range(len_axis))
-        # values will be arrays; must convert to tuples to make hashable
-        to_hashable = tuple
-
-
-    is_dupe = np.full(len_axis, False)
-
-    # could exit early with a set, but would have to hash all array twice to go to set and dictionary
-    # creating a list for each entry and tracking indices would be very expensive
-
-    unique_to_first: tp.Dict[tp.Hashable, int] = {} # value to first occurence
-    dupe_to_first: tp.Dict[tp.Hashable, int] = {}
-    dupe_to_last: tp.Dict[tp.Hashable, int] = {}
-
-    for idx, v in enumerate(value_source):
-
-        if to_hashable:
-            v = to_hashable(v)
-
-        if v not in unique_to_first:
-            unique_to_first[v] = idx
-        else:
-            # v has been seen before; upate Boolean array
-            is_dupe[idx] = True
-
-            # if no entry in dupe to first, no update with value in unique to first, which is the index this values was first seen
-            if v not in dupe_to_first:
-                dupe_to_first[v] = unique_to_first[v]
-            # always update last
-            dupe_to_last[v] = idx
+    # np.unique fails under the same conditions that sorting fails, so there is no need to try np.unique: must factorize by hashing
+    first, codes = array_factorize(array, axis=axis)
+    is_dupe = np.bincount(codes, minlength=len(first))[codes] > 1
 
     if exclude_last: # overwrite with False
-        is_dupe[list(dupe_to_last.values())] = False
+        last = np.zeros(len(first), dtype=DTYPE_INT_DEFAULT)
+        np.maximum.at(last, codes, np.arange(len(codes)))
+        is_dupe[last] = False
 
-    if not exclude_first: # add in first values
-        is_dupe[list(dupe_to_first.values())] = True
+    if exclude_first:
+        is_dupe[first] = False
 
     return is_dupe
 
@@ -3359,3 +3400,376 @@ def iloc_to_insertion_iloc(key: int, size: int) -> int:
     if key < -size or key >= size:
         raise IndexError(f'index {key} out of range for length {size} container.')
     return key % size
+
+#-------------------------------------------------------------------------------
+# executors for process pools
+
+def get_executor(
+        executor: tp.Optional[Executor] = None,
+        *,
+        max_workers: tp.Optional[int] = None,
+        use_threads: bool = False,
+        mp_context: tp.Optional[str] = None,
+        ) -> tp.ContextManager[Executor]:
+    '''
+    Return a context manager providing an executor. If ``executor`` is provided, it is used and is not shut down on exit, such that a long-lived executor can be reused across calls; otherwise, a new ThreadPoolExecutor or ProcessPoolExecutor (started with the ``mp_context`` start method, if provided) is created and shut down on exit.
+    '''
+    if executor is not None:
+        return contextlib.nullcontext(executor)
+    if use_threads:
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=None if mp_context is None else multiprocessing.get_context(mp_context),
+            )
+
+def executor_is_process(
+        executor: tp.Optional[Executor] = None,
+        *,
+        use_threads: bool = False,
+        ) -> bool:
+    '''
+    Return True if the executor provided by :obj:`get_executor` transfers arguments and results to other processes.
+    '''
+    if executor is not None:
+        return isinstance(executor, ProcessPoolExecutor)
+    return not use_threads
+
+CHUNKSIZE_AUTO = 'auto'
+CHUNKS_PER_WORKER = 4
+COST_WINDOW_PER_WORKER = 16
+IN_FLIGHT_PER_WORKER = 2
+
+def estimate_cost(value: tp.Any) -> int:
+    '''
+    Estimate the cost of processing ``value`` by its size in bytes, if defined.
+    '''
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is None or not isinstance(nbytes, INT_TYPES):
+        return 1
+    return max(int(nbytes), 1)
+
+def chunk_by_cost(
+        costs: tp.Sequence[int],
+        count: int,
+        ) -> tp.List[tp.List[int]]:
+    '''
+    Partition the positions of ``costs`` into approximately ``count`` chunks of balanced total cost. Positions are taken in descending order of cost, such that the costliest chunks are first, and a position with a cost at or above the target is in a chunk of its own.
+    '''
+    order = sorted(range(len(costs)), key=costs.__getitem__, reverse=True)
+    target = sum(costs) / max(count, 1)
+
+    chunks = []
+    chunk: tp.List[int] = []
+    chunk_cost = 0
+    for i in order:
+        chunk.append(i)
+        chunk_cost += costs[i]
+        if chunk_cost >= target:
+            chunks.append(chunk)
+            chunk = []
+            chunk_cost = 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+def call_chunk(
+        func: AnyCallable,
+        args: tp.List[tp.Any],
+        ) -> tp.List[tp.Any]:
+    '''
+    Call ``func`` with each of ``args`` (in a worker), returning a list of results.
+    '''
+    return [func(arg) for arg in args]
+
+def futures_cancel(futures: tp.Iterable[tp.Any]) -> None:
+    '''
+    Cancel ``futures`` that have not started, and wait for those that have, such that no work (or transfer of arguments or results) continues after return. Elements that are None (released futures) are skipped.
+    '''
+    running = [future for future in futures
+            if future is not None and not future.cancel()]
+    futures_wait(running)
+
+def map_by_cost(
+        executor: Executor,
+        func: AnyCallable,
+        args: tp.Iterable[tp.Any],
+        *,
+        cost: tp.Callable[[tp.Any], int] = estimate_cost,
+        max_workers: tp.Optional[int] = None,
+        wrap: tp.Optional[tp.Callable[[tp.Iterator[tp.Any], AnyCallable],
+                tp.Tuple[tp.Iterator[tp.Any], AnyCallable]]] = None,
+        ) -> tp.Generator[tp.Any, None, None]:
+    '''
+    An alternative to ``executor.map()`` that groups ``args`` into chunks of balanced estimated cost, submitting the costliest chunks first. Rather than consuming all ``args``, ``args`` are consumed in windows of ``COST_WINDOW_PER_WORKER`` per worker, each partitioned into ``CHUNKS_PER_WORKER`` chunks per worker; the next window is consumed and submitted only when results of the previous window are first yielded, such that no more than two windows are held. Results are yielded in the order of ``args``. If the returned generator is closed, unfinished work is cancelled.
+
+    Args:
+        wrap: Optionally, a function to transform the iterator of chunks and the function called per chunk before submission.
+    '''
+    workers = max_workers or os.cpu_count() or 1
+    count = workers * CHUNKS_PER_WORKER
+    args_iter = iter(args)
+
+    def submit() -> bool:
+        window = list(islice(args_iter, workers * COST_WINDOW_PER_WORKER))
+        if not window:
+            return False
+        chunks = chunk_by_cost([cost(arg) for arg in window], count)
+        args_chunks: tp.Iterator[tp.Any] = ([window[i] for i in chunk] for chunk in chunks)
+        func_chunk: AnyCallable = partial(call_chunk, func)
+        if wrap is not None:
+            args_chunks, func_chunk = wrap(args_chunks, func_chunk)
+        futures = [executor.submit(func_chunk, arg) for arg in args_chunks]
+        windows.append((chunks, futures))
+        return True
+
+    # pairs of the chunks of positions in a window, and the futures of those chunks
+    windows: tp.Deque[tp.Tuple[tp.List[tp.List[int]], tp.List[tp.Any]]] = deque()
+    try:
+        submit()
+        while windows:
+            chunks, futures = windows[0]
+            submit()
+            # for each position in the window, the chunk and the position in the chunk
+            locations: tp.List[tp.Tuple[int, int]] = [(0, 0)] * sum(len(chunk) for chunk in chunks)
+            for i_chunk, chunk in enumerate(chunks):
+                for i_result, i in enumerate(chunk):
+                    locations[i] = (i_chunk, i_result)
+
+            remaining = [len(chunk) for chunk in chunks]
+            results: tp.Dict[int, tp.List[tp.Any]] = {}
+            for i_chunk, i_result in locations:
+                if i_chunk not in results:
+                    results[i_chunk] = futures[i_chunk].result()
+                    futures[i_chunk] = None # release
+                yield results[i_chunk][i_result]
+                remaining[i_chunk] -= 1
+                if not remaining[i_chunk]:
+                    del results[i_chunk]
+            windows.popleft()
+    finally: # on exception or close, do not start pending work
+        futures_cancel(f for _, futures in windows for f in futures)
+
+def map_bounded(
+        executor: Executor,
+        func: AnyCallable,
+        args: tp.Iterable[tp.Any],
+        *,
+        chunksize: int = 1,
+        max_workers: tp.Optional[int] = None,
+        ) -> tp.Generator[tp.Any, None, None]:
+    '''
+    An alternative to ``executor.map()`` that applies back-pressure: rather than consuming and submitting all ``args`` when called, ``args`` are consumed and submitted (in chunks of ``chunksize``) only as results are yielded, such that no more than ``IN_FLIGHT_PER_WORKER`` chunks per worker are submitted or held. Results are yielded in the order of ``args``. If the returned generator is closed, unfinished work is cancelled.
+    '''
+    max_in_flight = (max_workers or os.cpu_count() or 1) * IN_FLIGHT_PER_WORKER
+    func_chunk: AnyCallable = partial(call_chunk, func)
+    args_iter = iter(args)
+
+    def submit() -> bool:
+        chunk = list(islice(args_iter, chunksize))
+        if not chunk:
+            return False
+        futures.append(executor.submit(func_chunk, chunk))
+        return True
+
+    futures: tp.Deque[tp.Any] = deque()
+    try:
+        while len(futures) < max_in_flight and submit():
+            pass
+        while futures:
+            results = futures.popleft().result()
+            submit()
+            yield from results
+    finally: # on exception or close, do not start pending work
+        futures_cancel(futures)
+
+def reduce_tree(
+        combine: tp.Callable[[tp.Any, tp.Any], tp.Any],
+        values: tp.Iterable[tp.Any],
+        ) -> tp.Any:
+    '''
+    Combine ``values`` pairwise in a balanced binary tree, preserving order (the left operand always precedes the right). Values are consumed lazily and at most one partial result per level of the tree is held. Raises ``ValueError`` if ``values`` is empty.
+    '''
+    # pairs of level, partial result; levels are strictly decreasing
+    stack: tp.List[tp.Tuple[int, tp.Any]] = []
+    for value in values:
+        level = 0
+        while stack and stack[-1][0] == level:
+            value = combine(stack.pop()[1], value)
+            level += 1
+        stack.append((level, value))
+
+    if not stack:
+        raise ValueError('no values to reduce')
+
+    value = stack.pop()[1]
+    while stack:
+        value = combine(stack.pop()[1], value)
+    return value
+
+#-------------------------------------------------------------------------------
+# pickling for process pools
+
+def array_to_pickle(array: np.ndarray) -> np.ndarray:
+    '''
+    Prepare an array for pickling such that, with protocol 5, its data can be transferred as an out-of-band buffer: NumPy pickles datetime64 and timedelta64 arrays in-band, so these are viewed as integers.
+    '''
+    if array.dtype.kind in DTYPE_NAT_KINDS:
+        return array.view(DTYPE_INT_DEFAULT)
+    return array
+
+def array_from_pickle(array: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    '''
+    Restore an array prepared with :obj:`array_to_pickle`; as the unpickled array is not shared, it is set not writeable without a copy.
+    '''
+    array.flags.writeable = False
+    if array.dtype != dtype:
+        return array.view(dtype)
+    return array
+
+class SharedMemoryBuffer:
+    '''
+    Expose the memory of an attached shared memory segment to NumPy through the array interface. Arrays created from this object (and all views of them) hold a reference to it, such that the segment is closed, and its memory freed, only when those arrays are garbage collected.
+    '''
+    __slots__ = ('_shm', '_interface')
+
+    def __init__(self, shm: 'SharedMemory') -> None:
+        self._shm = shm
+        # the address is read through a temporary array; as that array is released, the segment's buffer has no exports when closed
+        address = np.frombuffer(shm.buf, dtype=np.uint8).__array_interface__['data'][0]
+        self._interface = {
+                'shape': (shm.size,),
+                'typestr': '|u1',
+                'data': (address, False),
+                'version': 3,
+                }
+
+    @property
+    def __array_interface__(self) -> tp.Dict[str, tp.Any]:
+        return self._interface
+
+    def __del__(self) -> None:
+        self._shm.close()
+
+
+def shared_memory_attach(name: str) -> np.ndarray:
+    '''
+    Attach and unlink the shared memory segment of ``name``, returning a 1D array of bytes on its memory. The segment is closed when that array, and all arrays created on it, are garbage collected.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    shm.unlink()
+    return np.asarray(SharedMemoryBuffer(shm))
+
+def shared_memory_unlink(names: tp.Iterable[str]) -> None:
+    '''
+    Unlink the shared memory segments of ``names`` that exist, i.e., that were created but not attached.
+    '''
+    from multiprocessing.shared_memory import SharedMemory
+
+    for name in names:
+        try:
+            shm = SharedMemory(name=name)
+        except (ValueError, OSError):
+            # not found, or not yet sized by the creating process
+            continue
+        try:
+            shm.unlink()
+        except OSError: # unlinked by another process
+            pass
+        shm.close()
+
+def pickle_shared_memory_loads(
+        data: bytes,
+        name: str,
+        sizes: tp.List[int],
+        ) -> tp.Any:
+    '''
+    Unpickle an object pickled by :obj:`PickleSharedMemory`; arrays are created on the attached shared memory segment without copying, and the segment is unlinked, such that its memory is freed when those arrays are no longer referenced.
+    '''
+    # the size of the segment might be rounded up to a page size
+    base = shared_memory_attach(name)[:sum(sizes)]
+    buffers = []
+    start = 0
+    for size in sizes:
+        buffers.append(base[start: start + size])
+        start += size
+    return pickle.loads(data, buffers=buffers)
+
+
+class PickleSharedMemory:
+    '''
+    Wrapper of an object to be sent to or from a process pool. When pickled (with any protocol), the wrapped object is pickled with protocol 5, and contiguous array data is copied into a new shared memory segment named ``name``; when unpickled, the wrapped object (not this wrapper) is returned, with arrays created on that segment without a further copy.
+    '''
+    __slots__ = ('obj', 'name')
+
+    def __init__(self, obj: tp.Any, name: str) -> None:
+        self.obj = obj
+        self.name = name
+
+    def __reduce__(self) -> tp.Tuple[tp.Any, ...]:
+        buffers: tp.List[pickle.PickleBuffer] = []
+        data = pickle.dumps(self.obj, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            return (pickle.loads, (data,))
+
+        from multiprocessing import resource_tracker  # type: ignore
+        from multiprocessing.shared_memory import SharedMemory
+
+        raws = [b.raw() for b in buffers]
+        sizes = [raw.nbytes for raw in raws]
+        shm = SharedMemory(name=self.name, create=True, size=max(sum(sizes), 1))
+        if os.name == 'posix':
+            # the segment is unlinked by the receiving process (or the SharedMemorySession), which might not share this process's resource tracker
+            resource_tracker.unregister(f'/{shm.name}', 'shared_memory')
+        start = 0
+        for raw, size in zip(raws, sizes):
+            shm.buf[start: start + size] = raw
+            start += size
+        shm.close()
+        return (pickle_shared_memory_loads, (data, self.name, sizes))
+
+
+class SharedMemorySession:
+    '''
+    Provide names of shared memory segments for the arguments and results of calls in a process pool; when exited, segments created but never attached (for example, results not retrieved) are unlinked.
+    '''
+    __slots__ = ('_prefix', '_count')
+
+    def __init__(self) -> None:
+        # names are limited to 30 characters on some platforms
+        self._prefix = f'sf{secrets.token_hex(6)}_'
+        self._count = 0
+
+    def __enter__(self) -> 'SharedMemorySession':
+        return self
+
+    def __exit__(self,
+            exc_type: tp.Optional[tp.Type[BaseException]],
+            exc_value: tp.Optional[BaseException],
+            traceback: tp.Optional[TracebackType],
+            ) -> None:
+        shared_memory_unlink(f'{self._prefix}{i}{suffix}'
+                for i in range(self._count)
+                for suffix in ('a', 'r')
+                )
+
+    def wrap(self, arg: tp.Any) -> tp.Tuple[PickleSharedMemory, str]:
+        '''
+        Return the pair of ``arg`` wrapped for transfer to a worker, and the name of the segment to be used for the result.
+        '''
+        name = f'{self._prefix}{self._count}'
+        self._count += 1
+        return PickleSharedMemory(arg, f'{name}a'), f'{name}r'
+
+
+def call_pickle_shared_memory(
+        func: AnyCallable,
+        arg_name: tp.Tuple[tp.Any, str],
+        ) -> PickleSharedMemory:
+    '''
+    Call ``func`` with an argument provided by :obj:`SharedMemorySession.wrap` (in a worker process), wrapping the result in :obj:`PickleSharedMemory` for return.
+    '''
+    arg, name = arg_name
+    return PickleSharedMemory(func(arg), name)
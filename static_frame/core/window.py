@@ -0,0 +1,476 @@
+import typing as tp
+from functools import partial
+
+import numpy as np
+
+from static_frame.core.group import UFUNC_GROUP_REDUCE
+from static_frame.core.group import _group_reduce_columns
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_INEXACT_KINDS
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_NA_KINDS
+from static_frame.core.util import DTYPE_NAT_KINDS
+from static_frame.core.util import array_ufunc_axis_skipna
+from static_frame.core.util import isna_array
+from static_frame.core.util import ufunc_dtype_to_dtype
+
+# names of reductions supported by window_reduce()
+WINDOW_REDUCTIONS = (
+        'count',
+        'max',
+        'mean',
+        'min',
+        'std',
+        'sum',
+        'var',
+        )
+
+# kinds reduced with cumulative sums and block-wise accumulations
+WINDOW_KERNEL_KINDS = frozenset(('b', 'i', 'u', 'f'))
+
+# functions that, given an axis, reduce each window of a view of all windows in one call
+WINDOW_VIEW_REDUCTIONS = frozenset((
+        np.all,
+        np.any,
+        np.max,
+        np.mean,
+        np.median,
+        np.min,
+        np.nanmax,
+        np.nanmean,
+        np.nanmedian,
+        np.nanmin,
+        np.nanprod,
+        np.nanstd,
+        np.nansum,
+        np.nanvar,
+        np.prod,
+        np.ptp,
+        np.std,
+        np.sum,
+        np.var,
+        ))
+
+# the maximum count of elements of windows reduced in one call; windows are copied when reshaped for reduction
+WINDOW_VIEW_CHUNK_ELEMENTS = 2 ** 22
+
+def window_positions(*,
+        count: int,
+        size: int,
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    For the valid windows yielded by ``axis_window_items`` (when ``window_func``, ``window_valid``, and ``size_increment`` are not used), return the unfloored position of the left edge of each window and the position of its label. Each window is the slice of ``size`` positions from its left edge, floored at 0.
+
+    Args:
+        count: the length of the axis windowed.
+    '''
+    # see axis_window_items() for the iterative definition reproduced here
+    if size <= 0:
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    if start_shift >= 0:
+        count_window_max = count
+    else:
+        count_window_max = count + abs(start_shift)
+    idx_left_max = count_window_max - 1
+
+    # the first window is always evaluated; as step is not negative, left edges are non-decreasing and subsequent windows are evaluated until a left edge exceeds idx_left_max
+    following = start_shift + np.arange(1, count_window_max + 1) * step
+    iterations = 1 + np.count_nonzero(following <= idx_left_max)
+
+    lefts = start_shift + np.arange(iterations, dtype=DTYPE_INT_DEFAULT) * step
+    labels = lefts + (size - 1 + label_shift)
+    valid = (labels >= 0) & (labels < count)
+    if window_sized:
+        lengths = np.clip(lefts + size, 0, count) - np.clip(lefts, 0, count)
+        valid &= lengths == size
+    return lefts[valid], labels[valid]
+
+#-------------------------------------------------------------------------------
+
+def _window_cumulative(
+        array: np.ndarray,
+        dtype: np.dtype,
+        ) -> np.ndarray:
+    '''Return the cumulative sum along axis 0, with a leading row of zeros.'''
+    post = np.zeros((len(array) + 1,) + array.shape[1:], dtype=dtype)
+    np.cumsum(array, axis=0, dtype=dtype, out=post[1:])
+    return post
+
+def _window_sum_count(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        ) -> np.ndarray:
+    '''Return the count of True values of a Boolean array per window.'''
+    cumulative = _window_cumulative(array, DTYPE_INT_DEFAULT)
+    return cumulative[ends] - cumulative[starts]
+
+def _window_blocks(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        identity: tp.Any,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Pad ``array`` with ``identity``, such that every window of ``size`` from a position in ``lefts`` lies within the padded array, and partition it into blocks of ``size``; each window is then covered by a suffix of one block and a prefix of the next. Return the blocks, of shape (blocks, size, ...), and the position of the start of each window in the flattened blocks.
+    '''
+    count = len(array)
+    pad_front = max(0, -int(lefts.min()))
+    pad_back = max(0, int(lefts.max()) + size - count)
+    blocks = -(-(pad_front + count + pad_back) // size)
+
+    padded = np.full((blocks * size,) + array.shape[1:], identity, dtype=array.dtype)
+    padded[pad_front: pad_front + count] = array
+    return padded.reshape((blocks, size) + array.shape[1:]), lefts + pad_front
+
+def _window_block_accumulate(
+        blocks: np.ndarray,
+        ufunc: np.ufunc,
+        *,
+        suffix: bool = False,
+        ) -> np.ndarray:
+    '''
+    Return the prefix (or, if ``suffix``, the suffix) accumulation of ``ufunc`` within each block, flattened.
+    '''
+    shape = (-1,) + blocks.shape[2:]
+    if suffix:
+        return ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(shape)
+    return ufunc.accumulate(blocks, axis=1).reshape(shape)
+
+def _window_block_sum(
+        blocks: np.ndarray,
+        starts: np.ndarray,
+        size: int,
+        ) -> np.ndarray:
+    '''
+    Given blocks and starts from ``_window_blocks``, return the sum per window, as the sum of a suffix of one block and a prefix of the next; a window aligned to a block is the suffix alone.
+    '''
+    post = _window_block_accumulate(blocks, np.add, suffix=True)[starts]
+    offset = starts % size != 0
+    post[offset] += _window_block_accumulate(blocks, np.add)[starts[offset] + size - 1]
+    return post
+
+def _window_sum(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        dtype: np.dtype,
+        ) -> np.ndarray:
+    '''Return the sum per window, excluding NaN. As cumulative sums of inexact values lose precision to, or are corrupted by, preceding values of any magnitude, inexact windows are summed from block-wise accumulations, such that each sum is of values within two blocks of ``size``.'''
+    if array.dtype.kind not in DTYPE_INEXACT_KINDS:
+        count = len(array)
+        cumulative = _window_cumulative(array, dtype)
+        return cumulative[np.clip(lefts + size, 0, count)] - cumulative[np.clip(lefts, 0, count)]
+
+    values = np.where(np.isnan(array), 0, array).astype(dtype, copy=False)
+    blocks, starts = _window_blocks(values, lefts, size, 0)
+    return _window_block_sum(blocks, starts, size)
+
+def _window_var(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        ddof: int,
+        ) -> np.ndarray:
+    '''
+    Return the variance per window, excluding NaN. Each window is covered by a suffix of one block and a prefix of the next (see ``_window_blocks``); for each part, sums of deviations and of squared deviations are accumulated from a value of that part (the last finite value of the block for suffixes, the first for prefixes), limiting the loss of precision to the spread of the part, and the parts are combined with the pairwise update of Chan et al.
+    '''
+    dtype = ufunc_dtype_to_dtype(np.var, array.dtype)
+    values = array.astype(dtype, copy=False)
+    finite = np.isfinite(values)
+
+    blocks, starts = _window_blocks(np.where(finite, values, 0), lefts, size, 0)
+    valid, _ = _window_blocks(finite, lefts, size, False)
+
+    # reference values per block, broadcast along the block
+    position = np.arange(size).reshape((1, size) + (1,) * (array.ndim - 1))
+    last = np.where(valid, position, 0).max(axis=1)[:, np.newaxis]
+    first = np.where(valid, position, size - 1).min(axis=1)[:, np.newaxis]
+    ref_last = np.take_along_axis(blocks, last, axis=1)
+    ref_first = np.take_along_axis(blocks, first, axis=1)
+
+    def part(ref: np.ndarray, suffix: bool) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        '''Return the count, mean, and sum of squared deviations from the mean of each prefix or suffix.'''
+        deviations = np.where(valid, blocks - ref, 0)
+        count = _window_block_accumulate(valid.astype(DTYPE_INT_DEFAULT), np.add, suffix=suffix)
+        sums = _window_block_accumulate(deviations, np.add, suffix=suffix)
+        squares = _window_block_accumulate(deviations * deviations, np.add, suffix=suffix)
+        ref_flat = np.broadcast_to(ref, blocks.shape).reshape(count.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            offset = np.where(count > 0, sums / count, 0)
+        return count, ref_flat + offset, squares - sums * offset
+
+    count_s, mean_s, m2_s = part(ref_last, True)
+    count_p, mean_p, m2_p = part(ref_first, False)
+
+    # a window aligned to a block is the suffix alone
+    count_a = count_s[starts]
+    mean_a = mean_s[starts]
+    m2_a = m2_s[starts]
+    ends = starts + size - 1
+    aligned = (starts % size == 0).reshape((-1,) + (1,) * (array.ndim - 1))
+    count_b = np.where(aligned, 0, count_p[ends])
+    mean_b = mean_p[ends]
+    m2_b = np.where(aligned, 0, m2_p[ends])
+
+    count = count_a + count_b
+    delta = mean_b - mean_a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m2 = m2_a + m2_b + np.where(count_a * count_b > 0,
+                delta * delta * count_a * count_b / count,
+                0)
+        post = m2 / (count - ddof)
+    # loss of precision can produce small values for windows of one value, and negative values
+    np.maximum(post, 0, out=post)
+    post[count == 1] = 0
+    post[count - ddof <= 0] = np.nan
+
+    if not finite.all(): # NaN are excluded from count; infinities produce NaN
+        with np.errstate(invalid='ignore'):
+            is_inf = np.isinf(values)
+        length = len(array)
+        post[_window_sum_count(is_inf,
+                np.clip(lefts, 0, length),
+                np.clip(lefts + size, 0, length),
+                ) > 0] = np.nan
+    return post
+
+def _window_extreme(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        func: str,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''
+    Return the minimum or maximum of each window of ``size`` values with the van Herk/Gil-Werman algorithm: each window is covered by a suffix of one block and a prefix of the next (see ``_window_blocks``), which may overlap.
+    '''
+    kind = array.dtype.kind
+    is_min = func == 'min'
+
+    if kind in DTYPE_INEXACT_KINDS:
+        if skipna:
+            ufunc = np.fmin if is_min else np.fmax
+            identity = np.nan
+        else:
+            ufunc = np.minimum if is_min else np.maximum
+            identity = np.inf if is_min else -np.inf
+    else:
+        ufunc = np.minimum if is_min else np.maximum
+        if kind == 'b':
+            identity = is_min
+        else:
+            info = np.iinfo(array.dtype)
+            identity = info.max if is_min else info.min
+
+    blocks, starts = _window_blocks(array, lefts, size, identity)
+    prefix = _window_block_accumulate(blocks, ufunc)
+    suffix = _window_block_accumulate(blocks, ufunc, suffix=True)
+    return ufunc(suffix[starts], prefix[starts + size - 1])
+
+def window_reduce(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        *,
+        func: str,
+        skipna: bool = True,
+        ddof: int = 0,
+        min_periods: tp.Optional[int] = None,
+        ) -> np.ndarray:
+    '''
+    Reduce each window of ``array`` to a single row, where each window is the slice of ``size`` rows from a position in ``lefts`` (floored at 0). Boolean and numeric arrays are reduced for all windows in a single pass: sums, means, and variances from cumulative sums, minima and maxima from block-wise accumulations. Other arrays are reduced per window with the same functions used by :obj:`Frame` reductions.
+
+    Args:
+        array: 1D or 2D array; 2D arrays are reduced per column.
+        lefts: the unfloored position of the left edge of each window, as returned by ``window_positions``.
+        size: the size of all windows.
+        func: name of a reduction in ``WINDOW_REDUCTIONS``.
+        skipna: exclude NA values.
+        ddof: delta degrees of freedom, for ``std`` and ``var``.
+        min_periods: the minimum count of values (excluding NA values if ``skipna``) required in a window to produce a value; windows with fewer are NaN. If None, all windows with values produce a value.
+    '''
+    if func not in WINDOW_REDUCTIONS:
+        raise NotImplementedError(f'no window reduction for {func}')
+
+    kind = array.dtype.kind
+    count = len(array)
+    starts = np.clip(lefts, 0, count)
+    ends = np.clip(lefts + size, 0, count)
+    lengths = ends - starts
+    if array.ndim == 2:
+        lengths = np.repeat(lengths[:, np.newaxis], array.shape[1], axis=1)
+
+    if kind in DTYPE_NA_KINDS:
+        count_na = _window_sum_count(isna_array(array), starts, ends)
+        count_valid = lengths - count_na
+    else:
+        count_na = None
+        count_valid = lengths
+
+    post: np.ndarray
+    if func == 'count':
+        post = count_valid if skipna else lengths
+    elif not len(lefts):
+        post = array[:0]
+    elif kind in WINDOW_KERNEL_KINDS:
+        if func == 'sum':
+            post = _window_sum(array, lefts, size, ufunc_dtype_to_dtype(np.sum, array.dtype))
+        elif func == 'mean':
+            dtype = ufunc_dtype_to_dtype(np.mean, array.dtype)
+            total = _window_sum(array, lefts, size, dtype)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                post = (total / count_valid).astype(dtype, copy=False)
+        elif func == 'var' or func == 'std':
+            post = _window_var(array, lefts, size, ddof)
+            if func == 'std':
+                post = np.sqrt(post)
+        else:
+            post = _window_extreme(array, lefts, size, func, skipna)
+
+        if count_na is not None and not skipna:
+            post[count_na > 0] = np.nan
+    else:
+        ufunc, ufunc_skipna = UFUNC_GROUP_REDUCE[func]
+        if func == 'std' or func == 'var':
+            ufunc = partial(ufunc, ddof=ddof)
+            ufunc_skipna = partial(ufunc_skipna, ddof=ddof)
+        func_window = partial(array_ufunc_axis_skipna,
+                skipna=skipna,
+                axis=0,
+                ufunc=ufunc,
+                ufunc_skipna=ufunc_skipna,
+                )
+        post = _group_reduce_columns(array, starts, ends - starts, func_window)
+
+    if min_periods is not None:
+        threshold = min_periods
+    else: # windows without values are not given a minimum or maximum
+        threshold = 1 if func == 'min' or func == 'max' else 0
+    if threshold > 0 and len(post):
+        invalid = (count_valid if skipna else lengths) < threshold
+        if invalid.any():
+            if post.dtype.kind in DTYPE_NAT_KINDS:
+                post = post.copy()
+                post[invalid] = np.datetime64('nat')
+            else:
+                if post.dtype.kind not in DTYPE_INEXACT_KINDS and post.dtype.kind != 'O':
+                    post = post.astype(DTYPE_FLOAT_DEFAULT)
+                post[invalid] = np.nan
+
+    post.flags.writeable = False
+    return post
+
+def window_reduce_items(
+        items: tp.Iterable[tp.Tuple[tp.Hashable, np.ndarray]],
+        *,
+        func: str,
+        skipna: bool = True,
+        ddof: int = 0,
+        min_periods: tp.Optional[int] = None,
+        axis: int = 0,
+        ) -> tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]:
+    '''
+    Given pairs of label and window array, as yielded by ``axis_window_items``, yield pairs of label and the reduction of the window. Used for windows that cannot be described by ``window_positions``.
+
+    Args:
+        axis: for 2D windows, 0 reduces each column of the window, 1 reduces each row.
+    '''
+    lefts = np.zeros(1, dtype=DTYPE_INT_DEFAULT)
+    for label, window in items:
+        if axis == 1:
+            window = window.T
+        post = window_reduce(window,
+                lefts,
+                max(len(window), 1),
+                func=func,
+                skipna=skipna,
+                ddof=ddof,
+                min_periods=min_periods,
+                )
+        yield label, post[0]
+
+#-------------------------------------------------------------------------------
+
+def window_view(
+        array: np.ndarray,
+        lefts: np.ndarray,
+        size: int,
+        step: int,
+        *,
+        axis: int = 0,
+        ) -> np.ndarray:
+    '''
+    Return all windows as an immutable view of ``array``, with windows along axis 0 and each window shaped as it is yielded by ``axis_window_items``: for a 1D array, an array of shape (windows, size); for a 2D array, windows of rows (axis 0) are of shape (size, columns), and windows of columns (axis 1) are of shape (rows, size). No values are copied.
+
+    Args:
+        lefts: the position of the left edge of each window, as returned by ``window_positions``; all windows must be of ``size``.
+        step: the step between left edges, as given to ``window_positions``.
+        axis: the axis of a 2D array along which windows are formed.
+    '''
+    count = array.shape[axis]
+    if len(lefts) and (lefts[0] < 0 or lefts[-1] + size > count):
+        raise RuntimeError('windows must all be of size to be viewed; use window_sized')
+
+    if not len(lefts):
+        shape_window = list(array.shape)
+        shape_window[axis] = size
+        post = np.empty([0] + shape_window, dtype=array.dtype)
+        post.flags.writeable = False
+        return post
+
+    # windows are formed by repeating the stride of the windowed axis; as_strided, unlike sliding_window_view, is available in all supported NumPy
+    windows = count - size + 1
+    stride = array.strides[axis]
+    if array.ndim == 1:
+        shape: tp.Tuple[int, ...] = (windows, size)
+        strides: tp.Tuple[int, ...] = (stride, stride)
+    elif axis == 0:
+        shape = (windows, size, array.shape[1])
+        strides = (stride, stride, array.strides[1])
+    else:
+        shape = (windows, array.shape[0], size)
+        strides = (stride, array.strides[0], stride)
+    view = np.lib.stride_tricks.as_strided(array,
+            shape=shape,
+            strides=strides,
+            writeable=False,
+            )
+
+    first = lefts[0]
+    if step:
+        return view[first: lefts[-1] + 1: step]
+    # all windows are the same window
+    return np.broadcast_to(view[first], (len(lefts),) + view.shape[1:])
+
+def window_view_reduce(
+        view: np.ndarray,
+        func: tp.Callable[..., tp.Any],
+        ) -> np.ndarray:
+    '''
+    Given a view of windows from ``window_view``, apply ``func``, a function in ``WINDOW_VIEW_REDUCTIONS``, to all values of each window, returning a 1D array with an element per window. To bound memory, windows are reduced in chunks.
+    '''
+    count = len(view)
+    width = int(np.prod(view.shape[1:]))
+    chunk = max(WINDOW_VIEW_CHUNK_ELEMENTS // max(width, 1), 1)
+
+    parts = []
+    for i in range(0, count, chunk):
+        windows = view[i: i + chunk]
+        parts.append(func(windows.reshape(len(windows), width), axis=1))
+
+    if not parts:
+        post = func(np.empty((0, width), dtype=view.dtype), axis=1)
+    elif len(parts) == 1:
+        post = parts[0]
+    else:
+        post = np.concatenate(parts)
+    post.flags.writeable = False
+    return post
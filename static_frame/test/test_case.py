@@ -44,12 +44,35 @@ skip_linux_no_display = pytest.mark.skipif(
         reason='No display available'
         )
 
+skip_no_proc_maps = pytest.mark.skipif(
+        not os.path.exists('/proc/self/maps'),
+        reason='No /proc/self/maps to list memory maps'
+        )
+
+skip_pyle37 = pytest.mark.skipif(
+        sys.version_info[:2] <= (3, 7),
+        reason='No multiprocessing.shared_memory or pickle protocol 5'
+        )
+
 skip_mac_pyle38 = pytest.mark.skipif(
         sys.platform == 'darwin' and sys.version_info[:2] <= (3, 8),
         reason='MacOS tk.h issue'
         )
 
 
+def shared_memory_maps(prefix: str = 'sf') -> tp.List[str]:
+    '''
+    Return the names of shared memory segments, starting with ``prefix``, mapped by this process.
+    '''
+    post = []
+    with open('/proc/self/maps', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) > 5 and fields[5].startswith(f'/dev/shm/{prefix}'):
+                post.append(fields[5])
+    return post
+
+
 #-------------------------------------------------------------------------------
 class Timer():
 
@@ -1,20 +1,35 @@
 import datetime
+import operator
+import os
 import time
 import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import frame_fixtures as ff
 import numpy as np
 
+from static_frame.core.batch import REDUCE_CHUNKSIZE_DEFAULT
 from static_frame.core.batch import Batch
+from static_frame.core.batch import call_ops
+from static_frame.core.batch import call_ops_reduce
 from static_frame.core.batch import normalize_container
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.exception import BatchIterableInvalid
+from static_frame.core.exception import ErrorInit
 from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.frame import Frame
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.series import Series
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.util import iter_chunk
+from static_frame.core.util import reduce_tree
 from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import shared_memory_maps
+from static_frame.test.test_case import skip_no_proc_maps
+from static_frame.test.test_case import skip_pyle37
 from static_frame.test.test_case import temp_file
 
 nan = np.nan
@@ -26,6 +41,9 @@ def func1(f: Frame) -> Frame:
 def func2(label: tp.Hashable, f: Frame) -> Frame:
     return f.loc['q']
 
+def func3(f: Frame) -> Frame:
+    return f * 2 #type: ignore
+
 class TestUnit(TestCase):
 
     def test_normalize_container_a(self) -> None:
@@ -384,6 +402,275 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    @skip_pyle37
+    def test_batch_transport_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)|i(ID,dtD)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(bool,str)|i(ID,dtD)').rename('f2')
+
+        post1 = Batch.from_frames((f1, f2), max_workers=2, transport='shared_memory'
+                ).iloc[2:5].to_frame()
+        post2 = Batch.from_frames((f1, f2)).iloc[2:5].to_frame()
+        self.assertTrue(post1.equals(post2, compare_dtype=True, compare_class=True))
+
+        post3 = dict(Batch.from_frames((f1, f2), max_workers=2, transport='shared_memory'
+                ).sum().items())
+        self.assertEqual(post3['f1'].values.tolist(), f1.sum().values.tolist())
+        self.assertFalse(post3['f2'].values.flags.writeable)
+
+    @skip_pyle37
+    def test_batch_transport_b(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f3 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('x', 'q'),
+                name='f3')
+
+        post = Batch.from_frames((f1, f3), max_workers=2, transport='shared_memory'
+                ).apply_except(func1, KeyError).to_frame()
+        self.assertEqual(post.to_pairs(),
+                (('d', (('f3', 20),)), ('b', (('f3', 60),))))
+
+        with self.assertRaises(ErrorInit):
+            Batch.from_frames((f1, f3), max_workers=2, transport='shm')
+
+    @skip_pyle37
+    @skip_no_proc_maps
+    def test_batch_transport_c(self) -> None:
+        frames = [Frame(np.arange(20_000).reshape(200, 100), name=i) for i in range(4)]
+        post = dict(Batch.from_frames(frames, max_workers=2, transport='shared_memory'
+                ).sum().items())
+        self.assertEqual(len(shared_memory_maps()), 4)
+        self.assertEqual(post[0].sum(), frames[0].sum().sum())
+        # segments are released when results are dropped, without a further pool call
+        del post
+        self.assertEqual(shared_memory_maps(), [])
+
+    def test_batch_transport_d(self) -> None:
+        f1 = ff.parse('s(2,2)').rename('f1')
+        with patch('sys.version_info', (3, 7, 16)):
+            with self.assertRaises(ErrorInit):
+                Batch.from_frames((f1,), max_workers=2, transport='shared_memory')
+
+    @skip_pyle37
+    @skip_no_proc_maps
+    def test_batch_transport_e(self) -> None:
+        frames = [Frame(np.arange(20_000).reshape(200, 100), name=i) for i in range(16)]
+        segments = set(os.listdir('/dev/shm'))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for chunksize in (1, 'auto'):
+                items = Batch.from_frames(frames,
+                        max_workers=2,
+                        chunksize=chunksize,
+                        executor=executor,
+                        transport='shared_memory',
+                        ).apply(func3).items()
+                label, frame = next(items)
+                self.assertEqual(label, 0)
+                del frame
+                # closing early cancels or finishes pending work, then releases all segments
+                items.close() #type: ignore
+                self.assertEqual(shared_memory_maps(), [])
+            # the provided executor remains usable
+            self.assertEqual(executor.submit(len, 'abc').result(), 3)
+        # no segments are created after close, or left unlinked
+        self.assertEqual(
+                [n for n in set(os.listdir('/dev/shm')) - segments if n.startswith('sf')],
+                [])
+
+    def test_batch_fuse_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('x', 'q'),
+                name='f2')
+
+        b1 = Batch.from_frames((f1, f2), max_workers=2)
+        b2 = b1.apply(func3).apply_except(func1, KeyError).sum()
+        # operations are retained, to be called in one task per Frame
+        self.assertEqual(len(b2._ops), 3)
+        self.assertIs(b2._source, b1._items)
+
+        post = b2.to_frame()
+        self.assertEqual(post.to_pairs(), ((None, (('f2', 160),)),))
+
+        # after a non-pool derivation, operations are not retained
+        b3 = Batch.from_frames((f1, f2), max_workers=2).apply(func3).via_container.sum()
+        self.assertEqual(len(b3._ops), 1)
+        self.assertEqual(b3.to_frame(fill_value=0).to_pairs(),
+                (('a', (('f1', 6), ('f2', 0))), ('b', (('f1', 14), ('f2', 220))), ('d', (('f1', 0), ('f2', 60)))))
+
+    def test_batch_fuse_b(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) for i in range(4)]
+
+        with patch('static_frame.core.batch.call_ops', wraps=call_ops) as mock:
+            post = Batch.from_frames(frames, max_workers=2, use_threads=True
+                    ).iloc[:2].apply(func3).cumsum().to_frame(fill_value=0)
+            # one call per Frame, not per Frame per operation
+            self.assertEqual(mock.call_count, 4)
+
+        self.assertEqual(post.shape, (8, 3))
+        self.assertTrue(post.equals(Batch.from_frames(frames
+                ).iloc[:2].apply(func3).cumsum().to_frame(fill_value=0)))
+
+    def test_batch_fuse_c(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) for i in range(4)]
+        consumed = []
+        def gen() -> tp.Iterator[tp.Tuple[int, Frame]]:
+            for f in frames:
+                consumed.append(f.name)
+                yield f.name, f
+
+        b1 = Batch(gen(), max_workers=2, use_threads=True).apply(func3)
+        label, _ = next(b1._items)
+        self.assertEqual(label, 0)
+        # once started, a Batch is not fused, and its source is not iterated again
+        b2 = b1.apply(func3)
+        self.assertEqual(len(b2._ops), 1)
+        self.assertIs(b2._source, b1._items)
+
+        post = dict(b2.items())
+        self.assertEqual(list(post.keys()), [1, 2, 3])
+        self.assertTrue(post[1].equals(frames[1] * 4))
+        self.assertEqual(consumed, [0, 1, 2, 3])
+
+    def test_batch_chunksize_a(self) -> None:
+        frames = [ff.parse(f's({i * 3 + 1},3)|v(int,float)').rename(i) for i in range(8)]
+
+        post1 = Batch.from_frames(frames).iloc[1:].apply(func3).sum().to_frame()
+        post2 = Batch.from_frames(frames, max_workers=2, use_threads=True, chunksize='auto'
+                ).iloc[1:].apply(func3).sum().to_frame()
+        post3 = Batch.from_frames(frames, max_workers=2, chunksize='auto'
+                ).iloc[1:].apply(func3).sum().to_frame()
+        self.assertEqual(post1.index.values.tolist(), list(range(8)))
+        self.assertTrue(post1.equals(post2))
+        self.assertTrue(post1.equals(post3))
+
+    def test_batch_bounded_a(self) -> None:
+        consumed = []
+        def gen() -> tp.Iterator[tp.Tuple[int, Frame]]:
+            for i in range(40):
+                consumed.append(i)
+                yield i, ff.parse('s(4,3)|v(int)')
+
+        items = Batch(gen(), max_workers=2, use_threads=True).apply(func3).items()
+        label, frame = next(items)
+        self.assertEqual(label, 0)
+        self.assertTrue(len(consumed) < 40)
+        self.assertEqual(len(list(items)), 39)
+
+    def test_batch_reduce_a(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) * i for i in range(7)]
+
+        post1 = Batch.from_frames(frames).reduce_sum()
+        self.assertTrue(post1.equals(sum(frames[1:], frames[0])))
+
+        post2 = Batch.from_frames(frames, max_workers=2).apply(func3).reduce_sum()
+        self.assertTrue(post2.equals(post1 * 2))
+
+    def test_batch_reduce_b(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) * i for i in range(5)]
+
+        post1 = Batch.from_frames(frames, max_workers=2).iloc[:2].reduce(
+                func3, operator.add)
+        self.assertTrue(post1.equals(sum(f.iloc[:2] for f in frames) * 2))
+        self.assertEqual(Batch.from_frames(frames).reduce(
+                lambda f: str(f.name), lambda a, b: a + b), '01234')
+
+        with self.assertRaises(ValueError):
+            Batch(()).reduce_sum()
+        with self.assertRaises(ValueError):
+            Batch((), max_workers=2).reduce_sum()
+
+    @skip_pyle37
+    def test_batch_reduce_c(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) * i for i in range(9)]
+        expected = sum(frames[1:], frames[0])
+
+        # partial sums of chunks are combined in workers; only partial sums are combined here
+        combined = []
+        def combine(a: Frame, b: Frame) -> tp.Any:
+            combined.append((a, b))
+            return a + b
+
+        with patch('static_frame.core.batch.reduce_tree',
+                lambda func, values: reduce_tree(combine, values)):
+            post1 = Batch.from_frames(frames, max_workers=2, chunksize=3).reduce_sum()
+        self.assertTrue(post1.equals(expected))
+        self.assertEqual(len(combined), 2)
+
+        post2 = Batch.from_frames(frames, max_workers=2, transport='shared_memory'
+                ).apply(func3).reduce_sum()
+        self.assertTrue(post2.equals(expected * 2))
+
+        # all containers are dropped
+        post3 = Batch.from_frames(frames, max_workers=2).apply_except(func1, IndexError)
+        with self.assertRaises(ValueError):
+            post3.reduce_sum()
+
+    def test_batch_reduce_d(self) -> None:
+        frames = [ff.parse('s(4,3)|v(int)').rename(i) for i in range(20)]
+        sizes = []
+        def iter_chunk_size(iterable: tp.Iterable[tp.Any], size: int) -> tp.Iterator[tp.Any]:
+            sizes.append(size)
+            return iter_chunk(iterable, size)
+
+        # chunks are sized from the count of items, or, for iterators, a default
+        with patch('static_frame.core.batch.iter_chunk', iter_chunk_size):
+            post1 = Batch(((f.name, f) for f in frames), max_workers=2).reduce_sum()
+            post2 = Batch([(f.name, f) for f in frames], max_workers=2).reduce_sum()
+        self.assertEqual(sizes, [REDUCE_CHUNKSIZE_DEFAULT, 3])
+        self.assertTrue(post1.equals(post2))
+        self.assertTrue(post1.equals(sum(frames[1:], frames[0])))
+
+    def test_batch_call_ops_reduce_a(self) -> None:
+        frames = [ff.parse('s(2,2)|v(int)').rename(i) for i in range(3)]
+        keep, post = call_ops_reduce((
+                [(f, f.name) for f in frames],
+                Batch.from_frames(frames, max_workers=2).apply(func3)._ops,
+                operator.add,
+                ))
+        self.assertTrue(keep)
+        self.assertTrue(post.equals(frames[0] * 6))
+        self.assertEqual(call_ops_reduce(([], (), operator.add)), (False, None))
+
+    @skip_pyle37
+    def test_batch_executor_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(int,bool)').rename('f2')
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            b1 = Batch.from_frames((f1, f2), executor=executor)
+            post1 = b1.iloc[:4].apply(func3).sum().to_frame()
+            self.assertEqual(post1.shape, (2, 4))
+            self.assertEqual(post1.loc['f1'].values.tolist(),
+                    (f1.iloc[:4] * 2).sum().values.tolist())
+
+            # the executor is not shut down
+            b2 = Batch.from_frames((f1, f2), executor=executor, transport='shared_memory')
+            post2 = b2.iloc[:4].apply(func3).sum().to_frame()
+            self.assertTrue(post1.equals(post2))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            post3 = Batch.from_frames((f1, f2), executor=executor
+                    ).iloc[:4].apply(lambda f: f * 2).sum().to_frame()
+            self.assertTrue(post1.equals(post3))
+
+    def test_batch_executor_b(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(20,4)|v(int,bool)').rename('f2')
+
+        post = Batch.from_frames((f1, f2), max_workers=2, mp_context='spawn'
+                ).apply(func3).shapes
+        self.assertEqual(post.to_pairs(), (('f1', (20, 4)), ('f2', (20, 4))))
+
+    #---------------------------------------------------------------------------
+
     def test_batch_apply_items_a(self) -> None:
 
         f1 = Frame.from_dict(
@@ -1642,6 +1929,22 @@ class TestUnit(TestCase):
 
             self.assertTrue(frames['a'].equals(f1, compare_name=True, compare_dtype=True, compare_class=True))
 
+    def test_batch_to_directory_npy_a(self) -> None:
+
+        f1 = ff.parse('s(3,2)|v(bool)|c(I,str)|i(I,int)').rename('a')
+        f2 = ff.parse('s(3,5)|v(int)|c(I,str)|i(I,int)').rename('b')
+
+        b1 = Batch.from_frames((f1, f2))
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'batch')
+            b1.to_directory_npy(fp)
+            b2 = Batch.from_directory_npy(fp, memory_map=True)
+            frames = dict(b2.items())
+
+            self.assertTrue(frames['a'].equals(f1, compare_name=True, compare_dtype=True, compare_class=True))
+            self.assertEqual(b2.sum().to_frame().to_pairs(),
+                    b1.sum().to_frame().to_pairs())
+
 
     #---------------------------------------------------------------------------
     def test_batch_via_values_a(self) -> None:
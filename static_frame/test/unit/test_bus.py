@@ -3,6 +3,7 @@ import typing as tp
 from datetime import date
 from datetime import datetime
 from hashlib import sha256
+from tempfile import TemporaryDirectory
 
 import frame_fixtures as ff
 import numpy as np
@@ -2306,6 +2307,32 @@ class TestUnit(TestCase):
                 b1.to_zip_npy(fp)
             self.assertFalse(os.path.exists(fp))
 
+    #---------------------------------------------------------------------------
+    def test_bus_directory_npy_a(self) -> None:
+        f1 = ff.parse('s(4,2)').rename('f1')
+        f2 = ff.parse('s(4,5)|v(int,bool)').rename('f2')
+        f3 = ff.parse('s(2,2)|v(str)').rename('f3')
+        f4 = ff.parse('s(2,8)').rename('f4')
+
+        b1 = Bus.from_frames((f1, f2, f3, f4))
+
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'bus')
+            b1.to_directory_npy(fp)
+
+            b2 = Bus.from_directory_npy(fp, max_persist=2, memory_map=True)
+            self.assertEqual(b2.index.values.tolist(), ['f1', 'f2', 'f3', 'f4'])
+            self.assertEqual(b2.status['loaded'].sum(), 0)
+
+            for label, frame in b1.items():
+                self.assertTrue(frame.equals(b2[label],
+                        compare_name=True,
+                        compare_dtype=True,
+                        compare_class=True,
+                        ))
+            self.assertEqual(b2.status['loaded'].sum(), 2)
+            self.assertFalse(b2['f4'].values.flags.writeable)
+
     #---------------------------------------------------------------------------
 
     def test_bus_to_signature_bytes_a(self) -> None:
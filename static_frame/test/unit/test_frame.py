@@ -11566,6 +11566,86 @@ class TestUnit(TestCase):
                 ((('date', 'to'), ((('0', '2006-01-01'), 'a1'), (('1', '2006-01-02'), 'a1'), (('2', '2006-01-01'), 'b2'), (('3', '2006-01-02'), 'b2'))), (('value', 'a'), ((('0', '2006-01-01'), 12.5), (('1', '2006-01-02'), 12.5), (('2', '2006-01-01'), 12.5), (('3', '2006-01-02'), 12.5))))
                 )
 
+    def test_frame_from_sql_chunksize_a(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_e()
+
+        for chunksize in (1, 3, 10):
+            f1 = sf.Frame.from_sql('select * from events',
+                    connection=conn,
+                    dtypes={'date': 'datetime64[D]'},
+                    index_depth=2,
+                    index_constructors=(IndexDate, Index),
+                    chunksize=chunksize,
+                    )
+            f2 = sf.Frame.from_sql('select * from events',
+                    connection=conn,
+                    dtypes={'date': 'datetime64[D]'},
+                    index_depth=2,
+                    index_constructors=(IndexDate, Index),
+                    )
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True))
+            self.assertEqual([dt.kind for dt in f1.index.dtypes.values],
+                    ['M', 'U'])
+
+    def test_frame_from_sql_chunksize_b(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_b()
+
+        f1 = sf.Frame.from_sql('select * from events',
+                connection=conn,
+                index_depth=1,
+                columns_select=('value',),
+                chunksize=3,
+                )
+        self.assertEqual(f1.to_pairs(0),
+                (('value', ((0, 12.5), (1, 12.5), (2, 12.5), (3, 12.5))),)
+                )
+
+        f2 = sf.Frame.from_sql('select * from events where count > 100',
+                connection=conn,
+                chunksize=3,
+                )
+        self.assertEqual(f2.shape, (0, 5))
+        self.assertEqual(f2.columns.values.tolist(),
+                ['idx', 'date', 'identifier', 'value', 'count'])
+
+    def test_frame_iter_sql_a(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_b()
+
+        frames = list(sf.Frame.iter_sql('select * from events',
+                connection=conn,
+                chunksize=3,
+                index_depth=1,
+                ))
+        self.assertEqual([f.shape for f in frames], [(3, 4), (1, 4)])
+        self.assertEqual([dt.kind for dt in frames[1].dtypes.values],
+                ['U', 'U', 'f', 'i'])
+
+        f1 = sf.Frame.from_concat(frames)
+        f2 = sf.Frame.from_sql('select * from events',
+                connection=conn,
+                index_depth=1,
+                )
+        self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+    def test_frame_iter_sql_b(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_a()
+
+        frames = list(sf.Frame.iter_sql('select * from events where count > 100',
+                connection=conn,
+                ))
+        self.assertEqual(frames, [])
+
+    def test_frame_iter_sql_c(self) -> None:
+        conn: sqlite3.Connection = self.get_test_db_a()
+
+        # the query is executed when called, not when iterated
+        with self.assertRaises(sqlite3.OperationalError):
+            sf.Frame.iter_sql('select * from foo', connection=conn)
+
+        frames = sf.Frame.iter_sql('select * from events', connection=conn, chunksize=1)
+        self.assertEqual(next(frames).shape, (1, 4))
+        frames.close()
+
     #---------------------------------------------------------------------------
 
     def test_frame_from_records_items_a(self) -> None:
@@ -13845,6 +13925,40 @@ class TestUnit(TestCase):
                 )
 
 
+    def test_frame_pivot_unstack_d(self) -> None:
+        index = IndexHierarchy.from_labels((('r0', 'a'), ('r0', 'b'), ('r1', 'a')))
+        f1 = Frame.from_fields(
+                ([0, 1, 2], ['w', 'x', 'y']),
+                index=index,
+                columns=('p', 'q'),
+                )
+        f2 = f1.pivot_unstack(fill_value=-1)
+        # only columns with missing values are resolved with the fill value
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype('<U1'), np.dtype(object)])
+        self.assertEqual(f2.to_pairs(),
+                ((('p', 'a'), (('r0', 0), ('r1', 2))),
+                (('p', 'b'), (('r0', 1), ('r1', -1))),
+                (('q', 'a'), (('r0', 'w'), ('r1', 'y'))),
+                (('q', 'b'), (('r0', 'x'), ('r1', -1))))
+                )
+
+    def test_frame_pivot_stack_unstack_a(self) -> None:
+        f1 = FrameGO(np.arange(24).reshape(4, 6),
+                index=IndexHierarchy.from_product(('a', 'b'), (1, 2)),
+                columns=IndexHierarchy.from_product(('x', 'y', 'z'), (True, False)),
+                )
+        f2 = f1.pivot_stack()
+        self.assertEqual(f2.shape, (8, 3))
+        self.assertEqual(f2.index.depth, 3)
+        self.assertEqual(f2.index.values_at_depth(2).tolist(),
+                [True, False] * 4)
+
+        f3 = f2.pivot_unstack()
+        self.assertTrue(f3.equals(f1, compare_class=False))
+        self.assertIs(f3.__class__, FrameGO)
+        self.assertEqual(f3.columns.__class__, IndexHierarchyGO)
+
 
     #---------------------------------------------------------------------------
 
@@ -1,4 +1,6 @@
+import pickle
 import typing as tp
+from concurrent.futures import ProcessPoolExecutor
 
 import frame_fixtures as ff
 import numpy as np
@@ -69,6 +71,17 @@ class TestUnit(TestCase):
         self.assertEqual(post.shape, (100,))
         self.assertAlmostEqual(f1.sum().sum(), post.sum())
 
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            post = f1.iter_array(axis=0).apply_pool(np.sum, executor=executor)
+            self.assertAlmostEqual(f1.sum().sum(), post.sum())
+            post = f1.iter_array_items(axis=0).apply_pool(len, executor=executor)
+            self.assertEqual(post.unique().tolist(), [2])
+            post = f1.iter_array_items(axis=0).apply_pool(len, executor=executor, chunksize='auto')
+            self.assertEqual(post.index.values.tolist(), f1.columns.values.tolist())
+
+        post = f1.iter_array(axis=0).apply_pool(np.sum, max_workers=2, use_threads=True, chunksize='auto')
+        self.assertTrue(post.equals(f1.iter_array(axis=0).apply(np.sum)))
+
     def test_frame_iter_array_c(self) -> None:
         arrays = []
         for _ in range(8):
@@ -1123,6 +1136,336 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_frame_iter_group_reduce_a(self) -> None:
+        f = ff.parse('s(30,4)|v(int,float,bool,int)').assign[0].apply(lambda s: s % 4)
+        f = f.assign.iloc[[1, 5, 6], 1](nan)
+
+        for func in ('sum', 'mean', 'min', 'max', 'std', 'var'):
+            post = getattr(f.iter_group(0, drop=True), func)()
+            self.assertEqual(post.index.values.tolist(), [0, 1, 2, 3])
+            self.assertEqual(post.index.name, 0)
+            for label, group in f.iter_group_items(0, drop=True):
+                self.assertTrue(np.allclose(post.loc[label].values.astype(float),
+                        getattr(group, func)().values.astype(float)))
+
+        post1 = f.iter_group(0).count()
+        post2 = f.iter_group(0).apply(lambda g: g.count())
+        for label, s in post2.items():
+            self.assertEqual(post1.loc[label].values.tolist(), s.values.tolist())
+
+        post3 = f.iter_group(0).nunique()
+        post4 = f.iter_group(0).apply(lambda g: g.count(unique=True))
+        for label, s in post4.items():
+            self.assertEqual(post3.loc[label].values.tolist(), s.values.tolist())
+
+    def test_frame_iter_group_reduce_b(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 'x', np.datetime64('2021-01-01')),
+                 ('b', 2, 'y', np.datetime64('2020-01-01')),
+                 ('a', 3, 'z', np.datetime64('2022-01-01')),
+                 ('b', 4, None, np.datetime64('2019-01-01')),
+                 ),
+                columns=('p', 'q', 'r', 's'),
+                index=tuple('wxyz'),
+                )
+        post1 = f.iter_group('p').first()
+        self.assertEqual(post1.to_pairs(),
+                (('p', (('a', 'a'), ('b', 'b'))),
+                ('q', (('a', 1), ('b', 2))),
+                ('r', (('a', 'x'), ('b', 'y'))),
+                ('s', (('a', np.datetime64('2021-01-01')), ('b', np.datetime64('2020-01-01')))))
+                )
+        post2 = f.iter_group('p', drop=True).last()
+        self.assertEqual(post2.to_pairs(),
+                (('q', (('a', 3), ('b', 4))),
+                ('r', (('a', 'z'), ('b', None))),
+                ('s', (('a', np.datetime64('2022-01-01')), ('b', np.datetime64('2019-01-01')))))
+                )
+        post3 = f.iter_group('p', drop=True).max()
+        self.assertEqual(post3.to_pairs(),
+                (('q', (('a', 3), ('b', 4))),
+                ('r', (('a', 'z'), ('b', 'y'))),
+                ('s', (('a', np.datetime64('2022-01-01')), ('b', np.datetime64('2020-01-01')))))
+                )
+        post4 = f.iter_group(['p', 'q']).count()
+        self.assertEqual(post4.index.values.tolist(),
+                [('a', 1), ('a', 3), ('b', 2), ('b', 4)])
+        self.assertEqual(post4['r'].values.tolist(), [1, 1, 1, 0])
+
+    def test_frame_iter_group_reduce_c(self) -> None:
+        f = Frame.from_records(
+                ((0, 1, 0, 1), (2, 4, 6, 8), (1, 1, 3, 5)),
+                columns=tuple('abcd'),
+                index=tuple('xyz'),
+                )
+        post1 = f.iter_group('x', axis=1).sum()
+        self.assertEqual(post1.to_pairs(),
+                ((0, (('x', 0), ('y', 8), ('z', 4))), (1, (('x', 2), ('y', 12), ('z', 6))))
+                )
+        post2 = f.iter_group('x', axis=1, drop=True).mean()
+        self.assertEqual(post2.to_pairs(),
+                ((0, (('y', 4.0), ('z', 2.0))), (1, (('y', 6.0), ('z', 3.0))))
+                )
+        post3 = f.iter_group_array('x', axis=1).max()
+        self.assertEqual(post3.columns.values.tolist(), [0, 1])
+
+    def test_frame_iter_group_reduce_d(self) -> None:
+        # unsortable group values
+        f = Frame.from_records(
+                ((1, 10), ('b', 20), (1, 30), (None, 40)),
+                columns=('p', 'q'),
+                )
+        post = f.iter_group('p', drop=True).sum()
+        self.assertEqual(sorted(post['q'].values.tolist()), [20, 40, 40])
+        self.assertEqual(post.loc[1, 'q'], 40)
+
+        self.assertEqual(Frame(columns=('p', 'q')).iter_group('p').sum().shape, (0, 2))
+
+    def test_frame_iter_group_aggregate_a(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 10.5, 'x'), ('b', 2, nan, 'y'), ('a', 3, 4.5, 'z'), ('b', 4, 2.0, 'x')),
+                columns=('p', 'q', 'r', 's'),
+                )
+        post1 = f.iter_group('p').aggregate({'q': 'sum', 'r': 'max'})
+        self.assertEqual(post1.to_pairs(),
+                (('q', (('a', 4), ('b', 6))), ('r', (('a', 10.5), ('b', 2.0))))
+                )
+        self.assertEqual(post1.index.name, 'p')
+
+        post2 = f.iter_group('p').aggregate({'q': ('min', 'mean'), 's': (len, 'nunique')})
+        self.assertEqual(post2.columns.values.tolist(),
+                [['q', 'min'], ['q', 'mean'], ['s', 'len'], ['s', 'nunique']])
+        self.assertEqual(post2.values.tolist(),
+                [[1, 2.0, 2, 2], [2, 3.0, 2, 2]])
+
+        post3 = f.iter_group('p').aggregate({'r': 'count'}, skipna=False)
+        self.assertEqual(post3['r'].values.tolist(), [2, 2])
+
+        with self.assertRaises(KeyError):
+            f.iter_group('p').aggregate({('q', 'r'): 'sum'})
+
+    def test_frame_iter_group_aggregate_b(self) -> None:
+        f = FrameGO.from_records(
+                ((0, 1, 0, 1), (2, 4, 6, 8), (1, 1, 3, 5)),
+                columns=tuple('abcd'),
+                index=tuple('xyz'),
+                )
+        post = f.iter_group('x', axis=1).aggregate({'y': ('sum', 'max'), 'z': 'min'})
+        self.assertEqual(post.__class__, FrameGO)
+        self.assertEqual(post.index.values.tolist(),
+                [['y', 'sum'], ['y', 'max'], ['z', 'min']])
+        self.assertEqual(post.to_pairs(0)[0][1][0][1], 8)
+
+    def test_frame_iter_group_aggregate_c(self) -> None:
+        f = FrameGO.from_records(
+                (('a', 1, 10.5), ('b', 2, 3.0), ('a', 3, 4.5)),
+                columns=('p', 'q', 'r'),
+                )
+        # an empty mapping returns a Frame of only the groups
+        post1 = f.iter_group('p').aggregate({})
+        self.assertEqual(post1.__class__, FrameGO)
+        self.assertEqual(post1.shape, (2, 0))
+        self.assertEqual(post1.index.values.tolist(), ['a', 'b'])
+        self.assertEqual(f.T.iter_group('p', axis=1).aggregate({}).shape, (0, 2))
+
+        # reductions of a label must have unique names
+        with self.assertRaises(RuntimeError):
+            f.iter_group('p').aggregate({'q': (lambda a: a.min(), lambda a: a.max())})
+        with self.assertRaises(RuntimeError):
+            f.iter_group('p').aggregate({'q': ('sum', 'sum')})
+        post2 = f.iter_group('p').aggregate({'q': lambda a: a.max(), 'r': lambda a: a.min()})
+        self.assertEqual(post2.to_pairs(),
+                (('q', (('a', 3), ('b', 2))), ('r', (('a', 4.5), ('b', 3.0)))))
+
+    def test_frame_iter_group_transform_a(self) -> None:
+        f = Frame.from_records(
+                ((1, 2.0, 'a'), (2, np.nan, 'b'), (1, np.nan, 'c'), (2, 5.0, 'd'), (1, 7.0, 'e')),
+                columns=tuple('kvs'),
+                index=tuple('pqrst'),
+                name='x',
+                )
+        post1 = f[['k', 'v']].iter_group('k', drop=True).cumsum()
+        self.assertEqual(post1.to_pairs(),
+                (('v', (('p', 2.0), ('q', 0.0), ('r', 2.0), ('s', 5.0), ('t', 9.0))),))
+
+        post2 = f.iter_group('k').shift(fill_value=None)
+        self.assertEqual(post2.index.values.tolist(), list('pqrst'))
+        self.assertEqual(post2['s'].values.tolist(), [None, None, 'a', 'b', 'c'])
+        self.assertEqual(post2.name, 'x')
+
+        post3 = f.iter_group('k', drop=True).fillna_forward()
+        self.assertEqual(post3.loc[['p', 'r', 's', 't'], 'v'].values.tolist(), [2.0, 2.0, 5.0, 7.0])
+        self.assertTrue(np.isnan(post3.loc['q', 'v']))
+
+        post4 = f.iter_group('k', drop=True).rank_min(ascending=False)
+        self.assertEqual(post4['s'].values.tolist(), [2, 1, 1, 0, 0])
+
+        # equivalent to transforming each group independently
+        for label, group in f.iter_group_items('k', drop=True):
+            self.assertTrue(
+                    post4.loc[group.index].equals(group.rank_min(ascending=False)))
+
+    def test_frame_iter_group_transform_b(self) -> None:
+        f = Frame.from_records(
+                ((1, 1, 2, 2), (10, 20, 30, 40)),
+                index=('k', 'v'),
+                columns=tuple('abcd'),
+                )
+        post = f.iter_group('k', axis=1).cumsum()
+        self.assertEqual(post.to_pairs(1),
+                (('k', (('a', 1), ('b', 2), ('c', 2), ('d', 4))),
+                ('v', (('a', 10), ('b', 30), ('c', 30), ('d', 70)))))
+
+        post = f.iter_group('k', axis=1, drop=True).shift(-1, fill_value=0)
+        self.assertEqual(post.values.tolist(), [[20, 0, 40, 0]])
+
+    def test_frame_iter_group_transform_c(self) -> None:
+        f = Frame.from_records(
+                (('a', 1, 'p'), ('b', 2, 'q'), ('a', 3, 'r'), ('b', 4, 's')),
+                columns=tuple('kvs'),
+                )
+        post = f.iter_group('k').cumsum()
+        self.assertEqual(post.to_pairs(),
+                (('k', ((0, 'a'), (1, 'b'), (2, 'aa'), (3, 'bb'))),
+                ('v', ((0, 1), (1, 2), (2, 4), (3, 6))),
+                ('s', ((0, 'p'), (1, 'q'), (2, 'pr'), (3, 'qs')))))
+        # equivalent to the cumulative sum of each group
+        for label, group in f.iter_group_items('k'):
+            self.assertEqual(post.loc[group.index].values.tolist(),
+                    group.cumsum().values.tolist())
+
+    def test_frame_iter_resample_a(self) -> None:
+        index = sf.IndexMinute(
+                np.arange('2020-01-01T00:00', '2020-01-01T03:00', 30, dtype='datetime64[m]'),
+                name='t',
+                )
+        f = Frame.from_dict(dict(p=(3, 5, 1, 4, 2, 6), v=(1, 2, 3, 4, 5, 6)), index=index)
+
+        post1 = f.iter_resample('h').aggregate({'p': ('first', 'max', 'min', 'last'), 'v': 'sum'})
+        self.assertIs(post1.index.__class__, sf.IndexHour)
+        self.assertEqual(post1.index.name, 't')
+        self.assertEqual(post1.values.tolist(),
+                [[3, 5, 3, 5, 3], [1, 4, 1, 4, 7], [2, 6, 2, 6, 11]])
+
+        # equivalent to grouping on the index converted to hours
+        post2 = f.iter_resample('h').sum()
+        post3 = f.iter_group_other(f.index.values.astype('datetime64[h]')).apply(
+                lambda x: x['p'].sum(), index_constructor=sf.IndexHour)
+        self.assertEqual(post2.values.tolist(), [[8, 3], [5, 7], [8, 11]])
+        self.assertEqual(post2['p'].values.tolist(), post3.values.tolist())
+
+        post4 = f.iter_resample('h', step=2).mean()
+        self.assertEqual(post4.index.values.astype(str).tolist(),
+                ['2020-01-01T00', '2020-01-01T02'])
+        self.assertEqual(post4['v'].values.tolist(), [2.5, 5.5])
+
+        self.assertIs(f.iter_resample('D').count().index.__class__, IndexDate)
+        self.assertEqual(f.iter_resample('h').apply(len).to_pairs(),
+                ((np.datetime64('2020-01-01T00'), 2),
+                (np.datetime64('2020-01-01T01'), 2),
+                (np.datetime64('2020-01-01T02'), 2)))
+        self.assertEqual([a.tolist() for a in f.iter_resample_array('h', step=3)],
+                [[[3, 1], [5, 2], [1, 3], [4, 4], [2, 5], [6, 6]]])
+
+        with self.assertRaises(RuntimeError):
+            Frame.from_element(0, index=('a', 'b'), columns=('c',)).iter_resample('h').sum()
+        with self.assertRaises(AxisInvalid):
+            f.iter_resample('h', axis=2).sum()
+
+    def test_frame_iter_resample_b(self) -> None:
+        index = sf.IndexSecond(('2020-01-01T00:00:30', '2020-01-01T00:02:00',
+                '2020-01-01T00:00:10', '2020-01-01T00:01:59'))
+        f = Frame.from_dict(dict(v=(1.0, 2.0, np.nan, 4.0)), index=index)
+
+        # buckets of an unordered index are found with a stable sort
+        post1 = f.iter_resample('m').sum()
+        self.assertIs(post1.index.__class__, sf.IndexMinute)
+        self.assertEqual(post1['v'].values.tolist(), [1.0, 4.0, 2.0])
+        self.assertEqual([x.index.values.astype(str).tolist()
+                for x in f.iter_resample('m')][0],
+                ['2020-01-01T00:00:30', '2020-01-01T00:00:10'])
+
+        post2 = f.iter_resample('m').cumsum()
+        self.assertEqual(post2.index.values.tolist(), index.values.tolist())
+        self.assertEqual(post2['v'].values.tolist(), [1.0, 2.0, 1.0, 4.0])
+
+        post3 = f.T.iter_resample('m', axis=1).max()
+        self.assertIs(post3.columns.__class__, sf.IndexMinute)
+        self.assertEqual(post3.values.tolist(), [[1.0, 4.0, 2.0]])
+        self.assertEqual(f.T.iter_resample('m', axis=1).last().fillna(-1).values.tolist(),
+                [[-1.0, 4.0, 2.0]])
+
+    def test_frame_group_plan_a(self) -> None:
+        f = Frame.from_records(
+                ((1, 'a', 3.0), (2, 'b', 4.0), (1, 'a', 5.0), (3, None, 1.0)),
+                columns=tuple('xyz'),
+                index=tuple('pqrs'),
+                )
+        plan = f.group_plan('x')
+        self.assertEqual(plan.ordering.tolist(), [0, 2, 1, 3])
+        self.assertEqual(plan.labels.tolist(), [1, 2, 3])
+        self.assertIs(f.group_plan('x'), plan)
+        self.assertIs(f.group_plan(['x']), f.group_plan(sf.ILoc[[0]]))
+
+        # reused by iteration, reduction, and pivot
+        self.assertEqual(len(f._group_plans), 2)
+        self.assertEqual([g.index.values.tolist() for g in f.iter_group('x')],
+                [['p', 'r'], ['q'], ['s']])
+        self.assertEqual(f.iter_group('x').sum()['z'].values.tolist(), [8.0, 4.0, 1.0])
+        self.assertEqual(f.pivot('x', data_fields='z')['z'].values.tolist(), [8.0, 4.0, 1.0])
+        self.assertEqual(len(f._group_plans), 2)
+
+        # unsortable labels are grouped in order of discovery
+        plan_y = f.group_plan('y')
+        self.assertEqual(plan_y.labels.tolist(), ['a', 'b', None])
+        self.assertEqual(plan_y.codes.tolist(), [0, 1, 0, 2])
+        self.assertEqual(plan_y.sizes.tolist(), [2, 1, 1])
+
+        plan_p = f.group_plan('p', axis=1)
+        self.assertEqual(len(plan_p), 3)
+
+        with self.assertRaises(AxisInvalid):
+            f.group_plan('x', axis=2)
+
+    def test_frame_iter_group_object_a(self) -> None:
+        f = Frame.from_records(
+                ((1, 'a', 3), ('1', 'a', 4), (1, 'a', 5), (None, 2, 1)),
+                columns=tuple('xyz'),
+                )
+        # values with the same string representation remain distinct groups
+        post = f.iter_group(['x', 'y']).apply(lambda f: f['z'].sum())
+        self.assertEqual(post.to_pairs(),
+                (((1, 'a'), 8), (('1', 'a'), 4), ((None, 2), 1)))
+
+        post = f.pivot(['x', 'y'], data_fields='z')
+        self.assertEqual(post['z'].values.tolist(), [8, 4, 1])
+
+    def test_frame_iter_group_object_b(self) -> None:
+        f = Frame.from_dict(dict(
+                k=np.array(['a', np.nan, np.nan, 'a'], dtype=object),
+                j=np.array(['a', np.nan, np.nan, 'a'], dtype=object),
+                v=(1, 2, 3, 4),
+                ))
+        # distinct NaN objects form one group
+        post = f.iter_group(['k', 'j']).apply(lambda f: f['v'].sum())
+        self.assertEqual(len(post), 2)
+        self.assertEqual(post.values.tolist(), [5, 5])
+        self.assertEqual(post.index.values.tolist()[0], ('a', 'a'))
+
+    def test_frame_group_plan_b(self) -> None:
+        f1 = FrameGO.from_records(((1, 2), (1, 3)), columns=tuple('ab'))
+        f1.group_plan('a')
+        # grow-only Frames are not cached
+        self.assertFalse(hasattr(f1, '_group_plans'))
+
+        f2 = Frame.from_records(((1, 2), (1, 3)), columns=tuple('ab'))
+        f2.group_plan('a')
+        f3 = pickle.loads(pickle.dumps(f2))
+        self.assertFalse(hasattr(f3, '_group_plans'))
+        self.assertTrue(f3.equals(f2, compare_dtype=True))
+
+    #---------------------------------------------------------------------------
+
     def test_frame_reversed(self) -> None:
         columns = tuple('pqrst')
         index = tuple('zxwy')
@@ -1216,6 +1559,70 @@ class TestUnit(TestCase):
         self.assertEqual(len(post), 18)
         self.assertTrue(all(f.shape == (3, 4) for f in post))
 
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = FrameGO.from_dict(
+                dict(a=(1, 2, 3, 4), b=(1.5, np.nan, 3.0, 2.0), c=('p', 'q', 'r', 's')),
+                index=('w', 'x', 'y', 'z'),
+                name='f',
+                )
+        post1 = f1.iter_window(size=2).max()
+        self.assertEqual(post1.__class__, FrameGO)
+        self.assertEqual(post1.name, 'f')
+        self.assertEqual(post1.to_pairs(),
+                (('a', (('x', 2), ('y', 3), ('z', 4))),
+                ('b', (('x', 1.5), ('y', 3.0), ('z', 3.0))),
+                ('c', (('x', 'q'), ('y', 'r'), ('z', 's'))))
+                )
+        self.assertEqual(f1.iter_window(size=3).count().to_pairs(),
+                (('a', (('y', 3), ('z', 3))), ('b', (('y', 2), ('z', 2))), ('c', (('y', 3), ('z', 3))))
+                )
+        post2 = f1.iter_window(size=3).count(min_periods=3)
+        self.assertEqual(post2['b'].isna().values.tolist(), [True, True])
+        self.assertEqual(post2['a'].values.tolist(), [3.0, 3.0])
+
+    def test_frame_iter_window_reduce_b(self) -> None:
+        f1 = Frame(np.arange(12).reshape(3, 4), columns=tuple('abcd'), index=tuple('xyz'))
+
+        post1 = f1.iter_window_array(size=2, axis=1).sum()
+        self.assertEqual(post1.to_pairs(),
+                (('b', (('x', 1), ('y', 9), ('z', 17))),
+                ('c', (('x', 3), ('y', 11), ('z', 19))),
+                ('d', (('x', 5), ('y', 13), ('z', 21))))
+                )
+        post2 = f1.iter_window(size=2, axis=1, window_valid=lambda w: w[0, 0] > 0).sum()
+        self.assertEqual(post2.to_pairs(), post1[['c', 'd']].to_pairs())
+
+        post3 = f1.iter_window(size=2, window_func=lambda w: w * 2).mean()
+        self.assertEqual(post3.to_pairs(),
+                (('a', (('y', 4.0), ('z', 12.0))),
+                ('b', (('y', 6.0), ('z', 14.0))),
+                ('c', (('y', 8.0), ('z', 16.0))),
+                ('d', (('y', 10.0), ('z', 18.0))))
+                )
+        with self.assertRaises(AxisInvalid):
+            f1.iter_window(size=2, axis=2).sum()
+
+    def test_frame_iter_window_array_view_a(self) -> None:
+        f1 = Frame(np.arange(12).reshape(4, 3), columns=tuple('abc'), index=tuple('wxyz'))
+
+        post1 = f1.iter_window_array(size=2).array_view()
+        self.assertEqual(post1.shape, (3, 2, 3))
+        self.assertEqual(post1[2].tolist(), f1.iloc[2:].values.tolist())
+        self.assertTrue(np.shares_memory(post1, f1.values))
+
+        post2 = f1.iter_window_array(size=2, axis=1).array_view()
+        self.assertEqual(post2.shape, (2, 4, 2))
+
+        for axis in (0, 1):
+            for func in (np.sum, np.median):
+                post3 = f1.iter_window_array(size=2, axis=axis).apply(func)
+                # a lambda is not a known NumPy reduction, and is applied per window
+                post4 = f1.iter_window_array(size=2, axis=axis).apply(lambda a: func(a)) #pylint: disable=W0108
+                self.assertTrue(post3.equals(post4, compare_dtype=True))
+
+        post5 = f1.iter_window_array_items(size=2).apply(lambda k, a: a.sum())
+        self.assertEqual(post5.to_pairs(), (('x', 15), ('y', 33), ('z', 51)))
+
     #---------------------------------------------------------------------------
 
     def test_frame_axis_interface_a(self) -> None:
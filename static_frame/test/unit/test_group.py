@@ -0,0 +1,180 @@
+import numpy as np
+
+from static_frame.core.group import GroupPlan
+from static_frame.core.group import group_reduce
+from static_frame.core.group import group_starts
+from static_frame.core.group import group_transform
+from static_frame.core.group import resample_plan
+from static_frame.core.rank import rank_1d
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_group_starts_a(self) -> None:
+        self.assertEqual(group_starts(np.array([1, 1, 2, 3, 3, 3])).tolist(), [0, 2, 3])
+        self.assertEqual(group_starts(np.array([], dtype=int)).tolist(), [])
+        self.assertEqual(group_starts(np.array([[1, 'a'], [1, 'a'], [1, 'b']], dtype=object)).tolist(),
+                [0, 2])
+
+    def test_group_plan_a(self) -> None:
+        a1 = np.array([3, 1, 3, 2, 1])
+        plan1 = GroupPlan.from_ordering(a1, np.argsort(a1, kind='mergesort'))
+        self.assertEqual(plan1.ordering.tolist(), [1, 4, 3, 0, 2])
+        self.assertEqual(plan1.starts.tolist(), [0, 2, 3])
+        self.assertEqual(plan1.labels.tolist(), [1, 2, 3])
+        self.assertEqual(plan1.sizes.tolist(), [2, 1, 2])
+        self.assertEqual(plan1.codes.tolist(), [2, 0, 2, 1, 0])
+        self.assertFalse(plan1.ordering.flags.writeable)
+
+        plan2 = GroupPlan.from_locations(np.array(['b', 'a']), np.array([0, 1, 0]))
+        self.assertEqual(plan2.ordering.tolist(), [0, 2, 1])
+        self.assertEqual(plan2.starts.tolist(), [0, 2])
+        self.assertEqual(len(plan2), 2)
+        self.assertEqual(repr(plan2), '<GroupPlan groups=2 count=3>')
+
+    def test_resample_plan_a(self) -> None:
+        a1 = np.array(['2020-01-01T00:10', '2020-01-01T00:50', '2020-01-01T01:00',
+                '2020-01-01T03:59'], dtype='datetime64[m]')
+        plan1 = resample_plan(a1, 'h')
+        self.assertEqual(plan1.ordering.tolist(), [0, 1, 2, 3])
+        self.assertEqual(plan1.starts.tolist(), [0, 2, 3])
+        self.assertEqual(plan1.labels.dtype, np.dtype('datetime64[h]'))
+        self.assertEqual(plan1.labels.astype(str).tolist(),
+                ['2020-01-01T00', '2020-01-01T01', '2020-01-01T03'])
+
+        plan2 = resample_plan(a1, 'h', step=2)
+        self.assertEqual(plan2.sizes.tolist(), [3, 1])
+        self.assertEqual(plan2.labels.astype(str).tolist(), ['2020-01-01T00', '2020-01-01T02'])
+
+        a2 = np.array(['2020-01-02', 'NaT', '2020-01-01', '2020-01-02'], dtype='datetime64[D]')
+        plan3 = resample_plan(a2, 'D')
+        self.assertEqual(plan3.ordering.tolist(), [1, 2, 0, 3])
+        self.assertEqual(plan3.labels.astype(str).tolist(), ['NaT', '2020-01-01', '2020-01-02'])
+        self.assertEqual(resample_plan(a2, 'D', step=3).labels.astype(str).tolist(),
+                ['NaT', '2019-12-31'])
+
+        with self.assertRaises(RuntimeError):
+            resample_plan(np.arange(3), 'D')
+        with self.assertRaises(RuntimeError):
+            resample_plan(a2, 'D', step=0)
+
+    def test_group_reduce_a(self) -> None:
+        a1 = np.array([3, 1, 2, 10, 20, 5])
+        starts = np.array([0, 3, 5])
+
+        self.assertEqual(group_reduce(a1, starts, func='sum').tolist(), [6, 30, 5])
+        self.assertEqual(group_reduce(a1, starts, func='mean').tolist(), [2.0, 15.0, 5.0])
+        self.assertEqual(group_reduce(a1, starts, func='min').tolist(), [1, 10, 5])
+        self.assertEqual(group_reduce(a1, starts, func='max').tolist(), [3, 20, 5])
+        self.assertEqual(group_reduce(a1, starts, func='first').tolist(), [3, 10, 5])
+        self.assertEqual(group_reduce(a1, starts, func='last').tolist(), [2, 20, 5])
+        self.assertEqual(group_reduce(a1, starts, func='count').tolist(), [3, 2, 1])
+        post = group_reduce(a1, starts, func='var', ddof=1)
+        self.assertEqual(post[:2].tolist(), [1.0, 50.0])
+        self.assertTrue(np.isnan(post[2]))
+
+        with self.assertRaises(NotImplementedError):
+            group_reduce(a1, starts, func='median')
+        self.assertEqual(group_reduce(a1, starts, func=np.median).tolist(), [2.0, 15.0, 5.0])
+
+    def test_group_reduce_b(self) -> None:
+        a1 = np.array([[3, np.nan], [np.nan, np.nan], [2, 4], [3, 1]])
+        starts = np.array([0, 2])
+
+        self.assertEqual(group_reduce(a1, starts, func='sum').tolist(), [[3.0, 0.0], [5.0, 5.0]])
+        self.assertEqual(group_reduce(a1, starts, func='count').tolist(), [[1, 0], [2, 2]])
+        self.assertEqual(group_reduce(a1, starts, func='nunique').tolist(), [[1, 0], [2, 2]])
+        post = group_reduce(a1, starts, func='max')
+        self.assertEqual(post[1].tolist(), [3.0, 4.0])
+        self.assertTrue(np.isnan(post[0, 1]))
+        self.assertTrue(np.isnan(group_reduce(a1, starts, func='sum', skipna=False)[0, 0]))
+        self.assertFalse(post.flags.writeable)
+
+    def test_group_reduce_c(self) -> None:
+        a1 = np.array(['b', 'a', 'b', 'c', None], dtype=object)
+        starts = np.array([0, 3])
+
+        self.assertEqual(group_reduce(a1, starts, func='nunique').tolist(), [2, 1])
+        self.assertEqual(group_reduce(a1, starts, func='min').tolist(), ['a', 'c'])
+        self.assertEqual(group_reduce(a1, starts, func='count').tolist(), [3, 1])
+
+        a3 = np.array(['b', 'a', 'b', 'c', 'c'])
+        self.assertEqual(group_reduce(a3, starts, func='nunique').tolist(), [2, 1])
+
+        a2 = np.array(['2021-01', '2020-05', 'NaT'], dtype='datetime64[M]')
+        self.assertEqual(group_reduce(a2, np.array([0, 2]), func='min').astype(str).tolist(),
+                ['2020-05', 'NaT'])
+
+    def test_group_transform_a(self) -> None:
+        a1 = np.array([1.0, np.nan, 3, 4, 5, 6, np.nan, np.nan, 9])
+        starts = np.array([0, 3, 5])
+
+        self.assertEqual(group_transform(a1, starts, func='cumsum').tolist(),
+                [1.0, 1.0, 4.0, 4.0, 9.0, 6.0, 6.0, 6.0, 15.0])
+        self.assertEqual(group_transform(a1, starts, func='cumprod').tolist(),
+                [1.0, 1.0, 3.0, 4.0, 20.0, 6.0, 6.0, 6.0, 54.0])
+        self.assertEqual(group_transform(a1, starts, func='fillna_forward').tolist(),
+                [1.0, 1.0, 3.0, 4.0, 5.0, 6.0, 6.0, 6.0, 9.0])
+        self.assertEqual(group_transform(a1, starts, func='fillna_backward').tolist(),
+                [1.0, 3.0, 3.0, 4.0, 5.0, 6.0, 9.0, 9.0, 9.0])
+
+        post1 = group_transform(a1, starts, func='fillna_forward', limit=1)
+        self.assertTrue(np.isnan(post1[7]))
+        self.assertEqual(post1[6], 6.0)
+
+        post2 = group_transform(np.arange(9), starts, func='shift', shift=-1, fill_value=-1)
+        self.assertEqual(post2.tolist(), [1, 2, -1, 4, -1, 6, 7, 8, -1])
+        self.assertFalse(post2.flags.writeable)
+
+        post3 = group_transform(a1, starts, func='cumsum', skipna=False)
+        self.assertTrue(np.isnan(post3[1:3]).all())
+
+        with self.assertRaises(NotImplementedError):
+            group_transform(a1, starts, func='cummax')
+
+    def test_group_transform_b(self) -> None:
+        a1 = np.array([3, 1, 3, 2, 2, 2, 5, 0])
+        starts = np.array([0, 3, 7])
+        for method in ('ordinal', 'dense', 'min', 'max', 'mean'):
+            for ascending in (True, False):
+                post = group_transform(a1, starts,
+                        func=f'rank_{method}',
+                        ascending=ascending,
+                        start=1,
+                        )
+                expected = np.concatenate([
+                        rank_1d(a1[s], method, ascending=ascending, start=1)
+                        for s in (slice(0, 3), slice(3, 7), slice(7, 8))])
+                self.assertEqual(post.tolist(), expected.tolist())
+
+        a2 = np.array([[1, 10], [2, 20], [3, 30], [4, 40]])
+        self.assertEqual(group_transform(a2, np.array([0, 1]), func='cumsum').tolist(),
+                [[1, 10], [2, 20], [5, 50], [9, 90]])
+        self.assertEqual(group_transform(a2, np.array([0, 2]), func='rank_ordinal', ascending=False).tolist(),
+                [[1, 1], [0, 0], [1, 1], [0, 0]])
+
+        a3 = np.array([2.0, np.nan, 1.0])
+        post = group_transform(a3, np.array([0]), func='rank_min', fill_value=-1)
+        self.assertEqual(post.tolist(), [1, -1, 0])
+
+        a4 = np.array(['b', 'a', 'b', 'c'])
+        self.assertEqual(group_transform(a4, np.array([0, 3]), func='rank_dense').tolist(),
+                [1, 0, 1, 0])
+
+    def test_group_transform_c(self) -> None:
+        # large groups of inexact values are summed per group; integers are summed once
+        a1 = np.arange(300, dtype=float) / 7
+        a2 = np.arange(600).reshape(300, 2)
+        starts = np.array([0, 100, 250])
+        for array in (a1, a2, a1[:, np.newaxis] + 1e16, a2.astype(np.uint8)):
+            post = group_transform(array, starts, func='cumsum')
+            expected = np.concatenate([np.cumsum(part, axis=0)
+                    for part in np.split(array, starts[1:])])
+            self.assertEqual(post.tolist(), expected.tolist())
+
+        # strings are concatenated as objects
+        a3 = np.array(['a', 'b', 'c', 'd'])
+        post = group_transform(a3, np.array([0, 2]), func='cumsum')
+        self.assertEqual(post.dtype, object)
+        self.assertEqual(post.tolist(), ['a', 'ab', 'c', 'cd'])
@@ -28,6 +28,7 @@ from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import arrays_equal
 from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import skip_pyle37
 
 
 class TestUnit(TestCase):
@@ -727,6 +728,30 @@ class TestUnit(TestCase):
                 self.assertFalse(index_new._labels.flags.writeable)
                 self.assertEqual(index_new.loc[v], index.loc[v])
 
+    @skip_pyle37
+    def test_index_pickle_b(self) -> None:
+        a = Index(('a', 'b', 'c'), name='foo')
+        b = IndexGO(range(4), loc_is_iloc=True)
+        c = IndexDate.from_date_range('2020-01-01', '2020-01-05')
+
+        for index in (a, b, c):
+            buffers: tp.List[pickle.PickleBuffer] = []
+            pbytes = pickle.dumps(index, protocol=5, buffer_callback=buffers.append)
+            self.assertTrue(len(buffers) >= 1)
+
+            index_new = pickle.loads(pbytes, buffers=buffers)
+            self.assertIs(index_new.__class__, index.__class__)
+            self.assertEqual(index_new.name, index.name)
+            self.assertEqual(index_new.values.tolist(), index.values.tolist())
+            self.assertEqual(index_new._map is None, index._map is None)
+            self.assertFalse(index_new._labels.flags.writeable)
+            self.assertEqual(index_new.loc_to_iloc(index.iloc[-1]), len(index) - 1)
+
+        b_new = pickle.loads(pickle.dumps(b, protocol=5))
+        b_new.append(4)
+        self.assertEqual(b_new.values.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(b.values.tolist(), [0, 1, 2, 3])
+
     def test_index_drop_a(self) -> None:
 
         index = Index(list('abcdefg'))
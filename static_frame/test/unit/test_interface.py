@@ -26,7 +26,7 @@ class TestUnit(TestCase):
 
         self.assertEqual(
             counts.to_pairs(),
-            (('Accessor Datetime', 21), ('Accessor Fill Value', 26), ('Accessor Hashlib', 10), ('Accessor Regular Expression', 7), ('Accessor String', 39), ('Accessor Transpose', 24), ('Accessor Values', 3), ('Assignment', 16), ('Attribute', 12), ('Constructor', 40), ('Dictionary-Like', 7), ('Display', 6), ('Exporter', 31), ('Iterator', 156), ('Method', 98), ('Operator Binary', 24), ('Operator Unary', 4), ('Selector', 13))
+            (('Accessor Datetime', 21), ('Accessor Fill Value', 26), ('Accessor Hashlib', 10), ('Accessor Regular Expression', 7), ('Accessor String', 39), ('Accessor Transpose', 24), ('Accessor Values', 3), ('Assignment', 16), ('Attribute', 12), ('Constructor', 41), ('Dictionary-Like', 7), ('Display', 6), ('Exporter', 31), ('Iterator', 374), ('Method', 99), ('Operator Binary', 24), ('Operator Unary', 4), ('Selector', 13))
             )
 
     def test_interface_summary_c(self) -> None:
@@ -38,6 +38,12 @@ class TestUnit(TestCase):
 
         self.assertTrue((counts == counts_cls).all())
 
+    def test_interface_summary_d(self) -> None:
+        post = InterfaceSummary.to_frame(Frame)
+        # class methods returning iterators are constructors, documented with their signature
+        self.assertEqual(post.loc[post['group'] == 'Constructor'].index.values.tolist().count(
+                'iter_sql(query, *, connection, chunksize, ...)'), 1)
+
     def test_interface_get_signatures_a(self) -> None:
 
         sig, signa = _get_signatures('__init__', Series.__init__)
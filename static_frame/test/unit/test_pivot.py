@@ -4,8 +4,10 @@ import numpy as np
 from static_frame.core.frame import Frame
 from static_frame.core.index import Index
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.pivot import pivot_codes_first_seen
 from static_frame.core.pivot import pivot_items_to_block
 from static_frame.core.pivot import pivot_items_to_frame
+from static_frame.core.pivot import pivot_scatter_blocks
 from static_frame.test.test_case import TestCase
 
 # from static_frame.core.pivot import pivot_records_items
@@ -104,6 +106,88 @@ class TestUnit(TestCase):
                 ((2, (((0, 0), 463099), ((0, 1), -88017), ((0, 2), 35021), ((1, 0), 92867), ((1, 2), 96520), ((2, 0), 172133), ((2, 1), 279191), ((2, 2), 13448), ((3, 0), 255338), ((3, 1), 372807), ((3, 2), 155574))), (3, (((0, 0), 348362), ((0, 1), 175579), ((0, 2), 105269), ((1, 0), 58768), ((1, 2), 13448), ((2, 0), 84967), ((2, 1), 239151), ((2, 2), 170440), ((3, 0), 269300), ((3, 1), 204528), ((3, 2), 493169))))
                 )
 
+    def test_pivot_scatter_blocks_a(self) -> None:
+        f = Frame.from_fields(([0, 0, 1, 1, 1], [3.0, np.nan, 2.0, 4.0, 1.0]))
+
+        post = pivot_scatter_blocks(
+                blocks=f._blocks,
+                index_codes=np.array([0, 0, 1, 1, 0]),
+                index_count=2,
+                columns_codes=np.array([0, 0, 0, 1, 1]),
+                columns_count=2,
+                data_fields_iloc=[0, 1],
+                funcs=[('sum', True), ('count', False)],
+                dtypes=[np.dtype(int), None, np.dtype(float), None],
+                fill_value=-1,
+                fill_value_dtype=np.dtype(int),
+                fill_always=False,
+                )
+        # ordered by columns group, then data field, then function
+        self.assertEqual([a.tolist() for a in post],
+                [[0, 1], [2, 1], [3.0, 2.0], [2, 1],
+                [1, 1], [1, 1], [1.0, 4.0], [1, 1]])
+        self.assertTrue(all(not a.flags.writeable for a in post))
+
+    def test_pivot_scatter_blocks_b(self) -> None:
+        f = Frame.from_fields(([1.5, np.nan, 2.0, 4.0],))
+
+        post = pivot_scatter_blocks(
+                blocks=f._blocks,
+                index_codes=np.array([0, 0, 1, 1]),
+                index_count=2,
+                columns_codes=np.array([0, 0, 0, 1]),
+                columns_count=2,
+                data_fields_iloc=[0],
+                funcs=[('min', True), ('max', False)],
+                dtypes=[np.dtype(float), np.dtype(float)],
+                fill_value=None,
+                fill_value_dtype=np.dtype(object),
+                fill_always=False,
+                )
+        # only columns groups with unobserved cells are resolved to the fill value dtype
+        self.assertEqual([a.dtype.kind for a in post], ['f', 'f', 'O', 'O'])
+        self.assertEqual(post[0].tolist(), [1.5, 2.0])
+        self.assertTrue(np.isnan(post[1][0]))
+        self.assertEqual(post[2].tolist(), [None, 4.0])
+
+    def test_pivot_scatter_a(self) -> None:
+        f = Frame.from_records(
+                [('a', 'x', 1, 1.5), ('a', 'y', 2, np.nan), ('b', 'x', 3, 2.5),
+                ('a', 'x', 4, 0.5), ('c', 'y', 5, 1.0)],
+                columns=('p', 'q', 'r', 's'),
+                )
+        post1 = f.pivot('p', 'q', 'r', func=np.sum, fill_value=0)
+        self.assertEqual(post1.to_pairs(),
+                (('x', (('a', 5), ('b', 3), ('c', 0))), ('y', (('a', 2), ('b', 0), ('c', 5)))))
+        self.assertEqual(post1.dtypes.values.tolist(), [np.dtype(int), np.dtype(int)])
+
+        post2 = f.pivot('p', 'q', 's', func={'min': np.nanmin, 'count': len})
+        self.assertEqual(post2.columns.values.tolist(),
+                [['x', 'min'], ['x', 'count'], ['y', 'min'], ['y', 'count']])
+        self.assertEqual(post2.fillna(-1).to_pairs(),
+                ((('x', 'min'), (('a', 0.5), ('b', 2.5), ('c', -1.0))),
+                (('x', 'count'), (('a', 2.0), ('b', 1.0), ('c', -1.0))),
+                (('y', 'min'), (('a', -1.0), ('b', -1.0), ('c', 1.0))),
+                (('y', 'count'), (('a', 1.0), ('b', -1.0), ('c', 1.0)))))
+
+        post3 = f.pivot(('p', 'q'), 'r', 's', func=np.mean, fill_value=0)
+        self.assertEqual(post3.index.values.tolist(),
+                [('a', 'x'), ('a', 'y'), ('b', 'x'), ('c', 'y')])
+        self.assertEqual(post3.iloc[0].to_pairs(),
+                ((1, 1.5), (2, 0.0), (3, 0.0), (4, 0.5), (5, 0.0)))
+
+    def test_pivot_codes_first_seen_a(self) -> None:
+        codes, first = pivot_codes_first_seen(np.array([[2, 0, 2, 1, 0]]))
+        self.assertEqual(codes.tolist(), [0, 1, 0, 2, 1])
+        self.assertEqual(first.tolist(), [0, 1, 3])
+
+        codes, first = pivot_codes_first_seen(np.array([[1, 1, 0, 1], [0, 1, 0, 0]]))
+        self.assertEqual(codes.tolist(), [0, 1, 2, 0])
+        self.assertEqual(first.tolist(), [0, 1, 2])
+
+        codes, first = pivot_codes_first_seen(np.empty((2, 0), dtype=int))
+        self.assertEqual((len(codes), len(first)), (0, 0))
+
 
 if __name__ == '__main__':
     import unittest
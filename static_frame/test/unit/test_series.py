@@ -3913,6 +3913,125 @@ class TestUnit(TestCase):
         self.assertEqual(post2.to_pairs(),
                 ((4, 2.0), (5, 3.0), (6, 4.0), (7, 5.0), (8, 6.0), (9, 7.0), (10, 8.0), (11, 9.0)))
 
+    def test_series_iter_window_reduce_a(self) -> None:
+        s1 = sf.Series(range(12), name='x')
+        post1 = s1.iter_window(size=5, start_shift=-10).mean()
+        self.assertEqual(post1.name, 'x')
+        self.assertEqual(post1.to_pairs(),
+                s1.iter_window_array(size=5, start_shift=-10).apply(np.mean).to_pairs())
+
+        post2 = s1.iter_window(size=4, step=3, window_sized=False, label_shift=1).max()
+        self.assertEqual(post2.to_pairs(),
+                s1.iter_window_array(size=4, step=3, window_sized=False, label_shift=1
+                ).apply(np.max).to_pairs())
+
+        post3 = s1.iter_window(size=2, size_increment=1).sum()
+        self.assertEqual(post3.to_pairs(), ((1, 1), (3, 6), (5, 14), (7, 25), (9, 39), (11, 56)))
+
+    def test_series_iter_window_reduce_b(self) -> None:
+        s1 = sf.Series((1.0, np.nan, 3.0, 4.0, np.nan),
+                index=sf.IndexDate.from_date_range('2021-01-01', '2021-01-05'),
+                )
+        post1 = s1.iter_window(size=2).sum(min_periods=2)
+        self.assertIs(post1.index.__class__, sf.IndexDate)
+        self.assertEqual(post1.fillna(-1).values.tolist(), [-1.0, -1.0, 7.0, -1.0])
+
+        self.assertEqual(s1.iter_window_items(size=3).count().values.tolist(), [2, 2, 2])
+        self.assertEqual(s1.iter_window_array(size=3).count(skipna=False).values.tolist(), [3, 3, 3])
+        self.assertEqual(s1.iter_window(size=2).min(skipna=False).fillna(-1).values.tolist(),
+                [-1.0, -1.0, 3.0, -1.0])
+
+    def test_series_iter_window_reduce_c(self) -> None:
+        s1 = sf.Series((1e16, 1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(s1.iter_window(size=2).sum().values.tolist(),
+                [1e16 + 1, 3.0, 5.0, 7.0])
+        self.assertEqual(s1.iter_window(size=2).mean().values.tolist(),
+                [5e15, 1.5, 2.5, 3.5])
+
+    def test_series_iter_resample_a(self) -> None:
+        s1 = sf.Series((1.0, 2.0, np.nan, 4.0, 5.0),
+                index=sf.IndexDate.from_date_range('2021-01-28', '2021-02-01'),
+                name='x',
+                )
+        post1 = s1.iter_resample('M').sum()
+        self.assertIs(post1.index.__class__, sf.IndexYearMonth)
+        self.assertEqual(post1.name, 'x')
+        self.assertEqual(post1.to_pairs(),
+                ((np.datetime64('2021-01'), 7.0), (np.datetime64('2021-02'), 5.0)))
+        self.assertEqual(s1.iter_resample('M').count(skipna=False).values.tolist(), [4, 1])
+        # multi-unit buckets are aligned to the epoch
+        self.assertEqual(s1.iter_resample('D', step=2).max().values.tolist(), [1.0, 2.0, 5.0])
+
+        post2 = s1.iter_resample_items('M').apply(lambda k, v: v.index[0])
+        self.assertIs(post2.index.__class__, sf.IndexYearMonth)
+        self.assertEqual(post2.values.tolist(), [np.datetime64('2021-01-28'), np.datetime64('2021-02-01')])
+
+        post3 = s1.iter_resample('M').aggregate({'x': ('first', 'last')})
+        self.assertEqual(post3.values.tolist(), [[1.0, 4.0], [5.0, 5.0]])
+
+        with self.assertRaises(RuntimeError):
+            sf.Series(range(3)).iter_resample('D').sum()
+
+    def test_series_iter_resample_b(self) -> None:
+        s1 = sf.Series((3, 1, 2, 4),
+                index=sf.IndexHour(('2021-01-01T12', '2021-01-01T01', '2021-01-02T05', '2021-01-01T03')),
+                )
+        post1 = s1.iter_resample('D').mean()
+        self.assertIs(post1.index.__class__, sf.IndexDate)
+        self.assertEqual(post1.values.tolist(), [8 / 3, 2.0])
+        self.assertEqual([a.tolist() for a in s1.iter_resample_array('D')], [[3, 1, 4], [2]]) #type: ignore
+
+        post2 = s1.iter_resample('D').cumsum()
+        self.assertTrue(post2.index.equals(s1.index))
+        self.assertEqual(post2.values.tolist(), [3, 4, 2, 8])
+
+        post3 = s1.iter_resample('D').rank_ordinal()
+        self.assertEqual(post3.values.tolist(), [1, 0, 0, 2])
+
+    def test_series_iter_resample_c(self) -> None:
+        s1 = sf.Series(range(10), index=sf.IndexDate.from_date_range('2020-01-01', '2020-01-10'))
+        # weeks are labelled by their first day, a Thursday
+        post1 = s1.iter_resample('W').sum()
+        self.assertIs(post1.index.__class__, sf.IndexDate)
+        self.assertEqual(post1.to_pairs(),
+                ((np.datetime64('2019-12-26'), 0),
+                (np.datetime64('2020-01-02'), 28),
+                (np.datetime64('2020-01-09'), 17)))
+
+        post2 = s1.iter_resample_items('W', step=2).apply(lambda k, v: v.sum())
+        self.assertIs(post2.index.__class__, sf.IndexDate)
+        self.assertEqual(post2.values.tolist(), [28, 17])
+
+        with self.assertRaises(RuntimeError):
+            s1.iter_resample('ps').sum()
+        with self.assertRaises(RuntimeError):
+            s1.iter_resample_items('ps').apply(lambda k, v: v.sum())
+
+    def test_series_iter_window_array_view_a(self) -> None:
+        s1 = sf.Series(np.arange(8.0), index=tuple('abcdefgh'))
+        post1 = s1.iter_window_array(size=3, step=2).array_view()
+        self.assertEqual(post1.tolist(), [[0.0, 1.0, 2.0], [2.0, 3.0, 4.0], [4.0, 5.0, 6.0]])
+        self.assertFalse(post1.flags.writeable)
+        self.assertTrue(np.shares_memory(post1, s1.values))
+
+        with self.assertRaises(RuntimeError):
+            s1.iter_window_array(size=3, window_sized=False, start_shift=-1).array_view()
+        with self.assertRaises(RuntimeError):
+            s1.iter_window_array(size=3, window_func=lambda a: a).array_view()
+
+    def test_series_iter_window_array_apply_a(self) -> None:
+        s1 = sf.Series((3, 1, 4, 1, 5, 9, 2, 6), index=tuple('abcdefgh'))
+        for func in (np.median, np.sum, np.ptp, np.all):
+            for kwargs in (dict(size=3), dict(size=2, step=3), dict(size=3, window_sized=False)):
+                post1 = s1.iter_window_array(**kwargs).apply(func, name='x')
+                # a lambda is not a known NumPy reduction, and is applied per window
+                post2 = s1.iter_window_array(**kwargs).apply(lambda a: func(a), name='x') #pylint: disable=W0108
+                self.assertTrue(post1.equals(post2, compare_dtype=True, compare_name=True))
+
+        post3 = s1.iter_window_array(size=4).apply(np.mean, index_constructor=sf.Index)
+        self.assertEqual(post3.to_pairs(),
+                (('d', 2.25), ('e', 2.75), ('f', 4.75), ('g', 4.25), ('h', 5.5)))
+
     #---------------------------------------------------------------------------
 
     def test_series_bool_a(self) -> None:
@@ -117,6 +117,9 @@ class TestUnit(TestCase):
                 index_depth=1,
                 columns_depth=1,
                 consolidate_blocks=True,
+                rows_start=1,
+                rows_stop=10,
+                rows_where='a > 0',
                 skip_header=1,
                 skip_footer=1,
                 trim_nadir=True,
@@ -0,0 +1,92 @@
+import mmap
+import os
+from tempfile import TemporaryDirectory
+
+import frame_fixtures as ff
+
+from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.frame import FrameGO
+from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_directory import StoreDirectoryNPY
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import temp_file
+
+
+class TestUnit(TestCase):
+
+    def test_store_directory_npy_a(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('c')
+        f2 = ff.parse('s(4,8)|v(bool,str,float)|i(I,str)|c(I,str)').rename('a')
+        f3 = ff.parse('s(4,7)|v(str)|i(I,str)|c(I,str)').rename('b')
+
+        config = StoreConfig()
+
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'store')
+            st = StoreDirectoryNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+            # labels are returned in the order written
+            self.assertEqual(tuple(st.labels()), ('c', 'a', 'b'))
+
+            self.assertTrue(f1.equals(st.read('c'), compare_dtype=True))
+            self.assertTrue(f2.equals(st.read('a'), compare_dtype=True))
+            self.assertTrue(f3.equals(st.read('b'), compare_dtype=True))
+
+            f4 = st.read('c')
+            self.assertIs(f4, st.read('c'))
+
+            with self.assertRaises(ErrorInitStore):
+                st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+    def test_store_directory_npy_b(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,float,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(10,3)|v(float)').rename('b')
+
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'store')
+            StoreDirectoryNPY(fp).write(((f.name, f) for f in (f1, f2)))
+
+            st = StoreDirectoryNPY(fp, memory_map=True)
+            f3, f4 = st.read_many(('a', 'b'))
+            self.assertTrue(f1.equals(f3, compare_dtype=True))
+            self.assertTrue(f2.equals(f4, compare_dtype=True))
+            self.assertFalse(f4.values.flags.writeable)
+            # blocks are views of memory maps, not arrays read into memory
+            for f in (f3, f4):
+                for b in f._blocks._blocks:
+                    self.assertIsInstance(b.base, mmap.mmap)
+
+            f5 = st.read('b', container_type=FrameGO)
+            self.assertIs(f5.__class__, FrameGO)
+
+    def test_store_directory_npy_c(self) -> None:
+        f1 = ff.parse('s(4,2)').rename('a')
+        f2 = ff.parse('s(2,2)').rename('b').astype(object)
+
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'store')
+            with self.assertRaises(ErrorNPYEncode):
+                StoreDirectoryNPY(fp).write(((f.name, f) for f in (f1, f2)))
+            self.assertFalse(os.path.exists(fp))
+
+    def test_store_directory_npy_d(self) -> None:
+        with temp_file() as fp:
+            with self.assertRaises(ErrorInitStore):
+                StoreDirectoryNPY(fp)
+
+        # a directory name might contain a dot
+        f1 = ff.parse('s(2,3)|v(int)').rename('a')
+        with TemporaryDirectory() as dir:
+            fp = os.path.join(dir, 'store.v1')
+            StoreDirectoryNPY(fp).write(((f1.name, f1),))
+            self.assertTrue(os.path.isdir(fp))
+            self.assertTrue(StoreDirectoryNPY(fp).read('a').equals(f1))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
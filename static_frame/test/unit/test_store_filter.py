@@ -1,4 +1,5 @@
 import datetime
+import pickle
 from io import StringIO
 
 import numpy as np
@@ -363,6 +364,17 @@ class TestUnit(TestCase):
         self.assertEqual(post2.tolist(),
                 ['0.413-0.000j', '0.412-0.593j', 'foo', False, 100, '0.833', '20.000+3.000j'])
 
+    def test_store_filter_pickle_a(self) -> None:
+        sf1 = StoreFilter(from_nan='NaN', to_none=frozenset(('', 'None')), value_format_float_positional='{:.3f}')
+        sf2 = pickle.loads(pickle.dumps(sf1))
+        self.assertEqual(sf2.from_nan, 'NaN')
+        self.assertEqual(sf2.to_none, frozenset(('', 'None')))
+        self.assertEqual(sf2.from_posinf, 'inf')
+
+        a1 = np.array([np.nan, 1.5, None], dtype=object)
+        self.assertEqual(sf1.from_type_filter_array(a1).tolist(),
+                sf2.from_type_filter_array(a1).tolist())
+
 
 if __name__ == '__main__':
     import unittest
@@ -1,5 +1,9 @@
 import typing as tp
+from unittest.mock import patch
 
+import frame_fixtures as ff
+
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store_config import StoreConfig
@@ -132,6 +136,74 @@ class TestUnit(TestCase):
                     (('0ax', ((0, 1), (1, 2), (2, -5), (3, 3))),
                     ('3iv', ((0, 3), (1, 4), (2, -5), (3, -3000)))))
 
+    def test_store_hdf5_write_f(self) -> None:
+        f1 = ff.parse('s(1_000,4)|v(int,float,bool,str)|i(I,str)|c(I,str)').rename('foo')
+        config = StoreConfig(index_depth=1)
+
+        with temp_file('.hdf5') as fp:
+            st1 = StoreHDF5(fp)
+            # force many chunks per table
+            with patch.object(StoreHDF5, '_WRITE_CHUNK_BYTES', 300):
+                st1.write(((f.name, f) for f in (f1,)))
+            f2 = st1.read('foo', config=config)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+    def test_store_hdf5_write_append_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float,bool)|i(I,str)|c(I,str)').rename('foo')
+        f2 = ff.parse('s(6,3)|v(int,float,bool)|i(I,str)|c(I,str)').rename('foo')
+        f3 = ff.parse('s(2,2)|v(float)|c(I,str)').rename('bar')
+        config = StoreConfig(index_depth=1)
+
+        with temp_file('.hdf5') as fp:
+            StoreHDF5(fp).write(((f.name, f) for f in (f1,)))
+            st1 = StoreHDF5(fp)
+            st1.write(((f.name, f) for f in (f2, f3)), append=True)
+
+            self.assertEqual(set(st1.labels()), {'foo', 'bar'})
+            f4 = st1.read('foo')
+            self.assertEqual(f4.shape, (10, 4))
+            self.assertEqual(f4['__index0__'].values.tolist(),
+                    f1.index.values.tolist() + f2.index.values.tolist())
+            self.assertTrue(f3.equals(st1.read('bar', config=config)))
+
+            f5 = ff.parse('s(2,2)|v(float)|c(I,str)').rename('foo')
+            with self.assertRaises(StoreParameterConflict):
+                st1.write(((f.name, f) for f in (f5,)), append=True)
+
+    def test_store_hdf5_write_append_b(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int,float,bool)|c(I,str)').rename('foo')
+
+        with temp_file('.hdf5') as fp:
+            f1.to_hdf5(fp)
+            f1.to_hdf5(fp, append=True)
+            f2 = Frame.from_hdf5(fp, label='foo', index_depth=0)
+            self.assertEqual(f2.shape, (8, 4))
+
+            f1.to_hdf5(fp)
+            f3 = Frame.from_hdf5(fp, label='foo', index_depth=1)
+            self.assertTrue(f1.equals(f3))
+
+    def test_store_hdf5_write_append_c(self) -> None:
+        f1 = Frame.from_dict(dict(a=('p', 'q'), b=(1, 2)), index=('x', 'y'), name='foo')
+
+        with temp_file('.hdf5') as fp:
+            f1.to_hdf5(fp)
+            # wider strings would be truncated
+            f2 = Frame.from_dict(dict(a=('pqrstu', 'q'), b=(3, 4)), index=('z', 'w'), name='foo')
+            with self.assertRaises(StoreParameterConflict):
+                f2.to_hdf5(fp, append=True)
+            # floats would be cast to integers
+            f3 = Frame.from_dict(dict(a=('r', 's'), b=(1.5, 2.0)), index=('z', 'w'), name='foo')
+            with self.assertRaises(StoreParameterConflict):
+                f3.to_hdf5(fp, append=True)
+
+            f4 = Frame.from_dict(dict(a=('r', 's'), b=(True, False)), index=('z', 'w'), name='foo')
+            f4.to_hdf5(fp, append=True)
+            f5 = Frame.from_hdf5(fp, label='foo', index_depth=1)
+            self.assertEqual(f5.to_pairs(),
+                    (('a', (('x', 'p'), ('y', 'q'), ('z', 'r'), ('w', 's'))),
+                    ('b', (('x', 1), ('y', 2), ('z', 1), ('w', 0)))))
+
     #---------------------------------------------------------------------------
 
     def test_store_hdf5_read_many_a(self) -> None:
@@ -188,6 +260,47 @@ class TestUnit(TestCase):
                 f_src = frames[i]
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
+    def test_store_hdf5_read_many_b(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float,bool,str)|i(I,str)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(10,3)|v(float)|c(I,str)').rename('f2')
+
+        with temp_file('.hdf5') as fp:
+            st1 = StoreHDF5(fp)
+            st1.write(((f.name, f) for f in (f1, f2)))
+
+            c1 = StoreConfig(index_depth=1, columns_select=('zUvW', 'zkuW'))
+            c2 = StoreConfig(index_depth=1, rows_start=2, rows_stop=5)
+            f3, f4 = st1.read_many(('f1', 'f2'), config={'f1': c1, 'f2': c2})
+
+            self.assertTrue(f1[['zUvW', 'zkuW']].equals(f3, compare_dtype=True))
+            self.assertTrue(f2.iloc[2:5].equals(f4, compare_dtype=True))
+
+            f5 = st1.read('f2', config=StoreConfig(index_depth=1, rows_start=7))
+            self.assertTrue(f2.iloc[7:].equals(f5, compare_dtype=True))
+
+    def test_store_hdf5_read_many_c(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float,bool,str)|i(I,str)|c(I,str)').rename('f1')
+
+        with temp_file('.hdf5') as fp:
+            f1.to_hdf5(fp)
+
+            f2 = Frame.from_hdf5(fp,
+                    label='f1',
+                    index_depth=1,
+                    rows_where='zUvW > 0',
+                    )
+            self.assertTrue(f1.loc[f1['zUvW'] > 0].equals(f2, compare_dtype=True))
+
+            f3 = Frame.from_hdf5(fp,
+                    label='f1',
+                    index_depth=1,
+                    columns_select=('zZbu',),
+                    rows_start=10,
+                    rows_where='zUvW > 0',
+                    )
+            f4 = f1.iloc[10:]
+            self.assertTrue(f4.loc[f4['zUvW'] > 0, ['zZbu']].equals(f3, compare_dtype=True))
+
 
 if __name__ == '__main__':
     import unittest
@@ -1,9 +1,17 @@
+import copy
+import sqlite3
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
+from unittest.mock import patch
 
 import numpy as np
 
+from static_frame.core.bus import Bus
+from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import Frame
+from static_frame.core.index_datetime import IndexDate
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
@@ -159,6 +167,143 @@ class TestUnit(TestCase):
 
             self.assertEqual(list(st2.labels()), ['f2'])
 
+    def test_store_sqlite_write_g(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=np.arange(7), b=np.arange(7) * 0.5, c=tuple('abcdefg')),
+                index=IndexDate.from_date_range('2020-01-01', '2020-01-07'),
+                name='f1')
+
+        with temp_file('.sqlite') as fp:
+
+            st1 = StoreSQLite(fp)
+            with patch.object(StoreSQLite, '_WRITE_CHUNKSIZE', 3):
+                st1.write(((f1.name, f1),), journal_mode='wal', synchronous='off')
+
+            conn = sqlite3.connect(fp)
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(conn.execute('SELECT * FROM f1 LIMIT 2').fetchall(),
+                    [('2020-01-01', 0, 0.0, 'a'), ('2020-01-02', 1, 0.5, 'b')])
+            conn.close()
+
+            config = StoreConfig(index_depth=1,
+                    index_constructors=IndexDate,
+                    dtypes={'__index0__': 'datetime64[D]'},
+                    )
+            f2 = st1.read(f1.name, config=config)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True))
+
+    def test_store_sqlite_write_h(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='f1')
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            with self.assertRaises(RuntimeError):
+                st1.write(((f1.name, f1),), journal_mode='foo')
+            with self.assertRaises(RuntimeError):
+                st1.write(((f1.name, f1),), synchronous='foo')
+
+    def test_store_sqlite_write_i(self) -> None:
+
+        # datetime64 values of any unit are written as ISO 8601 strings
+        f1 = Frame.from_dict(
+                dict(a=np.array(('2020-01-02', '2021-03-04'), dtype='datetime64[s]'),
+                        b=np.array(('2020-01-02', '2021-03-04'), dtype='datetime64[ns]'),
+                        ),
+                name='f1')
+
+        with temp_file('.sqlite') as fp:
+            StoreSQLite(fp).write(((f1.name, f1),))
+
+            conn = sqlite3.connect(fp)
+            self.assertEqual(conn.execute('SELECT a, b FROM f1').fetchall(),
+                    [('2020-01-02T00:00:00', '2020-01-02T00:00:00.000000000'),
+                    ('2021-03-04T00:00:00', '2021-03-04T00:00:00.000000000')])
+            conn.close()
+
+            config = StoreConfig(index_depth=1,
+                    dtypes={'a': 'datetime64[s]', 'b': 'datetime64[ns]'},
+                    )
+            f2 = StoreSQLite(fp).read(f1.name, config=config)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+    def test_store_sqlite_write_blob_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(x=(1.5,-np.inf,np.inf,np.nan), y=(3,4,-5,-3000)),
+                index=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f1')
+        f2 = Frame.from_records(
+                ((10.4, 20.1, 50, 60), (50.1, 60.4, -50, -60)),
+                index=IndexDate(('2020-01-01', '2020-01-02')),
+                columns=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f2')
+        frames = (f1, f2)
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in frames), blob_layout=True)
+
+            self.assertEqual(list(st1.labels()), ['f1', 'f2'])
+            for f_src, f_loaded in zip(frames, st1.read_many(('f1', 'f2'))):
+                self.assertTrue(f_src.equals(f_loaded, compare_dtype=True, compare_class=True, compare_name=True))
+            # single-table write and read
+            f1.to_sqlite(fp, blob_layout=True)
+            self.assertTrue(Frame.from_sqlite(fp, label='f1').equals(f1, compare_dtype=True))
+
+    def test_store_sqlite_write_blob_b(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6), c=(None, 'a', 3)),
+                index=('x', 'y', 'z'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(a=(1,2,3)),
+                name='f2')
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            # object arrays cannot be encoded; no tables are written
+            with self.assertRaises(ErrorNPYEncode):
+                st1.write(((f.name, f) for f in (f2, f1)), blob_layout=True)
+            self.assertEqual(list(StoreSQLite(fp).labels()), [])
+
+    def test_store_sqlite_write_blob_c(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6), c=(True, False, True)),
+                index=('x', 'y', 'z'),
+                name='f1')
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f1.name, f1),), blob_layout=True)
+
+            config = StoreConfig(index_depth=1,
+                    columns_select=('a', 'c'),
+                    dtypes={'a': float},
+                    )
+            f2 = st1.read('f1', config=config)
+            self.assertEqual(f2.dtypes.values.tolist(),
+                    [np.dtype(float), np.dtype(bool)])
+            self.assertEqual(f2.to_pairs(0),
+                    (('a', (('x', 1.0), ('y', 2.0), ('z', 3.0))),
+                    ('c', (('x', True), ('y', False), ('z', True)))))
+
+            f3 = st1.read('f1', config=StoreConfig(columns_select=('a', 'b'), consolidate_blocks=True))
+            self.assertEqual(f3._blocks.shapes.tolist(), [(3, 2)])
+
+            with self.assertRaises(ErrorInitStore):
+                st1.read('f1', config=StoreConfig(index_depth=2))
+            with self.assertRaises(ErrorInitStore):
+                st1.read('f1', config=StoreConfig(columns_depth=2))
+            with self.assertRaises(ErrorInitStore):
+                st1.read('f1', config=StoreConfig(index_constructors=IndexDate))
+
     #---------------------------------------------------------------------------
 
     def test_store_sqlite_read_many_a(self) -> None:
@@ -215,6 +360,90 @@ class TestUnit(TestCase):
                 f_src = frames[i]
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
+    def test_store_sqlite_read_many_b(self) -> None:
+
+        frames = [Frame.from_dict(
+                dict(a=np.arange(20) + i, b=np.arange(20) * 0.5),
+                name=f'f{i}') for i in range(8)]
+        config = StoreConfig(index_depth=1)
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write((f.name, f) for f in frames)
+
+            f1 = st1.read('f0', config=config)
+            conn = st1._connection_read()
+            f2 = st1.read('f1', config=config)
+            # the same connection is reused by this thread
+            self.assertIs(st1._connection_read(), conn)
+            self.assertTrue(f1.equals(frames[0]))
+            self.assertTrue(f2.equals(frames[1]))
+
+            # connections are read-only
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute('DELETE FROM f0')
+
+            def read(f: Frame) -> tp.Tuple[Frame, sqlite3.Connection]:
+                return st1.read(f.name, config=config), st1._connection_read()
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                post = list(executor.map(read, frames))
+            for f_src, (f_loaded, conn_thread) in zip(frames, post):
+                self.assertTrue(f_src.equals(f_loaded))
+                # each thread reads with its own connection
+                self.assertIsNot(conn_thread, conn)
+
+            # writing closes all connections
+            st1.write((f.name, f) for f in frames[:2])
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
+            self.assertIsNot(st1._connection_read(), conn)
+            self.assertEqual(list(st1.labels()), ['f0', 'f1'])
+
+    def test_store_sqlite_read_many_d(self) -> None:
+        frames = [Frame.from_dict(dict(a=np.arange(4) + i), name=f'f{i}') for i in range(2)]
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write((f.name, f) for f in frames)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                conn = executor.submit(st1._connection_read).result()
+                self.assertEqual(st1._connections, {conn})
+
+                # writing closes connections of other threads, even if those threads are alive
+                st1.write((f.name, f) for f in frames[:1])
+                with self.assertRaises(sqlite3.ProgrammingError):
+                    conn.execute('SELECT 1')
+                self.assertEqual(st1._connections, set())
+
+                # the thread creates a new connection on next read
+                conn_new = executor.submit(st1._connection_read).result()
+                self.assertIsNot(conn_new, conn)
+                self.assertEqual(executor.submit(lambda: list(st1.labels())).result(), ['f0'])
+
+    def test_store_sqlite_read_many_c(self) -> None:
+        frames = [Frame.from_dict(dict(a=np.arange(4) + i), name=f'f{i}') for i in range(2)]
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write((f.name, f) for f in frames)
+            conn = st1._connection_read()
+
+            # connections are not copied
+            st2 = copy.deepcopy(st1)
+            self.assertIsNot(st2._connection_read(), conn)
+            self.assertTrue(st2.read('f1').equals(st1.read('f1')))
+
+            b1 = Bus.from_sqlite(fp)
+            _ = b1['f0']
+            b2 = copy.deepcopy(b1)
+            self.assertTrue(b2['f1'].equals(b1['f1']))
+
+            # connections inherited from another process are not used
+            with patch('os.getpid', lambda: -1):
+                self.assertIsNot(st1._connection_read(), conn)
+
 
 if __name__ == '__main__':
     import unittest
@@ -1,4 +1,5 @@
 import typing as tp
+from unittest.mock import patch
 
 import numpy as np
 
@@ -388,6 +389,91 @@ class TestUnit(TestCase):
                         ((0, (((2, 2, 'a'), False), ((30, 73, 'd'), True))),)
                         )
 
+    def test_store_xlsx_read_many_g(self) -> None:
+
+        frames = [Frame.from_dict(
+                dict(a=np.arange(5) + i, b=tuple('abcde')),
+                index=tuple('pqrst'),
+                name=f'f{i}') for i in range(5)]
+
+        with temp_file('.xlsx') as fp:
+            st1 = StoreXLSX(fp)
+            st1.write((f.name, f) for f in frames)
+
+            for read_chunksize in (1, 2, 10):
+                config = StoreConfig(index_depth=1,
+                        read_max_workers=2,
+                        read_chunksize=read_chunksize,
+                        )
+                labels = ('f3', 'f0', 'f4', 'f1')
+                post = list(st1.read_many(labels, config=config))
+                self.assertEqual([f.name for f in post], list(labels))
+                for f in post:
+                    self.assertTrue(f.equals(frames[int(f.name[1])], compare_dtype=True))
+
+            config = StoreConfig(index_depth=1, read_max_workers=2)
+            f1 = st1.read(STORE_LABEL_DEFAULT, config=config)
+            self.assertTrue(f1.equals(frames[0].rename(None), compare_name=True))
+
+    def test_store_xlsx_write_constant_memory_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(x=(None,-np.inf,np.inf,None), y=(3,4,-5,-3000)),
+                index=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f1')
+        f2 = Frame.from_records(
+                ((10.4, 20.1, 50, 60), (50.1, np.nan, -50, -60)),
+                index=('p', 'q'),
+                columns=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f2')
+        f3 = Frame.from_fields((
+                np.array(('2020-01-01', '2021-01-02'), dtype='datetime64[D]'),
+                np.array((1+2j, 3j)),
+                np.array((True, False)),
+                np.array(('a', 'b')),
+                ),
+                columns=('a', 'b', 'c', 'd'),
+                index=('x', 'y'),
+                name='f3')
+        frames = (f1, f2, f3)
+
+        with temp_file('.xlsx') as fp1, temp_file('.xlsx') as fp2:
+            for config in (
+                    StoreConfig(),
+                    StoreConfig(include_index_name=False, include_columns_name=True),
+                    StoreConfig(include_columns=False),
+                    ):
+                st1 = StoreXLSX(fp1)
+                with patch.object(StoreXLSX, '_WRITE_CHUNKSIZE', 1):
+                    st1.write(((f.name, f) for f in frames),
+                            config=config,
+                            constant_memory=True,
+                            )
+                st2 = StoreXLSX(fp2)
+                st2.write(((f.name, f) for f in frames), config=config)
+
+                for f in frames:
+                    c = StoreConfig(
+                            index_depth=f.index.depth,
+                            columns_depth=f.columns.depth if config.include_columns else 0,
+                            )
+                    f_loaded1 = st1.read(f.name, config=c)
+                    f_loaded2 = st2.read(f.name, config=c)
+                    self.assertTrue(f_loaded1.equals(f_loaded2, compare_dtype=True))
+
+    def test_store_xlsx_write_constant_memory_b(self) -> None:
+        f1 = Frame.from_records(
+                ((10, 20), (50, 60), (1, 2)),
+                index=('p', 'q', 'r'),
+                columns=('a', 'b'),
+                name='f1')
+
+        with temp_file('.xlsx') as fp:
+            f1.to_xlsx(fp, constant_memory=True)
+            f2 = Frame.from_xlsx(fp, index_depth=1)
+            self.assertEqual(f2.to_pairs(),
+                    (('a', (('p', 10), ('q', 50), ('r', 1))), ('b', (('p', 20), ('q', 60), ('r', 2)))))
+
     #---------------------------------------------------------------------------
 
     def test_dtype_to_writer_attr(self) -> None:
@@ -3,6 +3,7 @@ import typing as tp
 import frame_fixtures as ff
 
 from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.frame import Frame
 from static_frame.core.frame import FrameGO
 from static_frame.core.frame import FrameHE
@@ -403,6 +404,25 @@ class TestUnitMultiProcess(TestCase):
     def test_store_zip_npz_mp(self) -> None:
         self.run_assertions(StoreZipNPZ)
 
+    def test_store_zip_npz_mp_context(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        with temp_file('.zip') as fp:
+            config = StoreConfig(
+                    index_depth=1,
+                    read_max_workers=2,
+                    write_max_workers=2,
+                    mp_context='spawn',
+                    )
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+            post = tuple(st.read_many(('baz', 'foo'), config=config))
+            self.assertTrue(post[0].equals(f3))
+            self.assertTrue(post[1].equals(f1))
+
+            with self.assertRaises(ValueError):
+                st.write(((f1.name, f1),), config=StoreConfig(
+                        write_max_workers=2, mp_context='foo'))
+
     #---------------------------------------------------------------------------
 
     def test_store_zip_npz_a(self) -> None:
@@ -423,6 +443,23 @@ class TestUnitMultiProcess(TestCase):
             self.assertIs(post[0].index.__class__, IndexDate)
             self.assertIs(post[1].index.__class__, IndexDate)
 
+    def test_store_zip_npz_b(self) -> None:
+
+        f1, f2 = get_test_framesB()
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write((f.name, f) for f in (f1, f2))
+
+            # selecting rows is only supported by StoreHDF5
+            with self.assertRaises(ErrorInitStoreConfig):
+                st.read('a', config=StoreConfig(rows_start=1))
+            with self.assertRaises(ErrorInitStoreConfig):
+                tuple(st.read_many(('a', 'b'), config=StoreConfigMap.from_initializer(
+                        {'b': StoreConfig(rows_where='a > 0')})))
+
+            self.assertTrue(st.read('a', config=StoreConfig(index_depth=1)).equals(f1))
+
     #---------------------------------------------------------------------------
     def test_store_zip_npy_a(self) -> None:
 
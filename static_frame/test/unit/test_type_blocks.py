@@ -1,5 +1,6 @@
 import copy
 import pickle
+import typing as tp
 from itertools import zip_longest
 
 import frame_fixtures as ff
@@ -21,6 +22,7 @@ from static_frame.core.type_blocks import group_sorted
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import isna_array
 from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import skip_pyle37
 from static_frame.test.test_case import skip_win
 
 nan = np.nan
@@ -1607,6 +1609,23 @@ class TestUnit(TestCase):
                 [(6, 1), (6, 1)]
                 )
 
+    def test_type_blocks_group_e(self) -> None:
+        # unsortable values are factorized in order of appearance
+        a1 = np.array([1, 'a', 1, None], dtype=object)
+        a2 = np.array([10, 20, 30, 40])
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+        post = [(label, x.values.tolist()) for label, _, x in tb1.group(axis=0, key=0)]
+        self.assertEqual(post,
+                [(1, [[1, 10], [1, 30]]), ('a', [['a', 20]]), (None, [[None, 40]])]
+                )
+        plan = tb1.group_plan(axis=0, key=0)
+        self.assertEqual(plan.codes.tolist(), [0, 1, 0, 2])
+
+        a3 = np.array(['1', 'a', 'a', 'b'], dtype=object)
+        tb2 = TypeBlocks.from_blocks((a1, a3, a2))
+        post = [label for label, _, _ in tb2.group(axis=0, key=[0, 1])]
+        self.assertEqual(post, [(1, '1'), ('a', 'a'), (1, 'a'), (None, 'b')])
+
     #---------------------------------------------------------------------------
 
     def test_type_blocks_transpose_a(self) -> None:
@@ -3226,6 +3245,34 @@ class TestUnit(TestCase):
                 [False, False, False]
                 )
 
+    @skip_pyle37
+    def test_type_blocks_pickle_b(self) -> None:
+
+        a1 = np.arange(6).reshape(3, 2)
+        a2 = np.array([False, True, False])
+        a3 = np.array(['b', None, 'd'], dtype=object)
+        a4 = np.array(['2020-01-01', '2020-02-01', None], dtype='datetime64[D]')
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3, a4))
+
+        buffers: tp.List[pickle.PickleBuffer] = []
+        pbytes = pickle.dumps(tb1, protocol=5, buffer_callback=buffers.append)
+        # object arrays are pickled in-band
+        self.assertEqual(len(buffers), 3)
+
+        tb2 = pickle.loads(pbytes, buffers=buffers)
+        self.assertEqual(tb2.shape, (3, 5))
+        self.assertTrue(tb1.equals(tb2, compare_dtype=True))
+        self.assertEqual(tb2.dtypes[-1], np.dtype('datetime64[D]'))
+        self.assertEqual([b.flags.writeable for b in tb2._blocks],
+                [False, False, False, False]
+                )
+
+    @skip_pyle37
+    def test_type_blocks_pickle_c(self) -> None:
+        tb1 = TypeBlocks.from_zero_size_shape((3, 0))
+        tb2 = pickle.loads(pickle.dumps(tb1, protocol=5))
+        self.assertEqual(tb2.shape, (3, 0))
+
     #---------------------------------------------------------------------------
 
     def test_type_blocks_roll_blocks_a(self) -> None:
@@ -1,8 +1,10 @@
 import datetime
 import json
+import pickle
 import typing as tp
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import partial
 
@@ -13,6 +15,7 @@ from arraykit import resolve_dtype_iter
 from arraykit import row_1d_filter
 
 from static_frame.core.exception import InvalidDatetime64Comparison
+from static_frame.core.util import COST_WINDOW_PER_WORKER
 from static_frame.core.util import DT64_DAY
 from static_frame.core.util import DT64_MONTH
 from static_frame.core.util import DT64_MS
@@ -20,6 +23,7 @@ from static_frame.core.util import DT64_YEAR
 from static_frame.core.util import UFUNC_MAP
 from static_frame.core.util import JSONFilter
 from static_frame.core.util import ManyToOneType
+from static_frame.core.util import SharedMemorySession
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import _array_to_duplicated_sortable
 from static_frame.core.util import _isin_1d
@@ -33,6 +37,7 @@ from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_factorize
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_sample
@@ -42,6 +47,8 @@ from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import binary_transition
 from static_frame.core.util import blocks_to_array_2d
 from static_frame.core.util import bytes_to_size_label
+from static_frame.core.util import call_pickle_shared_memory
+from static_frame.core.util import chunk_by_cost
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import datetime64_not_aligned
 from static_frame.core.util import dtype_from_element
@@ -60,7 +67,10 @@ from static_frame.core.util import iterable_to_array_2d
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import key_to_datetime_key
 from static_frame.core.util import list_to_tuple
+from static_frame.core.util import map_bounded
+from static_frame.core.util import map_by_cost
 from static_frame.core.util import prepare_iter_for_array
+from static_frame.core.util import reduce_tree
 from static_frame.core.util import roll_1d
 from static_frame.core.util import roll_2d
 from static_frame.core.util import setdiff1d
@@ -84,6 +94,9 @@ from static_frame.core.util import union2d
 from static_frame.core.util import validate_depth_selection
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import UnHashable
+from static_frame.test.test_case import shared_memory_maps
+from static_frame.test.test_case import skip_no_proc_maps
+from static_frame.test.test_case import skip_pyle37
 from static_frame.test.test_case import skip_win
 
 
@@ -379,6 +392,50 @@ class TestUnit(TestCase):
         self.assertEqual(post4.tolist(),
             [False, False, False])
 
+    def test_array_factorize_a(self) -> None:
+        first1, codes1 = array_factorize(np.array([3, 'a', 3, None, 'a'], dtype=object))
+        self.assertEqual(first1.tolist(), [0, 1, 3])
+        self.assertEqual(codes1.tolist(), [0, 1, 0, 2, 1])
+
+        a2 = np.array([[1, 'a'], ['1', 'a'], [1, 'a'], [1, 'b']], dtype=object)
+        first2, codes2 = array_factorize(a2)
+        self.assertEqual(first2.tolist(), [0, 1, 3])
+        self.assertEqual(codes2.tolist(), [0, 1, 0, 2])
+
+        first3, codes3 = array_factorize(a2.T, axis=1)
+        self.assertEqual(codes3.tolist(), codes2.tolist())
+
+        first4, codes4 = array_factorize(np.array([], dtype=object))
+        self.assertEqual((first4.tolist(), codes4.tolist()), ([], []))
+
+    def test_array_factorize_b(self) -> None:
+        # distinct NaN objects are given one code; None is distinct from NaN
+        a1 = np.array([['a', float('nan')], [float('nan'), None], [float('nan'), float('nan')],
+                ['a', np.nan], [np.nan, np.nan]], dtype=object)
+        first1, codes1 = array_factorize(a1)
+        self.assertEqual(first1.tolist(), [0, 1, 2])
+        self.assertEqual(codes1.tolist(), [0, 1, 2, 0, 2])
+
+        first2, codes2 = array_factorize(np.array([1.0, np.nan, 1.0, np.nan]))
+        self.assertEqual(first2.tolist(), [0, 1])
+        self.assertEqual(codes2.tolist(), [0, 1, 0, 1])
+
+        a3 = np.array(['2020-01', 'NaT', 'NaT'], dtype='datetime64[M]')
+        self.assertEqual(array_factorize(a3)[1].tolist(), [0, 1, 1])
+
+    def test_ufunc_unique2d_indexer_object_a(self) -> None:
+        # values that share a string representation are not merged
+        a1 = np.array([[1, 'a'], ['1', 'a'], [1, 'a']], dtype=object)
+        values, indexer = ufunc_unique2d_indexer(a1)
+        self.assertEqual(values.tolist(), [[1, 'a'], ['1', 'a']])
+        self.assertEqual(indexer.tolist(), [0, 1, 0])
+
+        # sortable object rows are sorted
+        a2 = np.array([['b', 2], ['a', 1], ['b', 2]], dtype=object)
+        values, indexer = ufunc_unique2d_indexer(a2)
+        self.assertEqual(values.tolist(), [['a', 1], ['b', 2]])
+        self.assertEqual(indexer.tolist(), [1, 0, 1])
+
     def test_array_to_duplicated_g(self) -> None:
 
         array = np.array([
@@ -2928,6 +2985,100 @@ class TestUnit(TestCase):
         post2 = json.dumps(JSONFilter.from_element(np.array((complex(1.2), complex(3.5))).reshape(2,1)))
         self.assertEqual(post2, '[["(1.2+0j)"], ["(3.5+0j)"]]')
 
+    #---------------------------------------------------------------------------
+    @skip_pyle37
+    def test_pickle_shared_memory_a(self) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        a1 = np.arange(8).reshape(2, 4)
+        with SharedMemorySession() as session:
+            arg, name = session.wrap((a1, 'a'))
+            post = pickle.loads(pickle.dumps(arg))
+            self.assertEqual(post[1], 'a')
+            self.assertEqual(post[0].tolist(), a1.tolist())
+            # the segment is unlinked when attached
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name=arg.name)
+
+            result = call_pickle_shared_memory(np.negative, (post[0], name))
+            _ = pickle.dumps(result) # creates the segment
+            del post
+        # the segment of the result, never unpickled, is unlinked on exit
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    @skip_pyle37
+    def test_pickle_shared_memory_b(self) -> None:
+        with SharedMemorySession() as session:
+            arg, _ = session.wrap(('a', 3))
+            self.assertEqual(pickle.loads(pickle.dumps(arg)), ('a', 3))
+
+    @skip_pyle37
+    @skip_no_proc_maps
+    def test_pickle_shared_memory_c(self) -> None:
+        with SharedMemorySession() as session:
+            arg, _ = session.wrap(np.arange(100_000))
+            post = pickle.loads(pickle.dumps(arg))
+            view = post[10:20]
+            del post
+            self.assertEqual(len(shared_memory_maps(arg.name)), 1)
+            # the segment is closed when the last array created on it is garbage collected
+            del view
+            self.assertEqual(shared_memory_maps(arg.name), [])
+
+    #---------------------------------------------------------------------------
+    def test_chunk_by_cost_a(self) -> None:
+        self.assertEqual(chunk_by_cost([1, 1, 1, 1], 2), [[0, 1], [2, 3]])
+        # costliest first, with a large item in a chunk of its own
+        self.assertEqual(chunk_by_cost([1, 10, 2, 1], 2), [[1], [2, 0, 3]])
+        self.assertEqual(chunk_by_cost([], 4), [])
+
+    def test_map_by_cost_a(self) -> None:
+        args = [np.arange(n) for n in (3, 100, 1, 40, 2)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            post = list(map_by_cost(executor, len, args, max_workers=2))
+        self.assertEqual(post, [3, 100, 1, 40, 2])
+
+    def test_map_by_cost_b(self) -> None:
+        consumed = []
+        def gen() -> tp.Iterator[np.ndarray]:
+            for i in range(200):
+                consumed.append(i)
+                yield np.arange(i % 7)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            post = map_by_cost(executor, len, gen(), max_workers=2)
+            self.assertEqual(consumed, [])
+            self.assertEqual(next(post), 0)
+            # two windows of args are consumed, not all args
+            self.assertEqual(len(consumed), 2 * 2 * COST_WINDOW_PER_WORKER)
+            self.assertEqual(list(post), [i % 7 for i in range(1, 200)])
+
+            post = map_by_cost(executor, len, gen(), max_workers=2)
+            next(post)
+            post.close()
+
+    def test_map_bounded_a(self) -> None:
+        consumed = []
+        def gen() -> tp.Iterator[int]:
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            post = map_bounded(executor, lambda x: x * 2, gen(), chunksize=3, max_workers=2)
+            self.assertEqual(next(post), 0)
+            # two chunks per worker are in flight, and one more is submitted when a result is consumed
+            self.assertEqual(len(consumed), 15)
+            self.assertEqual(list(post), [x * 2 for x in range(1, 100)])
+
+    def test_reduce_tree_a(self) -> None:
+        combine = lambda a, b: f'({a}{b})'
+        self.assertEqual(reduce_tree(combine, 'abcde'), '(((ab)(cd))e)')
+        self.assertEqual(reduce_tree(combine, 'a'), 'a')
+        with self.assertRaises(ValueError):
+            reduce_tree(combine, ())
+
 
 
 
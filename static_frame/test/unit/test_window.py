@@ -0,0 +1,119 @@
+import numpy as np
+
+from static_frame.core.window import window_positions
+from static_frame.core.window import window_reduce
+from static_frame.core.window import window_view
+from static_frame.core.window import window_view_reduce
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_window_positions_a(self) -> None:
+        lefts, labels = window_positions(count=6, size=3)
+        self.assertEqual(lefts.tolist(), [0, 1, 2, 3])
+        self.assertEqual(labels.tolist(), [2, 3, 4, 5])
+
+        lefts, labels = window_positions(count=6, size=3, step=2, window_sized=False, start_shift=-2)
+        self.assertEqual(lefts.tolist(), [-2, 0, 2])
+        self.assertEqual(labels.tolist(), [0, 2, 4])
+
+        lefts, labels = window_positions(count=6, size=2, label_shift=1)
+        self.assertEqual(lefts.tolist(), [0, 1, 2, 3])
+        self.assertEqual(labels.tolist(), [2, 3, 4, 5])
+
+        with self.assertRaises(RuntimeError):
+            window_positions(count=6, size=0)
+
+    def test_window_reduce_a(self) -> None:
+        a1 = np.array([3, 1, 2, 10, 20, 5])
+        lefts, _ = window_positions(count=len(a1), size=3)
+
+        self.assertEqual(window_reduce(a1, lefts, 3, func='sum').tolist(), [6, 13, 32, 35])
+        self.assertEqual(window_reduce(a1, lefts, 3, func='min').tolist(), [1, 1, 2, 5])
+        self.assertEqual(window_reduce(a1, lefts, 3, func='max').tolist(), [3, 10, 20, 20])
+        self.assertEqual(window_reduce(a1, lefts, 3, func='count').tolist(), [3, 3, 3, 3])
+        self.assertTrue(np.allclose(
+                window_reduce(a1, lefts, 3, func='var', ddof=1),
+                [np.var(a1[i: i + 3], ddof=1) for i in range(4)],
+                ))
+        self.assertFalse(window_reduce(a1, lefts, 3, func='mean').flags.writeable)
+
+    def test_window_reduce_b(self) -> None:
+        a1 = np.array([[1.0, np.nan], [np.nan, 2.0], [3.0, np.inf], [4.0, 1.0]])
+        lefts = np.array([-1, 0, 1, 2])
+
+        self.assertEqual(window_reduce(a1, lefts, 2, func='count').tolist(),
+                [[1, 0], [1, 1], [1, 2], [2, 2]])
+        post0 = window_reduce(a1, lefts, 2, func='count', min_periods=2)
+        self.assertEqual(np.isnan(post0).tolist(),
+                [[True, True], [True, True], [True, False], [False, False]])
+        post0 = window_reduce(a1, lefts, 2, func='count', skipna=False, min_periods=2)
+        self.assertEqual(np.isnan(post0[:, 0]).tolist(), [True, False, False, False])
+        post1 = window_reduce(a1, lefts, 2, func='sum', min_periods=1)
+        self.assertEqual(np.isnan(post1).tolist(),
+                [[False, True], [False, False], [False, False], [False, False]])
+        self.assertEqual(post1[1:].tolist(), [[1.0, 2.0], [3.0, np.inf], [7.0, np.inf]])
+
+        post2 = window_reduce(a1, lefts, 2, func='max', skipna=False)
+        self.assertEqual(np.isnan(post2).tolist(),
+                [[False, True], [True, True], [True, False], [False, False]])
+        self.assertEqual(window_reduce(a1, lefts, 2, func='min').tolist()[3], [3.0, 1.0])
+
+        post3 = window_reduce(a1, lefts, 2, func='std')
+        self.assertEqual(post3[:, 0].tolist(), [0.0, 0.0, 0.0, 0.5])
+        self.assertTrue(np.isnan(post3[2:, 1]).all())
+
+    def test_window_reduce_c(self) -> None:
+        a1 = np.array(['b', 'a', 'c', 'd'], dtype=object)
+        lefts, _ = window_positions(count=len(a1), size=2)
+        self.assertEqual(window_reduce(a1, lefts, 2, func='min').tolist(), ['a', 'a', 'c'])
+
+        a2 = np.array([1, 2, 3, 4])
+        post = window_reduce(a2, lefts, 2, func='mean', min_periods=3)
+        self.assertEqual(post.dtype.kind, 'f')
+        self.assertTrue(np.isnan(post).all())
+
+        with self.assertRaises(NotImplementedError):
+            window_reduce(a2, lefts, 2, func='median')
+
+    def test_window_reduce_d(self) -> None:
+        # a large value does not affect the precision of windows that exclude it
+        a1 = np.array([1e16, 1.0, 2.0, 3.0, 4.0, 5.0, np.nan, 7.0])
+        lefts, _ = window_positions(count=len(a1), size=2)
+
+        self.assertEqual(window_reduce(a1, lefts, 2, func='sum').tolist()[1:],
+                [3.0, 5.0, 7.0, 9.0, 5.0, 7.0])
+        self.assertEqual(window_reduce(a1, lefts, 2, func='mean').tolist()[1:],
+                [1.5, 2.5, 3.5, 4.5, 5.0, 7.0])
+        self.assertEqual(window_reduce(a1, lefts, 2, func='var').tolist()[1:],
+                [0.25, 0.25, 0.25, 0.25, 0.0, 0.0])
+
+        lefts, _ = window_positions(count=len(a1), size=3, step=2, window_sized=False, start_shift=-1)
+        post = window_reduce(a1, lefts, 3, func='std', ddof=1)
+        self.assertEqual(post.tolist()[1:], [1.0, 1.0, np.std([5.0, 7.0], ddof=1)])
+
+    def test_window_view_a(self) -> None:
+        a1 = np.arange(12).reshape(4, 3)
+        lefts, _ = window_positions(count=4, size=2, step=2)
+
+        post1 = window_view(a1, lefts, 2, 2)
+        self.assertEqual(post1.shape, (2, 2, 3))
+        self.assertEqual(post1[1].tolist(), a1[2:4].tolist())
+        self.assertFalse(post1.flags.writeable)
+        self.assertTrue(np.shares_memory(post1, a1))
+
+        lefts, _ = window_positions(count=3, size=2)
+        post2 = window_view(a1, lefts, 2, 1, axis=1)
+        self.assertEqual(post2.shape, (2, 4, 2))
+        self.assertEqual(post2[1].tolist(), a1[:, 1:3].tolist())
+
+        self.assertEqual(window_view_reduce(post2, np.sum).tolist(), [40, 48])
+
+        post3 = window_view(a1, np.array([1, 1, 1]), 2, 0)
+        self.assertEqual(post3.shape, (3, 2, 3))
+        self.assertEqual(post3[2].tolist(), a1[1:3].tolist())
+
+        self.assertEqual(window_view(a1, lefts[:0], 2, 1).shape, (0, 2, 3))
+        with self.assertRaises(RuntimeError):
+            window_view(a1, np.array([-1, 0]), 2, 1)